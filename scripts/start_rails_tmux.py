@@ -11,7 +11,11 @@ This mirrors the commonly used manual command, but reads configuration from
       bundle exec rails console"' C-m
 
 Usage:
-  python scripts/start_rails_tmux.py [--attach]
+  python scripts/start_rails_tmux.py [--attach] [--sessions N]
+
+With ``--sessions N`` (N > 1) the additional consoles ``<session>_2`` ..
+``<session>_N`` are started as well; set ``J2O_RAILS_SESSIONS=N`` so the
+migration's Rails session pool uses them.
 """
 
 from __future__ import annotations
@@ -92,18 +96,28 @@ def main() -> int:
         default=str(Path.home() / "rails_console.tmux.log"),
         help="Path to capture tmux pane output (default: ~/rails_console.tmux.log)",
     )
+    parser.add_argument(
+        "--sessions",
+        type=int,
+        default=1,
+        help="Number of Rails console sessions to start for the session pool (default: 1)",
+    )
     args = parser.parse_args()
 
     log_path = Path(args.log)
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
-    if session_exists(session):
-        print(f"tmux session '{session}' already exists.")
-    else:
+    # Extra pool sessions follow the RailsSessionPool naming: <session>_2 .. <session>_N
+    sessions = [session] + [f"{session}_{i}" for i in range(2, max(1, args.sessions) + 1)]
+    for name in sessions:
+        if session_exists(name):
+            print(f"tmux session '{name}' already exists.")
+            continue
+        session_log = log_path if name == session else log_path.with_name(f"{name}.tmux.log")
         try:
-            start_tmux_session(session, server, user, container, log_path)
+            start_tmux_session(name, server, user, container, session_log)
             print(
-                f"Started tmux session '{session}'. Logs: {log_path}. Attach with: tmux attach -t {session}",
+                f"Started tmux session '{name}'. Logs: {session_log}. Attach with: tmux attach -t {name}",
             )
         except subprocess.CalledProcessError as e:
             print(f"Failed to start tmux session: {e}", file=sys.stderr)
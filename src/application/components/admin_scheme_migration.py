@@ -288,9 +288,14 @@ class AdminSchemeMigration(BaseMigration):
                 failed += len(group_assignments)
                 self.logger.exception("Failed to assign group roles: %s", exc)
 
-        for assignment in user_assignments:
+        if user_assignments:
             try:
-                result = self.op_client.assign_user_roles(**assignment)
+                user_results = self.op_client.bulk_assign_user_roles(user_assignments)
+            except Exception as exc:
+                failed += len(user_assignments)
+                user_results = []
+                self.logger.exception("Failed to assign user roles: %s", exc)
+            for assignment, result in zip(user_assignments, user_results, strict=False):
                 if result.get("success"):
                     updated += 1
                 else:
@@ -301,14 +306,6 @@ class AdminSchemeMigration(BaseMigration):
                         assignment.get("user_id"),
                         result.get("error") or result,
                     )
-            except Exception as exc:
-                failed += 1
-                self.logger.exception(
-                    "Failed to assign user %s to project %s: %s",
-                    assignment.get("user_id"),
-                    assignment.get("project_id"),
-                    exc,
-                )
 
         return ComponentResult(
             success=failed == 0,
@@ -6,10 +6,12 @@ comma-separated version names from Jira `versions` (distinct from `fixVersions`)
 
 from __future__ import annotations
 
+from typing import Any
+
 from src.application.components.base_migration import BaseMigration, register_entity_types
 from src.config import logger
 from src.infrastructure.jira.jira_client import JiraClient
-from src.infrastructure.openproject.openproject_client import OpenProjectClient, escape_ruby_single_quoted
+from src.infrastructure.openproject.openproject_client import OpenProjectClient
 from src.models import ComponentResult, WorkPackageMappingEntry
 from src.models.jira import JiraIssueFields
 
@@ -18,6 +20,10 @@ AFFECTS_VERSIONS_CF_NAME = "Affects Versions"
 
 @register_entity_types("affects_versions")
 class AffectsVersionsMigration(BaseMigration):  # noqa: D101
+    JIRA_FIELDS = ("versions",)
+    JIRA_EXPAND = ()
+    FUSED_EXTRACTION = True
+
     def __init__(self, jira_client: JiraClient, op_client: OpenProjectClient) -> None:
         super().__init__(jira_client=jira_client, op_client=op_client)
 
@@ -50,18 +56,14 @@ class AffectsVersionsMigration(BaseMigration):  # noqa: D101
         keys = self._jira_keys_from_wp_map(wp_map)
         if not keys:
             return ComponentResult(success=True, data={"versions": {}})
-        issues = self._merge_batch_issues(keys)
-        versions_by_key: dict[str, list[str]] = {}
-        for k, issue in issues.items():
-            try:
-                fields = JiraIssueFields.from_issue_any(issue)
-                names = [v.name.strip() for v in fields.affects_versions if v.name and v.name.strip()]
-                if names:
-                    versions_by_key[k] = names
-            except Exception:
-                continue
+        versions_by_key: dict[str, list[str]] = self._issue_values(keys)
         return ComponentResult(success=True, data={"versions": versions_by_key})
 
+    def _extract_issue_value(self, key: str, issue: Any, fields: JiraIssueFields | None) -> list[str] | None:
+        if fields is None:
+            return None
+        return [v.name.strip() for v in fields.affects_versions if v.name and v.name.strip()] or None
+
     def _map(self, extracted: ComponentResult) -> ComponentResult:
         data = extracted.data or {}
         raw: dict[str, list[str]] = data.get("versions", {}) if isinstance(data, dict) else {}
@@ -85,6 +87,7 @@ class AffectsVersionsMigration(BaseMigration):  # noqa: D101
         failed = 0
         projects_with_values: set[int] = set()
 
+        values_by_wp: dict[int, str] = {}
         for jira_key, text in text_by_key.items():
             if not text:
                 continue
@@ -97,25 +100,17 @@ class AffectsVersionsMigration(BaseMigration):  # noqa: D101
                 # Corrupt or unsupported wp_map shape — skip silently to
                 # preserve the pre-typed call-site behaviour.
                 continue
-            wp_id = int(entry.openproject_id)
+            values_by_wp[int(entry.openproject_id)] = text
             # Track project for selective enablement
             if entry.openproject_project_id is not None:
                 projects_with_values.add(int(entry.openproject_project_id))
-            try:
-                val = escape_ruby_single_quoted(text)
-                script = (
-                    "wp = WorkPackage.find(%d); cf = CustomField.find(%d); "
-                    "cv = wp.custom_value_for(cf); if cv; cv.value = '%s'; cv.save; else; wp.custom_field_values = { cf.id => '%s' }; end; wp.save!; true"
-                    % (wp_id, cf_id, val, val)
-                )
-                ok = self.op_client.execute_query(script)
-                if ok:
-                    updated += 1
-                else:
-                    failed += 1
-            except Exception:
-                logger.exception("Failed to set Affects Versions for %s", jira_key)
-                failed += 1
+
+        if values_by_wp:
+            logger.info("Bulk setting %d affects versions values...", len(values_by_wp))
+            res = self.op_client.bulk_set_custom_values(cf_id, values_by_wp, touch_journal=True)
+            updated = int(res.get("updated", 0)) + int(res.get("unchanged", 0))
+            failed = int(res.get("failed", 0))
+            logger.info("Bulk affects versions: updated=%d, failed=%d", updated, failed)
 
         # Enable CF only for projects that have values
         if projects_with_values:
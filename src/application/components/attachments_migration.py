@@ -463,10 +463,10 @@ class AttachmentsMigration(BaseMigration):  # noqa: D101
         if not ops:
             return ComponentResult(success=True, updated=0, data={"attachment_mapping": {}})
 
-        # Copy files to container and build data payload for Rails script
-        logger.info("_load: transferring %d files to container", len(ops))
-        container_ops: list[dict[str, Any]] = []
-        for idx, op in enumerate(ops):
+        # Build the container payload, then copy all files in one tar stream
+        # (one SSH round trip per batch instead of ~6 per file).
+        pending: list[tuple[Path, dict[str, Any]]] = []
+        for op in ops:
             try:
                 local_path = Path(str(op["local_path"]))
                 if not local_path.exists():
@@ -476,32 +476,47 @@ class AttachmentsMigration(BaseMigration):  # noqa: D101
                     # operator sees the discrepancy.
                     self._loss_counters["load_local_file_missing"] += 1
                     continue
-                wp_id = int(op["work_package_id"])  # type: ignore[arg-type]
-                jira_key = str(op["jira_key"])
                 filename = str(op["filename"])
                 digest = str(op["digest"])
                 # Place in /tmp with digest prefix to avoid collisions
                 container_path = f"/tmp/j2o_att_{digest[:12]}_{os.path.basename(filename)}"
-                try:
-                    logger.info("_load: transferring file %d/%d: %s", idx + 1, len(ops), filename)
-                    self.op_client.transfer_file_to_container(local_path, container_path)
-                    logger.info("_load: transfer completed for %s", filename)
-                except Exception:
-                    logger.exception("File transfer failed for %s", local_path)
-                    self._loss_counters["load_transfer_failed"] += 1
-                    continue
-                container_ops.append(
-                    {
-                        "work_package_id": wp_id,
-                        "jira_key": jira_key,
-                        "filename": filename,
-                        "container_path": container_path,
-                    },
+                pending.append(
+                    (
+                        local_path,
+                        {
+                            "work_package_id": int(op["work_package_id"]),  # type: ignore[arg-type]
+                            "jira_key": str(op["jira_key"]),
+                            "filename": filename,
+                            "container_path": container_path,
+                        },
+                    ),
                 )
             except Exception:
                 self._loss_counters["load_per_op_exception"] += 1
                 continue
 
+        container_ops: list[dict[str, Any]] = []
+        if pending:
+            logger.info("_load: transferring %d files to container", len(pending))
+            try:
+                self.op_client.transfer_files_to_container(
+                    [(local_path, Path(op["container_path"])) for local_path, op in pending],
+                )
+                container_ops = [op for _local_path, op in pending]
+                logger.info("_load: batched transfer completed for %d files", len(pending))
+            except Exception:
+                # Isolate the offending file(s): retry one by one so a single
+                # bad file doesn't drop the whole batch.
+                logger.warning("_load: batched transfer failed; retrying %d files individually", len(pending))
+                for local_path, op in pending:
+                    try:
+                        self.op_client.transfer_file_to_container(local_path, op["container_path"])
+                    except Exception:
+                        logger.exception("File transfer failed for %s", local_path)
+                        self._loss_counters["load_transfer_failed"] += 1
+                        continue
+                    container_ops.append(op)
+
         if not container_ops:
             return ComponentResult(success=True, updated=0, data={"attachment_mapping": {}})
 
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Callable
+import sqlite3
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Any, ClassVar
 
@@ -14,11 +15,13 @@ from src.infrastructure.jira.jira_client import JiraClient
 from src.infrastructure.openproject.openproject_client import OpenProjectClient
 from src.infrastructure.persistence.mapping_repo import JsonFileMappingRepository
 from src.models import ComponentResult
+from src.models.jira import JiraIssueFields
 
 # Import dependencies
 from src.utils.change_aware_runner import ChangeAwareRunner
 from src.utils.change_detector import ChangeDetector, ChangeReport
 from src.utils.entity_cache import EntityCache
+from src.utils.jira_issue_store import JiraIssueStore, issue_from_raw, issue_store_enabled
 from src.utils.json_store import JsonStore
 
 
@@ -219,6 +222,28 @@ class BaseMigration:
     # example-style explanation above as commented-out code.
     DRY_RUN_SAFE: ClassVar[bool] = False
 
+    # Jira fields this component reads from ``_merge_batch_issues``.
+    # ``None`` (the default) fetches every field, for components that walk
+    # dynamic ``customfield_*`` attributes. ``JIRA_FIELD_NAMES`` lists
+    # custom-field display names that are resolved to field ids through
+    # ``JiraFieldService`` at fetch time; if one cannot be resolved the
+    # component falls back to every field.
+    JIRA_FIELDS: ClassVar[tuple[str, ...] | None] = None
+    JIRA_FIELD_NAMES: ClassVar[tuple[str, ...]] = ()
+    JIRA_EXPAND: ClassVar[tuple[str, ...]] = ("changelog",)
+
+    # Union of the projections of every projected component in the current
+    # run (``fields``, ``field_names``, ``expand``), set by the orchestrator
+    # through ``set_run_jira_projection`` so all of them request one shape.
+    _run_jira_projection: ClassVar[tuple[frozenset[str], frozenset[str], frozenset[str]] | None] = None
+
+    # Components that derive one value per issue set ``FUSED_EXTRACTION``
+    # and implement ``_extract_issue_value``; the orchestrator then runs all
+    # of them over a single pass of the issues (``run_fused_extraction``)
+    # and each reads its precomputed map through ``_issue_values``.
+    FUSED_EXTRACTION: ClassVar[bool] = False
+    _fused_issue_values: ClassVar[dict[type[BaseMigration], dict[str, Any]]] = {}
+
     def __init__(
         self,
         jira_client: JiraClient | None = None,
@@ -441,11 +466,73 @@ class BaseMigration:
 
     # ── DRY helper methods ─────────────────────────────────────────────
 
+    @classmethod
+    def set_run_jira_projection(cls, components: Iterable[type[BaseMigration]]) -> None:
+        """Record the union of the Jira projections declared by ``components``.
+
+        Components that keep ``JIRA_FIELDS = None`` do not contribute; they
+        still fetch every field. Passing no projected components clears the
+        run projection.
+        """
+        projected = [c for c in components if c.JIRA_FIELDS is not None]
+        if not projected:
+            cls._run_jira_projection = None
+            return
+        cls._run_jira_projection = (
+            frozenset(f for c in projected for f in c.JIRA_FIELDS or ()),
+            frozenset(n for c in projected for n in c.JIRA_FIELD_NAMES),
+            frozenset(e for c in projected for e in c.JIRA_EXPAND),
+        )
+
+    def _jira_fetch_projection(self) -> tuple[str | None, str | None]:
+        """Return the ``(fields, expand)`` arguments for ``batch_get_issues``.
+
+        Uses the run-wide union when the orchestrator set one (merged with
+        this component's own declaration), otherwise the component's own.
+        Resolved custom-field ids are kept in ``self._jira_field_ids`` so
+        extractors can look the values up by display name.
+        """
+        cls = type(self)
+        expand = set(cls.JIRA_EXPAND)
+        if cls.JIRA_FIELDS is None:
+            return None, ",".join(sorted(expand)) or None
+
+        fields = set(cls.JIRA_FIELDS)
+        names = set(cls.JIRA_FIELD_NAMES)
+        run = self._run_jira_projection
+        if run is not None:
+            fields |= run[0]
+            names |= run[1]
+            expand |= run[2]
+
+        self._jira_field_ids: dict[str, str] = {}
+        if names:
+            try:
+                resolved = self.jira_client.resolve_field_ids(sorted(names))
+                if isinstance(resolved, dict):
+                    self._jira_field_ids = resolved
+            except Exception as e:
+                config.logger.debug("Jira field id resolution failed: %s", e)
+            unresolved = [n for n in cls.JIRA_FIELD_NAMES if n not in self._jira_field_ids]
+            if unresolved:
+                config.logger.info(
+                    "Could not resolve Jira field(s) %s; fetching all fields for %s",
+                    unresolved,
+                    cls.__name__,
+                )
+                return None, ",".join(sorted(expand)) or None
+            fields |= set(self._jira_field_ids.values())
+        return ",".join(sorted(fields)), ",".join(sorted(expand)) or None
+
     def _merge_batch_issues(self, keys: list[str]) -> dict[str, Any]:
         """Fetch issues via batch_get_issues and merge batch results into a single dict.
 
         batch_get_issues may return list[dict] (from batch processor) or dict.
         This helper normalizes either return type into a single merged dict.
+        Components that declare ``JIRA_FIELDS`` only fetch those fields (see
+        ``_jira_fetch_projection``). Issues already in the shared Jira issue
+        store are read from disk; only the misses are fetched from Jira, and
+        full-field fetches are written back to the store.
 
         Args:
             keys: List of Jira issue keys to fetch
@@ -454,7 +541,25 @@ class BaseMigration:
             Merged dict mapping issue key to issue data
 
         """
-        result = self.jira_client.batch_get_issues(keys)
+        if type(self).JIRA_FIELDS is None:
+            fields, expand = None, "changelog"
+        else:
+            fields, expand = self._jira_fetch_projection()
+        stored = self._stored_jira_issues(
+            keys,
+            fields=fields.split(",") if fields else None,
+            expand=(expand or "").split(","),
+        )
+        missing = [k for k in keys if k not in stored]
+        if stored:
+            config.logger.info("Read %d of %d issues from the Jira issue store", len(stored), len(keys))
+        if stored and not missing:
+            return stored
+
+        if type(self).JIRA_FIELDS is None:
+            result = self.jira_client.batch_get_issues(missing)
+        else:
+            result = self.jira_client.batch_get_issues(missing, fields=fields, expand=expand)
         issues: dict[str, Any] = {}
         if isinstance(result, list):
             for batch_dict in result:
@@ -462,7 +567,143 @@ class BaseMigration:
                     issues.update(batch_dict)
         elif isinstance(result, dict):
             issues = result
-        return issues
+        if fields is None:
+            self._store_jira_issues(issues.values(), expand)
+        return {**stored, **issues}
+
+    def _prepare_issue_extraction(self) -> None:
+        """Load whatever ``_extract_issue_value`` needs before the issue pass."""
+
+    def _extract_issue_value(self, key: str, issue: Any, fields: JiraIssueFields | None) -> Any:
+        """Return this component's value for one issue, or ``None`` to skip it.
+
+        Args:
+            key: Jira issue key
+            issue: The issue as returned by ``_merge_batch_issues``
+            fields: Typed view of the issue fields, parsed once per issue
+                for all fused components; ``None`` if it does not validate
+
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _typed_issue_fields(issue: Any) -> JiraIssueFields | None:
+        try:
+            return JiraIssueFields.from_issue_any(issue)
+        except Exception:
+            return None
+
+    def _issue_values(self, keys: list[str]) -> dict[str, Any]:
+        """Return this component's ``_extract_issue_value`` results for ``keys``.
+
+        Served from the fused extraction stage when the orchestrator ran one
+        for this component; otherwise the issues are fetched and extracted
+        here.
+        """
+        fused = self._fused_issue_values.pop(type(self), None)
+        if fused is not None:
+            wanted = set(keys)
+            return {k: v for k, v in fused.items() if k in wanted}
+
+        issues = self._merge_batch_issues(keys)
+        self._prepare_issue_extraction()
+        values: dict[str, Any] = {}
+        for key, issue in issues.items():
+            try:
+                value = self._extract_issue_value(key, issue, self._typed_issue_fields(issue))
+            except Exception:
+                continue
+            if value is not None:
+                values[key] = value
+        return values
+
+    @classmethod
+    def run_fused_extraction(cls, components: Iterable[BaseMigration]) -> None:
+        """Extract the per-issue values of several components in one pass.
+
+        The issues of all migrated work packages are fetched once, with a
+        shape covering every component (all fields if any of them needs
+        them, otherwise the run projection), parsed into
+        :class:`JiraIssueFields` once per issue and dispatched to each
+        component's ``_extract_issue_value``. The resulting maps are kept
+        until each component reads its own through ``_issue_values``.
+        """
+        fused = [c for c in components if type(c).FUSED_EXTRACTION]
+        cls._fused_issue_values.clear()
+        if len(fused) < 2:
+            return
+        if cls._run_jira_projection is None:
+            cls.set_run_jira_projection(type(c) for c in fused)
+        lead = next((c for c in fused if type(c).JIRA_FIELDS is None), fused[0])
+
+        wp_map = lead.mappings.get_mapping("work_package") or {}
+        keys = lead._jira_keys_from_wp_map(wp_map)
+        if not keys:
+            return
+        issues = lead._merge_batch_issues(keys)
+        for component in fused:
+            component._prepare_issue_extraction()
+
+        values: dict[type[BaseMigration], dict[str, Any]] = {type(c): {} for c in fused}
+        for key, issue in issues.items():
+            fields = cls._typed_issue_fields(issue)
+            for component in fused:
+                try:
+                    value = component._extract_issue_value(key, issue, fields)
+                except Exception:
+                    continue
+                if value is not None:
+                    values[type(component)][key] = value
+        cls._fused_issue_values.update(values)
+        config.logger.info(
+            "Fused extraction: %d issues for %s",
+            len(issues),
+            ", ".join(type(c).__name__ for c in fused),
+        )
+
+    def _jira_issue_store(self) -> JiraIssueStore | None:
+        """Return the shared Jira issue store, or ``None`` when it is disabled."""
+        data_dir = getattr(self, "data_dir", None)
+        if data_dir is None or not issue_store_enabled():
+            return None
+        return JiraIssueStore.for_data_dir(data_dir)
+
+    def _store_jira_issues(self, issues: Iterable[Any], expand: str | None) -> None:
+        """Write full-field issues to the shared Jira issue store.
+
+        Best-effort: the store only saves later re-fetches, so a write
+        failure is logged and the migration continues.
+        """
+        store = self._jira_issue_store()
+        if store is None:
+            return
+        try:
+            store.upsert(issues, expand=expand)
+        except (sqlite3.Error, OSError) as e:
+            config.logger.warning("Could not write Jira issues to the issue store: %s", e)
+
+    def _stored_jira_issues(
+        self,
+        keys: Iterable[str],
+        *,
+        fields: Iterable[str] | None = None,
+        expand: Iterable[str] = (),
+    ) -> dict[str, Any]:
+        """Return issues for ``keys`` from the shared Jira issue store.
+
+        Hits are returned as SDK-shaped attribute views (see
+        :func:`~src.utils.jira_issue_store.issue_from_raw`); keys that are
+        not stored are omitted.
+        """
+        store = self._jira_issue_store()
+        if store is None:
+            return {}
+        try:
+            raws = store.get_many(keys, fields=fields, expand=expand)
+        except (sqlite3.Error, OSError) as e:
+            config.logger.warning("Could not read the Jira issue store: %s", e)
+            return {}
+        return {key: issue_from_raw(raw) for key, raw in raws.items()}
 
     # Pattern that all valid Jira issue keys must match: e.g. "TEST-123", "ABC_DEF-1"
     _JIRA_KEY_RE: ClassVar[re.Pattern[str]] = re.compile(r"^[A-Z][A-Z0-9_]*-\d+$")
@@ -26,7 +26,7 @@ shape Phase 7 set out to retire — it is normalised through
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from src.application.components.base_migration import BaseMigration, register_entity_types
 from src.config import logger
@@ -34,9 +34,14 @@ from src.infrastructure.jira.jira_client import JiraClient
 from src.infrastructure.openproject.openproject_client import OpenProjectClient
 from src.models import ComponentResult, WorkPackageMappingEntry
 
+if TYPE_CHECKING:
+    from src.models.jira import JiraIssueFields
+
 
 @register_entity_types("customfields_generic")
 class CustomFieldsGenericMigration(BaseMigration):  # noqa: D101
+    FUSED_EXTRACTION = True
+
     def __init__(self, jira_client: JiraClient, op_client: OpenProjectClient) -> None:
         super().__init__(jira_client=jira_client, op_client=op_client)
 
@@ -71,13 +76,10 @@ class CustomFieldsGenericMigration(BaseMigration):  # noqa: D101
         """Extract unmapped customfield_* values per issue mapped to a WP."""
         wp_map = self.mappings.get_mapping("work_package") or {}
         keys = self._jira_keys_from_wp_map(wp_map)
-        issues = self._merge_batch_issues(keys)
-
-        # Use existing CF mapping to decide names/types
-        cf_mapping = self.mappings.get_mapping("custom_field") or {}
+        cf_specs_by_key: dict[str, list[tuple[str, str, str]]] = self._issue_values(keys)
 
         # Production wp_map is keyed by the numeric Jira ID with the human key
-        # nested under ``jira_key``; ``issues`` is keyed by the human key. Index
+        # nested under ``jira_key``; the extracted values are keyed by the human key. Index
         # entries by their human key so the lookup below works for both the
         # production (numeric-ID) and legacy/test (human-key) mapping shapes
         # instead of silently skipping every issue (#260).
@@ -89,13 +91,7 @@ class CustomFieldsGenericMigration(BaseMigration):  # noqa: D101
 
         values_by_wp: dict[int, list[tuple[str, str, str]]] = {}
         wp_to_project: dict[int, int] = {}  # Track project ID for each WP
-        for jira_key, issue in issues.items():
-            # Walk raw ``fields`` for dynamic ``customfield_*`` attributes —
-            # the per-tenant set of CFs is not modelled by JiraIssueFields,
-            # so attribute access on the underlying object is correct here.
-            fields = getattr(issue, "fields", None)
-            if not fields:
-                continue
+        for jira_key, cf_specs in cf_specs_by_key.items():
             raw_entry = entry_by_jira_key.get(jira_key)
             if raw_entry is None:
                 continue
@@ -109,27 +105,47 @@ class CustomFieldsGenericMigration(BaseMigration):  # noqa: D101
             # Track project ID for selective enablement
             if entry.openproject_project_id is not None:
                 wp_to_project[wp_id] = int(entry.openproject_project_id)
+            values_by_wp.setdefault(wp_id, []).extend(cf_specs)
 
-            # Iterate over fields attributes beginning with customfield_
-            for attr in dir(fields):
-                if not attr.startswith("customfield_"):
-                    continue
-                cf_id = attr
-                cf_value = getattr(fields, attr, None)
-                if cf_value in (None, "", [], {}):
-                    continue
+        return ComponentResult(success=True, data={"values_by_wp": values_by_wp, "wp_to_project": wp_to_project})
 
-                # Map to OP CF name/type using mapping; fallback to using Jira ID as name
-                map_entry = cf_mapping.get(cf_id, {}) if isinstance(cf_mapping, dict) else {}
-                op_name = map_entry.get("openproject_name") or map_entry.get("jira_name") or cf_id
-                op_type = map_entry.get("openproject_type", "text")
+    def _prepare_issue_extraction(self) -> None:
+        # Use existing CF mapping to decide names/types
+        cf_mapping = self.mappings.get_mapping("custom_field") or {}
+        self._cf_mapping: dict[str, Any] = cf_mapping if isinstance(cf_mapping, dict) else {}
+
+    def _extract_issue_value(
+        self,
+        key: str,
+        issue: Any,
+        fields: JiraIssueFields | None,
+    ) -> list[tuple[str, str, str]] | None:
+        # Walk raw ``fields`` for dynamic ``customfield_*`` attributes —
+        # the per-tenant set of CFs is not modelled by JiraIssueFields,
+        # so attribute access on the underlying object is correct here.
+        raw_fields = getattr(issue, "fields", None)
+        if not raw_fields:
+            return None
+        cf_specs: list[tuple[str, str, str]] = []
+        # Iterate over fields attributes beginning with customfield_
+        for attr in dir(raw_fields):
+            if not attr.startswith("customfield_"):
+                continue
+            cf_id = attr
+            cf_value = getattr(raw_fields, attr, None)
+            if cf_value in (None, "", [], {}):
+                continue
 
-                norm_value = self._to_string_value(cf_value)
-                if not norm_value:
-                    continue
-                values_by_wp.setdefault(wp_id, []).append((op_name, op_type, norm_value))
+            # Map to OP CF name/type using mapping; fallback to using Jira ID as name
+            map_entry = self._cf_mapping.get(cf_id, {})
+            op_name = map_entry.get("openproject_name") or map_entry.get("jira_name") or cf_id
+            op_type = map_entry.get("openproject_type", "text")
 
-        return ComponentResult(success=True, data={"values_by_wp": values_by_wp, "wp_to_project": wp_to_project})
+            norm_value = self._to_string_value(cf_value)
+            if not norm_value:
+                continue
+            cf_specs.append((op_name, op_type, norm_value))
+        return cf_specs or None
 
     def _load(self, mapped: ComponentResult) -> ComponentResult:
         from src.infrastructure.openproject.openproject_client import escape_ruby_single_quoted
@@ -11,7 +11,7 @@ Maps to OpenProject attributes:
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from src.application.components.base_migration import BaseMigration, register_entity_types
 from src.config import logger
@@ -19,25 +19,58 @@ from src.infrastructure.jira.jira_client import JiraClient
 from src.infrastructure.openproject.openproject_client import OpenProjectClient
 from src.models import ComponentResult, WorkPackageMappingEntry
 
+if TYPE_CHECKING:
+    from src.models.jira import JiraIssueFields
+
 HOURS_PER_DAY = 8
 DAYS_PER_WEEK = 5
 
 
 @register_entity_types("estimates")
 class EstimatesMigration(BaseMigration):  # noqa: D101
+    JIRA_FIELDS = ("timeoriginalestimate", "timeestimate", "timetracking")
+    JIRA_EXPAND = ()
+    FUSED_EXTRACTION = True
+
     def __init__(self, jira_client: JiraClient, op_client: OpenProjectClient) -> None:
         super().__init__(jira_client=jira_client, op_client=op_client)
 
     def _extract(self) -> ComponentResult:
-        """Extract issues for which we have work package mappings."""
+        """Extract (original, remaining) estimate hours per issue mapped to a WP."""
         wp_map = self.mappings.get_mapping("work_package") or {}
         jira_keys = self._jira_keys_from_wp_map(wp_map)
         if not jira_keys:
-            return ComponentResult(success=True, extracted=0, data={"issues": {}})
+            return ComponentResult(success=True, extracted=0, data={"estimates": {}})
 
-        issues: dict[str, Any] = self._merge_batch_issues(jira_keys)
+        estimates: dict[str, tuple[float | None, float | None]] = self._issue_values(jira_keys)
 
-        return ComponentResult(success=True, extracted=len(issues), data={"issues": issues})
+        return ComponentResult(success=True, extracted=len(estimates), data={"estimates": estimates})
+
+    def _extract_issue_value(
+        self,
+        key: str,
+        issue: Any,
+        fields: JiraIssueFields | None,
+    ) -> tuple[float | None, float | None] | None:
+        raw_fields = getattr(issue, "fields", None)
+        if not raw_fields:
+            return None
+        # Prefer explicit seconds fields when available
+        orig_hours = self._seconds_to_hours(getattr(raw_fields, "timeoriginalestimate", None))
+        rem_hours = self._seconds_to_hours(getattr(raw_fields, "timeestimate", None))
+
+        # Fall back to timetracking strings
+        if orig_hours is None or rem_hours is None:
+            tt = getattr(raw_fields, "timetracking", None)
+            if tt:
+                if orig_hours is None:
+                    orig_hours = self._parse_estimate_string_to_hours(getattr(tt, "originalEstimate", None))
+                if rem_hours is None:
+                    rem_hours = self._parse_estimate_string_to_hours(getattr(tt, "remainingEstimate", None))
+
+        if orig_hours is None and rem_hours is None:
+            return None
+        return orig_hours, rem_hours
 
     @staticmethod
     def _parse_estimate_string_to_hours(value: str | None) -> float | None:
@@ -84,14 +117,16 @@ class EstimatesMigration(BaseMigration):  # noqa: D101
             return None
 
     def _map(self, extracted: ComponentResult) -> ComponentResult:
-        issues: dict[str, Any] = (extracted.data or {}).get("issues", {}) if extracted.data else {}
-        if not issues:
+        estimates: dict[str, tuple[float | None, float | None]] = (
+            (extracted.data or {}).get("estimates", {}) if extracted.data else {}
+        )
+        if not estimates:
             return ComponentResult(success=True, data={"updates": []})
 
         wp_map = self.mappings.get_mapping("work_package") or {}
         updates: list[dict[str, Any]] = []
 
-        for key, issue in issues.items():
+        for key, (orig_hours, rem_hours) in estimates.items():
             try:
                 wp_entry = wp_map.get(key)
                 if wp_entry is None:
@@ -107,28 +142,6 @@ class EstimatesMigration(BaseMigration):  # noqa: D101
                 if not wp_id:
                     continue
 
-                fields = getattr(issue, "fields", None)
-                if not fields:
-                    continue
-                # Prefer explicit seconds fields when available
-                orig_sec = getattr(fields, "timeoriginalestimate", None)
-                rem_sec = getattr(fields, "timeestimate", None)
-                orig_hours = self._seconds_to_hours(orig_sec)
-                rem_hours = self._seconds_to_hours(rem_sec)
-
-                # Fall back to timetracking strings
-                if orig_hours is None or rem_hours is None:
-                    tt = getattr(fields, "timetracking", None)
-                    if tt:
-                        if orig_hours is None:
-                            orig_hours = self._parse_estimate_string_to_hours(
-                                getattr(tt, "originalEstimate", None),
-                            )
-                        if rem_hours is None:
-                            rem_hours = self._parse_estimate_string_to_hours(
-                                getattr(tt, "remainingEstimate", None),
-                            )
-
                 update_rec: dict[str, Any] = {"id": int(wp_id)}
                 if orig_hours is not None:
                     update_rec["estimated_hours"] = float(orig_hours)
@@ -14,12 +14,10 @@ no Jira issue / user payloads to parse through :class:`JiraIssueFields`
 / :class:`JiraUser` here. The remaining ``isinstance(...)`` branches
 guard the two Ruby boundary helpers this migration uses:
 
-* :meth:`OpenProjectClient.execute_query` is typed as returning ``str``
-  (raw Rails console output), but in practice the runner's wrapper
-  returns ``{"status": "success"|"error", "output": <text>}`` envelopes
-  -- the dict-shape ``isinstance`` checks are defensive guards that
-  also surface a typed error result when the wrapper unexpectedly
-  yields a raw string.
+* :meth:`OpenProjectClient.reconcile_records` returns a mapping with
+  ``existing`` / ``created`` / ``conflicts`` / ``errors`` lists for the
+  desired type set; the branches map each entry back to the Jira types
+  by record index.
 * :meth:`OpenProjectClient.bulk_create_records` returns a mapping with
   ``created`` / ``existing`` / ``errors`` lists; the branches drive
   the per-type creation counters from those lists.
@@ -33,7 +31,6 @@ from __future__ import annotations
 
 import json
 import os
-import re
 from pathlib import Path
 from typing import Any, ClassVar
 
@@ -41,7 +38,8 @@ from src import config
 from src.application.components.base_migration import BaseMigration, register_entity_types
 from src.display import console
 from src.infrastructure.jira.jira_client import JiraClient
-from src.infrastructure.openproject.openproject_client import OpenProjectClient, escape_ruby_single_quoted
+from src.infrastructure.openproject.openproject_client import OpenProjectClient
+from src.infrastructure.openproject.openproject_records_service import metadata_reconcile_enabled
 from src.models import ComponentResult, MigrationError
 
 
@@ -502,164 +500,35 @@ class IssueTypeMigration(BaseMigration):
 
         """
         type_name = type_data.get("openproject_name", "")
-        type_color = type_data.get("color", "#1A67A3")
-        is_milestone = type_data.get("is_milestone", False)
+        is_milestone = bool(type_data.get("is_milestone", False))
 
         self.logger.info(
             "Creating work package type '%s' via Rails console...",
             type_name,
         )
 
-        # Check if the type already exists to avoid duplicates
-        # Use parameterized query to prevent Rails injection
-        safe_type_name = escape_ruby_single_quoted(type_name)
-        check_command = f"existing_type = Type.where(\"name ilike ?\", '{safe_type_name}').first"
-        check_result = self.op_client.execute_query(check_command)
-        self.logger.debug(
-            f"check_result type: {type(check_result)}, value: {check_result}",
-        )
-        if not isinstance(check_result, dict):
-            self.logger.error(
-                f"Expected dict from execute_query, got {type(check_result)}: {check_result}",
-            )
-            return {
-                "status": "error",
-                "error": "Invalid result type from execute_query (check_result)",
-            }
-
-        exists_command = "existing_type.present?"
-        exists_result = self.op_client.execute_query(exists_command)
-        self.logger.debug(
-            f"exists_result type: {type(exists_result)}, value: {exists_result}",
-        )
-        if not isinstance(exists_result, dict):
-            self.logger.error(
-                f"Expected dict from execute_query, got {type(exists_result)}: {exists_result}",
-            )
-            return {
-                "status": "error",
-                "error": "Invalid result type from execute_query (exists_result)",
-            }
-
-        if exists_result["status"] == "success" and "true" in exists_result["output"]:
-            self.logger.info(
-                "Work package type '%s' already exists, retrieving ID",
-                type_name,
-            )
-            id_command = "existing_type.id"
-            id_result = self.op_client.execute_query(id_command)
-            self.logger.debug(f"id_result type: {type(id_result)}, value: {id_result}")
-            if not isinstance(id_result, dict):
-                self.logger.error(
-                    f"Expected dict from execute_query, got {type(id_result)}: {id_result}",
-                )
-                return {
-                    "status": "error",
-                    "error": "Invalid result type from execute_query (id_result)",
-                }
-
-            if id_result["status"] == "success" and id_result["output"].strip().isdigit():
-                type_id = int(id_result["output"].strip())
-                return {
-                    "status": "success",
-                    "message": "Work package type already exists",
-                    "id": type_id,
-                }
-            self.logger.warning(
-                "Failed to retrieve ID for existing type '%s'",
-                type_name,
-            )
-
-        # Create the type with proper escaping to prevent Rails injection
-        milestone_flag = "true" if is_milestone else "false"
-        safe_type_color = escape_ruby_single_quoted(type_color)
-
-        command = f"""
-        begin
-          type = Type.create!(
-            name: '{safe_type_name}',
-            color: '{safe_type_color}',
-            is_milestone: {milestone_flag},
-            is_default: false,
-            is_standard: true,
-            position: Type.count + 1,
-            attribute_groups: Type.new.default_attribute_groups
-          )
-          type_id = type.id
-          {{id: type_id, name: type.name, status: :success}}
-        rescue => e
-          {{status: :error, message: e.message}}
-        end
-        """
-
-        result = self.op_client.execute_query(command)
-        self.logger.debug(f"result type: {type(result)}, value: {result}")
-        if not isinstance(result, dict):
-            self.logger.error(
-                f"Expected dict from execute_query, got {type(result)}: {result}",
-            )
-            return {
-                "status": "error",
-                "error": "Invalid result type from execute_query (result)",
-            }
-
-        # Parse the result
-        output = result.get("output", "")
-
-        if "status: :error" in output:
-            error_msg = "Unknown error"
-            error_match = re.search(r'message: "([^"]+)"', output)
-            if error_match:
-                error_msg = error_match.group(1)
-
-            self.logger.error(
-                "Error creating work package type '%s': %s",
-                type_name,
-                error_msg,
-            )
-            return {"status": "error", "error": error_msg}
-
-        # Extract ID if successful
-        id_match = re.search(r"id: (\d+)", output)
-        if id_match:
-            type_id = int(id_match.group(1))
-            self.logger.info(
-                "Created work package type '%s' with ID %s",
-                type_name,
-                type_id,
-            )
-
-            # Verify the type exists by querying it (type_id is safe as it's an integer)
-            verify_command = f"Type.find({type_id}).present? rescue false"
-            verify_result = self.op_client.execute_query(verify_command)
-            self.logger.debug(
-                f"verify_result type: {type(verify_result)}, value: {verify_result}",
-            )
-            if not isinstance(verify_result, dict):
-                self.logger.error(
-                    f"Expected dict from execute_query, got {type(verify_result)}: {verify_result}",
-                )
-                return {
-                    "status": "error",
-                    "error": "Invalid result type from execute_query (verify_result)",
-                }
-
-            if verify_result["status"] == "success" and "true" in verify_result["output"]:
-                self.logger.info(
-                    "Verified work package type '%s' with ID %s exists",
-                    type_name,
-                    type_id,
-                )
-                return {"status": "success", "id": type_id, "name": type_name}
-            self.logger.warning(
-                "Created type but failed verification: %s",
-                verify_result.get("output", "Unknown error"),
+        # One round-trip: the lookup (case-insensitive) and the create
+        # happen in the same Rails call.
+        try:
+            result = self.op_client.reconcile_records(
+                "Type",
+                [{"name": type_name, "is_milestone": is_milestone, "is_default": False}],
             )
+        except Exception as e:
+            self.logger.error("Error creating work package type '%s': %s", type_name, e)
+            return {"status": "error", "error": str(e)}
 
-        self.logger.warning("Failed to parse type ID from Rails response: %s", output)
+        for item in result.get("existing", []) + result.get("conflicts", []):
+            self.logger.info("Work package type '%s' already exists with ID %s", type_name, item.get("id"))
+            return {"status": "success", "message": "Work package type already exists", "id": item.get("id")}
+        for item in result.get("created", []):
+            self.logger.info("Created work package type '%s' with ID %s", type_name, item.get("id"))
+            return {"status": "success", "id": item.get("id"), "name": item.get("name", type_name)}
 
-        # If we reached here without returning, assume success but couldn't get ID
-        return {"status": "success", "name": type_name}
+        errors = [msg for err in result.get("errors", []) for msg in err.get("errors", [])]
+        error_msg = "; ".join(errors) or "Unknown error"
+        self.logger.error("Error creating work package type '%s': %s", type_name, error_msg)
+        return {"status": "error", "error": error_msg}
 
     def _resolve_name_taken_errors(
         self,
@@ -715,6 +584,105 @@ class IssueTypeMigration(BaseMigration):
 
         return resolved, unresolved
 
+    def _persist_issue_type_mapping(self) -> None:
+        """Persist the type mappings and record provenance for the mapped types."""
+        config.mappings.set_mapping("issue_type", self.issue_type_mapping)
+        final_mapping = {}
+        for m in self.issue_type_mapping.values():
+            jira_id = m["jira_id"]
+            op_id = m.get("openproject_id")
+            if op_id:
+                final_mapping[jira_id] = op_id
+        config.mappings.set_mapping("issue_type_id", final_mapping)
+
+        # Record provenance for successfully migrated issue types
+        # This enables restoration of mappings from OP alone without local files
+        provenance_mappings = [
+            {
+                "jira_key": str(m.get("jira_id", "")),  # Use Jira type ID as key
+                "jira_name": m.get("jira_name"),
+                "op_entity_id": m["openproject_id"],
+            }
+            for m in self.issue_type_mapping.values()
+            if m.get("openproject_id")
+        ]
+        if provenance_mappings:
+            try:
+                result = self.op_client.bulk_record_entity_provenance("type", provenance_mappings)
+                self.logger.info(
+                    "Recorded type provenance: %d success, %d failed",
+                    result.get("success", 0),
+                    result.get("failed", 0),
+                )
+            except Exception as prov_err:
+                self.logger.warning("Failed to record type provenance: %s", prov_err)
+
+    def _reconcile_issue_types(self) -> None:
+        """Map and create all unmapped types with one ``reconcile_records`` call.
+
+        Raises:
+            MigrationError: If the call fails or some types could not be created
+
+        """
+        records: list[dict[str, Any]] = []
+        seen: set[str] = set()
+        for mapping in self.issue_type_mapping.values():
+            name = mapping.get("openproject_name") or ""
+            if mapping.get("openproject_id") is None and name and name.lower() not in seen:
+                seen.add(name.lower())
+                records.append(
+                    {
+                        "name": name,
+                        "is_milestone": bool(mapping.get("is_milestone", False)),
+                        "is_default": bool(mapping.get("is_default", False)),
+                    },
+                )
+        if not records:
+            self.logger.info("No new work package types to create")
+            self._persist_issue_type_mapping()
+            return
+
+        try:
+            result = self.op_client.reconcile_records("Type", records, compare=("is_milestone",), timeout=120)
+        except Exception as e:
+            msg = f"Error during Type reconciliation: {e}"
+            self.logger.exception(msg)
+            raise MigrationError(msg) from e
+
+        matched_by = {"existing": "found_existing", "conflicts": "found_existing", "created": "created"}
+        for bucket, label in matched_by.items():
+            for item in result.get(bucket, []):
+                idx = item.get("index")
+                if not isinstance(idx, int) or not (0 <= idx < len(records)):
+                    continue
+                name = records[idx]["name"].lower()
+                if bucket == "conflicts":
+                    self.logger.warning(
+                        "Work package type '%s' exists with different settings %s; mapping to it anyway",
+                        records[idx]["name"],
+                        item.get("fields"),
+                    )
+                for mapping in self.issue_type_mapping.values():
+                    same_name = (mapping.get("openproject_name") or "").lower() == name
+                    if same_name and mapping.get("openproject_id") is None:
+                        mapping["openproject_id"] = item.get("id")
+                        mapping["matched_by"] = label
+
+        self.logger.info(
+            "Reconciled %d work package types: %d existing, %d created, %d conflicts, %d errors",
+            len(records),
+            len(result.get("existing", [])),
+            len(result.get("created", [])),
+            len(result.get("conflicts", [])),
+            len(result.get("errors", [])),
+        )
+        self._persist_issue_type_mapping()
+
+        errors = result.get("errors", [])
+        if errors:
+            msg = f"Failed to create {len(errors)} work package types"
+            raise MigrationError(msg)
+
     def migrate_issue_types_via_rails(self, window: int = 0, pane: int = 0) -> None:
         """Migrate issue types directly via the Rails console using a bulk operation.
 
@@ -732,6 +700,10 @@ class IssueTypeMigration(BaseMigration):
         if not self.issue_type_mapping:
             self.create_issue_type_mapping()
 
+        if metadata_reconcile_enabled():
+            self._reconcile_issue_types()
+            return
+
         # Get existing types to avoid creating duplicates
         existing_types = self.check_existing_work_package_types()
         existing_names = [type_data.get("name", "").lower() for type_data in existing_types]
@@ -865,37 +837,7 @@ class IssueTypeMigration(BaseMigration):
                         resolved,
                     )
 
-            # Persist mappings
-            config.mappings.set_mapping("issue_type", self.issue_type_mapping)
-            final_mapping = {}
-            for m in self.issue_type_mapping.values():
-                jira_id = m["jira_id"]
-                op_id = m.get("openproject_id")
-                if op_id:
-                    final_mapping[jira_id] = op_id
-            config.mappings.set_mapping("issue_type_id", final_mapping)
-
-            # Record provenance for successfully migrated issue types
-            # This enables restoration of mappings from OP alone without local files
-            provenance_mappings = [
-                {
-                    "jira_key": str(m.get("jira_id", "")),  # Use Jira type ID as key
-                    "jira_name": m.get("jira_name"),
-                    "op_entity_id": m["openproject_id"],
-                }
-                for m in self.issue_type_mapping.values()
-                if m.get("openproject_id")
-            ]
-            if provenance_mappings:
-                try:
-                    result = self.op_client.bulk_record_entity_provenance("type", provenance_mappings)
-                    self.logger.info(
-                        "Recorded type provenance: %d success, %d failed",
-                        result.get("success", 0),
-                        result.get("failed", 0),
-                    )
-                except Exception as prov_err:
-                    self.logger.warning("Failed to record type provenance: %s", prov_err)
+            self._persist_issue_type_mapping()
 
             if errors:
                 self.logger.warning("Some work package types failed to create: %s", len(errors))
@@ -21,6 +21,10 @@ LABELS_CF_NAME = "Labels"
 
 @register_entity_types("labels")
 class LabelsMigration(BaseMigration):  # noqa: D101
+    JIRA_FIELDS = ("labels",)
+    JIRA_EXPAND = ()
+    FUSED_EXTRACTION = True
+
     def __init__(
         self,
         jira_client: JiraClient,
@@ -61,17 +65,14 @@ class LabelsMigration(BaseMigration):  # noqa: D101
         """
         wp_map = self.mappings.get_mapping("work_package") or {}
         keys = self._jira_keys_from_wp_map(wp_map)
-        issues = self._merge_batch_issues(keys)
-        labels_by_key: dict[str, list[str]] = {}
-        for k, issue in issues.items():
-            try:
-                fields = JiraIssueFields.from_issue_any(issue)
-                if fields.labels:
-                    labels_by_key[k] = [label for label in fields.labels if label.strip()]
-            except Exception:
-                continue
+        labels_by_key: dict[str, list[str]] = self._issue_values(keys)
         return ComponentResult(success=True, data={"labels": labels_by_key})
 
+    def _extract_issue_value(self, key: str, issue: Any, fields: JiraIssueFields | None) -> list[str] | None:
+        if fields is None or not fields.labels:
+            return None
+        return [label for label in fields.labels if label.strip()]
+
     def _map(self, extracted: ComponentResult) -> ComponentResult:
         data = extracted.data or {}
         raw: dict[str, list[str]] = data.get("labels", {}) if isinstance(data, dict) else {}
@@ -19,6 +19,10 @@ from src.models.jira import JiraIssueFields
 
 @register_entity_types("native_tags")
 class NativeTagsMigration(BaseMigration):  # noqa: D101
+    JIRA_FIELDS = ("labels",)
+    JIRA_EXPAND = ()
+    FUSED_EXTRACTION = True
+
     def __init__(self, jira_client: JiraClient, op_client: OpenProjectClient) -> None:
         super().__init__(jira_client=jira_client, op_client=op_client)
 
@@ -42,18 +46,15 @@ class NativeTagsMigration(BaseMigration):  # noqa: D101
         keys = self._jira_keys_from_wp_map(wp_map)
         if not keys:
             return ComponentResult(success=True, data={"by_key": {}})
-        issues = self._merge_batch_issues(keys)
-        by_key: dict[str, list[str]] = {}
-        for k, issue in issues.items():
-            try:
-                fields = JiraIssueFields.from_issue_any(issue)
-                labels = [v.strip() for v in fields.labels if v and v.strip()]
-                if labels:
-                    by_key[k] = sorted(set(labels))
-            except Exception:
-                continue
+        by_key: dict[str, list[str]] = self._issue_values(keys)
         return ComponentResult(success=True, data={"by_key": by_key})
 
+    def _extract_issue_value(self, key: str, issue: Any, fields: JiraIssueFields | None) -> list[str] | None:
+        if fields is None:
+            return None
+        labels = [v.strip() for v in fields.labels if v and v.strip()]
+        return sorted(set(labels)) or None
+
     def _map(self, extracted: ComponentResult) -> ComponentResult:
         data = extracted.data or {}
         by_key: dict[str, list[str]] = data.get("by_key", {}) if isinstance(data, dict) else {}
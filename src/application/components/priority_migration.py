@@ -9,6 +9,7 @@ from src.config import logger
 from src.domain.repositories import MappingRepository
 from src.infrastructure.jira.jira_client import JiraClient
 from src.infrastructure.openproject.openproject_client import OpenProjectClient
+from src.infrastructure.openproject.openproject_records_service import metadata_reconcile_enabled
 from src.models import ComponentResult, JiraPriority
 from src.models.jira import JiraIssueFields
 
@@ -17,6 +18,9 @@ from src.models.jira import JiraIssueFields
 class PriorityMigration(BaseMigration):
     """Migrate priorities and set on work packages."""
 
+    JIRA_FIELDS = ("priority",)
+    JIRA_EXPAND = ()
+
     def __init__(
         self,
         jira_client: JiraClient,
@@ -79,6 +83,8 @@ class PriorityMigration(BaseMigration):
     def _map(self, extracted: ComponentResult) -> ComponentResult:
         """Map Jira priority names to OP IssuePriority records, create missing."""
         priorities: list[JiraPriority] = (extracted.data or {}).get("priorities", []) if extracted.data else []
+        if metadata_reconcile_enabled():
+            return self._reconcile_priorities(priorities)
         created = 0
         mapping: dict[str, int] = {}
 
@@ -108,6 +114,34 @@ class PriorityMigration(BaseMigration):
         self.mappings.set_mapping("priority", mapping)
         return ComponentResult(success=True, created_types=created, data={"mapping": mapping})
 
+    def _reconcile_priorities(self, priorities: list[JiraPriority]) -> ComponentResult:
+        """Map and create all priorities with one ``reconcile_records`` call."""
+        names = list(dict.fromkeys(pr.name for pr in priorities if pr.name))
+        mapping: dict[str, int] = {}
+        created = 0
+        if names:
+            try:
+                result = self.op_client.reconcile_records(
+                    "IssuePriority",
+                    [{"name": name, "active": True} for name in names],
+                )
+            except Exception:
+                logger.exception("Failed reconciling IssuePriorities")
+                result = {}
+            for bucket in ("existing", "conflicts", "created"):
+                for item in result.get(bucket, []):
+                    idx = item.get("index")
+                    if isinstance(idx, int) and 0 <= idx < len(names) and item.get("id"):
+                        mapping[names[idx]] = int(item["id"])
+                        created += bucket == "created"
+            for err in result.get("errors", []):
+                idx = err.get("index")
+                name = names[idx] if isinstance(idx, int) and 0 <= idx < len(names) else "?"
+                logger.error("Failed creating IssuePriority %s: %s", name, "; ".join(err.get("errors", [])))
+
+        self.mappings.set_mapping("priority", mapping)
+        return ComponentResult(success=True, created_types=created, data={"mapping": mapping})
+
     def _load(self, mapped: ComponentResult) -> ComponentResult:
         """Set priority on work packages using the mapping if missing or different."""
         mapping: dict[str, int] = (mapped.data or {}).get("mapping", {}) if mapped.data else {}
@@ -224,11 +224,22 @@ class RelationMigration(BaseMigration):
             self._wp_key_map = {}
 
         # Batch get issues using jira_client
-        # First check for cached issues from work_packages_content migration
-        issues: dict[str, Any] = {}
+        # Prefer the shared Jira issue store written by the work package
+        # fetch (only ``issuelinks`` is read; misses are fetched from Jira),
+        # then the legacy monolithic JSON cache.
+        issues: dict[str, Any] = self._stored_jira_issues(jira_keys, fields=("issuelinks",))
         cache_file = self.data_dir / "jira_issues_cache.json"
-        logger.info("Checking for cached issues at: %s (exists=%s)", cache_file, cache_file.exists())
-        if cache_file.exists():
+        if issues:
+            missing = [k for k in jira_keys if k not in issues]
+            logger.info(
+                "Using %d issues from the Jira issue store (%d to fetch)",
+                len(issues),
+                len(missing),
+            )
+            if missing:
+                issues.update(self._merge_batch_issues(missing))
+        elif cache_file.exists():
+            logger.info("Checking for cached issues at: %s", cache_file)
             try:
                 import json
 
@@ -6,6 +6,8 @@ This avoids CF proliferation and presents links inline for users.
 
 from __future__ import annotations
 
+from typing import Any
+
 from src.application.components.base_migration import BaseMigration, register_entity_types
 from src.config import logger
 from src.infrastructure.jira.jira_client import JiraClient
@@ -18,6 +20,10 @@ SECTION_TITLE = "Remote Links"
 
 @register_entity_types("remote_links")
 class RemoteLinksMigration(BaseMigration):  # noqa: D101
+    JIRA_FIELDS = ("issuelinks",)
+    JIRA_EXPAND = ()
+    FUSED_EXTRACTION = True
+
     def __init__(self, jira_client: JiraClient, op_client: OpenProjectClient) -> None:
         super().__init__(jira_client=jira_client, op_client=op_client)
 
@@ -44,18 +50,19 @@ class RemoteLinksMigration(BaseMigration):  # noqa: D101
         keys = self._jira_keys_from_wp_map(wp_map)
         if not keys:
             return ComponentResult(success=True, data={"links": {}})
-        issues = self._merge_batch_issues(keys)
-        links_by_key: dict[str, list[tuple[str, str]]] = {}
-        for k, issue in issues.items():
-            try:
-                fields = JiraIssueFields.from_issue_any(issue)
-                pairs = self._extract_links_from_fields(fields)
-                if pairs:
-                    links_by_key[k] = pairs
-            except Exception:
-                continue
+        links_by_key: dict[str, list[tuple[str, str]]] = self._issue_values(keys)
         return ComponentResult(success=True, data={"links": links_by_key})
 
+    def _extract_issue_value(
+        self,
+        key: str,
+        issue: Any,
+        fields: JiraIssueFields | None,
+    ) -> list[tuple[str, str]] | None:
+        if fields is None:
+            return None
+        return self._extract_links_from_fields(fields) or None
+
     def _map(self, extracted: ComponentResult) -> ComponentResult:
         data = extracted.data or {}
         raw: dict[str, list[tuple[str, str]]] = data.get("links", {}) if isinstance(data, dict) else {}
@@ -25,6 +25,9 @@ RESOLUTION_CF_NAME = "Resolution"
 
 @register_entity_types("resolutions")
 class ResolutionMigration(BaseMigration):  # noqa: D101
+    JIRA_FIELDS = ("resolution",)
+    JIRA_EXPAND = ()
+
     def __init__(self, jira_client: JiraClient, op_client: OpenProjectClient) -> None:
         super().__init__(jira_client=jira_client, op_client=op_client)
 
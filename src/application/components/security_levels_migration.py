@@ -11,7 +11,7 @@ from typing import Any
 from src.application.components.base_migration import BaseMigration, register_entity_types
 from src.config import logger
 from src.infrastructure.jira.jira_client import JiraClient
-from src.infrastructure.openproject.openproject_client import OpenProjectClient, escape_ruby_single_quoted
+from src.infrastructure.openproject.openproject_client import OpenProjectClient
 from src.models import ComponentResult, WorkPackageMappingEntry
 from src.models.jira import JiraIssueFields
 
@@ -20,6 +20,10 @@ SECURITY_LEVEL_CF_NAME = "Security Level"
 
 @register_entity_types("security_levels")
 class SecurityLevelsMigration(BaseMigration):  # noqa: D101
+    JIRA_FIELDS = ("security",)
+    JIRA_EXPAND = ()
+    FUSED_EXTRACTION = True
+
     def __init__(self, jira_client: JiraClient, op_client: OpenProjectClient) -> None:
         super().__init__(jira_client=jira_client, op_client=op_client)
 
@@ -44,19 +48,13 @@ class SecurityLevelsMigration(BaseMigration):  # noqa: D101
         """Extract Jira security level names per issue mapped to a WP."""
         wp_map = self.mappings.get_mapping("work_package") or {}
         keys = self._jira_keys_from_wp_map(wp_map)
-        issues = self._merge_batch_issues(keys)
-
-        sec_by_key: dict[str, str] = {}
-        for k, issue in issues.items():
-            try:
-                fields = JiraIssueFields.from_issue_any(issue)
-                name = fields.security.name if fields.security else None
-                if name:
-                    sec_by_key[k] = str(name)
-            except Exception:
-                continue
+        sec_by_key: dict[str, str] = self._issue_values(keys)
         return ComponentResult(success=True, data={"security": sec_by_key})
 
+    def _extract_issue_value(self, key: str, issue: Any, fields: JiraIssueFields | None) -> str | None:
+        name = fields.security.name if fields is not None and fields.security else None
+        return str(name) if name else None
+
     def _load(self, mapped: ComponentResult) -> ComponentResult:
         cf_id = self._ensure_wp_custom_field(SECURITY_LEVEL_CF_NAME, "string")
         if not cf_id:
@@ -69,6 +67,7 @@ class SecurityLevelsMigration(BaseMigration):  # noqa: D101
         failed = 0
         projects_with_values: set[int] = set()
 
+        values_by_wp: dict[int, str] = {}
         for jira_key, sec_name in sec_by_key.items():
             if not sec_name:
                 continue
@@ -81,23 +80,17 @@ class SecurityLevelsMigration(BaseMigration):  # noqa: D101
                 # Corrupt or unsupported wp_map shape — skip silently to
                 # preserve the pre-typed call-site behaviour.
                 continue
-            wp_id = int(entry.openproject_id)
+            values_by_wp[int(entry.openproject_id)] = sec_name
             # Track project for selective enablement
             if entry.openproject_project_id is not None:
                 projects_with_values.add(int(entry.openproject_project_id))
-            try:
-                # Set CF value
-                set_script = (
-                    "wp = WorkPackage.find(%d); cf = CustomField.find(%d); "
-                    "cv = wp.custom_value_for(cf); if cv; cv.value = '%s'; cv.save; else; wp.custom_field_values = { cf.id => '%s' }; end; wp.save!; true"
-                    % (wp_id, cf_id, escape_ruby_single_quoted(sec_name), escape_ruby_single_quoted(sec_name))
-                )
-                ok = self.op_client.execute_query(set_script)
-                if ok:
-                    updated += 1
-            except Exception:
-                logger.exception("Failed to apply security level for %s", jira_key)
-                failed += 1
+
+        if values_by_wp:
+            logger.info("Bulk setting %d security level values...", len(values_by_wp))
+            res = self.op_client.bulk_set_custom_values(cf_id, values_by_wp, touch_journal=True)
+            updated = int(res.get("updated", 0)) + int(res.get("unchanged", 0))
+            failed = int(res.get("failed", 0))
+            logger.info("Bulk security levels: updated=%d, failed=%d", updated, failed)
 
         # Enable CF only for projects that have values
         if projects_with_values:
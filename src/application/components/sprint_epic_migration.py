@@ -23,20 +23,25 @@ ladder is normalised through
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from src import config
 from src.application.components.base_migration import BaseMigration, register_entity_types
 from src.config import logger
 from src.infrastructure.jira.jira_client import JiraClient
-from src.infrastructure.openproject.openproject_client import OpenProjectClient, escape_ruby_single_quoted
+from src.infrastructure.openproject.openproject_client import OpenProjectClient
 from src.models import ComponentResult, WorkPackageMappingEntry
 
+if TYPE_CHECKING:
+    from src.models.jira import JiraIssueFields
+
 SPRINT_CF_NAME = "Sprint"
 
 
 @register_entity_types("sprint_epic")
 class SprintEpicMigration(BaseMigration):  # noqa: D101
+    FUSED_EXTRACTION = True
+
     def __init__(self, jira_client: JiraClient, op_client: OpenProjectClient) -> None:
         super().__init__(jira_client=jira_client, op_client=op_client)
 
@@ -145,44 +150,51 @@ class SprintEpicMigration(BaseMigration):  # noqa: D101
         if not keys:
             return ComponentResult(success=True, data={"sprint": {}, "epic": []})
 
-        issues = self._merge_batch_issues(keys)
-
         sprint_by_key: dict[str, list[str]] = {}
         epic_links: list[tuple[str, str]] = []  # (child_key, epic_key)
 
-        for k, issue in issues.items():
-            try:
-                fields = getattr(issue, "fields", None)
-                if not fields:
-                    continue
-                # Sprint: look for common fields
-                sprint_val = None
-                for cand in ("sprint", "customfield_10020", "Sprints", "Sprint"):
-                    if hasattr(fields, cand):
-                        sprint_val = getattr(fields, cand)
-                        break
-                if sprint_val is None:
-                    # wide scan for attr containing 'sprint'
-                    sprint_val = self._get_attr_ci(fields, "sprint")
-                names = self._coerce_sprint_names(sprint_val)
-                if names:
-                    sprint_by_key[k] = names
-
-                # Epic Link: common field customfield_10008 or epicLink
-                epic_key = None
-                for cand in ("epicLink", "customfield_10008", "Epic Link"):
-                    if hasattr(fields, cand):
-                        epic_key = getattr(fields, cand)
-                        break
-                if epic_key is None:
-                    epic_key = self._get_attr_ci(fields, "epic_link", "epicLink")
-                if isinstance(epic_key, str) and epic_key.strip():
-                    epic_links.append((k, epic_key.strip()))
-            except Exception:
-                continue
+        for k, (names, epic_key) in self._issue_values(keys).items():
+            if names:
+                sprint_by_key[k] = names
+            if epic_key:
+                epic_links.append((k, epic_key))
 
         return ComponentResult(success=True, data={"sprint": sprint_by_key, "epic": epic_links})
 
+    def _extract_issue_value(
+        self,
+        key: str,
+        issue: Any,
+        fields: JiraIssueFields | None,
+    ) -> tuple[list[str], str | None] | None:
+        raw_fields = getattr(issue, "fields", None)
+        if not raw_fields:
+            return None
+        # Sprint: look for common fields
+        sprint_val = None
+        for cand in ("sprint", "customfield_10020", "Sprints", "Sprint"):
+            if hasattr(raw_fields, cand):
+                sprint_val = getattr(raw_fields, cand)
+                break
+        if sprint_val is None:
+            # wide scan for attr containing 'sprint'
+            sprint_val = self._get_attr_ci(raw_fields, "sprint")
+        names = self._coerce_sprint_names(sprint_val)
+
+        # Epic Link: common field customfield_10008 or epicLink
+        epic_key = None
+        for cand in ("epicLink", "customfield_10008", "Epic Link"):
+            if hasattr(raw_fields, cand):
+                epic_key = getattr(raw_fields, cand)
+                break
+        if epic_key is None:
+            epic_key = self._get_attr_ci(raw_fields, "epic_link", "epicLink")
+        epic = epic_key.strip() if isinstance(epic_key, str) and epic_key.strip() else None
+
+        if not names and epic is None:
+            return None
+        return names, epic
+
     def _map(self, extracted: ComponentResult) -> ComponentResult:
         data = extracted.data or {}
         sprint_raw: dict[str, list[str]] = data.get("sprint", {}) if isinstance(data, dict) else {}
@@ -295,7 +307,7 @@ class SprintEpicMigration(BaseMigration):  # noqa: D101
                 logger.exception("Failed to assign versions for sprint mapping")
                 failed += len(version_updates)
 
-        # Ensure Sprint CF and set values via minimal Rails per record
+        # Ensure Sprint CF and set values in bulk
         cf_id = 0
         try:
             cf_id = self._ensure_wp_custom_field(SPRINT_CF_NAME, "text")
@@ -317,29 +329,20 @@ class SprintEpicMigration(BaseMigration):  # noqa: D101
             )
 
         projects_with_values: set[int] = set()
+        values_by_wp: dict[int, str] = {}
         for jira_key, text in sprint_text.items():
             entry = entries_by_jira_key.get(jira_key)
             if entry is None:
                 continue
-            wp_id = int(entry.openproject_id)
+            values_by_wp[int(entry.openproject_id)] = str(text)
             # Track project for selective enablement
             if entry.openproject_project_id is not None:
                 projects_with_values.add(int(entry.openproject_project_id))
-            try:
-                val = escape_ruby_single_quoted(str(text))
-                script = (
-                    "wp = WorkPackage.find(%d); cf = CustomField.find(%d); "
-                    "cv = wp.custom_value_for(cf); if cv; cv.value = '%s'; cv.save; else; wp.custom_field_values = { cf.id => '%s' }; end; wp.save!; true"
-                    % (wp_id, cf_id, val, val)
-                )
-                ok = self.op_client.execute_query(script)
-                if ok:
-                    updated += 1
-                else:
-                    failed += 1
-            except Exception:
-                logger.exception("Failed to set Sprint CF for %s", jira_key)
-                failed += 1
+
+        if values_by_wp:
+            res = self.op_client.bulk_set_custom_values(cf_id, values_by_wp, touch_journal=True)
+            updated += int(res.get("updated", 0)) + int(res.get("unchanged", 0))
+            failed += int(res.get("failed", 0))
 
         # Enable CF only for projects that have values
         if projects_with_values:
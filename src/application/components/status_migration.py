@@ -38,6 +38,7 @@ from src.config import logger
 from src.display import ProgressTracker
 from src.infrastructure.jira.jira_client import JiraClient
 from src.infrastructure.openproject.openproject_client import OpenProjectClient
+from src.infrastructure.openproject.openproject_records_service import metadata_reconcile_enabled
 from src.mappings.mappings import Mappings
 from src.models import ComponentResult
 from src.models.migration_error import MigrationError
@@ -334,6 +335,9 @@ class StatusMigration(BaseMigration):
             len(statuses_to_create),
         )
 
+        if metadata_reconcile_enabled():
+            return self._reconcile_statuses(statuses_to_create)
+
         # Minimal Ruby policy: Ruby creation now handled by bulk_create_records
 
         try:
@@ -395,6 +399,60 @@ class StatusMigration(BaseMigration):
             logger.exception(msg)
             raise MigrationError(msg) from e
 
+    def _reconcile_statuses(
+        self,
+        statuses_to_create: list[dict[str, Any]],
+    ) -> dict[str, dict[str, Any]]:
+        """Match and create the desired statuses with one ``reconcile_records`` call.
+
+        Returns:
+            Same shape as ``create_statuses_bulk_via_rails``; statuses found
+            in OpenProject carry ``already_existed: True``
+
+        """
+        records = [
+            {
+                "name": st.get("name"),
+                "is_closed": bool(st.get("is_closed", False)),
+                "is_default": bool(st.get("is_default", False)),
+            }
+            for st in statuses_to_create
+        ]
+        try:
+            result = self.op_client.reconcile_records("Status", records, compare=("is_closed",), timeout=90)
+        except Exception as e:
+            msg = f"Exception during status reconciliation: {e}"
+            logger.exception(msg)
+            raise MigrationError(msg) from e
+
+        typed_statuses: dict[str, dict[str, Any]] = {}
+        for bucket in ("existing", "conflicts", "created"):
+            for item in result.get(bucket, []):
+                idx = item.get("index")
+                if not isinstance(idx, int) or not (0 <= idx < len(statuses_to_create)):
+                    continue
+                if bucket == "conflicts":
+                    logger.warning(
+                        "Status '%s' exists with different settings %s; mapping to it anyway",
+                        item.get("name"),
+                        item.get("fields"),
+                    )
+                typed_statuses[str(statuses_to_create[idx].get("jira_id"))] = {
+                    "id": item.get("id"),
+                    "name": item.get("name"),
+                    "already_existed": bucket != "created",
+                }
+        for err in result.get("errors", []):
+            idx = err.get("index")
+            if isinstance(idx, int) and 0 <= idx < len(statuses_to_create):
+                typed_statuses[str(statuses_to_create[idx].get("jira_id"))] = {
+                    "error": "; ".join(err.get("errors", [])),
+                    "already_existed": False,
+                }
+
+        logger.info("Reconciled %s statuses in one call", len(typed_statuses))
+        return typed_statuses
+
     def create_status_mapping(self) -> dict[str, Any]:
         """Create a mapping between Jira statuses and OpenProject statuses.
 
@@ -479,12 +537,16 @@ class StatusMigration(BaseMigration):
             logger.error(msg)
             raise MigrationError(msg)
 
+        # Reconciliation matches existing statuses in the same Rails call
+        # that creates the missing ones, so the separate lookup is skipped.
+        reconcile = metadata_reconcile_enabled() and not config.migration_config.get("dry_run", False)
+
         # Get existing OpenProject statuses if not already done
-        if not self.op_statuses:
+        if not self.op_statuses and not reconcile:
             self.op_statuses = self.get_openproject_statuses()
 
         # Create a name-based lookup for OpenProject statuses
-        op_statuses_by_name = {s.get("name", "").lower(): s for s in self.op_statuses}
+        op_statuses_by_name = {} if reconcile else {s.get("name", "").lower(): s for s in self.op_statuses}
 
         # Create status mapping if not already done
         if not self.status_mapping:
@@ -633,9 +695,8 @@ class StatusMigration(BaseMigration):
                     }
 
                     if result.get("already_existed", False):
-                        # Count as already existing if not counted above
-                        # (shouldn't happen in normal flow but included for safety)
-                        pass
+                        # Matched by reconciliation (or, defensively, by the bulk helper)
+                        already_exists_count += 1
                     else:
                         created_count += 1
                 else:
@@ -4,7 +4,9 @@ Creates/ensures a WorkPackage custom field "Story Points" (float) and writes the
 Jira story points value per issue.
 
 Detection strategy:
-- Prefer `fields.storyPoints` if present
+- Prefer the custom field whose display name is "Story Points", resolved
+  through JiraFieldService (the fetch requests only that field)
+- Then `fields.storyPoints` if present
 - Fallback to common custom field key `fields.customfield_10016`
 - As last resort, scan `fields` attributes for a numeric value where the
   attribute name contains both 'story' and 'point' (case-insensitive)
@@ -24,19 +26,27 @@ work-package mapping ladder, on the other hand, is normalised through
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from src.application.components.base_migration import BaseMigration, register_entity_types
 from src.config import logger
 from src.infrastructure.jira.jira_client import JiraClient
-from src.infrastructure.openproject.openproject_client import OpenProjectClient, escape_ruby_single_quoted
+from src.infrastructure.openproject.openproject_client import OpenProjectClient
 from src.models import ComponentResult, WorkPackageMappingEntry
 
+if TYPE_CHECKING:
+    from src.models.jira import JiraIssueFields
+
 STORY_POINTS_CF_NAME = "Story Points"
 
 
 @register_entity_types("story_points")
 class StoryPointsMigration(BaseMigration):  # noqa: D101
+    JIRA_FIELDS = ("customfield_10016",)
+    JIRA_FIELD_NAMES = (STORY_POINTS_CF_NAME,)
+    JIRA_EXPAND = ()
+    FUSED_EXTRACTION = True
+
     def __init__(self, jira_client: JiraClient, op_client: OpenProjectClient) -> None:
         super().__init__(jira_client=jira_client, op_client=op_client)
 
@@ -71,9 +81,10 @@ class StoryPointsMigration(BaseMigration):  # noqa: D101
         return None
 
     @staticmethod
-    def _extract_story_points_from_fields(fields: Any) -> float | None:
-        # Preferred explicit attributes
-        for attr in ("storyPoints", "customfield_10016", "story_points"):
+    def _extract_story_points_from_fields(fields: Any, field_ids: tuple[str, ...] = ()) -> float | None:
+        # Field ids resolved from the "Story Points" display name come first,
+        # then the preferred explicit attributes
+        for attr in (*field_ids, "storyPoints", "customfield_10016", "story_points"):
             if hasattr(fields, attr):
                 num = StoryPointsMigration._coerce_number(getattr(fields, attr, None))
                 if num is not None:
@@ -106,19 +117,22 @@ class StoryPointsMigration(BaseMigration):  # noqa: D101
         if not keys:
             return ComponentResult(success=True, data={"sp": {}})
 
-        issues = self._merge_batch_issues(keys)
-
-        sp_by_key: dict[str, float] = {}
-        for k, issue in issues.items():
-            try:
-                fields = getattr(issue, "fields", None)
-                num = self._extract_story_points_from_fields(fields) if fields else None
-                if isinstance(num, (int, float)):
-                    sp_by_key[k] = float(num)
-            except Exception:
-                continue
+        sp_by_key: dict[str, float] = self._issue_values(keys)
         return ComponentResult(success=True, data={"sp": sp_by_key})
 
+    def _prepare_issue_extraction(self) -> None:
+        # In a fused pass another component fetched the issues, so the
+        # "Story Points" field id has not been resolved for this one yet.
+        if not hasattr(self, "_jira_field_ids"):
+            self._jira_fetch_projection()
+        resolved_id = self._jira_field_ids.get(STORY_POINTS_CF_NAME)
+        self._story_points_field_ids = (resolved_id,) if resolved_id else ()
+
+    def _extract_issue_value(self, key: str, issue: Any, fields: JiraIssueFields | None) -> float | None:
+        raw_fields = getattr(issue, "fields", None)
+        num = self._extract_story_points_from_fields(raw_fields, self._story_points_field_ids) if raw_fields else None
+        return float(num) if isinstance(num, (int, float)) else None
+
     def _map(self, extracted: ComponentResult) -> ComponentResult:
         data = extracted.data or {}
         raw: dict[str, float] = data.get("sp", {}) if isinstance(data, dict) else {}
@@ -153,31 +167,25 @@ class StoryPointsMigration(BaseMigration):  # noqa: D101
             except ValueError:
                 continue
 
+        values_by_wp: dict[int, str] = {}
         for jira_key, text in text_by_key.items():
             if text is None or text == "0":
                 continue
             entry = entries_by_jira_key.get(jira_key)
             if entry is None:
                 continue
-            wp_id = int(entry.openproject_id)
+            values_by_wp[int(entry.openproject_id)] = str(text)
             # Track project for selective enablement
             if entry.openproject_project_id is not None:
                 projects_with_values.add(int(entry.openproject_project_id))
-            try:
-                val = escape_ruby_single_quoted(str(text))
-                set_script = (
-                    "wp = WorkPackage.find(%d); cf = CustomField.find(%d); "
-                    "cv = wp.custom_value_for(cf); if cv; cv.value = '%s'; cv.save; else; wp.custom_field_values = { cf.id => '%s' }; end; wp.save!; true"
-                    % (wp_id, cf_id, val, val)
-                )
-                ok = self.op_client.execute_query(set_script)
-                if ok:
-                    updated += 1
-                else:
-                    failed += 1
-            except Exception:
-                logger.exception("Failed to apply Story Points for %s", jira_key)
-                failed += 1
+
+        # One Rails call per few thousand work packages instead of one per issue
+        if values_by_wp:
+            logger.info("Bulk setting %d story points values...", len(values_by_wp))
+            res = self.op_client.bulk_set_custom_values(cf_id, values_by_wp, touch_journal=True)
+            updated = int(res.get("updated", 0)) + int(res.get("unchanged", 0))
+            failed = int(res.get("failed", 0))
+            logger.info("Bulk story points: updated=%d, failed=%d", updated, failed)
 
         # Enable CF only for projects that have values
         if projects_with_values:
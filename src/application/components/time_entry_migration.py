@@ -170,12 +170,6 @@ class TimeEntryMigration(BaseMigration):
                 warnings=[warn],
             )
 
-        # Determine larger batch size for time entries (env overrides default)
-        try:
-            int(__import__("os").environ.get("J2O_TIME_ENTRY_BATCH_SIZE") or "200")
-        except Exception:
-            pass
-
         try:
             result = self.time_entry_migrator.migrate_time_entries_for_issues(
                 migrated_wps,
@@ -52,6 +52,7 @@ import mimetypes
 import re
 import uuid
 from collections import Counter
+from collections.abc import Iterable
 from contextlib import suppress
 from pathlib import Path
 from typing import Any
@@ -306,8 +307,9 @@ class UserMigration(BaseMigration):
     def _discover_users_from_cached_issues(self) -> list[dict[str, Any]]:
         """Harvest user identities from the cached Jira issues file.
 
-        For each issue in ``data_dir / 'jira_issues_cache.json'``,
-        collect raw user dicts from:
+        For each issue in the shared Jira issue store (or, when the store
+        is empty, ``data_dir / 'jira_issues_cache.json'``), collect raw
+        user dicts from:
 
         - ``fields.watches.watchers[*]``
         - ``fields.assignee``
@@ -321,28 +323,35 @@ class UserMigration(BaseMigration):
         """
         import json as _json
 
-        cache_file = self.data_dir / "jira_issues_cache.json"
-        if not cache_file.exists():
-            return []
-        try:
-            with open(cache_file, encoding="utf-8") as f:
-                issues = _json.load(f)
-        except (OSError, _json.JSONDecodeError) as exc:
-            # Narrow to realistic failure modes — a refactor bug
-            # (e.g. accidental ``getattr`` typo) should crash loud
-            # instead of being silently classified as "could not
-            # read cache".
-            self.logger.warning(
-                "Could not read jira_issues_cache.json for user discovery: %s",
-                exc,
-            )
-            return []
+        issues: Iterable[Any] = ()
+        store = self._jira_issue_store()
+        if store is not None and store.count():
+            # Streamed page by page, only the user-bearing fields decoded.
+            issues = store.iter_project(fields=("watches", "assignee", "reporter", "comment"))
+        else:
+            cache_file = self.data_dir / "jira_issues_cache.json"
+            if not cache_file.exists():
+                return []
+            try:
+                with open(cache_file, encoding="utf-8") as f:
+                    cached = _json.load(f)
+            except (OSError, _json.JSONDecodeError) as exc:
+                # Narrow to realistic failure modes — a refactor bug
+                # (e.g. accidental ``getattr`` typo) should crash loud
+                # instead of being silently classified as "could not
+                # read cache".
+                self.logger.warning(
+                    "Could not read jira_issues_cache.json for user discovery: %s",
+                    exc,
+                )
+                return []
 
-        if not isinstance(issues, dict):
-            self.logger.warning(
-                "jira_issues_cache.json is not a dict at the top level — skipping user discovery",
-            )
-            return []
+            if not isinstance(cached, dict):
+                self.logger.warning(
+                    "jira_issues_cache.json is not a dict at the top level — skipping user discovery",
+                )
+                return []
+            issues = cached.values()
 
         discovered: list[dict[str, Any]] = []
         seen_ids: set[str] = set()
@@ -367,7 +376,7 @@ class UserMigration(BaseMigration):
             seen_ids.add(stable)
             discovered.append(raw)
 
-        for issue in issues.values():
+        for issue in issues:
             if not isinstance(issue, dict):
                 continue
             fields = issue.get("fields") or {}
@@ -20,6 +20,9 @@ from src.models.jira import JiraIssueFields
 
 @register_entity_types("versions")
 class VersionsMigration(BaseMigration):  # noqa: D101
+    JIRA_FIELDS = ("fixVersions",)
+    JIRA_EXPAND = ()
+
     def __init__(self, jira_client: JiraClient, op_client: OpenProjectClient) -> None:
         super().__init__(jira_client=jira_client, op_client=op_client)
 
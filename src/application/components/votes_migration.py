@@ -6,6 +6,8 @@ Jira `fields.votes.votes` count for mapped issues.
 
 from __future__ import annotations
 
+from typing import Any
+
 from src.application.components.base_migration import BaseMigration, register_entity_types
 from src.config import logger
 from src.infrastructure.jira.jira_client import JiraClient
@@ -18,6 +20,10 @@ VOTES_CF_NAME = "Votes"
 
 @register_entity_types("votes_reactions")
 class VotesMigration(BaseMigration):  # noqa: D101
+    JIRA_FIELDS = ("votes",)
+    JIRA_EXPAND = ()
+    FUSED_EXTRACTION = True
+
     def __init__(self, jira_client: JiraClient, op_client: OpenProjectClient) -> None:
         super().__init__(jira_client=jira_client, op_client=op_client)
 
@@ -42,19 +48,13 @@ class VotesMigration(BaseMigration):  # noqa: D101
         """Extract Jira votes count per issue mapped to a WP."""
         wp_map = self.mappings.get_mapping("work_package") or {}
         keys = self._jira_keys_from_wp_map(wp_map)
-        issues = self._merge_batch_issues(keys)
-
-        votes_by_key: dict[str, int] = {}
-        for k, issue in issues.items():
-            try:
-                fields = JiraIssueFields.from_issue_any(issue)
-                count = fields.votes.votes if fields.votes else None
-                if isinstance(count, int):
-                    votes_by_key[k] = count
-            except Exception:
-                continue
+        votes_by_key: dict[str, int] = self._issue_values(keys)
         return ComponentResult(success=True, data={"votes": votes_by_key})
 
+    def _extract_issue_value(self, key: str, issue: Any, fields: JiraIssueFields | None) -> int | None:
+        count = fields.votes.votes if fields is not None and fields.votes else None
+        return count if isinstance(count, int) else None
+
     def _load(self, mapped: ComponentResult) -> ComponentResult:
         cf_id = self._ensure_wp_custom_field(VOTES_CF_NAME, "int")
         if not cf_id:
@@ -177,7 +177,13 @@ class WatcherMigration(BaseMigration):
         # silently on the live TEST run (2026-05-07).
         issues: dict[str, Any] = {}
         cache_file = self.data_dir / "jira_issues_cache.json"
-        if cache_file.exists():
+        stored = self._stored_jira_issues(jira_keys, fields=("watches",))
+        if stored:
+            # Issues missing from the shared store still get the API call
+            # through an empty placeholder.
+            logger.info("Using %d issues from the Jira issue store for watcher migration", len(stored))
+            issues = {k: stored.get(k, {}) for k in jira_keys}
+        elif cache_file.exists():
             try:
                 import json
 
@@ -61,6 +61,7 @@ from src.application.transformers.issue_transformer import IssueTransformer
 from src.domain.enums import JournalEntryType
 from src.infrastructure.jira.jira_client import JiraClient
 from src.infrastructure.openproject.openproject_client import OpenProjectClient
+from src.infrastructure.openproject.rails_bulk_mode import bulk_mode_enabled
 from src.models import ComponentResult, JiraUser, WorkPackageMappingEntry
 from src.utils.markdown_converter import MarkdownConverter
 
@@ -328,17 +329,20 @@ class WorkPackageContentMigration(BaseMigration):
         batch_size: int,
     ) -> list[Issue]:
         """Fetch issues with full fields for content migration."""
+        expand = "renderedFields,changelog"
         try:
             # Expanded fields for content
-            return self.jira_client.jira.search_issues(
+            issues = self.jira_client.jira.search_issues(
                 jql,
                 startAt=start_at,
                 maxResults=batch_size,
-                expand="renderedFields,changelog",
+                expand=expand,
             )
         except Exception as e:
             self.logger.error("Failed to fetch issues: %s", e)
             return []
+        self._store_jira_issues(issues, expand)
+        return issues
 
     def _convert_jira_links(self, text: str | None, jira_key: str | None = None) -> str:
         """Convert Jira issue references to OpenProject WP links.
@@ -1013,6 +1017,12 @@ class WorkPackageContentMigration(BaseMigration):
                     project_key,
                 )
 
+            # Bulk mode skipped per-record callbacks; recompute once per project
+            if project_results["updated"] and bulk_mode_enabled():
+                op_project_id = self._get_openproject_project_id(project_key)
+                if op_project_id:
+                    self.op_client.rebuild_derived_work_package_data([op_project_id])
+
             # Aggregate
             results["projects"][project_key] = project_results
             results["total_processed"] += project_results["processed"]
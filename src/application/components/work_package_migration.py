@@ -21,8 +21,10 @@ import json
 import os
 import sqlite3
 import time
-from collections.abc import Iterator
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -38,13 +40,34 @@ from src.config import logger
 from src.display import ProgressTracker
 from src.domain.enums import JournalEntryType
 from src.infrastructure.jira.jira_client import JiraClient
+from src.infrastructure.openproject.openproject_bulk_create_service import BulkCreatePipeline, bulk_pipeline_enabled
 from src.infrastructure.openproject.openproject_client import OpenProjectClient
+from src.infrastructure.openproject.rails_bulk_mode import bulk_mode_enabled
+from src.infrastructure.openproject.rails_session_pool import session_pool_for
 from src.models import ComponentResult, WorkPackageMappingEntry
 from src.utils import data_handler
 from src.utils.enhanced_audit_trail_migrator import EnhancedAuditTrailMigrator
 from src.utils.enhanced_timestamp_migrator import EnhancedTimestampMigrator
 from src.utils.enhanced_user_association_migrator import EnhancedUserAssociationMigrator
 from src.utils.markdown_converter import MarkdownConverter
+from src.utils.wp_snapshot_cache import WorkPackageSnapshotCache, snapshot_delta_enabled
+
+
+@dataclass(slots=True)
+class _ProjectBulkCreate:
+    """Per-project state of the ``bulk_create_records`` batches in ``_migrate_work_packages``."""
+
+    project_key: str
+    op_project_id: int
+    pipeline: BulkCreatePipeline | None
+    # Submitted pipeline batches not settled yet: (future, records, meta, tail)
+    pending: deque[tuple[Future[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]], bool]] = field(
+        default_factory=deque,
+    )
+    created_count: int = 0
+    # Early termination tracking
+    total_attempted: int = 0
+    batches_processed: int = 0
 
 
 @register_entity_types("work_packages", "issues")
@@ -189,6 +212,8 @@ class WorkPackageMigration(BaseMigration):
         except Exception:
             data_dir_path = Path()
         self._checkpoint_db_path = data_dir_path.parent / ".migration_checkpoints.db"
+        # Cached WP snapshots live in the checkpoint store, so resetting it drops them too
+        self._snapshot_cache = WorkPackageSnapshotCache(self._checkpoint_db_path)
         self._project_latest_issue_ts: dict[str, datetime] = {}
         if config.migration_config.get("reset_wp_checkpoints"):
             self.logger.info("Resetting work package checkpoint store via CLI flag")
@@ -475,29 +500,33 @@ class WorkPackageMigration(BaseMigration):
             f"Assigning memberships for {len(mentioned_user_ids)} mentioned users in project {project_id}",
         )
 
-        for user_id in mentioned_user_ids:
-            try:
-                assign_result = self.op_client.assign_user_roles(
-                    project_id=project_id,
-                    user_id=user_id,
-                    role_ids=[self._mention_role_id],
-                )
-                if assign_result.get("success"):
-                    if assign_result.get("changed"):
-                        result["users_added"] += 1
-                        self.logger.debug(f"Added user {user_id} to project {project_id}")
-                    else:
-                        result["users_skipped"] += 1
-                        self.logger.debug(f"User {user_id} already member of project {project_id}")
+        user_ids = list(mentioned_user_ids)
+        try:
+            assign_results = self.op_client.bulk_assign_user_roles(
+                [
+                    {"project_id": project_id, "user_id": user_id, "role_ids": [self._mention_role_id]}
+                    for user_id in user_ids
+                ],
+            )
+        except Exception as e:
+            result["errors"].extend(f"User {user_id}: {e}" for user_id in user_ids)
+            self.logger.warning(f"Exception adding mentioned users to project {project_id}: {e}")
+            assign_results = []
+
+        for user_id, assign_result in zip(user_ids, assign_results, strict=False):
+            if assign_result.get("success"):
+                if assign_result.get("changed"):
+                    result["users_added"] += 1
+                    self.logger.debug(f"Added user {user_id} to project {project_id}")
                 else:
-                    error_msg = assign_result.get("error", "Unknown error")
-                    result["errors"].append(f"User {user_id}: {error_msg}")
-                    self.logger.warning(
-                        f"Failed to add user {user_id} to project {project_id}: {error_msg}",
-                    )
-            except Exception as e:
-                result["errors"].append(f"User {user_id}: {e}")
-                self.logger.warning(f"Exception adding user {user_id} to project {project_id}: {e}")
+                    result["users_skipped"] += 1
+                    self.logger.debug(f"User {user_id} already member of project {project_id}")
+            else:
+                error_msg = assign_result.get("error", "Unknown error")
+                result["errors"].append(f"User {user_id}: {error_msg}")
+                self.logger.warning(
+                    f"Failed to add user {user_id} to project {project_id}: {error_msg}",
+                )
 
         if result["users_added"] > 0:
             self.logger.info(
@@ -846,15 +875,95 @@ class WorkPackageMigration(BaseMigration):
 
         return id_lookup, name_lookup
 
-    def _get_existing_work_packages(self, op_project_id: int) -> dict[str, dict[str, Any]]:
+    def _project_wp_snapshot(self, project_key: str, op_project_id: int) -> Iterable[dict[str, Any]]:
+        """Return the WP snapshot rows of a project.
+
+        With the snapshot delta enabled, rows come from the local cache
+        brought up to date with the WPs changed since its high-water marks;
+        the full snapshot is only downloaded on the first run or when WPs
+        were deleted (the merged rows' count or id sum no longer matches
+        OpenProject's). New WPs always get ids above the cached ``max_id``,
+        so a deletion offset by a creation still changes the id sum.
+        Otherwise the full snapshot is streamed.
+        """
+        if not snapshot_delta_enabled():
+            return self.op_client.iter_project_wp_cf_snapshot(op_project_id)
+
+        try:
+            cached = self._snapshot_cache.load(project_key)
+        except sqlite3.DatabaseError as exc:
+            self._handle_corrupt_checkpoint_db(exc)
+            cached = None
+        delta = None
+        if cached is not None and cached.high_water:
+            try:
+                delta = self.op_client.get_project_wp_cf_delta(
+                    op_project_id,
+                    since=cached.high_water,
+                    after_id=cached.max_id,
+                )
+            except Exception as exc:
+                self.logger.warning("Snapshot delta failed for %s, refreshing fully: %s", project_key, exc)
+        if cached is not None and delta is not None:
+            rows = cached.rows
+            for row in delta["rows"]:
+                if isinstance(row, dict) and row.get("id") is not None:
+                    rows[int(row["id"])] = row
+            if len(rows) == int(delta.get("count") or 0) and sum(rows) == delta.get("id_sum"):
+                self.logger.debug(
+                    "Snapshot delta for %s: %d changed of %d work packages",
+                    project_key,
+                    len(delta["rows"]),
+                    len(rows),
+                )
+                self._store_wp_snapshot(
+                    project_key,
+                    delta["rows"],
+                    high_water=delta.get("high_water") or cached.high_water,
+                    max_id=int(delta.get("max_id") or cached.max_id),
+                    replace=False,
+                )
+                return list(rows.values())
+            self.logger.info("Work packages were removed from %s; refreshing its snapshot", project_key)
+
+        rows = [row for row in self.op_client.iter_project_wp_cf_snapshot(op_project_id) if isinstance(row, dict)]
+        stamps = [str(row["updated_at"]) for row in rows if row.get("updated_at")]
+        self._store_wp_snapshot(
+            project_key,
+            rows,
+            # ISO-8601 UTC strings of one format compare chronologically
+            high_water=max(stamps) if stamps else None,
+            max_id=max((int(row["id"]) for row in rows if row.get("id") is not None), default=0),
+            replace=True,
+        )
+        return rows
+
+    def _store_wp_snapshot(self, project_key: str, rows: list[dict[str, Any]], **state: Any) -> None:
+        """Persist snapshot rows; a failing cache only costs the next run a full download."""
+        try:
+            self._snapshot_cache.save(project_key, rows, **state)
+        except sqlite3.DatabaseError as exc:
+            self._handle_corrupt_checkpoint_db(exc)
+        except Exception as exc:
+            self.logger.warning("Failed to cache work package snapshot for %s: %s", project_key, exc)
+
+    def _get_existing_work_packages(
+        self,
+        op_project_id: int,
+        project_key: str | None = None,
+    ) -> dict[str, dict[str, Any]]:
         """Get existing work packages from OpenProject for incremental updates.
 
         Returns a dict mapping Jira keys to OpenProject work package info.
         """
         try:
-            snapshot = self.op_client.get_project_wp_cf_snapshot(op_project_id)
             existing_map = {}
-            for row in snapshot:
+            rows = (
+                self._project_wp_snapshot(project_key, op_project_id)
+                if project_key
+                else self.op_client.iter_project_wp_cf_snapshot(op_project_id)
+            )
+            for row in rows:
                 jira_key = row.get("jira_issue_key")
                 if jira_key:
                     existing_map[str(jira_key).strip()] = {
@@ -1620,7 +1729,6 @@ class WorkPackageMigration(BaseMigration):
         Used for incremental migrations to process all issues.
         Includes renderedFields expansion for comment data extraction.
         """
-        start_at = 0
         batch_size = config.migration_config.get("batch_size", 100)
         jql = f'project = "{project_key}" ORDER BY created ASC'
         fields = None  # Get all fields
@@ -1657,19 +1765,8 @@ class WorkPackageMigration(BaseMigration):
             raise JiraResourceNotFoundError(msg) from e
 
         total_yielded = 0
-        while True:
-            issues_batch = self._fetch_issues_with_retry(
-                jql=jql,
-                start_at=start_at,
-                max_results=batch_size,
-                fields=fields,
-                expand=expand,
-                project_key=project_key,
-            )
-
-            if not issues_batch:
-                break
-
+        for issues_batch in self._iter_issue_pages(jql, batch_size, fields, expand, project_key):
+            self._store_jira_issues(issues_batch, expand)
             for issue in issues_batch:
                 yield issue
                 total_yielded += 1
@@ -1680,11 +1777,6 @@ class WorkPackageMigration(BaseMigration):
 
             self.logger.debug(f"Yielded {len(issues_batch)} issues (total: {total_yielded}) for {project_key}")
 
-            if len(issues_batch) < batch_size:
-                break
-
-            start_at += len(issues_batch)
-
         self.logger.info(f"Finished yielding {total_yielded} issues for project '{project_key}'")
 
     def iter_project_issues(self, project_key: str) -> Iterator[Issue]:
@@ -1705,7 +1797,6 @@ class WorkPackageMigration(BaseMigration):
             JiraResourceNotFoundError: If the project is not found
 
         """
-        start_at = 0
         batch_size = config.migration_config.get("batch_size", 100)
 
         # Reset per-project tracking for latest issue timestamps
@@ -1740,7 +1831,6 @@ class WorkPackageMigration(BaseMigration):
 
         if fast_forward:
             checkpoint_ts = self._get_checkpoint_timestamp(project_key)
-            snapshot: list[dict[str, Any]] = []
             op_project_id = None
             try:
                 project_entry = self.project_mapping.get(project_key, {}) or {}
@@ -1752,16 +1842,20 @@ class WorkPackageMigration(BaseMigration):
                 try:
                     _ = self.op_client.ensure_work_package_custom_field("Jira Issue Key", "string")
                     _ = self.op_client.ensure_work_package_custom_field("Jira Migration Date", "date")
-                    snapshot = self.op_client.get_project_wp_cf_snapshot(int(op_project_id))
-                    existing_keys = {
-                        str(row.get("jira_issue_key")).strip()
-                        for row in snapshot
-                        if isinstance(row, dict)
-                        and isinstance(row.get("jira_issue_key"), str)
-                        and row.get("jira_issue_key").strip()
-                    }
+                    # Single streamed pass: collect keys and the newest timestamp
+                    # without materialising the project's snapshot.
+                    snapshot_ts: datetime | None = None
+                    for row in self._project_wp_snapshot(project_key, int(op_project_id)):
+                        if not isinstance(row, dict):
+                            continue
+                        jira_key = row.get("jira_issue_key")
+                        if isinstance(jira_key, str) and jira_key.strip():
+                            existing_keys.add(jira_key.strip())
+                        row_ts = self._derive_snapshot_timestamp([row])
+                        if row_ts and (snapshot_ts is None or row_ts > snapshot_ts):
+                            snapshot_ts = row_ts
                     if not checkpoint_ts:
-                        checkpoint_ts = self._derive_snapshot_timestamp(snapshot)
+                        checkpoint_ts = snapshot_ts
                 except Exception as op_err:  # pragma: no cover - observational logging
                     self.logger.debug(
                         "Failed to inspect existing work packages for %s: %s",
@@ -1814,25 +1908,8 @@ class WorkPackageMigration(BaseMigration):
             )
 
         total_yielded = 0
-        while True:
-            # Fetch batch with retry logic
-            issues_batch = self._fetch_issues_with_retry(
-                jql=jql,
-                start_at=start_at,
-                max_results=batch_size,
-                fields=fields,
-                expand=expand,
-                project_key=project_key,
-            )
-
-            if not issues_batch:
-                logger.debug(
-                    "No more issues found for %s at startAt=%s",
-                    project_key,
-                    start_at,
-                )
-                break
-
+        for issues_batch in self._iter_issue_pages(jql, batch_size, fields, expand, project_key):
+            self._store_jira_issues(issues_batch, expand)
             # Yield individual issues
             for issue in issues_batch:
                 yield issue
@@ -1849,12 +1926,6 @@ class WorkPackageMigration(BaseMigration):
                 project_key,
             )
 
-            # Check if this was the last page
-            if len(issues_batch) < batch_size:
-                break
-
-            start_at += len(issues_batch)
-
         logger.info(
             "Finished yielding %s issues for project '%s'",
             total_yielded,
@@ -1946,6 +2017,161 @@ class WorkPackageMigration(BaseMigration):
                 raise JiraApiError(error_msg) from e
         return None
 
+    def _iter_issue_pages(
+        self,
+        jql: str,
+        batch_size: int,
+        fields: str | None,
+        expand: str | None,
+        project_key: str,
+    ) -> Iterator[list[Issue]]:
+        """Yield pages of issues matching ``jql`` in query order.
+
+        With ``jira_page_concurrency`` above 1 the matching issue ids are
+        listed first (``fields=id``, no expand — cheap pages), then split
+        into windows of ``batch_size`` ids that are fetched with their
+        full payload concurrently and yielded in listing order from a
+        reorder buffer bounded to the concurrency. Windows are keyed by
+        issue id rather than ``startAt`` offsets, so issues created or
+        deleted mid-run cannot shift a page and cause skips or repeats.
+        Falls back to sequential ``startAt`` pagination when concurrency
+        is 1 or the id listing is unavailable.
+
+        Args:
+            jql: JQL query, including its ``ORDER BY`` clause
+            batch_size: Issues per page
+            fields: Fields to retrieve for each issue
+            expand: Expand options for each issue
+            project_key: Project key for logging
+
+        Yields:
+            Lists of Jira Issue objects, one per page
+
+        """
+        try:
+            concurrency = int(config.migration_config.get("jira_page_concurrency", 1))
+        except TypeError, ValueError:
+            concurrency = 1
+
+        issue_ids = self._list_issue_ids(jql, project_key) if concurrency > 1 else None
+        if issue_ids is None:
+            start_at = 0
+            while True:
+                issues_batch = self._fetch_issues_with_retry(
+                    jql=jql,
+                    start_at=start_at,
+                    max_results=batch_size,
+                    fields=fields,
+                    expand=expand,
+                    project_key=project_key,
+                )
+                if not issues_batch:
+                    logger.debug(
+                        "No more issues found for %s at startAt=%s",
+                        project_key,
+                        start_at,
+                    )
+                    return
+                yield issues_batch
+                # Check if this was the last page
+                if len(issues_batch) < batch_size:
+                    return
+                start_at += len(issues_batch)
+
+        windows = [issue_ids[i : i + batch_size] for i in range(0, len(issue_ids), batch_size)]
+        logger.info(
+            "Fetching %s issues for '%s' in %s windows (%s concurrent)",
+            len(issue_ids),
+            project_key,
+            len(windows),
+            concurrency,
+        )
+
+        def fetch_window(window: list[str]) -> list[Issue]:
+            limiter = getattr(self.jira_client, "rate_limiter", None)
+            if limiter is not None:
+                limiter.wait_if_needed(f"search_issues_{project_key}")
+            request_start = time.time()
+            issues = self._fetch_issues_with_retry(
+                jql=f"id in ({','.join(window)})",
+                start_at=0,
+                max_results=len(window),
+                fields=fields,
+                expand=expand,
+                project_key=project_key,
+            )
+            if limiter is not None:
+                limiter.record_response(time.time() - request_start, 200)
+            # ``id in (...)`` carries no ordering of its own; restore the
+            # listing order so consumers see the original ORDER BY.
+            position = {issue_id: idx for idx, issue_id in enumerate(window)}
+            return sorted(issues or [], key=lambda issue: position.get(str(issue.id), len(position)))
+
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="j2o-jira-page")
+        pending: deque[Future[list[Issue]]] = deque()
+        next_window = 0
+        try:
+            while next_window < len(windows) or pending:
+                while next_window < len(windows) and len(pending) < concurrency:
+                    pending.append(executor.submit(fetch_window, windows[next_window]))
+                    next_window += 1
+                issues_batch = pending.popleft().result()
+                if issues_batch:
+                    yield issues_batch
+        finally:
+            # Early exit (e.g. J2O_MAX_ISSUES) must not wait on in-flight pages
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _list_issue_ids(self, jql: str, project_key: str) -> list[str] | None:
+        """Return the ids of all issues matching ``jql`` in query order.
+
+        Pages through the search API with ``fields=id`` only, so each
+        request carries a few bytes per issue instead of the full payload.
+
+        Args:
+            jql: JQL query, including its ``ORDER BY`` clause
+            project_key: Project key for logging
+
+        Returns:
+            Ordered list of issue ids, or None if the listing failed or the
+            client returned an unexpected shape (callers then paginate
+            sequentially)
+
+        """
+        limiter = getattr(self.jira_client, "rate_limiter", None)
+        issue_ids: list[str] = []
+        start_at = 0
+        try:
+            while True:
+                if limiter is not None:
+                    limiter.wait_if_needed(f"search_issues_{project_key}")
+                request_start = time.time()
+                resp: Any = self.jira_client.jira.search_issues(
+                    jql,
+                    startAt=start_at,
+                    maxResults=1000,
+                    fields="id",
+                    expand=None,
+                    json_result=True,
+                )
+                if limiter is not None:
+                    limiter.record_response(time.time() - request_start, 200)
+                if not isinstance(resp, dict) or not isinstance(resp.get("issues"), list):
+                    return None
+                page = [str(item["id"]) for item in resp["issues"] if isinstance(item, dict) and item.get("id")]
+                if not page:
+                    break
+                issue_ids.extend(page)
+                start_at += len(resp["issues"])
+                total = resp.get("total")
+                if isinstance(total, int) and start_at >= total:
+                    break
+        except Exception as e:
+            logger.debug("Issue id listing failed for %s, paginating sequentially: %s", project_key, e)
+            return None
+        # Drop ids that shifted across listing pages while paging
+        return list(dict.fromkeys(issue_ids))
+
     def _get_project_total_issues(self, project_key: str) -> int | None:
         """Return total number of issues in a Jira project using search metadata.
 
@@ -3455,6 +3681,246 @@ class WorkPackageMigration(BaseMigration):
             ):
                 continue
 
+    def _settle_bulk_batch(
+        self,
+        run: _ProjectBulkCreate,
+        records: list[dict[str, Any]],
+        records_meta: list[dict[str, Any]],
+        outcome: Callable[[], dict[str, Any]],
+        *,
+        tail: bool,
+    ) -> None:
+        """Record one batch's result; on failure retry it in smaller sub-batches.
+
+        Raises:
+            StopIteration: If 3+ non-tail batches all failed (early termination)
+
+        """
+        prefix = "tail " if tail else ""
+        fallback_label = "Tail fallback" if tail else "Fallback"
+        try:
+            res = outcome()
+            if isinstance(res, dict):
+                # Persist the bulk result for diagnostics (include paired meta)
+                try:
+                    debug_path = (
+                        Path(self.data_dir)
+                        / f"bulk_result_{run.project_key}_{datetime.now(tz=UTC).strftime('%Y%m%d_%H%M%S')}.json"
+                    )
+                    with debug_path.open("w", encoding="utf-8") as f:
+                        json.dump({"result": res, "meta": records_meta}, f, indent=2)
+                    self.logger.info("Saved bulk result to %s", debug_path)
+                except Exception:
+                    pass
+                # Always process the created list to build mapping
+                created_list = res.get("created", [])
+                if isinstance(created_list, list) and created_list:
+                    self._record_created_work_packages(
+                        created_list,
+                        records_meta,
+                        run.op_project_id,
+                    )
+                # Compute created count
+                c = res.get("created_count") or res.get("total_created")
+                if c is None:
+                    c = len(created_list) if isinstance(created_list, list) else 0
+                run.created_count += int(c or 0)
+
+                # Track batch for early termination detection
+                run.total_attempted += len(records)
+                run.batches_processed += 1
+
+                if tail:
+                    # Log warning if we have systematic failure even on tail batch
+                    if run.created_count == 0 and run.total_attempted >= 100:
+                        self.logger.warning(
+                            "Processed %d batches (%d work packages attempted) with 0%% success rate for %s. "
+                            "All items are failing validation. Please review bulk result files in %s for error details.",
+                            run.batches_processed,
+                            run.total_attempted,
+                            run.project_key,
+                            self.data_dir,
+                        )
+                # Early termination: if we've processed 3+ batches (300+ items) with 0% success rate, stop
+                elif run.batches_processed >= 3 and run.created_count == 0 and run.total_attempted >= 300:
+                    self.logger.error(
+                        "EARLY TERMINATION: Processed %d batches (%d work packages attempted) with 0%% success rate for %s. "
+                        "All items are failing validation. Stopping to prevent wasted processing. "
+                        "Please review bulk result files in %s for error details.",
+                        run.batches_processed,
+                        run.total_attempted,
+                        run.project_key,
+                        self.data_dir,
+                    )
+                    # Break out of the issue iteration loop
+                    msg = "Early termination due to 100% failure rate"
+                    raise StopIteration(msg)
+        except StopIteration:
+            raise
+        except Exception as e:
+            self.logger.exception(
+                "Bulk create failed%s for %s: %s",
+                " (final)" if tail else "",
+                run.project_key,
+                e,
+            )
+            # Fallback: adaptively reduce batch size and retry in smaller chunks
+            try:
+                sizes = [max(1, len(records) // 2), max(10, len(records) // 4), 5, 1]
+                for sz in sizes:
+                    if sz >= len(records) and sz != 1:
+                        continue
+                    self.logger.info(
+                        "Retrying %s%s in %s sub-batches of size %s",
+                        prefix,
+                        run.project_key,
+                        (len(records) + sz - 1) // sz,
+                        sz,
+                    )
+                    for start in range(0, len(records), sz):
+                        sub = records[start : start + sz]
+                        meta_slice = records_meta[start : start + sz]
+                        try:
+                            sub_res = self.op_client.bulk_create_records(
+                                "WorkPackage",
+                                sub,
+                                timeout=900,
+                                result_basename=f"work_packages_{run.project_key}_sz{sz}",
+                            )
+                            if isinstance(sub_res, dict):
+                                created_list = sub_res.get("created", [])
+                                if isinstance(created_list, list) and created_list:
+                                    self._record_created_work_packages(
+                                        created_list,
+                                        meta_slice,
+                                        run.op_project_id,
+                                    )
+                                c = sub_res.get("created_count") or (
+                                    len(created_list) if isinstance(created_list, list) else 0
+                                )
+                                run.created_count += int(c or 0)
+                        except Exception as sub_e:
+                            self.logger.warning(
+                                "%s failed (%s..%s) for %s: %s",
+                                "Tail sub-batch" if tail else "Sub-batch",
+                                start,
+                                start + sz,
+                                run.project_key,
+                                sub_e,
+                            )
+                self.logger.info(
+                    "%s batching complete for %s; created so far: %s",
+                    fallback_label,
+                    run.project_key,
+                    run.created_count,
+                )
+            except Exception as fb_e:
+                self.logger.warning(
+                    "%s batching aborted for %s: %s",
+                    fallback_label,
+                    run.project_key,
+                    fb_e,
+                )
+
+    def _flush_bulk_batch(
+        self,
+        run: _ProjectBulkCreate,
+        records: list[dict[str, Any]],
+        records_meta: list[dict[str, Any]],
+        defaults_cache: dict[str, Any],
+        *,
+        tail: bool,
+    ) -> None:
+        """Apply defaults to a full batch and hand it to ``bulk_create_records``.
+
+        Raises:
+            StopIteration: If early termination triggered while settling a batch
+
+        """
+        # Ensure project_id is present on every record in the batch
+        try:
+            for _rec in records:
+                if "project_id" not in _rec or _rec.get("project_id") in (None, 0, ""):
+                    _rec["project_id"] = run.op_project_id
+        except Exception:
+            pass
+
+        # Determine a fallback admin user id (looked up once per run)
+        fallback_admin_user_id: int | str | None = None
+        try:
+            admin_id = _defaults_query(
+                self.op_client,
+                "User.where(admin: true).limit(1).pluck(:id).first",
+                defaults_cache,
+                timeout=60,
+            )
+            if isinstance(admin_id, int):
+                fallback_admin_user_id = admin_id
+        except Exception:
+            fallback_admin_user_id = None
+        try:
+            _apply_required_defaults(
+                records,
+                project_id=run.op_project_id,
+                op_client=self.op_client,
+                fallback_admin_user_id=fallback_admin_user_id,
+                query_cache=defaults_cache,
+            )
+        except Exception as e:
+            self.logger.warning("Defaults application failed for %s: %s", run.project_key, e)
+
+        # Remove _log_counters before sending to Rails (not a valid attribute)
+        for wp in records:
+            wp.pop("_log_counters", None)
+
+        if run.pipeline is None:
+            self._settle_bulk_batch(
+                run,
+                records,
+                records_meta,
+                lambda: self.op_client.bulk_create_records(
+                    "WorkPackage",
+                    records,
+                    timeout=900,
+                    result_basename=f"work_packages_{run.project_key}",
+                ),
+                tail=tail,
+            )
+            return
+
+        # ``records`` must stay untouched from here on: the pipeline
+        # serializes it on its stage worker.
+        future = run.pipeline.submit(
+            "WorkPackage",
+            records,
+            timeout=900,
+            result_basename=f"work_packages_{run.project_key}",
+        )
+        run.pending.append((future, records, records_meta, tail))
+        # Settle finished batches in submission order without blocking.
+        while run.pending and run.pending[0][0].done():
+            done_future, done_records, done_meta, done_tail = run.pending.popleft()
+            self._settle_bulk_batch(run, done_records, done_meta, done_future.result, tail=done_tail)
+
+    def _drain_bulk_pipeline(self, run: _ProjectBulkCreate) -> None:
+        """Settle every batch still in the pipeline and shut it down."""
+        stopped = False
+        while run.pending:
+            future, records, records_meta, tail = run.pending.popleft()
+            try:
+                self._settle_bulk_batch(run, records, records_meta, future.result, tail=tail)
+            except StopIteration:
+                # The batches already in flight still get their mappings.
+                if not stopped:
+                    self.logger.warning(
+                        "Migration stopped early for %s after %d failed attempts",
+                        run.project_key,
+                        run.total_attempted,
+                    )
+                stopped = True
+        if run.pipeline is not None:
+            run.pipeline.close()
+
     def _migrate_work_packages(self) -> dict[str, Any]:
         """Simplified migration implementation to unblock execution.
 
@@ -3488,6 +3954,9 @@ class WorkPackageMigration(BaseMigration):
             return results
 
         batch_size = config.migration_config.get("batch_size", 100)
+        # Default type/status/priority/admin ids are looked up once per run
+        # instead of once per batch (see ``_defaults_query``).
+        defaults_cache: dict[str, Any] = {}
 
         for project_key in jira_projects:
             # Resolve OpenProject project id - check mapping first
@@ -3537,17 +4006,22 @@ class WorkPackageMigration(BaseMigration):
                     )
                     continue
 
-            created_count = 0
             issues_seen = 0
             batch: list[dict[str, Any]] = []
-            # Early termination tracking
-            total_attempted = 0
-            batches_processed = 0
 
             # Fetch existing work packages for incremental update detection
-            existing_wp_map = self._get_existing_work_packages(int(op_project_id))
+            existing_wp_map = self._get_existing_work_packages(int(op_project_id), project_key)
             self.logger.info(f"Found {len(existing_wp_map)} existing work packages for project {project_key}")
 
+            # Batches are created via ``bulk_create_records``. With the bulk
+            # pipeline enabled, batch N+1 uploads while batch N runs in Rails
+            # and each outcome is settled once its future completes, i.e.
+            # usually one batch late.
+            bulk_run = _ProjectBulkCreate(
+                project_key=project_key,
+                op_project_id=int(op_project_id),
+                pipeline=self.op_client.bulk_create_pipeline() if bulk_pipeline_enabled() else None,
+            )
             try:
                 work_packages_meta: list[dict[str, Any]] = []
                 # Collect existing WP updates for parallel processing
@@ -3588,341 +4062,94 @@ class WorkPackageMigration(BaseMigration):
                         pass
                     work_packages_meta.append(meta)
                     if len(batch) >= batch_size:
-                        # Ensure project_id is present on every record in the batch
                         try:
-                            for _rec in batch:
-                                if "project_id" not in _rec or _rec.get("project_id") in (None, 0, ""):
-                                    _rec["project_id"] = int(op_project_id)
-                        except Exception:
-                            pass
-
-                        # Determine a fallback admin user id once (best-effort)
-                        fallback_admin_user_id: int | str | None = None
-                        try:
-                            admin_id = self.op_client.execute_large_query_to_json_file(
-                                "User.where(admin: true).limit(1).pluck(:id).first",
-                                timeout=60,
-                            )
-                            if isinstance(admin_id, int):
-                                fallback_admin_user_id = admin_id
-                        except Exception:
-                            fallback_admin_user_id = None
-                        try:
-                            _apply_required_defaults(
-                                batch,
-                                project_id=int(op_project_id),
-                                op_client=self.op_client,
-                                fallback_admin_user_id=fallback_admin_user_id,
-                            )
-                        except Exception as e:
-                            self.logger.warning("Defaults application failed for %s: %s", project_key, e)
-
-                        # Save batch size for tracking before processing
-                        current_batch_size = len(batch)
-
-                        try:
-                            # Remove _log_counters before sending to Rails (not a valid attribute)
-                            for wp in batch:
-                                wp.pop("_log_counters", None)
-                            res = self.op_client.bulk_create_records(
-                                "WorkPackage",
-                                batch,
-                                timeout=900,
-                                result_basename=f"work_packages_{project_key}",
-                            )
-                            if isinstance(res, dict):
-                                # Persist the bulk result for diagnostics (include paired meta)
-                                try:
-                                    debug_path = (
-                                        Path(self.data_dir)
-                                        / f"bulk_result_{project_key}_{datetime.now(tz=UTC).strftime('%Y%m%d_%H%M%S')}.json"
-                                    )
-                                    with debug_path.open("w", encoding="utf-8") as f:
-                                        json.dump({"result": res, "meta": work_packages_meta}, f, indent=2)
-                                    self.logger.info("Saved bulk result to %s", debug_path)
-                                except Exception:
-                                    pass
-                                # Always process the created list to build mapping
-                                created_list = res.get("created", [])
-                                if isinstance(created_list, list) and created_list:
-                                    self._record_created_work_packages(
-                                        created_list,
-                                        work_packages_meta,
-                                        int(op_project_id),
-                                    )
-                                # Compute created count
-                                c = res.get("created_count") or res.get("total_created")
-                                if c is None:
-                                    c = len(created_list) if isinstance(created_list, list) else 0
-                                created_count += int(c or 0)
-
-                                # Track batch for early termination detection
-                                total_attempted += current_batch_size
-                                batches_processed += 1
-
-                                # Early termination: if we've processed 3+ batches (300+ items) with 0% success rate, stop
-                                if batches_processed >= 3 and created_count == 0 and total_attempted >= 300:
-                                    self.logger.error(
-                                        "EARLY TERMINATION: Processed %d batches (%d work packages attempted) with 0%% success rate for %s. "
-                                        "All items are failing validation. Stopping to prevent wasted processing. "
-                                        "Please review bulk result files in %s for error details.",
-                                        batches_processed,
-                                        total_attempted,
-                                        project_key,
-                                        self.data_dir,
-                                    )
-                                    # Break out of the issue iteration loop
-                                    msg = "Early termination due to 100% failure rate"
-                                    raise StopIteration(msg)
+                            self._flush_bulk_batch(bulk_run, batch, work_packages_meta, defaults_cache, tail=False)
                         except StopIteration:
                             # Early termination triggered - exit cleanly
                             self.logger.warning(
                                 "Migration stopped early for %s after %d failed attempts",
                                 project_key,
-                                total_attempted,
+                                bulk_run.total_attempted,
                             )
                             break
-                        except Exception as e:
-                            self.logger.exception("Bulk create failed for %s: %s", project_key, e)
-                            # Fallback: adaptively reduce batch size and retry in smaller chunks
-                            try:
-                                sizes = [max(1, len(batch) // 2), max(10, len(batch) // 4), 5, 1]
-                                for sz in sizes:
-                                    if sz >= len(batch) and sz != 1:
-                                        continue
-                                    self.logger.info(
-                                        "Retrying %s in %s sub-batches of size %s",
-                                        project_key,
-                                        (len(batch) + sz - 1) // sz,
-                                        sz,
-                                    )
-                                    for start in range(0, len(batch), sz):
-                                        sub = batch[start : start + sz]
-                                        meta_slice = work_packages_meta[start : start + sz]
-                                        try:
-                                            # Remove _log_counters before sending to Rails
-                                            for wp in sub:
-                                                wp.pop("_log_counters", None)
-                                            sub_res = self.op_client.bulk_create_records(
-                                                "WorkPackage",
-                                                sub,
-                                                timeout=900,
-                                                result_basename=f"work_packages_{project_key}_sz{sz}",
-                                            )
-                                            if isinstance(sub_res, dict):
-                                                created_list = sub_res.get("created", [])
-                                                if isinstance(created_list, list) and created_list:
-                                                    self._record_created_work_packages(
-                                                        created_list,
-                                                        meta_slice,
-                                                        int(op_project_id),
-                                                    )
-                                                c = sub_res.get("created_count") or (
-                                                    len(created_list) if isinstance(created_list, list) else 0
-                                                )
-                                                created_count += int(c or 0)
-                                        except Exception as sub_e:
-                                            self.logger.warning(
-                                                "Sub-batch failed (%s..%s) for %s: %s",
-                                                start,
-                                                start + sz,
-                                                project_key,
-                                                sub_e,
-                                            )
-                                self.logger.info(
-                                    "Fallback batching complete for %s; created so far: %s",
-                                    project_key,
-                                    created_count,
-                                )
-                            except Exception as fb_e:
-                                self.logger.warning("Fallback batching aborted for %s: %s", project_key, fb_e)
                         finally:
                             batch = []
                             work_packages_meta = []
 
                 # Flush tail batch
                 if batch:
-                    # Ensure project_id is present on every record in the tail batch
-                    try:
-                        for _rec in batch:
-                            if "project_id" not in _rec or _rec.get("project_id") in (None, 0, ""):
-                                _rec["project_id"] = int(op_project_id)
-                    except Exception:
-                        pass
-
-                    # Determine a fallback admin user id once (best-effort)
-                    fallback_admin_user_id: int | str | None = None
-                    try:
-                        admin_id = self.op_client.execute_large_query_to_json_file(
-                            "User.where(admin: true).limit(1).pluck(:id).first",
-                            timeout=60,
-                        )
-                        if isinstance(admin_id, int):
-                            fallback_admin_user_id = admin_id
-                    except Exception:
-                        fallback_admin_user_id = None
                     try:
-                        _apply_required_defaults(
-                            batch,
-                            project_id=int(op_project_id),
-                            op_client=self.op_client,
-                            fallback_admin_user_id=fallback_admin_user_id,
+                        self._flush_bulk_batch(bulk_run, batch, work_packages_meta, defaults_cache, tail=True)
+                    except StopIteration:
+                        # In pipeline mode the tail flush also settles earlier
+                        # non-tail batches, which can trigger early termination
+                        self.logger.warning(
+                            "Migration stopped early for %s after %d failed attempts",
+                            project_key,
+                            bulk_run.total_attempted,
                         )
-                    except Exception as e:
-                        self.logger.warning("Defaults application failed for %s: %s", project_key, e)
-
-                    # Save batch size for tracking before processing
-                    current_batch_size = len(batch)
-
-                    try:
-                        # Remove _log_counters before sending to Rails
-                        for wp in batch:
-                            wp.pop("_log_counters", None)
-                        res = self.op_client.bulk_create_records(
-                            "WorkPackage",
-                            batch,
-                            timeout=900,
-                            result_basename=f"work_packages_{project_key}",
-                        )
-                        if isinstance(res, dict):
-                            # Persist the bulk result for diagnostics (include paired meta)
-                            try:
-                                debug_path = (
-                                    Path(self.data_dir)
-                                    / f"bulk_result_{project_key}_{datetime.now(tz=UTC).strftime('%Y%m%d_%H%M%S')}.json"
-                                )
-                                with debug_path.open("w", encoding="utf-8") as f:
-                                    json.dump({"result": res, "meta": work_packages_meta}, f, indent=2)
-                                self.logger.info("Saved bulk result to %s", debug_path)
-                            except Exception:
-                                pass
-                            # Always process the created list to build mapping
-                            created_list = res.get("created", [])
-                            if isinstance(created_list, list) and created_list:
-                                self._record_created_work_packages(
-                                    created_list,
-                                    work_packages_meta,
-                                    int(op_project_id),
-                                )
-                            # Compute created count
-                            c = res.get("created_count") or res.get("total_created")
-                            if c is None:
-                                c = len(created_list) if isinstance(created_list, list) else 0
-                            created_count += int(c or 0)
-
-                            # Track tail batch for early termination detection
-                            total_attempted += current_batch_size
-                            batches_processed += 1
-
-                            # Log warning if we have systematic failure even on tail batch
-                            if created_count == 0 and total_attempted >= 100:
-                                self.logger.warning(
-                                    "Processed %d batches (%d work packages attempted) with 0%% success rate for %s. "
-                                    "All items are failing validation. Please review bulk result files in %s for error details.",
-                                    batches_processed,
-                                    total_attempted,
-                                    project_key,
-                                    self.data_dir,
-                                )
-                    except Exception as e:
-                        self.logger.exception("Bulk create failed (final) for %s: %s", project_key, e)
-                        # Final fallback for tail batch
-                        try:
-                            sizes = [max(1, len(batch) // 2), max(10, len(batch) // 4), 5, 1]
-                            for sz in sizes:
-                                if sz >= len(batch) and sz != 1:
-                                    continue
-                                self.logger.info(
-                                    "Retrying tail %s in %s sub-batches of size %s",
-                                    project_key,
-                                    (len(batch) + sz - 1) // sz,
-                                    sz,
-                                )
-                                for start in range(0, len(batch), sz):
-                                    sub = batch[start : start + sz]
-                                    meta_slice = work_packages_meta[start : start + sz]
-                                    try:
-                                        # Remove _log_counters before sending to Rails
-                                        for wp in sub:
-                                            wp.pop("_log_counters", None)
-                                        sub_res = self.op_client.bulk_create_records(
-                                            "WorkPackage",
-                                            sub,
-                                            timeout=900,
-                                            result_basename=f"work_packages_{project_key}_sz{sz}",
-                                        )
-                                        if isinstance(sub_res, dict):
-                                            created_list = sub_res.get("created", [])
-                                            if isinstance(created_list, list) and created_list:
-                                                self._record_created_work_packages(
-                                                    created_list,
-                                                    meta_slice,
-                                                    int(op_project_id),
-                                                )
-                                            c = sub_res.get("created_count") or (
-                                                len(created_list) if isinstance(created_list, list) else 0
-                                            )
-                                            created_count += int(c or 0)
-                                    except Exception as sub_e:
-                                        self.logger.warning(
-                                            "Tail sub-batch failed (%s..%s) for %s: %s",
-                                            start,
-                                            start + sz,
-                                            project_key,
-                                            sub_e,
-                                        )
-                            self.logger.info(
-                                "Tail fallback batching complete for %s; created so far: %s",
-                                project_key,
-                                created_count,
-                            )
-                        except Exception as fb_e:
-                            self.logger.warning("Tail fallback batching aborted for %s: %s", project_key, fb_e)
+                    finally:
+                        batch = []
+                        work_packages_meta = []
+                self._drain_bulk_pipeline(bulk_run)
 
                 # Process existing WP updates in batches
                 # Batching amortizes SSH/tmux overhead across multiple WPs
-                # Each batch: parallel Jira fetch, single Rails call
+                # Each batch: parallel Jira fetch, single Rails call. Batches
+                # cover disjoint WPs, so they run concurrently on the Rails
+                # session pool (sequentially with a single session).
                 WP_BATCH_SIZE = 20  # Number of WPs per batch
                 if existing_wp_updates:
                     total_wps = len(existing_wp_updates)
-                    num_batches = (total_wps + WP_BATCH_SIZE - 1) // WP_BATCH_SIZE
+                    batches = [
+                        existing_wp_updates[start : start + WP_BATCH_SIZE]
+                        for start in range(0, total_wps, WP_BATCH_SIZE)
+                    ]
+                    num_batches = len(batches)
+                    session_pool = session_pool_for(self.op_client)
                     self.logger.info(
                         f"Processing {total_wps} existing WP updates in {num_batches} batches "
-                        f"(batch size: {WP_BATCH_SIZE})",
+                        f"(batch size: {WP_BATCH_SIZE}, rails sessions: {session_pool.size})",
                     )
                     total_success = 0
                     total_errors = 0
-
-                    for batch_idx in range(num_batches):
-                        start_idx = batch_idx * WP_BATCH_SIZE
-                        end_idx = min(start_idx + WP_BATCH_SIZE, total_wps)
-                        batch = existing_wp_updates[start_idx:end_idx]
-
-                        self.logger.info(
-                            f"Batch {batch_idx + 1}/{num_batches}: WPs {start_idx + 1}-{end_idx}",
-                        )
-
-                        try:
-                            success, errors = self._update_existing_work_packages_batch(batch)
+                    processed = 0
+
+                    for batch_idx, outcome, error in session_pool.dispatch(
+                        batches,
+                        self._update_existing_work_packages_batch,
+                    ):
+                        batch = batches[batch_idx]
+                        if error is not None:
+                            self.logger.warning(f"Batch {batch_idx + 1} failed: {error}")
+                            total_errors += len(batch)
+                        else:
+                            success, errors = outcome
                             total_success += success
                             total_errors += errors
-                        except Exception as e:
-                            self.logger.warning(f"Batch {batch_idx + 1} failed: {e}")
-                            total_errors += len(batch)
 
                         # Log progress after each batch
-                        processed = end_idx
+                        processed += len(batch)
                         self.logger.info(
-                            f"Batch progress: {processed}/{total_wps} WPs "
+                            f"Batch {batch_idx + 1}/{num_batches} done; progress: {processed}/{total_wps} WPs "
                             f"(success: {total_success}, errors: {total_errors})",
                         )
 
                     self.logger.info(
                         f"WP update complete: {total_success} success, {total_errors} errors",
                     )
+                    if session_pool.size > 1:
+                        session_pool.log_utilisation()
 
             except Exception as e:
                 self.logger.exception("Failed migrating project %s: %s", project_key, e)
+            finally:
+                # Batches still in flight were already sent to Rails; map them regardless.
+                self._drain_bulk_pipeline(bulk_run)
+
+            # Bulk mode skipped the hierarchy callbacks; rebuild once per project
+            if bulk_run.created_count and bulk_mode_enabled():
+                self.op_client.rebuild_derived_work_package_data([int(op_project_id)])
 
             # Assign project membership for mentioned users (so @mentions render as clickable links)
             if op_project_id:
@@ -3935,8 +4162,10 @@ class WorkPackageMigration(BaseMigration):
                 except Exception as e:
                     self.logger.warning(f"Failed to assign memberships for mentioned users in {project_key}: {e}")
 
-            results["projects"].append({"project_key": project_key, "created": created_count, "issues": issues_seen})
-            results["total_created"] += created_count
+            results["projects"].append(
+                {"project_key": project_key, "created": bulk_run.created_count, "issues": issues_seen}
+            )
+            results["total_created"] += bulk_run.created_count
             results["total_issues"] += issues_seen
 
         # Save the work package mapping if available (used by time_entries)
@@ -3982,16 +4211,33 @@ class WorkPackageMigration(BaseMigration):
             )
 
 
-def _choose_default_type_id(op_client: Any) -> int:
+def _defaults_query(
+    op_client: Any,
+    query: str,
+    query_cache: dict[str, Any] | None,
+    *,
+    timeout: int = 180,
+) -> Any:
+    """Run a defaults lookup, reusing the answer stored in ``query_cache`` if any.
+
+    Only successful answers are cached; the looked-up ids (first type, status,
+    priority, admin) don't change during a run.
+    """
+    if query_cache is not None and query in query_cache:
+        return query_cache[query]
+    value = op_client.execute_large_query_to_json_file(query, timeout=timeout)
+    if query_cache is not None:
+        query_cache[query] = value
+    return value
+
+
+def _choose_default_type_id(op_client: Any, query_cache: dict[str, Any] | None = None) -> int:
     """Pick a default Type ID, preferring the first by position, else 1.
 
     This helper is isolated for testability.
     """
     try:
-        type_ids = op_client.execute_large_query_to_json_file(
-            "Type.order(:position).pluck(:id)",
-            timeout=180,
-        )
+        type_ids = _defaults_query(op_client, "Type.order(:position).pluck(:id)", query_cache)
         if isinstance(type_ids, list) and type_ids:
             return int(type_ids[0])
     except Exception:
@@ -4005,20 +4251,19 @@ def _apply_required_defaults(
     project_id: int | None,
     op_client: Any,
     fallback_admin_user_id: int | str | None,
+    query_cache: dict[str, Any] | None = None,
 ) -> None:
     """Fill in missing required fields on WorkPackage records.
 
-    Sets type_id, status_id, priority_id, author_id if missing.
+    Sets type_id, status_id, priority_id, author_id if missing. Lookups go
+    through ``query_cache`` when one is given.
     """
     # Defaults via file-based queries
-    default_type_id = _choose_default_type_id(op_client)
+    default_type_id = _choose_default_type_id(op_client, query_cache)
 
     default_status_id = 1
     try:
-        status_ids = op_client.execute_large_query_to_json_file(
-            "Status.order(:position).pluck(:id)",
-            timeout=180,
-        )
+        status_ids = _defaults_query(op_client, "Status.order(:position).pluck(:id)", query_cache)
         if isinstance(status_ids, list) and status_ids:
             default_status_id = int(status_ids[0])
     except Exception:
@@ -4026,10 +4271,7 @@ def _apply_required_defaults(
 
     default_priority_id = None
     try:
-        pr_ids = op_client.execute_large_query_to_json_file(
-            "IssuePriority.order(:position).pluck(:id)",
-            timeout=180,
-        )
+        pr_ids = _defaults_query(op_client, "IssuePriority.order(:position).pluck(:id)", query_cache)
         if isinstance(pr_ids, list) and pr_ids:
             default_priority_id = int(pr_ids[0])
     except Exception:
@@ -4043,10 +4285,7 @@ def _apply_required_defaults(
             default_author_id = fallback_admin_user_id
     if not default_author_id:
         try:
-            admin_ids = op_client.execute_large_query_to_json_file(
-                "User.where(admin: true).limit(1).pluck(:id)",
-                timeout=180,
-            )
+            admin_ids = _defaults_query(op_client, "User.where(admin: true).limit(1).pluck(:id)", query_cache)
             if isinstance(admin_ids, list) and admin_ids:
                 default_author_id = int(admin_ids[0])
         except Exception:
@@ -58,7 +58,9 @@ from typing import TYPE_CHECKING, Any, NoReturn
 from src import config
 from src.application.components.base_migration import BaseMigration, register_entity_types
 from src.infrastructure.jira.jira_client import JiraClient
+from src.infrastructure.openproject.openproject_bulk_create_service import skeleton_fast_path_enabled
 from src.infrastructure.openproject.openproject_client import OpenProjectClient
+from src.infrastructure.openproject.rails_bulk_mode import bulk_mode_enabled
 from src.models import ComponentResult, JiraUser
 from src.models.migration_error import MigrationError
 
@@ -836,6 +838,11 @@ class WorkPackageSkeletonMigration(BaseMigration):
         if not payloads:
             return 0, 0, []
 
+        if skeleton_fast_path_enabled():
+            key_cf_id = self._get_j2o_origin_key_cf_id()
+            if key_cf_id:
+                return self._insert_skeletons_batch(payloads, project_key, int(key_cf_id))
+
         # Extract jira info before sending to batch (we remove _ prefixed keys)
         jira_info = [(p["_jira_id"], p["_jira_key"]) for p in payloads]
         clean_payloads = [{k: v for k, v in p.items() if not k.startswith("_")} for p in payloads]
@@ -879,6 +886,55 @@ class WorkPackageSkeletonMigration(BaseMigration):
             self.logger.error("Batch creation failed for %s: %s", project_key, e)
             return 0, len(payloads), []
 
+    def _insert_skeletons_batch(
+        self,
+        payloads: list[dict[str, Any]],
+        project_key: str,
+        key_cf_id: int,
+    ) -> tuple[int, int, list[tuple[str, str, int]]]:
+        """Create a batch of skeletons set-based, matched back by Jira key.
+
+        Skeletons that already exist in OpenProject (same J2O Origin Key)
+        are mapped but not counted as created.
+
+        Returns:
+            Tuple of (created_count, failed_count, list of (jira_id, jira_key, wp_id))
+
+        """
+        jira_ids = {p["_jira_key"]: p["_jira_id"] for p in payloads}
+        skeletons = [{**{k: v for k, v in p.items() if not k.startswith("_")}, "key": p["_jira_key"]} for p in payloads]
+
+        try:
+            result = self.op_client.insert_work_package_skeletons(skeletons, key_cf_id)
+        except Exception as e:
+            self.logger.error("Skeleton insert failed for %s: %s", project_key, e)
+            return 0, len(payloads), []
+
+        mappings = [
+            (jira_ids[key], key, int(wp_id))
+            for key, wp_id in (result.get("ids_by_key") or {}).items()
+            if key in jira_ids
+        ]
+        failed_details = [
+            f"{res.get('key')}: {res.get('error', 'Unknown error')}"
+            for res in result.get("results", [])
+            if res.get("status") == "failed"
+        ]
+        created = int(result.get("created", 0))
+        failed = int(result.get("failed", 0))
+        self.logger.info(
+            "  Batch result: %d created, %d existing, %d failed in %s",
+            created,
+            int(result.get("existing", 0)),
+            failed,
+            project_key,
+        )
+        for detail in failed_details[:5]:
+            self.logger.warning("  Failed: %s", detail)
+        if len(failed_details) > 5:
+            self.logger.warning("  ... and %d more failures", len(failed_details) - 5)
+        return created, failed, mappings
+
     def _update_mapping(
         self,
         jira_issue: Issue,
@@ -1014,6 +1070,10 @@ class WorkPackageSkeletonMigration(BaseMigration):
                     }
                 self._save_mapping()
 
+            # Bulk mode skipped the hierarchy callbacks; rebuild once per project
+            if project_results["created"] and bulk_mode_enabled():
+                self.op_client.rebuild_derived_work_package_data([project_id])
+
             # Aggregate results
             results["projects"][project_key] = project_results
             results["total_processed"] += project_results["processed"]
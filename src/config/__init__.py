@@ -22,6 +22,7 @@ ADR-002, this proxy is removed in Phase 7.
 from __future__ import annotations
 
 import logging
+import os
 import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
@@ -163,6 +164,7 @@ __all__ = [
     "logger",
     "mappings",
     "migration_config",
+    "migration_flag",
     "openproject_config",
     "reset_mappings",
     "update_from_cli_args",
@@ -278,6 +280,18 @@ def get_value(
     return _config_loader.get_value(section, key, default)
 
 
+def migration_flag(env: str, key: str, *, default: bool = False) -> bool:
+    """Return a boolean switch from ``env`` if set, else ``migration.<key>``.
+
+    The environment variable wins so a single run can flip a configured
+    switch; it is true for ``1``/``true``/``yes``/``on`` (any case).
+    """
+    raw = os.environ.get(env)
+    if raw is not None:
+        return raw.strip().lower() in {"1", "true", "yes", "on"}
+    return bool(migration_config.get(key, default))
+
+
 def get_path(path_type: DirType) -> Path:
     """Get a specific path from var_dirs."""
     if path_type not in var_dirs:
@@ -189,7 +189,12 @@ class BatchOperationsDecorator(_BaseJiraDecorator):
     def _chunked(self, keys: list[str]) -> list[list[str]]:
         return [keys[i : i + self._batch_size] for i in range(0, len(keys), self._batch_size)]
 
-    def _fetch_issues_batch(self, issue_keys: list[str]) -> dict[str, Issue | None]:
+    def _fetch_issues_batch(
+        self,
+        issue_keys: list[str],
+        fields: str | None = None,
+        expand: str | None = "changelog",
+    ) -> dict[str, Issue | None]:
         if not issue_keys:
             return {}
         jira = getattr(self._wrapped, "jira", None)
@@ -198,13 +203,22 @@ class BatchOperationsDecorator(_BaseJiraDecorator):
             raise RuntimeError(msg)
         jql = f"key in ({','.join(issue_keys)})"
         try:
-            issues = jira.search_issues(jql, maxResults=len(issue_keys), expand="changelog")
+            search_kwargs: dict[str, Any] = {"maxResults": len(issue_keys), "expand": expand}
+            if fields is not None:
+                search_kwargs["fields"] = fields
+            issues = jira.search_issues(jql, **search_kwargs)
             found = {issue.key: issue for issue in issues}
             return {key: found.get(key) for key in issue_keys}
         except Exception:
             return dict.fromkeys(issue_keys)
 
-    def batch_get_issues(self, issue_keys: list[str]) -> dict[str, Issue | None]:
+    def batch_get_issues(
+        self,
+        issue_keys: list[str],
+        *,
+        fields: str | None = None,
+        expand: str | None = "changelog",
+    ) -> dict[str, Issue | None]:
         """Fetch issues in parallel batches; missing/failed keys map to ``None``."""
         if not issue_keys:
             return {}
@@ -214,7 +228,7 @@ class BatchOperationsDecorator(_BaseJiraDecorator):
         with ThreadPoolExecutor(max_workers=self._parallel_workers) as executor:
             future_to_keys: dict[Any, list[str]] = {}
             for batch in batches:
-                future_to_keys[executor.submit(self._fetch_issues_batch, batch)] = batch
+                future_to_keys[executor.submit(self._fetch_issues_batch, batch, fields, expand)] = batch
             for fut in as_completed(future_to_keys):
                 keys = future_to_keys[fut]
                 try:
@@ -58,7 +58,12 @@ class EnhancedJiraClient(JiraClient):
     # dynamic JIRA class import and authentication
 
     # ----- Batch operations -----
-    def _fetch_issues_batch(self, issue_keys: list[str]) -> dict[str, Issue | None]:
+    def _fetch_issues_batch(
+        self,
+        issue_keys: list[str],
+        fields: str | None = None,
+        expand: str | None = "changelog",
+    ) -> dict[str, Issue | None]:
         """Fetch a batch of issues by keys using one JQL call."""
         if not issue_keys:
             return {}
@@ -68,14 +73,23 @@ class EnhancedJiraClient(JiraClient):
 
         jql = f"key in ({','.join(issue_keys)})"
         try:
-            issues = self.jira.search_issues(jql, maxResults=len(issue_keys), expand="changelog")
+            search_kwargs: dict[str, Any] = {"maxResults": len(issue_keys), "expand": expand}
+            if fields is not None:
+                search_kwargs["fields"] = fields
+            issues = self.jira.search_issues(jql, **search_kwargs)
             found_map = {issue.key: issue for issue in issues}
             return {key: found_map.get(key) for key in issue_keys}
         except Exception:
             # On error, return None for all keys in this batch (tests expect this)
             return dict.fromkeys(issue_keys)
 
-    def batch_get_issues(self, issue_keys: list[str]) -> dict[str, Issue | None]:
+    def batch_get_issues(
+        self,
+        issue_keys: list[str],
+        *,
+        fields: str | None = None,
+        expand: str | None = "changelog",
+    ) -> dict[str, Issue | None]:
         """Retrieve issues in parallel batches with graceful error handling."""
         if not issue_keys:
             return {}
@@ -87,7 +101,7 @@ class EnhancedJiraClient(JiraClient):
             futures: list[Any] = []
             future_to_keys: dict[Any, list[str]] = {}
             for batch in batches:
-                fut = executor.submit(self._fetch_issues_batch, batch)
+                fut = executor.submit(self._fetch_issues_batch, batch, fields, expand)
                 futures.append(fut)
                 future_to_keys[fut] = batch
 
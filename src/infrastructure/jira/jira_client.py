@@ -8,12 +8,14 @@ caching, and parallel processing.
 from __future__ import annotations
 
 import time
-from collections.abc import Iterator, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from typing import TYPE_CHECKING, Any
 
 from requests import Response
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from jira.exceptions import JIRAError as AtlassianJIRAError
 
     from jira import JIRA, Issue
@@ -568,6 +570,10 @@ class JiraClient:
         """Thin delegator over ``self.fields.get_custom_fields``."""
         return self.fields.get_custom_fields()
 
+    def resolve_field_ids(self, names: list[str]) -> dict[str, str]:
+        """Thin delegator over ``self.fields.resolve_field_ids``."""
+        return self.fields.resolve_field_ids(names)
+
     def _patch_jira_client(self) -> None:
         """Patch the JIRA client to catch CAPTCHA challenges.
 
@@ -697,11 +703,29 @@ class JiraClient:
         project_key: str,
         *,
         include_empty: bool = False,
+        bulk: bool = False,
+        since: datetime | int | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
         """Delegate to ``self.worklogs.get_all_work_logs_for_project``."""
         return self.worklogs.get_all_work_logs_for_project(
             project_key,
             include_empty=include_empty,
+            bulk=bulk,
+            since=since,
+        )
+
+    def get_work_logs_for_projects(
+        self,
+        project_keys: Iterable[str],
+        *,
+        since: datetime | int | None = None,
+        include_empty: bool = False,
+    ) -> tuple[dict[str, list[dict[str, Any]]], int | None]:
+        """Delegate to ``self.worklogs.get_work_logs_for_projects``."""
+        return self.worklogs.get_work_logs_for_projects(
+            project_keys,
+            since=since,
+            include_empty=include_empty,
         )
 
     def get_work_log_details(self, issue_key: str, work_log_id: str) -> dict[str, Any]:
@@ -835,9 +859,15 @@ class JiraClient:
 
     # ===== BATCH OPERATIONS =====
 
-    def batch_get_issues(self, issue_keys: list[str]) -> dict[str, Issue]:
+    def batch_get_issues(
+        self,
+        issue_keys: list[str],
+        *,
+        fields: str | None = None,
+        expand: str | None = "changelog",
+    ) -> dict[str, Issue]:
         """Thin delegator over ``self.issues.batch_get_issues``."""
-        return self.issues.batch_get_issues(issue_keys)
+        return self.issues.batch_get_issues(issue_keys, fields=fields, expand=expand)
 
     def batch_get_projects(self, project_keys: list[str]) -> dict[str, dict]:
         """Thin delegator over ``self.projects.batch_get_projects``."""
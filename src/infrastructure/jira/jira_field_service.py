@@ -35,6 +35,8 @@ class JiraFieldService:
         from src.infrastructure.jira.jira_client import logger
 
         self._logger = logger
+        # Display name (lower-cased) → field id, filled on first resolve.
+        self._field_ids_by_name: dict[str, str] | None = None
 
     # ── reads ────────────────────────────────────────────────────────────
 
@@ -220,3 +222,34 @@ class JiraFieldService:
             error_msg = f"Failed to retrieve custom fields: {e}"
             self._logger.exception(error_msg)
             raise JiraApiError(error_msg) from e
+
+    def resolve_field_ids(self, names: list[str]) -> dict[str, str]:
+        """Resolve custom-field display names to Jira field ids.
+
+        The custom-field list is fetched once and cached on the service.
+        Matching is case-insensitive; names without a match are omitted
+        from the result so callers can decide how to fall back.
+
+        Args:
+            names: Custom-field display names, e.g. ``"Story Points"``
+
+        Returns:
+            Mapping of each resolved name to its ``customfield_*`` id
+
+        Raises:
+            JiraConnectionError: If the Jira client isn't initialized.
+            JiraApiError: If the custom-field listing fails.
+
+        """
+        if self._field_ids_by_name is None:
+            self._field_ids_by_name = {
+                str(field["name"]).strip().lower(): str(field["id"])
+                for field in self.get_custom_fields()
+                if field.get("name") and field.get("id")
+            }
+        resolved: dict[str, str] = {}
+        for name in names:
+            field_id = self._field_ids_by_name.get(name.strip().lower())
+            if field_id:
+                resolved[name] = field_id
+        return resolved
@@ -18,6 +18,7 @@ the ``jira`` SDK — so there is no Ruby-script escaping to worry about.
 
 from __future__ import annotations
 
+import functools
 import re
 import time
 from collections.abc import Iterator
@@ -247,8 +248,22 @@ class JiraIssueService:
 
     # ── batch operations ─────────────────────────────────────────────────
 
-    def batch_get_issues(self, issue_keys: list[str]) -> dict[str, Issue]:
-        """Retrieve multiple issues in batches for optimal performance."""
+    def batch_get_issues(
+        self,
+        issue_keys: list[str],
+        *,
+        fields: str | None = None,
+        expand: str | None = "changelog",
+    ) -> dict[str, Issue]:
+        """Retrieve multiple issues in batches for optimal performance.
+
+        Args:
+            issue_keys: Jira issue keys to fetch
+            fields: Comma-separated field ids to request; ``None`` requests
+                every field
+            expand: Comma-separated expand options; ``None`` requests none
+
+        """
         if not issue_keys:
             return {}
         if not self._client.jira:
@@ -263,7 +278,7 @@ class JiraIssueService:
         # Issue]``).
         batch_results: list[dict[str, Issue]] = self._client.performance_optimizer.batch_processor.process_batches(
             issue_keys,
-            self._fetch_issues_batch,
+            functools.partial(self._fetch_issues_batch, fields=fields, expand=expand),
         )
         merged: dict[str, Issue] = {}
         for batch_result in batch_results:
@@ -271,7 +286,14 @@ class JiraIssueService:
                 merged.update(batch_result)
         return merged
 
-    def _fetch_issues_batch(self, issue_keys: list[str], **kwargs: object) -> dict[str, Issue]:
+    def _fetch_issues_batch(
+        self,
+        issue_keys: list[str],
+        *,
+        fields: str | None = None,
+        expand: str | None = "changelog",
+        **kwargs: object,
+    ) -> dict[str, Issue]:
         """Fetch a batch of issues from Jira API.
 
         Deduplicates ``issue_keys`` (preserving order), then splits them into
@@ -297,6 +319,8 @@ class JiraIssueService:
             chunk_result = self._fetch_single_chunk(
                 chunk,
                 chunk_idx // _FETCH_BATCH_CHUNK_SIZE,
+                fields=fields,
+                expand=expand,
                 **kwargs,
             )
             merged.update(chunk_result)
@@ -328,6 +352,9 @@ class JiraIssueService:
         self,
         issue_keys: list[str],
         chunk_index: int,
+        *,
+        fields: str | None = None,
+        expand: str | None = "changelog",
         **kwargs: object,
     ) -> dict[str, Issue]:
         """Fetch one URL-safe chunk of issue keys from the Jira search API.
@@ -337,6 +364,8 @@ class JiraIssueService:
             chunk_index: Zero-based index of this chunk within the enclosing
                          batch; included in the error log so operators can
                          identify which range of keys failed.
+            fields:      Comma-separated field ids; ``None`` requests all fields.
+            expand:      Comma-separated expand options.
             **kwargs:    Forwarded from :meth:`_fetch_issues_batch`; may contain
                          ``batch_num`` supplied by ``BatchProcessor`` for
                          cross-batch log correlation.
@@ -356,14 +385,14 @@ class JiraIssueService:
         first_key = issue_keys[0] if issue_keys else "?"
         last_key = issue_keys[-1] if issue_keys else "?"
 
+        search_kwargs: dict[str, Any] = {"maxResults": len(issue_keys), "expand": expand}
+        if fields is not None:
+            search_kwargs["fields"] = fields
+
         auth_retries = 0
         while True:
             try:
-                issues = self._client.jira.search_issues(
-                    jql,
-                    maxResults=len(issue_keys),
-                    expand="changelog",
-                )
+                issues = self._client.jira.search_issues(jql, **search_kwargs)
                 return {issue.key: issue for issue in issues}
             except Exception as exc:
                 status = self._extract_http_status(exc)
@@ -386,8 +415,12 @@ class JiraIssueService:
                         len(issue_keys) - mid,
                     )
                     merged: dict[str, Issue] = {}
-                    merged.update(self._fetch_single_chunk(issue_keys[:mid], chunk_index, **kwargs))
-                    merged.update(self._fetch_single_chunk(issue_keys[mid:], chunk_index, **kwargs))
+                    merged.update(
+                        self._fetch_single_chunk(issue_keys[:mid], chunk_index, fields=fields, expand=expand, **kwargs),
+                    )
+                    merged.update(
+                        self._fetch_single_chunk(issue_keys[mid:], chunk_index, fields=fields, expand=expand, **kwargs),
+                    )
                     return merged
                 if status in {413, 414}:
                     # A single key whose URI is still rejected cannot be split further.
@@ -14,7 +14,10 @@ worry about.
 
 from __future__ import annotations
 
+import json
 import time
+from collections.abc import Iterable
+from datetime import UTC, datetime
 from typing import Any
 
 from src.infrastructure.jira.jira_client import (
@@ -23,8 +26,23 @@ from src.infrastructure.jira.jira_client import (
     JiraApiError,
     JiraClient,
     JiraResourceNotFoundError,
+    _assert_json_response,
 )
 
+# Jira's bulk worklog endpoints page ``/worklog/updated`` and accept at
+# most this many ids per ``/worklog/list`` request.
+WORKLOG_BULK_PAGE_SIZE = 1000
+
+
+def _raw_user(raw: Any) -> dict[str, Any]:
+    raw = raw if isinstance(raw, dict) else {}
+    return {
+        "name": raw.get("name"),
+        "display_name": raw.get("displayName"),
+        "email": raw.get("emailAddress"),
+        "account_id": raw.get("accountId"),
+    }
+
 
 class JiraWorklogService:
     """Worklog-domain queries for ``JiraClient``."""
@@ -144,8 +162,23 @@ class JiraWorklogService:
         project_key: str,
         *,
         include_empty: bool = False,
+        bulk: bool = False,
+        since: datetime | int | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
-        """Get all work logs for all issues in a project."""
+        """Get all work logs for all issues in a project.
+
+        By default every issue is loaded and its work logs are fetched one
+        issue at a time. With ``bulk`` (implied by ``since``) the work logs
+        come from Jira's bulk worklog endpoints instead; see
+        :meth:`get_work_logs_for_projects`.
+        """
+        if bulk or since is not None:
+            work_logs_by_issue, _until = self.get_work_logs_for_projects(
+                [project_key],
+                since=since,
+                include_empty=include_empty,
+            )
+            return work_logs_by_issue
         try:
             self._logger.info(
                 "Fetching work logs for all issues in project '%s'...",
@@ -245,6 +278,149 @@ class JiraWorklogService:
                 raise JiraResourceNotFoundError(msg) from e
             raise JiraApiError(error_msg) from e
 
+    def get_work_logs_for_projects(
+        self,
+        project_keys: Iterable[str],
+        *,
+        since: datetime | int | None = None,
+        include_empty: bool = False,
+    ) -> tuple[dict[str, list[dict[str, Any]]], int | None]:
+        """Get work logs of several projects through Jira's bulk worklog endpoints.
+
+        ``/worklog/updated?since=`` pages the ids of every work log created
+        or updated since ``since`` (1000 per page, instance-wide), and
+        ``/worklog/list`` fetches them 1000 at a time. Work logs are kept
+        only when their issue belongs to one of ``project_keys``; the issue
+        ids of those projects are listed once up front with a keys-only
+        search.
+
+        Args:
+            project_keys: Jira project keys to keep work logs for
+            since: Only work logs updated at or after this time (datetime,
+                naive means UTC, or epoch milliseconds); ``None`` fetches all
+                of them
+            include_empty: Also return issues without work logs
+
+        Returns:
+            Work logs by issue key, in the shape of
+            :meth:`get_work_logs_for_issue`, and the ``until`` timestamp
+            (epoch milliseconds) of the last page, to pass as ``since`` on
+            the next incremental run
+
+        Raises:
+            JiraApiError: If a request fails
+
+        """
+        keys = list(dict.fromkeys(project_keys))
+        if isinstance(since, datetime):
+            # Naive datetimes are taken as UTC, like Jira's and OpenProject's timestamps
+            since_ms = int((since if since.tzinfo else since.replace(tzinfo=UTC)).timestamp() * 1000)
+        else:
+            since_ms = int(since or 0)
+        try:
+            issue_keys_by_id = self._list_issue_keys_by_id(keys)
+            work_logs_by_issue: dict[str, list[dict[str, Any]]] = (
+                {key: [] for key in issue_keys_by_id.values()} if include_empty else {}
+            )
+
+            worklog_ids, until = self._list_updated_worklog_ids(since_ms)
+            total_work_logs = 0
+            for i in range(0, len(worklog_ids), WORKLOG_BULK_PAGE_SIZE):
+                batch = worklog_ids[i : i + WORKLOG_BULK_PAGE_SIZE]
+                for raw in self._bulk_request("post", "/rest/api/2/worklog/list", data=json.dumps({"ids": batch})):
+                    issue_key = issue_keys_by_id.get(str(raw.get("issueId")))
+                    if issue_key is None:
+                        continue
+                    work_logs_by_issue.setdefault(issue_key, []).append(self._work_log_from_raw(raw, issue_key))
+                    total_work_logs += 1
+
+            self._logger.info(
+                "Bulk work log extraction for %s: %s of %s updated work logs in %s issues",
+                ", ".join(keys),
+                total_work_logs,
+                len(worklog_ids),
+                sum(1 for logs in work_logs_by_issue.values() if logs),
+            )
+            return work_logs_by_issue, until
+        except JiraApiError:
+            raise
+        except Exception as e:
+            error_msg = f"Failed to get work logs for projects {', '.join(keys)}: {e!s}"
+            self._logger.exception(error_msg)
+            raise JiraApiError(error_msg) from e
+
+    def _list_issue_keys_by_id(self, project_keys: list[str]) -> dict[str, str]:
+        """Return ``{issue id: issue key}`` for every issue of ``project_keys``."""
+        if not project_keys:
+            return {}
+        jql = "project in ({}) ORDER BY id ASC".format(", ".join(f'"{k}"' for k in project_keys))
+        keys_by_id: dict[str, str] = {}
+        start_at = 0
+        while True:
+            self._client.rate_limiter.wait_if_needed("list_worklog_issues")
+            request_start = time.time()
+            page = self._client.jira.search_issues(
+                jql,
+                startAt=start_at,
+                maxResults=WORKLOG_BULK_PAGE_SIZE,
+                fields="key",
+                json_result=True,
+            )
+            self._client.rate_limiter.record_response(time.time() - request_start, HTTP_OK)
+            issues = page.get("issues", []) if isinstance(page, dict) else []
+            for issue in issues:
+                keys_by_id[str(issue.get("id"))] = str(issue.get("key"))
+            start_at += len(issues)
+            if not issues or start_at >= int(page.get("total", 0)):
+                return keys_by_id
+
+    def _list_updated_worklog_ids(self, since_ms: int) -> tuple[list[int], int | None]:
+        """Page ``/worklog/updated`` from ``since_ms`` and return the ids and last ``until``."""
+        worklog_ids: list[int] = []
+        until: int | None = None
+        path: str | None = f"/rest/api/2/worklog/updated?since={since_ms}"
+        while path:
+            page = self._bulk_request("get", path)
+            if not isinstance(page, dict):
+                break
+            worklog_ids.extend(int(v["worklogId"]) for v in page.get("values", []) if "worklogId" in v)
+            until = page.get("until", until)
+            next_page = page.get("nextPage")
+            path = next_page if next_page and not page.get("lastPage", True) else None
+        return worklog_ids, until
+
+    def _bulk_request(self, method: str, path: str, **kwargs: Any) -> Any:
+        """Send one rate-limited request to a bulk worklog endpoint and return its JSON."""
+        url = path if path.startswith("http") else f"{self._client.base_url}{path}"
+        self._client.rate_limiter.wait_if_needed("bulk_worklogs")
+        request_start = time.time()
+        response = getattr(self._client.jira._session, method)(url, **kwargs)
+        self._client.rate_limiter.record_response(time.time() - request_start, response.status_code)
+        endpoint = path.split("?", maxsplit=1)[0]
+        if response.status_code != HTTP_OK:
+            msg = f"Jira bulk worklog request {endpoint} failed: HTTP {response.status_code}"
+            raise JiraApiError(msg)
+        _assert_json_response(response, path=endpoint)
+        return response.json()
+
+    @staticmethod
+    def _work_log_from_raw(raw: dict[str, Any], issue_key: str) -> dict[str, Any]:
+        """Convert a REST worklog payload to the :meth:`get_work_logs_for_issue` shape."""
+        work_log_data: dict[str, Any] = {
+            "id": str(raw.get("id")),
+            "issue_key": issue_key,
+            "author": _raw_user(raw.get("author")),
+            "started": raw.get("started"),
+            "time_spent": raw.get("timeSpent"),
+            "time_spent_seconds": raw.get("timeSpentSeconds"),
+            "comment": raw.get("comment"),
+            "created": raw.get("created"),
+            "updated": raw.get("updated"),
+        }
+        if raw.get("updateAuthor"):
+            work_log_data["update_author"] = _raw_user(raw["updateAuthor"])
+        return work_log_data
+
     def get_work_log_details(self, issue_key: str, work_log_id: str) -> dict[str, Any]:
         """Get detailed information for a specific work log.
 
@@ -11,16 +11,24 @@ Part of the layered client architecture where:
 
 import json
 import re
+import tarfile
 import uuid
+from collections.abc import Iterable
 from pathlib import Path
 from shlex import quote
+from typing import IO
 
 from src.display import configure_logging
+from src.infrastructure.openproject.payload_compression import GunzipWriter, should_compress
 from src.infrastructure.openproject.ssh_client import SSHClient
 from src.utils.file_manager import FileManager
 
 logger = configure_logging("INFO", None)
 
+# Files per tar stream in ``transfer_files_to_container``; bounds the length
+# of the verification command line.
+TRANSFER_BATCH_MAX_FILES = 200
+
 
 class DockerClient:
     """Client for interacting with Docker containers on remote servers.
@@ -228,8 +236,15 @@ class DockerClient:
         self,
         container_path: Path | str,
         local_path: Path | str,
+        *,
+        compress: bool = False,
     ) -> Path:
-        """Copy a file from Docker container to local machine."""
+        """Copy a file from Docker container to local machine.
+
+        With ``compress`` the file is read through ``gzip -c`` inside the
+        container and gunzipped locally while it streams in (one SSH round
+        trip, no staging copy on the remote host).
+        """
         # Convert to Path objects if they're strings
         container_path = Path(container_path) if isinstance(container_path, str) else container_path
         local_path = Path(local_path) if isinstance(local_path, str) else local_path
@@ -242,6 +257,9 @@ class DockerClient:
             msg = f"File not found in container: {container_path}"
             raise FileNotFoundError(msg)
 
+        if compress:
+            return self._stream_gzipped_file_from_container(container_path, local_path)
+
         try:
             # Use a temporary file on the remote server for intermediate storage
             temp_filename = f"docker_transfer_{uuid.uuid4().hex}.tmp"
@@ -308,6 +326,38 @@ class DockerClient:
             msg = f"Failed to copy file from container: {e}"
             raise ValueError(msg) from e
 
+    def _stream_gzipped_file_from_container(self, container_path: Path, local_path: Path) -> Path:
+        command = f"docker exec {quote(self.container_name)} gzip -c -- {quote(container_path.as_posix())}"
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        partial = local_path.with_name(f"{local_path.name}.part")
+        try:
+            with partial.open("wb") as out:
+                sink = GunzipWriter(out)
+                stderr, rc = self.ssh_client.stream_command_output(
+                    command,
+                    sink.write,
+                    timeout=self.command_timeout,
+                    check=False,
+                )
+                if rc == 0:
+                    sink.finish()
+            if rc != 0:
+                if "No such file" in stderr:
+                    msg = f"File not found in container: {container_path}"
+                    raise FileNotFoundError(msg)
+                msg = f"Failed to stream file from container (rc={rc}): {stderr.strip()[:500]}"
+                raise ValueError(msg)
+            partial.replace(local_path)
+        finally:
+            partial.unlink(missing_ok=True)
+        logger.debug(
+            "Streamed %s from container gzipped (%d -> %d bytes)",
+            container_path,
+            sink.raw_bytes,
+            sink.compressed_bytes,
+        )
+        return local_path
+
     def check_file_exists_in_container(self, container_path: Path | str) -> bool:
         """Check if a file exists in the Docker container.
 
@@ -599,3 +649,89 @@ class DockerClient:
                     "Failed to clean up temporary file: %s",
                     remote_temp_path,
                 )
+
+    def transfer_files_to_container(
+        self,
+        files: Iterable[tuple[Path | str, Path | str]],
+        *,
+        mode: int = 0o644,
+        timeout: int | None = None,
+    ) -> None:
+        """Transfer many local files into the container in one SSH round trip.
+
+        The files are streamed as a tar archive through a single
+        ``ssh <host> docker exec -i -u root <container> tar -x`` pipe — no
+        staging on the remote host, no per-file ``docker cp``/``chmod``/checks.
+        Ownership and permissions come from the archive (root, ``mode``), and
+        one ``stat`` listing of the whole batch verifies every file size.
+
+        Args:
+            files: ``(local_path, container_path)`` pairs; container paths must be absolute
+            mode: Permission bits for the extracted files (default 0644)
+            timeout: Per-batch timeout in seconds (default: ``command_timeout``)
+
+        Raises:
+            ValueError: If a local file is missing or the transfer/verification fails
+
+        """
+        pairs = [(Path(local), Path(container)) for local, container in files]
+        for local_path, container_path in pairs:
+            if not local_path.is_file():
+                msg = f"Local file not found for transfer: {local_path}"
+                raise ValueError(msg)
+            if not container_path.is_absolute():
+                msg = f"Container path must be absolute: {container_path}"
+                raise ValueError(msg)
+
+        for start in range(0, len(pairs), TRANSFER_BATCH_MAX_FILES):
+            self._transfer_tar_batch(pairs[start : start + TRANSFER_BATCH_MAX_FILES], mode, timeout)
+
+    def _transfer_tar_batch(
+        self,
+        pairs: list[tuple[Path, Path]],
+        mode: int,
+        timeout: int | None,
+    ) -> None:
+        expected = {container.as_posix(): local.stat().st_size for local, container in pairs}
+        listing = " ".join(quote(path) for path in expected)
+        # Large batches travel gzipped; tar unpacks them inside the container.
+        gzipped = should_compress(sum(expected.values()))
+        remote_script = f'tar -x {"-z " if gzipped else ""}-f - -C / && stat -c "%s %n" -- {listing}'
+        command = f"docker exec -i -u root {quote(self.container_name)} sh -c {quote(remote_script)}"
+
+        def _write_tar(stream: IO[bytes]) -> None:
+            with tarfile.open(fileobj=stream, mode="w|gz" if gzipped else "w|") as tar:
+                for local_path, container_path in pairs:
+                    info = tar.gettarinfo(str(local_path), arcname=container_path.as_posix().lstrip("/"))
+                    info.mode = mode
+                    info.uid = info.gid = 0
+                    info.uname = info.gname = "root"
+                    with local_path.open("rb") as fh:
+                        tar.addfile(info, fh)
+
+        logger.debug(
+            "Streaming %d file(s) to container %s%s",
+            len(pairs),
+            self.container_name,
+            " (gzip)" if gzipped else "",
+        )
+        stdout, stderr, rc = self.ssh_client.execute_command_with_input(
+            command,
+            _write_tar,
+            timeout=timeout or self.command_timeout,
+            check=False,
+        )
+        if rc != 0:
+            msg = f"Batched transfer to container failed (rc={rc}): {stderr.strip()[:500]}"
+            raise ValueError(msg)
+
+        actual: dict[str, int] = {}
+        for line in stdout.splitlines():
+            size, _, path = line.strip().partition(" ")
+            if size.isdigit() and path:
+                actual[path] = int(size)
+        mismatched = [path for path, size in expected.items() if actual.get(path) != size]
+        if mismatched:
+            msg = f"Size mismatch after batched transfer to container: {', '.join(mismatched[:5])}"
+            raise ValueError(msg)
+        logger.debug("Transferred %d file(s) to container in one stream", len(pairs))
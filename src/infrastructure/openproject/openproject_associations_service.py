@@ -20,6 +20,13 @@ The service owns:
   ``find / save`` loop with structured success/failure result and
   symmetric ``relates`` dedupe).
 
+With ``migration.raw_bulk_associations`` (or
+``J2O_RAW_BULK_ASSOCIATIONS=1``) both bulk writers switch to a raw path:
+referential integrity and uniqueness are checked with one query per table
+per batch, rows go in through ``insert_all`` (``ON CONFLICT DO NOTHING`` …
+``RETURNING``) without model validations or callbacks, and the result
+carries a per-row ``outcomes`` list.
+
 ``OpenProjectClient`` exposes the service via ``self.associations``
 and keeps thin delegators for the same method names so existing call
 sites work unchanged.
@@ -30,9 +37,18 @@ from __future__ import annotations
 import json
 from typing import Any
 
+from src import config
 from src.infrastructure.exceptions import QueryExecutionError
 from src.infrastructure.openproject.openproject_client import OpenProjectClient
 
+# Errors echoed back per raw batch; ``outcomes`` still covers every row.
+RAW_BULK_ERROR_LIMIT = 50
+
+
+def raw_bulk_associations_enabled() -> bool:
+    """Whether watchers, relations and memberships are written with raw ``insert_all``."""
+    return config.migration_flag("J2O_RAW_BULK_ASSOCIATIONS", "raw_bulk_associations")
+
 
 class OpenProjectAssociationsService:
     """Watchers + relations helpers for ``OpenProjectClient``."""
@@ -112,7 +128,8 @@ class OpenProjectAssociationsService:
                 - user_id: int
 
         Returns:
-            Dict with 'success': bool, 'created': int, 'skipped': int, 'failed': int
+            Dict with 'success': bool, 'created': int, 'skipped': int, 'failed': int;
+            in raw bulk mode also 'outcomes' (one ``{status, error?}`` per input row)
 
         """
         if not watchers:
@@ -131,6 +148,8 @@ class OpenProjectAssociationsService:
         # Use ensure_ascii=False to output UTF-8 directly, avoiding \uXXXX escapes
         # that Ruby misinterprets as invalid Unicode escape sequences
         data_json = json.dumps(data, ensure_ascii=False)
+        if raw_bulk_associations_enabled():
+            return self._run_raw_bulk(self._raw_watchers_script(data_json), len(watchers), "watchers")
         # Use Ruby heredoc with literal syntax (<<-'X') to prevent \u escape interpretation
         # Optimized: Use bulk insert with conflict handling for speed
         script = f"""
@@ -295,7 +314,8 @@ J2O_DATA
                 - relation_type: str (relates, duplicates, blocks, precedes, follows)
 
         Returns:
-            Dict with 'success': bool, 'created': int, 'skipped': int, 'failed': int
+            Dict with 'success': bool, 'created': int, 'skipped': int, 'failed': int;
+            in raw bulk mode also 'outcomes' (one ``{status, error?}`` per input row)
 
         """
         if not relations:
@@ -314,6 +334,8 @@ J2O_DATA
 
         # Use ensure_ascii=False to output UTF-8 directly, avoiding \uXXXX escapes
         data_json = json.dumps(data, ensure_ascii=False)
+        if raw_bulk_associations_enabled():
+            return self._run_raw_bulk(self._raw_relations_script(data_json), len(relations), "relations")
         # Use Ruby heredoc with literal syntax (<<-'X') to prevent \u escape interpretation
         script = f"""
           require 'json'
@@ -375,3 +397,149 @@ J2O_DATA
         except Exception as e:
             self._logger.warning("Bulk create relations failed: %s", e)
             return {"success": False, "created": 0, "skipped": 0, "failed": len(relations), "error": str(e)}
+
+    # ── raw bulk mode ────────────────────────────────────────────────────
+
+    def _run_raw_bulk(self, script: str, row_count: int, label: str) -> dict[str, Any]:
+        """Run a raw bulk script, mapping transport failures to the usual envelope."""
+        failure: dict[str, Any] = {"success": False, "created": 0, "skipped": 0, "failed": row_count}
+        try:
+            result = self._client.execute_query_to_json_file(script)
+        except Exception as e:
+            self._logger.warning("Raw bulk %s failed: %s", label, e)
+            return {**failure, "error": str(e)}
+        if isinstance(result, dict):
+            return result
+        return {**failure, "error": str(result)}
+
+    @staticmethod
+    def _raw_watchers_script(data_json: str) -> str:
+        """Watchers via one validity query per table and ``insert_all … RETURNING``."""
+        return f"""
+          require 'json'
+          data = JSON.parse(<<-'J2O_DATA'
+{data_json}
+J2O_DATA
+)
+          wp_ids = data.map {{ |d| d['wp_id'] }}.uniq
+          user_ids = data.map {{ |d| d['user_id'] }}.uniq
+          valid_wps = WorkPackage.where(id: wp_ids).pluck(:id).to_set
+          valid_users = User.where(id: user_ids).pluck(:id).to_set
+          existing = Watcher.where(watchable_type: 'WorkPackage', watchable_id: wp_ids, user_id: user_ids)
+                            .pluck(:watchable_id, :user_id).to_set
+
+          outcomes = Array.new(data.size)
+          pending = {{}}
+          data.each_with_index do |item, i|
+            key = [item['wp_id'], item['user_id']]
+            if !valid_wps.include?(key[0]) || !valid_users.include?(key[1])
+              outcomes[i] = {{ status: 'failed', error: 'WorkPackage or User not found' }}
+            elsif existing.include?(key) || pending.key?(key)
+              outcomes[i] = {{ status: 'skipped' }}
+            else
+              pending[key] = i
+            end
+          end
+
+          if pending.any?
+            rows = pending.keys.map do |wp_id, user_id|
+              {{ watchable_type: 'WorkPackage', watchable_id: wp_id, user_id: user_id }}
+            end
+            begin
+              inserted = Watcher.insert_all(rows, returning: %w[watchable_id user_id])
+                                .rows.map {{ |wp_id, user_id| [wp_id.to_i, user_id.to_i] }}.to_set
+              # Rows not returned lost a race to a concurrent insert (ON CONFLICT DO NOTHING).
+              pending.each {{ |key, i| outcomes[i] = {{ status: inserted.include?(key) ? 'created' : 'skipped' }} }}
+            rescue => e
+              pending.each_value {{ |i| outcomes[i] = {{ status: 'failed', error: e.message }} }}
+            end
+          end
+
+          errors = []
+          outcomes.each_with_index do |o, i|
+            next unless o[:status] == 'failed' && errors.size < {RAW_BULK_ERROR_LIMIT}
+            errors << {{ wp_id: data[i]['wp_id'], user_id: data[i]['user_id'], error: o[:error] }}
+          end
+          counts = outcomes.group_by {{ |o| o[:status] }}.transform_values(&:size)
+          {{
+            success: counts.fetch('failed', 0).zero?,
+            created: counts.fetch('created', 0),
+            skipped: counts.fetch('skipped', 0),
+            failed: counts.fetch('failed', 0),
+            errors: errors,
+            outcomes: outcomes,
+          }}
+        """
+
+    @staticmethod
+    def _raw_relations_script(data_json: str) -> str:
+        """Relations via one validity query per table and ``insert_all … RETURNING``.
+
+        Reverse types (``follows``, ``blocked`` …) are stored flipped, as
+        ``Relation`` does before save; scheduling and cycle checks are skipped.
+        """
+        return f"""
+          require 'json'
+          data = JSON.parse(<<-'J2O_DATA'
+{data_json}
+J2O_DATA
+)
+          types = defined?(Relation::TYPES) ? Relation::TYPES : {{}}
+          rels = data.map do |item|
+            from_id, to_id, rel_type = item['from_id'].to_i, item['to_id'].to_i, item['type'].to_s
+            info = types[rel_type] || types[rel_type.to_sym]
+            reverse = info && info[:reverse]
+            reverse ? [to_id, from_id, reverse.to_s] : [from_id, to_id, rel_type]
+          end
+
+          ids = rels.flat_map {{ |from_id, to_id, _| [from_id, to_id] }}.uniq
+          valid_wps = WorkPackage.where(id: ids).pluck(:id).to_set
+          existing = Relation.where(from_id: ids, to_id: ids).pluck(:from_id, :to_id, :relation_type).to_set
+          # ``relates`` is symmetric: either direction counts as present.
+          seen = lambda do |set, (from_id, to_id, rel_type)|
+            set.include?([from_id, to_id, rel_type]) ||
+              (rel_type == 'relates' && set.include?([to_id, from_id, rel_type]))
+          end
+
+          outcomes = Array.new(data.size)
+          pending = {{}}
+          rels.each_with_index do |rel, i|
+            if !valid_wps.include?(rel[0]) || !valid_wps.include?(rel[1])
+              outcomes[i] = {{ status: 'failed', error: 'WorkPackage not found' }}
+            elsif rel[0] == rel[1]
+              outcomes[i] = {{ status: 'failed', error: 'Work package cannot be related to itself' }}
+            elsif seen.call(existing, rel) || seen.call(pending, rel)
+              outcomes[i] = {{ status: 'skipped' }}
+            else
+              pending[rel] = i
+            end
+          end
+
+          if pending.any?
+            rows = pending.keys.map do |from_id, to_id, rel_type|
+              {{ from_id: from_id, to_id: to_id, relation_type: rel_type }}
+            end
+            begin
+              inserted = Relation.insert_all(rows, returning: %w[from_id to_id relation_type])
+                                 .rows.map {{ |from_id, to_id, rel_type| [from_id.to_i, to_id.to_i, rel_type] }}.to_set
+              pending.each {{ |rel, i| outcomes[i] = {{ status: inserted.include?(rel) ? 'created' : 'skipped' }} }}
+            rescue => e
+              pending.each_value {{ |i| outcomes[i] = {{ status: 'failed', error: e.message }} }}
+            end
+          end
+
+          errors = []
+          outcomes.each_with_index do |o, i|
+            next unless o[:status] == 'failed' && errors.size < {RAW_BULK_ERROR_LIMIT}
+            errors << {{ from: data[i]['from_id'], to: data[i]['to_id'], error: o[:error] }}
+          end
+          counts = outcomes.group_by {{ |o| o[:status] }}.transform_values(&:size)
+          {{
+            success: counts.fetch('failed', 0).zero?,
+            created: counts.fetch('created', 0),
+            skipped: counts.fetch('skipped', 0),
+            failed: counts.fetch('failed', 0),
+            errors: errors,
+            outcomes: outcomes,
+          }}
+        """
@@ -17,6 +17,13 @@ The service owns:
   ``WorkPackage`` to apply Jira-key + provenance custom fields and
   optionally execute a journal-creation template loaded from
   ``src/ruby/create_work_package_journals.rb``.
+* **Pipelined mass-create** — ``pipeline`` returns a
+  ``BulkCreatePipeline`` that splits ``bulk_create_records`` into its
+  stage (serialize + upload), execute and collect (result download +
+  cleanup) legs and runs them on separate workers, so consecutive
+  batches overlap their transfers with Rails execution. Opt-in for the
+  WP migration via ``J2O_BULK_PIPELINE=1`` or
+  ``migration.bulk_pipeline: true``.
 * **Work-package batch wrapper** — ``batch_create_work_packages``
   is a thin entry point that hands a list of WP payloads to the
   ``performance_optimizer.batch_processor.process_batches`` helper,
@@ -28,7 +35,18 @@ The service owns:
   records to avoid N+1 lookups, then create each WP with provenance
   CFs and optional original timestamps via ``update_columns``) and
   runs it via ``execute_json_query``. Per-WP failures end up in the
-  result list; partial success is the normal shape.
+  result list; partial success is the normal shape. With
+  ``J2O_BULK_TRANSACTION=1`` (``migration.bulk_transaction``) this worker
+  and ``bulk_create_records`` commit each batch once and wrap every
+  record in a savepoint, so a bad row is rolled back on its own.
+* **Skeleton fast path** — ``insert_work_package_skeletons`` writes
+  minimal WPs, their v1 journals and custom values set-based with
+  ``insert_all``, keyed by the J2O Origin Key (opt-in via
+  ``J2O_SKELETON_FAST_PATH=1``).
+* **Bulk mode** — with ``J2O_BULK_MODE=1`` both Ruby bodies run inside
+  ``J2O::BulkMode`` (``rails_bulk_mode``): notifications, mail
+  deliveries and per-record hierarchy callbacks are off for the batch
+  and recomputed per project afterwards.
 
 ``OpenProjectClient`` exposes the service via ``self.bulk_create``
 and keeps thin delegators for the same method names so existing
@@ -46,15 +64,20 @@ import re
 import shlex
 import subprocess
 import tempfile
+import threading
 import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Self
 
 from src import config
 from src.infrastructure.exceptions import QueryExecutionError
-from src.infrastructure.openproject.openproject_client import OpenProjectClient
+from src.infrastructure.openproject.openproject_client import OpenProjectClient, escape_ruby_single_quoted
+from src.infrastructure.openproject.rails_bulk_mode import bulk_mode_enabled, wrap_bulk_mode
+from src.infrastructure.openproject.rails_script_cache import call_expression, script_digest
 
 # Default script-load mode for bulk-create scripts. ``console`` ships the
 # generated script as a file and ``load``s it inside the persistent tmux
@@ -64,6 +87,38 @@ from src.infrastructure.openproject.openproject_client import OpenProjectClient
 DEFAULT_SCRIPT_LOAD_MODE = "console"
 
 
+def bulk_pipeline_enabled() -> bool:
+    """Whether bulk batches should run through :py:class:`BulkCreatePipeline`."""
+    return config.migration_flag("J2O_BULK_PIPELINE", "bulk_pipeline")
+
+
+def bulk_transaction_enabled() -> bool:
+    """Whether a bulk batch should commit once, with a savepoint per record."""
+    return config.migration_flag("J2O_BULK_TRANSACTION", "bulk_transaction")
+
+
+def skeleton_fast_path_enabled() -> bool:
+    """Whether skeleton WPs should be written set-based by ``insert_work_package_skeletons``."""
+    return config.migration_flag("J2O_SKELETON_FAST_PATH", "skeleton_fast_path")
+
+
+@dataclass(slots=True)
+class _StagedBulkBatch:
+    """A bulk-create batch whose payload and stub script are already in the container."""
+
+    model: str
+    timeout: int | None
+    full_script: str
+    use_runner: bool
+    runner_script_path: str | None
+    local_json: Path
+    container_json: Path
+    local_result: Path
+    container_result: Path
+    local_progress: Path
+    container_progress: Path
+
+
 class OpenProjectBulkCreateService:
     """Generic mass-create + WP-specific batch creation for ``OpenProjectClient``."""
 
@@ -125,6 +180,23 @@ class OpenProjectBulkCreateService:
             QueryExecutionError: On execution or retrieval failure
 
         """
+        staged = self._stage_bulk_batch(model, records, timeout=timeout, result_basename=result_basename)
+        output = self._execute_bulk_batch(staged)
+        return self._collect_bulk_batch(staged, output)
+
+    def pipeline(self, depth: int = 2) -> BulkCreatePipeline:
+        """Return a :py:class:`BulkCreatePipeline` overlapping transfers with Rails execution."""
+        return BulkCreatePipeline(self, depth=depth)
+
+    def _stage_bulk_batch(
+        self,
+        model: str,
+        records: list[dict[str, Any]],
+        *,
+        timeout: int | None,
+        result_basename: str | None,
+    ) -> _StagedBulkBatch:
+        """Serialize ``records`` and upload payload + scripts (no Rails involvement)."""
         client = self._client
         # Validate model name against allowlist to prevent injection
         client._validate_model_name(model)
@@ -144,9 +216,9 @@ class OpenProjectBulkCreateService:
             _msg = f"Failed to serialize records: {e}"
             raise QueryExecutionError(_msg) from e
 
-        # Transfer JSON to container
+        # JSON goes to the container together with the runner script below
+        # (one tar stream instead of two six-step transfers).
         container_json = Path("/tmp") / local_json.name
-        client.transfer_file_to_container(local_json, container_json)
 
         # BUG #32 FIX: Load journal creation .rb file content as template for WorkPackage migrations
         # This avoids Ruby scoping issues with the `load` statement
@@ -205,17 +277,17 @@ class OpenProjectBulkCreateService:
             except Exception:
                 return f"j2o: migration/bulk_create model={model} pid={os.getpid()}"
 
+        # The bulk body below is constant per model family, so it is cached in
+        # the container by content hash (uploaded once per run, loaded once
+        # per Rails process); per-call values arrive through ``input_data``.
         header = (
-            f"# {_bulk_hint()}\n"
             "require 'json'\n"
             "require 'logger'\n"
             "begin; require 'fileutils'; rescue; end\n"
-            f"model_name = '{model}'\n"
-            f"data_path = '{container_json.as_posix()}'\n"
-            f"result_path = '{container_result.as_posix()}'\n"
-            # Ensure progress ENV defaults are present in both console and runner modes
-            f"ENV['J2O_BULK_PROGRESS_FILE'] ||= '{container_progress.as_posix()}'\n"
-            "ENV['J2O_BULK_PROGRESS_N'] ||= (ENV['J2O_BULK_PROGRESS_N'] || '50')\n"
+            "model_name = input_data['model_name']\n"
+            "data_path = input_data['data_path']\n"
+            "result_path = input_data['result_path']\n"
+            "batch_tx = input_data['batch_transaction'] == '1'\n"
         )
         ruby = (
             "# BUG #32 FIX: Disable stdout buffering completely\n"
@@ -229,9 +301,9 @@ class OpenProjectBulkCreateService:
             "verbose = (ENV['J2O_BULK_RUBY_VERBOSE'] == '1')\n"
             'puts "[RUBY] Verbose mode: #{verbose}"\n'
             "STDOUT.flush\n"
-            "progress_file = ENV['J2O_BULK_PROGRESS_FILE']\n"
+            "progress_file = input_data['progress_file'] || ENV['J2O_BULK_PROGRESS_FILE']\n"
             "begin; FileUtils.rm_f(progress_file); rescue; end if progress_file\n"
-            "progress_n = (ENV['J2O_BULK_PROGRESS_N'] || '50').to_i\n"
+            "progress_n = (input_data['progress_n'] || ENV['J2O_BULK_PROGRESS_N'] || '50').to_i\n"
             "begin\n"
             "model = Object.const_get(model_name)\n"
             "data = JSON.parse(File.read(data_path))\n"
@@ -239,7 +311,7 @@ class OpenProjectBulkCreateService:
             "errors = []\n"
             'puts "J2O bulk start: model=#{model_name} total=#{data.length} result=#{result_path}" if verbose\n'
             "begin; File.open(progress_file, 'a'){|f| f.write(\"START total=#{data.length}\\n\") }; rescue; end if progress_file\n"
-            "data.each_with_index do |attrs, idx|\n"
+            "process_row = lambda do |attrs, idx|\n"
             "  # Debug: Inspect attrs hash for Bug #32\n"
             "  if idx == 0 && model_name == 'WorkPackage'\n"
             '    puts "[BUG32-DEBUG] attrs.class = #{attrs.class}"\n'
@@ -389,10 +461,23 @@ class OpenProjectBulkCreateService:
             '      puts "processed=#{idx + 1}/#{data.length}"\n'
             "    end\n"
             "  rescue => e\n"
+            "    created.reject! { |c| c['index'] == idx } if batch_tx\n"
             "    errors << {'index' => idx, 'errors' => [e.message]}\n"
             '    puts "J2O bulk item #{idx}: exception #{e.class}: #{e.message}" if verbose\n'
+            "    # Batch-transaction mode: roll back this row's nested transaction only\n"
+            "    raise ActiveRecord::Rollback if batch_tx\n"
             "  end\n"
             "end\n"
+            "# One commit per batch instead of one per record; each row runs in a\n"
+            "# nested transaction (a savepoint) so a failing row rolls back only itself\n"
+            "# and its records skip after_commit\n"
+            "if batch_tx\n"
+            "  ActiveRecord::Base.transaction do\n"
+            "    data.each_with_index { |attrs, idx| model.transaction(requires_new: true) { process_row.call(attrs, idx) } }\n"
+            "  end\n"
+            "else\n"
+            "  data.each_with_index(&process_row)\n"
+            "end\n"
             "result = {\n"
             "  'status' => 'success',\n"
             "  'created' => created,\n"
@@ -421,8 +506,26 @@ class OpenProjectBulkCreateService:
             "end\n"
         )
 
+        bulk_body = header + ruby
+        if bulk_mode_enabled():
+            bulk_body = wrap_bulk_mode(bulk_body)
+        call_input = ", ".join(
+            f"'{key}' => '{escape_ruby_single_quoted(value)}'"
+            for key, value in (
+                ("model_name", model),
+                ("data_path", container_json.as_posix()),
+                ("result_path", container_result.as_posix()),
+                ("progress_file", container_progress.as_posix()),
+                ("progress_n", os.environ.get("J2O_BULK_PROGRESS_N", "50")),
+                ("batch_transaction", "1" if bulk_transaction_enabled() else "0"),
+            )
+        )
+        # Per-call stub: provenance hint + reference to the cached body.
+        full_script = (
+            f"# {_bulk_hint()}\nrequire 'json'\n{call_expression(script_digest(bulk_body), '{' + call_input + '}')}\n"
+        )
+
         # Decide execution mode: prefer rails runner for long scripts to avoid pasting into console
-        full_script = header + ruby
         max_lines_env = os.environ.get("J2O_SCRIPT_RUNNER_MAX_LINES")
         char_thresh_env = os.environ.get("J2O_SCRIPT_RUNNER_THRESHOLD")
         try:
@@ -434,22 +537,49 @@ class OpenProjectBulkCreateService:
         except Exception:
             char_threshold = 200
 
-        script_lines = full_script.count("\n") + 1
-        use_runner = (script_lines >= max_lines) or (len(full_script) >= char_threshold)
+        script_lines = bulk_body.count("\n") + 1
+        use_runner = (script_lines >= max_lines) or (len(bulk_body) >= char_threshold)
 
-        output: str | None = None
+        uploads: list[tuple[Path, Path]] = [(local_json, container_json)]
+        runner_script_path: str | None = None
         if use_runner:
             runner_script_path = f"/tmp/j2o_bulk_{os.urandom(4).hex()}.rb"
             local_tmp = Path(client.file_manager.data_dir) / "temp_scripts" / Path(runner_script_path).name
             local_tmp.parent.mkdir(parents=True, exist_ok=True)
             with local_tmp.open("w", encoding="utf-8") as f:
                 f.write(full_script)
-            client.docker_client.transfer_file_to_container(local_tmp, Path(runner_script_path))
+            uploads.append((local_tmp, Path(runner_script_path)))
+        # The cached body (first call only), JSON payload and stub share one stream.
+        client.rails_runner.script_cache.ensure(bulk_body, extra_uploads=uploads)
+
+        return _StagedBulkBatch(
+            model=model,
+            timeout=timeout,
+            full_script=full_script,
+            use_runner=use_runner,
+            runner_script_path=runner_script_path,
+            local_json=local_json,
+            container_json=container_json,
+            local_result=local_result,
+            container_result=container_result,
+            local_progress=local_progress,
+            container_progress=container_progress,
+        )
+
+    def _execute_bulk_batch(self, staged: _StagedBulkBatch) -> str | None:
+        """Run a staged batch in Rails; returns the console output, if any."""
+        client = self._client
+        timeout = staged.timeout
+        runner_script_path = staged.runner_script_path
+        container_progress = staged.container_progress
+        output: str | None = None
+
+        if staged.use_runner:
             mode = (os.environ.get("J2O_SCRIPT_LOAD_MODE") or DEFAULT_SCRIPT_LOAD_MODE).lower()
             allow_runner_fallback = str(os.environ.get("J2O_ALLOW_RUNNER_FALLBACK", "0")).lower() in {"1", "true"}
             if mode == "console":
                 try:
-                    _console_output = client.rails_client.execute(
+                    _console_output = client.rails_runner.console_execute(
                         f"load '{runner_script_path}'",
                         timeout=timeout or 120,
                         suppress_output=True,
@@ -460,10 +590,9 @@ class OpenProjectBulkCreateService:
                         raise QueryExecutionError(
                             msg,
                         ) from e
-                    runner_cmd = f"(cd /app || cd /opt/openproject) && bundle exec rails runner {runner_script_path}"
                     try:
-                        stdout, stderr, rc = client.docker_client.execute_command(
-                            runner_cmd,
+                        stdout, stderr, rc = client.rails_runner.execute_runner_script(
+                            runner_script_path,
                             timeout=timeout or 120,
                             env={
                                 "J2O_BULK_RUBY_VERBOSE": os.environ.get("J2O_BULK_RUBY_VERBOSE", "1"),
@@ -490,10 +619,9 @@ class OpenProjectBulkCreateService:
                     if stdout:
                         self._logger.info("runner stdout: %s", stdout[:500])
             else:
-                runner_cmd = f"(cd /app || cd /opt/openproject) && bundle exec rails runner {runner_script_path}"
                 try:
-                    stdout, stderr, rc = client.docker_client.execute_command(
-                        runner_cmd,
+                    stdout, stderr, rc = client.rails_runner.execute_runner_script(
+                        runner_script_path,
                         timeout=timeout or 120,
                         env={
                             "J2O_BULK_RUBY_VERBOSE": os.environ.get("J2O_BULK_RUBY_VERBOSE", "1"),
@@ -524,11 +652,23 @@ class OpenProjectBulkCreateService:
             try:
                 # Allow opt-in console progress visibility
                 suppress = os.environ.get("J2O_BULK_PROGRESS_CONSOLE", "0") != "1"
-                output = client.rails_client.execute(full_script, timeout=timeout or 120, suppress_output=suppress)
+                output = client.rails_runner.console_execute(
+                    staged.full_script,
+                    timeout=timeout or 120,
+                    suppress_output=suppress,
+                )
             except Exception as e:
                 _msg = f"Rails execution failed for bulk_create_records: {e}"
                 raise QueryExecutionError(_msg) from e
+        return output
 
+    def _collect_bulk_batch(self, staged: _StagedBulkBatch, output: str | None) -> dict[str, Any]:
+        """Wait for the batch's result file, copy it back, parse it and clean up."""
+        client = self._client
+        runner_script_path = staged.runner_script_path
+        local_result, container_result = staged.local_result, staged.container_result
+        local_progress, container_progress = staged.local_progress, staged.container_progress
+        container_json = staged.container_json
         # Poll-copy result back to local (allow slow writes on busy systems)
         max_wait_seconds_env = os.environ.get("J2O_BULK_RESULT_WAIT_SECONDS")
         try:
@@ -547,7 +687,7 @@ class OpenProjectBulkCreateService:
         last_progress_len = -1
         last_progress_change_at = 0.0
         last_heartbeat_logged = -10.0
-        runner_script_known = "runner_script_path" in locals()
+        runner_script_known = runner_script_path is not None
         while waited < max_wait_seconds:
             # Avoid noisy SSH errors: first, check for existence using Docker API
             if client.docker_client.check_file_exists_in_container(container_result):
@@ -719,7 +859,7 @@ class OpenProjectBulkCreateService:
             json.dump(work_packages, f)
 
         try:
-            client.docker_client.transfer_file_to_container(Path(local_json_path), Path(container_json_path))
+            client.transfer_files_to_container([(Path(local_json_path), Path(container_json_path))])
         finally:
             # Guard against ``FileNotFoundError`` so a missing temp
             # (e.g. if a future change ever moves the dump into a
@@ -756,7 +896,14 @@ class OpenProjectBulkCreateService:
         priorities_by_name = IssuePriority.where(name: priority_names).index_by(&:name)
         users_by_id = User.where(id: user_ids).index_by(&:id)
 
-        work_packages_data.each do |wp_data|
+        # Batch-transaction mode: one commit per batch, and a nested
+        # transaction (a savepoint) per WP so a failing row rolls back only
+        # itself and its records skip after_commit
+        batch_tx = {"true" if bulk_transaction_enabled() else "false"}
+
+        process_row = lambda do |wp_data|
+          row_results = results.length
+          row_created = created_count
           begin
             # Create work package with provided attributes
             wp = WorkPackage.new
@@ -853,7 +1000,9 @@ class OpenProjectBulkCreateService:
                 timestamp_attrs = {{}}
                 timestamp_attrs[:created_at] = Time.parse(wp_data['created_at']) if wp_data['created_at']
                 timestamp_attrs[:updated_at] = Time.parse(wp_data['updated_at']) if wp_data['updated_at']
-                wp.update_columns(timestamp_attrs) if timestamp_attrs.any?
+                if timestamp_attrs.any?
+                  WorkPackage.transaction(requires_new: true) {{ wp.update_columns(timestamp_attrs) }}
+                end
               rescue => ts_err
                 results << {{
                   id: wp.id,
@@ -877,13 +1026,26 @@ class OpenProjectBulkCreateService:
             end
 
           rescue => e
+            if batch_tx
+              results.pop(results.length - row_results)
+              created_count = row_created
+            end
             failed_count += 1
             results << {{
               subject: wp_data['subject'],
               status: 'failed',
               error: e.message
             }}
+            raise ActiveRecord::Rollback if batch_tx
+          end
+        end
+
+        if batch_tx
+          WorkPackage.transaction do
+            work_packages_data.each {{ |wp_data| WorkPackage.transaction(requires_new: true) {{ process_row.call(wp_data) }} }}
           end
+        else
+          work_packages_data.each(&process_row)
         end
 
         {{
@@ -892,6 +1054,8 @@ class OpenProjectBulkCreateService:
           results: results
         }}
         """
+        if bulk_mode_enabled():
+            script = wrap_bulk_mode(script)
 
         operation_succeeded = False  # Track success for debug file preservation
         try:
@@ -918,3 +1082,306 @@ class OpenProjectBulkCreateService:
                     client,
                     (Path(container_json_path),),
                 )
+
+    def insert_work_package_skeletons(
+        self,
+        skeletons: list[dict[str, Any]],
+        key_cf_id: int,
+    ) -> dict[str, Any]:
+        """Insert minimal work packages set-based, keyed by their J2O Origin Key.
+
+        Each skeleton is a ``_create_work_packages_batch`` payload plus its
+        origin ``key``. Ids for the new work packages, their v1 journals and
+        journal data rows are drawn from the table sequences up front, so
+        every row is keyed by its origin key rather than by insert order.
+        Rows are then written with ``WorkPackage.insert_all ... RETURNING
+        id`` and a few ``INSERT ... SELECT`` statements, all in one
+        transaction; the custom values (including ``key_cf_id``) are
+        written in the same call. Keys that already have a work package
+        carrying that origin key are reported as ``existing``.
+
+        Model validations and callbacks do not run: unknown project, type,
+        status, priority or user ids fail the row up front instead.
+
+        Returns:
+            ``{success, created, existing, failed, ids_by_key, results}``;
+            ``results`` holds one ``{key, status, id?, error?}`` per skeleton
+
+        """
+        if not skeletons:
+            return {"success": True, "created": 0, "existing": 0, "failed": 0, "ids_by_key": {}, "results": []}
+
+        data_json = json.dumps(skeletons, ensure_ascii=False)
+        script = f"""
+          require 'json'
+          require 'set'
+          require 'time'
+          rows = JSON.parse(<<-'J2O_DATA'
+{data_json}
+J2O_DATA
+)
+          key_cf_id = {int(key_cf_id)}
+          conn = ActiveRecord::Base.connection
+          now = Time.now.utc
+          parse_time = lambda do |value|
+            value.nil? || value.to_s.empty? ? now : (Time.parse(value.to_s).utc rescue now)
+          end
+          next_ids = lambda do |table, count|
+            conn.select_values(
+              "SELECT nextval(pg_get_serial_sequence('#{{table}}', 'id')) FROM generate_series(1, #{{count}})"
+            ).map(&:to_i)
+          end
+          id_values = lambda {{ |pairs| pairs.map {{ |pair| "(#{{pair.join(', ')}})" }}.join(', ') }}
+
+          keys = rows.map {{ |r| r['key'].to_s }}
+          existing = CustomValue.where(customized_type: 'WorkPackage', custom_field_id: key_cf_id, value: keys)
+                                .pluck(:value, :customized_id).to_h
+          lookups = {{
+            'project_id' => Project, 'type_id' => Type, 'status_id' => Status,
+            'priority_id' => IssuePriority, 'author_id' => User
+          }}
+          valid = lookups.to_h do |column, model|
+            [column, model.where(id: rows.map {{ |r| r[column] }}.compact.uniq).pluck(:id).to_set]
+          end
+          valid_assignees = Principal.where(id: rows.map {{ |r| r['assigned_to_id'] }}.compact.uniq).pluck(:id).to_set
+          cf_ids = rows.flat_map {{ |r| (r['custom_fields'] || []).map {{ |cf| cf['id'].to_i }} }} << key_cf_id
+          valid_cfs = CustomField.where(id: cf_ids.uniq).pluck(:id).to_set
+
+          outcomes = {{}}
+          fresh = []
+          rows.each do |r|
+            key = r['key'].to_s
+            if key.empty?
+              next
+            elsif existing[key]
+              outcomes[key] = {{ 'key' => key, 'status' => 'existing', 'id' => existing[key] }}
+            elsif outcomes[key]
+              next
+            else
+              bad = valid.keys.reject {{ |column| valid[column].include?(r[column]) }}
+              bad << 'assigned_to_id' if r['assigned_to_id'] && !valid_assignees.include?(r['assigned_to_id'])
+              bad << 'subject' if r['subject'].to_s.strip.empty?
+              if bad.any?
+                outcomes[key] = {{ 'key' => key, 'status' => 'failed', 'error' => "invalid #{{bad.join(', ')}}" }}
+              else
+                outcomes[key] = {{ 'key' => key, 'status' => 'created' }}
+                fresh << r
+              end
+            end
+          end
+
+          if fresh.any?
+            begin
+              WorkPackage.transaction do
+                wp_ids = next_ids.call('work_packages', fresh.size)
+                data_ids = next_ids.call('work_package_journals', fresh.size)
+                journal_ids = next_ids.call('journals', fresh.size)
+                wp_rows = fresh.each_with_index.map do |r, i|
+                  created_at = parse_time.call(r['created_at'])
+                  {{
+                    id: wp_ids[i], project_id: r['project_id'], type_id: r['type_id'], status_id: r['status_id'],
+                    priority_id: r['priority_id'], author_id: r['author_id'], assigned_to_id: r['assigned_to_id'],
+                    subject: r['subject'].to_s[0, 255], created_at: created_at,
+                    updated_at: r['updated_at'] ? parse_time.call(r['updated_at']) : created_at
+                  }}
+                end
+                inserted = WorkPackage.insert_all(wp_rows, returning: %w[id]).rows.flatten.map(&:to_i)
+                raise "inserted #{{inserted.size}} of #{{fresh.size}} work packages" unless inserted.sort == wp_ids.sort
+
+                # v1 journals snapshot the inserted rows, as a model save would
+                data_pairs = wp_ids.zip(data_ids)
+                conn.execute(<<~SQL)
+                  INSERT INTO work_package_journals (id, type_id, project_id, subject, description,
+                    due_date, category_id, status_id, assigned_to_id, priority_id, version_id, author_id,
+                    done_ratio, estimated_hours, start_date, parent_id, schedule_manually, ignore_non_working_days)
+                  SELECT v.data_id, wp.type_id, wp.project_id, wp.subject, wp.description,
+                    wp.due_date, wp.category_id, wp.status_id, wp.assigned_to_id, wp.priority_id, wp.version_id,
+                    wp.author_id, wp.done_ratio, wp.estimated_hours, wp.start_date, wp.parent_id,
+                    wp.schedule_manually, wp.ignore_non_working_days
+                  FROM work_packages wp JOIN (VALUES #{{id_values.call(data_pairs)}}) AS v(wp_id, data_id)
+                    ON v.wp_id = wp.id
+                SQL
+                validity_sql = Journal.column_names.include?('validity_period') ? ', validity_period' : ''
+                validity_value = validity_sql.empty? ? '' : ', tstzrange(wp.created_at, NULL)'
+                journal_triples = wp_ids.each_with_index.map {{ |wp_id, i| [wp_id, data_ids[i], journal_ids[i]] }}
+                conn.execute(<<~SQL)
+                  INSERT INTO journals (id, journable_id, journable_type, user_id, notes, version,
+                    created_at, updated_at, data_type, data_id#{{validity_sql}})
+                  SELECT v.journal_id, wp.id, 'WorkPackage', wp.author_id, '', 1,
+                    wp.created_at, wp.created_at, 'Journal::WorkPackageJournal', v.data_id#{{validity_value}}
+                  FROM work_packages wp
+                    JOIN (VALUES #{{id_values.call(journal_triples)}}) AS v(wp_id, data_id, journal_id)
+                    ON v.wp_id = wp.id
+                SQL
+                if conn.table_exists?('work_package_hierarchies')
+                  conn.execute(
+                    "INSERT INTO work_package_hierarchies (ancestor_id, descendant_id, generations) " \\
+                    "SELECT id, id, 0 FROM work_packages WHERE id IN (#{{wp_ids.join(', ')}})"
+                  )
+                end
+
+                value_rows = []
+                journal_value_rows = []
+                fresh.each_with_index do |r, i|
+                  values = {{}}
+                  (r['custom_fields'] || []).each do |cf|
+                    cf_id = cf['id'].to_i
+                    values[cf_id] = cf['value'].to_s if valid_cfs.include?(cf_id) && !cf['value'].nil?
+                  end
+                  values[key_cf_id] = r['key'].to_s
+                  values.each do |cf_id, value|
+                    next unless valid_cfs.include?(cf_id)
+
+                    value_rows << {{
+                      customized_type: 'WorkPackage', customized_id: wp_ids[i], custom_field_id: cf_id, value: value
+                    }}
+                    journal_value_rows << {{ journal_id: journal_ids[i], custom_field_id: cf_id, value: value }}
+                  end
+                end
+                CustomValue.insert_all(value_rows) if value_rows.any?
+                Journal::CustomizableJournal.insert_all(journal_value_rows) if journal_value_rows.any?
+
+                fresh.each_with_index {{ |r, i| outcomes[r['key'].to_s]['id'] = wp_ids[i] }}
+              end
+            rescue => e
+              error = "#{{e.class}}: #{{e.message}}"
+              fresh.each do |r|
+                outcomes[r['key'].to_s] = {{ 'key' => r['key'].to_s, 'status' => 'failed', 'error' => error }}
+              end
+            end
+          end
+
+          results = rows.each_with_index.map do |r, i|
+            key = r['key'].to_s
+            if key.empty?
+              {{ 'key' => key, 'status' => 'failed', 'error' => 'missing key' }}
+            elsif keys.index(key) != i && outcomes[key]['status'] != 'existing'
+              {{ 'key' => key, 'status' => 'failed', 'error' => 'duplicate key in batch' }}
+            else
+              outcomes[key]
+            end
+          end
+          counts = results.group_by {{ |o| o['status'] }}.transform_values(&:size)
+          {{
+            'success' => !counts.key?('failed'),
+            'created' => counts.fetch('created', 0),
+            'existing' => counts.fetch('existing', 0),
+            'failed' => counts.fetch('failed', 0),
+            'ids_by_key' => outcomes.values.select {{ |o| o['id'] }}.to_h {{ |o| [o['key'], o['id']] }},
+            'results' => results
+          }}
+        """
+
+        try:
+            result = self._client.execute_query_to_json_file(script, timeout=300)
+        except Exception as e:
+            self._logger.warning("Skeleton insert failed: %s", e)
+            return {
+                "success": False,
+                "created": 0,
+                "existing": 0,
+                "failed": len(skeletons),
+                "ids_by_key": {},
+                "results": [{"key": s.get("key"), "status": "failed", "error": str(e)} for s in skeletons],
+                "error": str(e),
+            }
+        if not isinstance(result, dict) or not isinstance(result.get("results"), list):
+            msg = f"Unexpected skeleton insert response: {str(result)[:200]}"
+            raise QueryExecutionError(msg)
+        return result
+
+
+class BulkCreatePipeline:
+    """Double-buffered executor for consecutive ``bulk_create_records`` batches.
+
+    Every batch passes through three legs, each on its own single-thread
+    worker:
+
+    * **stage** — serialize the records and upload payload + stub script,
+    * **execute** — run the script in Rails,
+    * **collect** — wait for the result file, copy it back, clean up.
+
+    While batch N runs in Rails, batch N+1 is uploaded and batch N-1's result
+    is downloaded, so Rails only idles on transfers around the first and last
+    batch. Rails execution stays strictly sequential, in submission order.
+
+    ``depth`` bounds the batches staged or executing at once (2 = one running,
+    one waiting); :py:meth:`submit` blocks while that many are in flight.
+    Records are serialized on the stage worker and must not be mutated after
+    they were submitted.
+
+    Usage::
+
+        with client.bulk_create_pipeline() as pipeline:
+            futures = [pipeline.submit("WorkPackage", batch) for batch in batches]
+        results = [f.result() for f in futures]
+    """
+
+    def __init__(self, service: OpenProjectBulkCreateService, depth: int = 2) -> None:
+        if depth < 1:
+            msg = f"Pipeline depth must be >= 1, got {depth}"
+            raise ValueError(msg)
+        self._service = service
+        self._slots = threading.BoundedSemaphore(depth)
+        self._stage_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="j2o-bulk-stage")
+        self._execute_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="j2o-bulk-exec")
+        self._collect_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="j2o-bulk-collect")
+        self._closed = False
+
+    def submit(
+        self,
+        model: str,
+        records: list[dict[str, Any]],
+        *,
+        timeout: int | None = None,
+        result_basename: str | None = None,
+    ) -> Future[dict[str, Any]]:
+        """Queue one batch; the future resolves to the ``bulk_create_records`` envelope.
+
+        Failures of any leg (e.g. ``QueryExecutionError``) surface through the
+        future and do not stop later batches.
+
+        Raises:
+            RuntimeError: If the pipeline was closed
+
+        """
+        if self._closed:
+            msg = "BulkCreatePipeline is closed"
+            raise RuntimeError(msg)
+        self._slots.acquire()
+        try:
+            staged = self._stage_pool.submit(
+                self._service._stage_bulk_batch,
+                model,
+                records,
+                timeout=timeout,
+                result_basename=result_basename,
+            )
+        except BaseException:
+            self._slots.release()
+            raise
+        executed = self._execute_pool.submit(self._execute, staged)
+        return self._collect_pool.submit(self._collect, staged, executed)
+
+    def _execute(self, staged: Future[_StagedBulkBatch]) -> str | None:
+        try:
+            return self._service._execute_bulk_batch(staged.result())
+        finally:
+            # The batch no longer occupies the Rails side; let the next one stage.
+            self._slots.release()
+
+    def _collect(self, staged: Future[_StagedBulkBatch], executed: Future[str | None]) -> dict[str, Any]:
+        output = executed.result()
+        return self._service._collect_bulk_batch(staged.result(), output)
+
+    def close(self, *, cancel_pending: bool = False) -> None:
+        """Wait for all submitted batches; optionally drop the ones not started yet."""
+        self._closed = True
+        for pool in (self._stage_pool, self._execute_pool, self._collect_pool):
+            pool.shutdown(wait=True, cancel_futures=cancel_pending)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        self.close(cancel_pending=exc_type is not None)
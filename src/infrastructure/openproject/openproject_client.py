@@ -4,10 +4,11 @@ import json
 import os
 import random
 import re
+import threading
 import time
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from src import config
 from src.config import logger
@@ -21,6 +22,8 @@ from src.infrastructure.openproject.docker_client import DockerClient
 from src.infrastructure.openproject.rails_console_client import (
     RailsConsoleClient,
 )
+from src.infrastructure.openproject.rails_rpc_worker import RailsRpcWorker
+from src.infrastructure.openproject.rails_session_pool import RailsSession, RailsSessionPool
 from src.infrastructure.openproject.ssh_client import SSHClient
 from src.utils.config_validation import ConfigurationValidationError, SecurityValidator
 from src.utils.file_manager import FileManager
@@ -28,6 +31,9 @@ from src.utils.idempotency_decorators import batch_idempotent
 from src.utils.performance_optimizer import PerformanceOptimizer
 from src.utils.rate_limiter import create_openproject_rate_limiter
 
+if TYPE_CHECKING:
+    from src.infrastructure.openproject.openproject_bulk_create_service import BulkCreatePipeline
+
 # Module-level constants
 BATCH_SIZE_DEFAULT = 50
 SAFE_OFFSET_LIMIT = 5000
@@ -249,6 +255,11 @@ class OpenProjectClient:
             "Using provided" if rails_client else "Initialized",
             self.tmux_session_name,
         )
+        # Persistent RPC worker (opt-in, started lazily by ``rails_runner``).
+        self.rpc_worker = None
+        # Pool of concurrent Rails sessions (built lazily, see ``rails_sessions``).
+        self._rails_session_pool: RailsSessionPool | None = None
+        self._rails_session_pool_lock = threading.Lock()
 
         # ===== PERFORMANCE OPTIMIZER SETUP =====
         # Performance configuration from kwargs (passed from migration.py)
@@ -356,6 +367,71 @@ class OpenProjectClient:
             self.container_name,
         )
 
+    # ── Rails session binding ─────────────────────────────────────────────
+
+    def _bound_rails_session(self) -> RailsSession | None:
+        pool = self.__dict__.get("_rails_session_pool")
+        return pool.current() if pool is not None else None
+
+    @property
+    def rails_client(self) -> RailsConsoleClient:
+        """Rails console for the calling thread.
+
+        The session held via ``rails_sessions.session()`` when there is one,
+        otherwise the client's own console.
+        """
+        session = self._bound_rails_session()
+        if session is not None and session.rails_client is not None:
+            return session.rails_client
+        return self._rails_client
+
+    @rails_client.setter
+    def rails_client(self, value: RailsConsoleClient) -> None:
+        self._rails_client = value
+
+    @property
+    def rpc_worker(self) -> RailsRpcWorker | None:
+        """Persistent RPC worker for the calling thread (see ``rails_client``)."""
+        session = self._bound_rails_session()
+        if session is not None and session.rpc_worker is not None:
+            return session.rpc_worker
+        return self.__dict__.get("_rpc_worker")
+
+    @rpc_worker.setter
+    def rpc_worker(self, value: RailsRpcWorker | None) -> None:
+        session = self._bound_rails_session()
+        if session is not None and session.rpc_worker is not None:
+            session.rpc_worker = value
+        else:
+            self._rpc_worker = value
+
+    @property
+    def rails_sessions(self) -> RailsSessionPool:
+        """Pool of concurrent Rails sessions, built on first use.
+
+        Sized by ``J2O_RAILS_SESSIONS`` / ``migration.rails_sessions``; a size
+        of 1 keeps everything on the client's own console.
+        """
+        with self._rails_session_pool_lock:
+            if self._rails_session_pool is None:
+                self._rails_session_pool = RailsSessionPool.from_client(self)
+            return self._rails_session_pool
+
+    def close(self) -> None:
+        """Stop the RPC workers started for this client, its own and the pool's.
+
+        The tmux consoles are left running; they are started outside the
+        migration and reused by the next run.
+        """
+        pool = self.__dict__.get("_rails_session_pool")
+        self._rails_session_pool = None
+        if pool is not None:
+            pool.close()
+        worker = self.__dict__.get("_rpc_worker")
+        self._rpc_worker = None
+        if worker is not None:
+            worker.close()
+
     def ensure_reporting_project(self, identifier: str, name: str) -> int:
         """Thin delegator over ``self.project_setup.ensure_reporting_project``."""
         return self.project_setup.ensure_reporting_project(identifier, name)
@@ -423,6 +499,13 @@ class OpenProjectClient:
         """
         self.file_transfer.transfer_file_to_container(local_path, container_path)
 
+    def transfer_files_to_container(self, files: list[tuple[Path, Path]]) -> None:
+        """Transfer several files to the container in one SSH round trip.
+
+        Thin delegator over ``self.file_transfer.transfer_files_to_container``.
+        """
+        self.file_transfer.transfer_files_to_container(files)
+
     def is_connected(self) -> bool:
         """Test if connected to OpenProject.
 
@@ -461,6 +544,19 @@ class OpenProjectClient:
             timeout,
         )
 
+    def iter_query_ndjson(
+        self,
+        ruby_body: str,
+        *,
+        container_file: str | None = None,
+        timeout: int | None = None,
+    ) -> Iterator[Any]:
+        """Stream a large result set as NDJSON rows (``emit.call(row)`` in Ruby).
+
+        Thin delegator over ``self.rails_runner.iter_query_ndjson``.
+        """
+        return self.rails_runner.iter_query_ndjson(ruby_body, container_file=container_file, timeout=timeout)
+
     def _check_console_output_for_errors(self, output: str, context: str) -> None:
         """Raise a QueryExecutionError if console output indicates a Ruby error.
 
@@ -696,6 +792,13 @@ class OpenProjectClient:
             role_ids=role_ids,
         )
 
+    def bulk_assign_user_roles(self, assignments: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Apply many user role assignments, one result per assignment.
+
+        Thin delegator over ``self.memberships.bulk_assign_user_roles``.
+        """
+        return self.memberships.bulk_assign_user_roles(assignments)
+
     def sync_workflow_transitions(
         self,
         transitions: list[dict[str, int]],
@@ -863,6 +966,17 @@ class OpenProjectClient:
         """
         return self.project_attributes.get_project_wp_cf_snapshot(project_id)
 
+    def get_project_wp_cf_delta(self, project_id: int, *, since: str, after_id: int) -> dict[str, Any]:
+        """Thin delegator over ``self.project_attributes.get_project_wp_cf_delta``."""
+        return self.project_attributes.get_project_wp_cf_delta(project_id, since=since, after_id=after_id)
+
+    def iter_project_wp_cf_snapshot(self, project_id: int) -> Iterator[dict[str, Any]]:
+        """Stream the WorkPackage snapshot of a project row by row.
+
+        Thin delegator over ``self.project_attributes.iter_project_wp_cf_snapshot``.
+        """
+        return self.project_attributes.iter_project_wp_cf_snapshot(project_id)
+
     def set_wp_last_update_date_by_keys(
         self,
         project_id: int,
@@ -888,6 +1002,10 @@ class OpenProjectClient:
             result_basename=result_basename,
         )
 
+    def bulk_create_pipeline(self, depth: int = 2) -> BulkCreatePipeline:
+        """Thin delegator over ``self.bulk_create.pipeline``."""
+        return self.bulk_create.pipeline(depth)
+
     def find_record(
         self,
         model: str,
@@ -1037,6 +1155,24 @@ class OpenProjectClient:
         """
         self.records.delete_record(model, record_id)
 
+    def reconcile_records(
+        self,
+        model: str,
+        records: list[dict[str, Any]],
+        *,
+        match_on: str = "name",
+        compare: Iterable[str] = (),
+        timeout: int | None = None,
+    ) -> dict[str, Any]:
+        """Thin delegator over ``self.records.reconcile_records``."""
+        return self.records.reconcile_records(
+            model,
+            records,
+            match_on=match_on,
+            compare=compare,
+            timeout=timeout,
+        )
+
     def find_all_records(
         self,
         model: str,
@@ -1275,6 +1411,16 @@ class OpenProjectClient:
         """Thin delegator over ``self.wp_cf.bulk_set_wp_custom_field_values``."""
         return self.wp_cf.bulk_set_wp_custom_field_values(cf_values)
 
+    def bulk_set_custom_values(
+        self,
+        cf_id: int,
+        values: Mapping[int, str],
+        *,
+        touch_journal: bool = False,
+    ) -> dict[str, Any]:
+        """Thin delegator over ``self.wp_cf.bulk_set_custom_values``."""
+        return self.wp_cf.bulk_set_custom_values(cf_id, values, touch_journal=touch_journal)
+
     def upsert_work_package_description_section(
         self,
         work_package_id: int,
@@ -1362,12 +1508,14 @@ class OpenProjectClient:
     def batch_create_time_entries(
         self,
         time_entries: list[dict[str, Any]],
+        *,
+        timeout: int = 120,
     ) -> dict[str, Any]:
         """Create multiple time entries via file-based JSON in the container.
 
         Thin delegator over ``self.time_entries.batch_create_time_entries``.
         """
-        return self.time_entries.batch_create_time_entries(time_entries)
+        return self.time_entries.batch_create_time_entries(time_entries, timeout=timeout)
 
     # ===== ENHANCED PERFORMANCE FEATURES =====
 
@@ -1398,6 +1546,14 @@ class OpenProjectClient:
         """
         return self.bulk_create._create_work_packages_batch(work_packages, **_kwargs)
 
+    def insert_work_package_skeletons(
+        self,
+        skeletons: list[dict[str, Any]],
+        key_cf_id: int,
+    ) -> dict[str, Any]:
+        """Thin delegator over ``self.bulk_create.insert_work_package_skeletons``."""
+        return self.bulk_create.insert_work_package_skeletons(skeletons, key_cf_id)
+
     def get_project_enhanced(self, project_id: int) -> dict[str, Any]:
         """Get comprehensive project information.
 
@@ -1444,6 +1600,10 @@ class OpenProjectClient:
         """
         return self.work_packages.batch_update_work_packages(updates)
 
+    def rebuild_derived_work_package_data(self, project_ids: Iterable[int]) -> list[dict[str, Any]]:
+        """Thin delegator over ``self.work_packages.rebuild_derived_work_package_data``."""
+        return self.work_packages.rebuild_derived_work_package_data(project_ids)
+
     def create_work_package(self, payload: dict[str, Any]) -> dict[str, Any] | None:
         """Create a single work package.
 
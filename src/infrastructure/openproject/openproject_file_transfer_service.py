@@ -37,6 +37,7 @@ from pathlib import Path
 from typing import Any
 
 from src.infrastructure.openproject.openproject_client import OpenProjectClient
+from src.infrastructure.openproject.payload_compression import compression_enabled
 
 
 class OpenProjectFileTransferService:
@@ -160,6 +161,24 @@ class OpenProjectFileTransferService:
             self._logger.exception(error_msg)
             raise FileTransferError(error_msg) from e
 
+    def transfer_files_to_container(self, files: list[tuple[Path, Path]]) -> None:
+        """Transfer several files to the container as one tar stream.
+
+        Raises:
+            FileTransferError: If the batch transfer fails for any reason.
+
+        """
+        from src.infrastructure.openproject.openproject_client import FileTransferError
+
+        if not files:
+            return
+        try:
+            self._client.docker_client.transfer_files_to_container(files)
+        except Exception as e:
+            error_msg = f"Failed to transfer {len(files)} file(s) to container."
+            self._logger.exception(error_msg)
+            raise FileTransferError(error_msg) from e
+
     def transfer_file_from_container(self, container_path: Path, local_path: Path) -> Path:
         """Copy a file from the container to the local system.
 
@@ -167,6 +186,9 @@ class OpenProjectFileTransferService:
         file) are wrapped in :py:class:`FileTransferError` — callers do not
         see :py:class:`FileNotFoundError` directly.
 
+        The file travels gzipped when payload compression is enabled (see
+        :py:mod:`payload_compression`).
+
         Raises:
             FileTransferError: If the transfer fails for any reason.
 
@@ -174,6 +196,12 @@ class OpenProjectFileTransferService:
         from src.infrastructure.openproject.openproject_client import FileTransferError
 
         try:
+            if compression_enabled():
+                return self._client.docker_client.copy_file_from_container(
+                    container_path,
+                    local_path,
+                    compress=True,
+                )
             return self._client.docker_client.copy_file_from_container(
                 container_path,
                 local_path,
@@ -11,8 +11,10 @@ operations onto a focused service. The service owns:
   idempotent Ruby loop that creates/updates groups to match the
   desired user-id sets, and reads the JSON summary back.
 * **Project membership / role assignment**: ``assign_group_roles``
-  (groups → projects with role ids) and ``assign_user_roles`` (single
-  user → single project with role ids).
+  (groups → projects with role ids), ``assign_user_roles`` (single
+  user → single project with role ids) and ``bulk_assign_user_roles``
+  (many of those; one Rails call per batch in raw bulk mode, see
+  :py:func:`raw_bulk_associations_enabled`).
 
 The shared ``_read_result_file`` helper stays on ``OpenProjectClient``
 because ``sync_workflow_transitions`` (still on the client) also uses
@@ -34,6 +36,7 @@ from pathlib import Path
 from typing import Any
 
 from src.infrastructure.exceptions import QueryExecutionError
+from src.infrastructure.openproject.openproject_associations_service import raw_bulk_associations_enabled
 from src.infrastructure.openproject.openproject_client import OpenProjectClient
 
 
@@ -324,3 +327,129 @@ end
         if isinstance(result, dict):
             return result
         return {"success": False, "error": "unexpected response"}
+
+    def bulk_assign_user_roles(self, assignments: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Apply many ``assign_user_roles`` assignments.
+
+        Args:
+            assignments: Dicts with ``project_id``, ``user_id`` and ``role_ids``
+
+        Returns:
+            One result per assignment, in order, shaped like
+            :py:meth:`assign_user_roles` (``success``, ``changed``, ``error``).
+
+        In raw bulk mode the whole batch is one Rails call: projects, users,
+        roles, members and member roles are each read with a single query,
+        missing members and member roles are added with ``insert_all`` and
+        roles outside the desired set are deleted — skipping ``Member``
+        validations, callbacks and notification mails. Otherwise each
+        assignment goes through :py:meth:`assign_user_roles`.
+
+        """
+        if not assignments:
+            return []
+        if not raw_bulk_associations_enabled():
+            results: list[dict[str, Any]] = []
+            for assignment in assignments:
+                try:
+                    results.append(
+                        self.assign_user_roles(
+                            project_id=assignment["project_id"],
+                            user_id=assignment["user_id"],
+                            role_ids=list(assignment.get("role_ids") or []),
+                        ),
+                    )
+                except Exception as e:
+                    results.append({"success": False, "error": str(e)})
+            return results
+
+        rows: list[list[Any]] = []
+        for assignment in assignments:
+            try:
+                role_ids = sorted({int(r) for r in assignment.get("role_ids") or [] if int(r) > 0})
+                rows.append([int(assignment["project_id"]), int(assignment["user_id"]), role_ids])
+            except KeyError, TypeError, ValueError:
+                rows.append([0, 0, []])
+
+        data_json = json.dumps(rows)
+        script = f"""
+          require 'json'
+          rows = JSON.parse(<<-'J2O_DATA'
+{data_json}
+J2O_DATA
+)
+          project_ids = rows.map {{ |r| r[0] }}.uniq
+          user_ids = rows.map {{ |r| r[1] }}.uniq
+          valid_projects = Project.where(id: project_ids).pluck(:id).to_set
+          valid_users = User.where(id: user_ids).pluck(:id).to_set
+          valid_roles = Role.where(id: rows.flat_map {{ |r| r[2] }}.uniq).pluck(:id).to_set
+
+          # The last assignment for a project/user pair wins, like sequential calls.
+          desired = {{}}
+          outcomes = Array.new(rows.size)
+          rows.each_with_index do |(project_id, user_id, role_ids), i|
+            if role_ids.empty?
+              outcomes[i] = {{ success: false, error: 'no roles specified' }}
+            elsif !valid_projects.include?(project_id) || !valid_users.include?(user_id)
+              outcomes[i] = {{ success: false, error: 'project or user not found' }}
+            elsif (unknown = role_ids.reject {{ |rid| valid_roles.include?(rid) }}).any?
+              outcomes[i] = {{ success: false, error: "unknown role ids: #{{unknown.join(', ')}}" }}
+            else
+              desired[[project_id, user_id]] = role_ids
+            end
+          end
+
+          members = {{}}
+          Member.where(project_id: desired.keys.map(&:first).uniq, user_id: desired.keys.map(&:last).uniq)
+                .pluck(:id, :project_id, :user_id)
+                .each {{ |id, project_id, user_id| members[[project_id, user_id]] = id }}
+          new_keys = desired.keys.reject {{ |key| members.key?(key) }}.to_set
+          result = {{}}
+
+          begin
+            Member.transaction do
+              if new_keys.any?
+                new_rows = new_keys.map {{ |project_id, user_id| {{ project_id: project_id, user_id: user_id }} }}
+                Member.insert_all(new_rows, returning: %w[id project_id user_id])
+                      .rows.each {{ |id, project_id, user_id| members[[project_id.to_i, user_id.to_i]] = id.to_i }}
+              end
+
+              current = Hash.new {{ |h, k| h[k] = {{}} }}
+              MemberRole.where(member_id: members.values, inherited_from: nil)
+                        .pluck(:id, :member_id, :role_id)
+                        .each {{ |id, member_id, role_id| current[member_id][role_id] = id }}
+
+              additions = []
+              removals = []
+              desired.each do |key, role_ids|
+                member_id = members[key]
+                next if member_id.nil?
+
+                have = current[member_id]
+                add = role_ids - have.keys
+                drop = have.reject {{ |role_id, _| role_ids.include?(role_id) }}.values
+                additions.concat(add.map {{ |role_id| {{ member_id: member_id, role_id: role_id }} }})
+                removals.concat(drop)
+                changed = new_keys.include?(key) || add.any? || drop.any?
+                result[key] = {{ success: true, changed: changed, role_ids: role_ids }}
+              end
+              MemberRole.insert_all(additions) if additions.any?
+              MemberRole.where(id: removals).delete_all if removals.any?
+            end
+          rescue => e
+            desired.each_key {{ |key| result[key] = {{ success: false, error: "#{{e.class}}: #{{e.message}}" }} }}
+          end
+
+          rows.each_with_index do |(project_id, user_id, _), i|
+            outcomes[i] ||= result[[project_id, user_id]] || {{ success: false, error: 'member not created' }}
+          end
+          outcomes
+        """
+        try:
+            result = self._client.execute_query_to_json_file(script, timeout=180)
+        except Exception as e:
+            self._logger.warning("Raw bulk membership assignment failed: %s", e)
+            return [{"success": False, "error": str(e)} for _ in assignments]
+        if isinstance(result, list) and len(result) == len(assignments):
+            return [r if isinstance(r, dict) else {"success": False, "error": "unexpected response"} for r in result]
+        return [{"success": False, "error": "unexpected response"} for _ in assignments]
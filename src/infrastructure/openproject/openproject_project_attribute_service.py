@@ -25,9 +25,14 @@ The service owns:
   projects.
 * ``rename_project_attribute`` — rename a ``ProjectCustomField`` by
   name; idempotent (returns true when already at the new name).
-* ``get_project_wp_cf_snapshot`` — read a project's WP custom-field
-  state ("J2O Origin Key" + "J2O Last Update Date") plus
-  ``updated_at`` for incremental-migration deltas.
+* ``get_project_wp_cf_snapshot`` / ``iter_project_wp_cf_snapshot`` —
+  read a project's WP custom-field state ("J2O Origin Key" + "J2O Last
+  Update Date") plus ``updated_at`` for incremental-migration deltas;
+  the iterator streams NDJSON rows so large projects are never held in
+  memory at once.
+* ``get_project_wp_cf_delta`` — the same rows restricted to WPs created
+  or updated since a high-water mark, plus the project's WP count so a
+  cached key set can detect deletions.
 
 ``OpenProjectClient`` exposes the service via ``self.project_attributes``
 and keeps thin delegators for the same method names so existing call
@@ -37,6 +42,8 @@ sites work unchanged.
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
+from datetime import UTC, datetime
 from typing import Any
 
 from src.infrastructure.exceptions import QueryExecutionError
@@ -402,6 +409,9 @@ J2O_DATA
 
         Each item: { id, updated_at, jira_issue_key, jira_migration_date }
 
+        Prefer :py:meth:`iter_project_wp_cf_snapshot` when the rows are
+        consumed once.
+
         Raises:
             QueryExecutionError: If the snapshot query fails or
                 ``project_id`` cannot be coerced to ``int``. Wrapping
@@ -409,6 +419,20 @@ J2O_DATA
                 documented exception type uniform — callers only have
                 to catch one thing.
 
+        """
+        return list(self.iter_project_wp_cf_snapshot(project_id))
+
+    def iter_project_wp_cf_snapshot(self, project_id: int) -> Iterator[dict[str, Any]]:
+        """Stream the snapshot of :py:meth:`get_project_wp_cf_snapshot` row by row.
+
+        Ruby walks the project with ``find_in_batches`` and looks up the two
+        CFs per batch, writing one NDJSON line per WorkPackage; rows are
+        parsed here as they arrive.
+
+        Raises:
+            QueryExecutionError: If the snapshot query fails or
+                ``project_id`` cannot be coerced to ``int``.
+
         """
         try:
             pid = int(project_id)
@@ -420,28 +444,67 @@ J2O_DATA
           cf_key = CustomField.find_by(type: 'WorkPackageCustomField', name: 'J2O Origin Key')
           cf_mig = CustomField.find_by(type: 'WorkPackageCustomField', name: 'J2O Last Update Date')
 
-          # Pre-load custom values for all WPs in this project for efficiency
-          wp_ids = WorkPackage.where(project_id: {pid}).pluck(:id)
+          WorkPackage.where(project_id: {pid}).select(:id, :updated_at).find_in_batches(batch_size: 1000) do |wps|
+            ids = wps.map(&:id)
+            key_values = cf_key ? CustomValue.where(custom_field_id: cf_key.id, customized_type: 'WorkPackage', customized_id: ids).pluck(:customized_id, :value).to_h : {{}}
+            mig_values = cf_mig ? CustomValue.where(custom_field_id: cf_mig.id, customized_type: 'WorkPackage', customized_id: ids).pluck(:customized_id, :value).to_h : {{}}
+            wps.each do |wp|
+              emit.call({{ id: wp.id, updated_at: (wp.updated_at&.utc&.iso8601), jira_issue_key: key_values[wp.id], jira_migration_date: mig_values[wp.id] }})
+            end
+          end
+        """
+        for row in self._client.iter_query_ndjson(ruby, timeout=120):
+            if not isinstance(row, dict):
+                msg = "Invalid snapshot from OpenProject"
+                raise QueryExecutionError(msg)
+            yield row
 
-          key_values = {{}}
-          mig_values = {{}}
+    def get_project_wp_cf_delta(self, project_id: int, *, since: str, after_id: int) -> dict[str, Any]:
+        """Return snapshot rows of WPs changed since a high-water mark.
 
-          if cf_key
-            CustomValue.where(custom_field_id: cf_key.id, customized_type: 'WorkPackage', customized_id: wp_ids)
-              .each {{ |cv| key_values[cv.customized_id] = cv.value }}
-          end
+        A WP is included when its id is above ``after_id`` (created since)
+        or its ``updated_at`` is at or after ``since``. Rows have the shape
+        of :py:meth:`iter_project_wp_cf_snapshot`.
 
-          if cf_mig
-            CustomValue.where(custom_field_id: cf_mig.id, customized_type: 'WorkPackage', customized_id: wp_ids)
-              .each {{ |cv| mig_values[cv.customized_id] = cv.value }}
-          end
+        Returns:
+            ``{rows, count, id_sum, max_id, high_water}`` where ``count``,
+            ``id_sum`` (sum of all WP ids) and ``max_id`` cover the whole
+            project and ``high_water`` is its newest ``updated_at``
+
+        Raises:
+            QueryExecutionError: If the query fails or an argument is invalid.
 
-          WorkPackage.where(project_id: {pid}).select(:id, :updated_at).map do |wp|
-            {{ id: wp.id, updated_at: (wp.updated_at&.utc&.iso8601), jira_issue_key: key_values[wp.id], jira_migration_date: mig_values[wp.id] }}
+        """
+        try:
+            pid = int(project_id)
+            last_id = int(after_id)
+            since_ts = datetime.fromisoformat(str(since))
+        except (TypeError, ValueError) as e:
+            msg = f"Invalid snapshot delta arguments: {project_id!r}, {since!r}, {after_id!r}"
+            raise QueryExecutionError(msg) from e
+        if since_ts.tzinfo is None:
+            since_ts = since_ts.replace(tzinfo=UTC)
+        since_iso = since_ts.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+        ruby = f"""
+          cf_key = CustomField.find_by(type: 'WorkPackageCustomField', name: 'J2O Origin Key')
+          cf_mig = CustomField.find_by(type: 'WorkPackageCustomField', name: 'J2O Last Update Date')
+          scope = WorkPackage.where(project_id: {pid})
+          changed = scope.where('work_packages.id > ? OR work_packages.updated_at >= ?', {last_id}, Time.iso8601('{since_iso}'))
+
+          rows = []
+          changed.select(:id, :updated_at).find_in_batches(batch_size: 1000) do |wps|
+            ids = wps.map(&:id)
+            key_values = cf_key ? CustomValue.where(custom_field_id: cf_key.id, customized_type: 'WorkPackage', customized_id: ids).pluck(:customized_id, :value).to_h : {{}}
+            mig_values = cf_mig ? CustomValue.where(custom_field_id: cf_mig.id, customized_type: 'WorkPackage', customized_id: ids).pluck(:customized_id, :value).to_h : {{}}
+            wps.each do |wp|
+              rows << {{ id: wp.id, updated_at: (wp.updated_at&.utc&.iso8601), jira_issue_key: key_values[wp.id], jira_migration_date: mig_values[wp.id] }}
+            end
           end
+          {{ rows: rows, count: scope.count, id_sum: scope.sum(:id), max_id: scope.maximum(:id), high_water: scope.maximum(:updated_at)&.utc&.iso8601(6) }}
         """
-        data = self._client.execute_large_query_to_json_file(ruby, timeout=120)
-        if not isinstance(data, list):
-            msg = "Invalid snapshot from OpenProject"
+        result = self._client.execute_query_to_json_file(ruby, timeout=120)
+        if not isinstance(result, dict) or not isinstance(result.get("rows"), list):
+            msg = "Invalid snapshot delta from OpenProject"
             raise QueryExecutionError(msg)
-        return data
+        return result
@@ -18,11 +18,23 @@ Phases 2e-2i of ADR-002 collected the Rails-console helpers off
   ``offset+limit`` reads with adaptive rate limiting) and
   ``count_records`` (marker-bracketed model count via direct tmux).
 * **Heavyweight ``execute*`` family** — ``execute_script_with_data``
-  (per-call structured-input pipeline with tmux markers and rails-runner
+  (per-call structured-input pipeline; the payload comes back through a
+  per-call result file, the pane only signals completion; rails-runner
   fallback) and ``execute_large_query_to_json_file`` (large result sets
   written to a container file then ``cat``-piped via SSH to bypass
   tmux/console truncation).
 
+* **Persistent RPC worker** — when ``migration.rails_rpc_worker`` (or
+  ``J2O_RAILS_RPC_WORKER=1``) is set, ``execute_query``,
+  ``execute_script_with_data``, ``count_records`` and the console leg of
+  ``execute_large_query_to_json_file`` run as one framed round trip on a
+  long-lived ``rails runner`` process instead of tmux send-keys + pane
+  polling (see :py:mod:`rails_rpc_worker`).
+* **Non-interactive runner** — ``execute_runner_script`` is the single entry
+  point for ``rails runner`` calls; with ``migration.rails_prefork_runner``
+  (or ``J2O_RAILS_PREFORK=1``) they fork from an already-booted Rails server
+  instead of booting Rails per call (see :py:mod:`rails_prefork_server`).
+
 ``OpenProjectClient`` exposes the service via ``self.rails_runner`` and
 keeps thin delegators for the same method names so existing call sites
 work unchanged.
@@ -30,6 +42,7 @@ work unchanged.
 
 from __future__ import annotations
 
+import io
 import json
 import os
 import re
@@ -38,24 +51,113 @@ import shlex
 import shutil
 import subprocess
 import time
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from src import config
 from src.infrastructure.exceptions import JsonParseError, QueryExecutionError
+from src.infrastructure.openproject.openproject_client import OpenProjectClient
+from src.infrastructure.openproject.payload_compression import GunzipWriter, compression_enabled, iter_gunzip
 from src.infrastructure.openproject.rails_console_client import (
     CommandExecutionError,
     ConsoleNotReadyError,
     RubyError,
 )
+from src.infrastructure.openproject.rails_prefork_server import (
+    UNAVAILABLE_EXIT,
+    RailsPreforkError,
+    RailsPreforkServer,
+    cold_runner_command,
+    prefork_runner_enabled,
+)
+from src.infrastructure.openproject.rails_rpc_worker import (
+    WORKER_SCRIPT_CONTAINER,
+    WORKER_SCRIPT_LOCAL,
+    RailsRpcError,
+    RailsRpcWorker,
+)
+from src.infrastructure.openproject.rails_script_cache import (
+    RailsScriptCache,
+    cached_script_path,
+    call_expression,
+    result_call_expression,
+)
+from src.infrastructure.openproject.tmux_output_channel import TmuxOutputChannel
 
 # Tunables for batched/paged Rails queries. Co-located with the service that
 # uses them so the batched-query implementation has no back-reference to
 # ``openproject_client``.
 BATCH_SIZE_DEFAULT: int = 50
 SAFE_OFFSET_LIMIT: int = 5000
-from src.infrastructure.openproject.openproject_client import OpenProjectClient
+
+
+# Build provenance hint: where did this originate?
+# Compose a concise hint like: "j2o: migration/work_packages func=_migrate_work_packages project=NRS ts=..."
+_HINT_SKIP_FILES = (
+    "/src/infrastructure/openproject/openproject_client.py",
+    "/src/infrastructure/openproject/openproject_rails_runner_service.py",
+    "/src/infrastructure/openproject/rails_console_client.py",
+    "/src/infrastructure/openproject/docker_client.py",
+    "/src/infrastructure/openproject/ssh_client.py",
+)
+
+
+def _query_caller_hint(default_component: str) -> str:
+    """Return a provenance comment (originating component/function) for generated Ruby."""
+    try:
+        import sys
+
+        # Use sys._getframe instead of inspect.stack (O(1) per frame, no source loading)
+        path: str | None = None
+        func: str | None = None
+        frame = sys._getframe(1)
+        for _ in range(49):
+            if frame is None:
+                break
+            filename = frame.f_code.co_filename
+            if "/src/" in filename and not any(skip in filename for skip in _HINT_SKIP_FILES):
+                path = filename.split("/src/")[-1]
+                func = frame.f_code.co_name
+                break
+            frame = frame.f_back
+
+        # Derive a concise component label from path
+        component = default_component
+        if path:
+            component = (
+                path.replace("migrations/", "migration/")
+                .replace("clients/", "client/")
+                .replace("_migration.py", "")
+                .replace(".py", "")
+            )
+
+        parts: list[str] = ["j2o:", component]
+        if func:
+            parts.append(f"func={func}")
+        ts = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+        parts.append(f"ts={ts}")
+        # include project filter if configured
+        proj = (config.jira_config or {}).get("project_filter")
+        if proj:
+            parts.append(f"project={proj}")
+        return " ".join(parts)
+    except Exception:
+        return f"j2o: {default_component}"
+
+
+def iter_ndjson(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Parse newline-delimited JSON from a byte stream, one document per line."""
+    pending = b""
+    for chunk in chunks:
+        pending += chunk
+        *complete, pending = pending.split(b"\n")
+        for line in complete:
+            if line.strip():
+                yield json.loads(line)
+    if pending.strip():
+        yield json.loads(pending)
 
 
 class OpenProjectRailsRunnerService:
@@ -64,6 +166,8 @@ class OpenProjectRailsRunnerService:
     def __init__(self, client: OpenProjectClient) -> None:
         self._client = client
         self._logger = client.logger
+        self.script_cache = RailsScriptCache(client)
+        self._prefork_server: RailsPreforkServer | None = None
 
     # ── connectivity ──────────────────────────────────────────────────────
 
@@ -81,6 +185,133 @@ class OpenProjectRailsRunnerService:
             self._logger.exception("Connection test failed.")
             return False
 
+    # ── persistent RPC worker ─────────────────────────────────────────────
+
+    def rpc_worker_enabled(self) -> bool:
+        """Whether Rails calls should go through the persistent RPC worker.
+
+        Opt-in via ``migration.rails_rpc_worker: true`` or
+        ``J2O_RAILS_RPC_WORKER=1``; the tmux console stays the default.
+        """
+        return config.migration_flag("J2O_RAILS_RPC_WORKER", "rails_rpc_worker")
+
+    def get_rpc_worker(self) -> RailsRpcWorker:
+        """Return the client's RPC worker, creating and starting it on first use.
+
+        The worker script is uploaded once; the worker itself boots Rails once
+        and is reused for every subsequent call of the run.
+        """
+        client = self._client
+        worker = getattr(client, "rpc_worker", None)
+        if isinstance(worker, RailsRpcWorker):
+            return worker
+        client.docker_client.transfer_file_to_container(WORKER_SCRIPT_LOCAL, WORKER_SCRIPT_CONTAINER)
+        worker = RailsRpcWorker.for_container(
+            client.ssh_client.get_ssh_base_command(),
+            str(client.container_name),
+            call_timeout=client.rails_client.command_timeout,
+        )
+        worker.start()
+        client.rpc_worker = worker
+        return worker
+
+    # ── non-interactive runner ────────────────────────────────────────────
+
+    def get_prefork_server(self) -> RailsPreforkServer:
+        """Return the handle of the container's prefork server (started on first use)."""
+        if self._prefork_server is None:
+            self._prefork_server = RailsPreforkServer(self._client.docker_client)
+        return self._prefork_server
+
+    def execute_runner_script(
+        self,
+        script_path: str | None = None,
+        *,
+        code: str | None = None,
+        timeout: int | None = None,
+        env: dict[str, str] | None = None,
+    ) -> tuple[str, str, int]:
+        """Run a container script (or inline ``code``) the way ``bundle exec rails runner`` would.
+
+        With the prefork runner enabled (``J2O_RAILS_PREFORK=1``, see
+        :py:mod:`rails_prefork_server`) the script runs in a child forked from
+        the warm server; if that server can't be reached, the call falls back
+        to a cold ``rails runner``.
+
+        Returns:
+            ``(stdout, stderr, returncode)`` as from ``DockerClient.execute_command``
+
+        """
+        docker = self._client.docker_client
+        if prefork_runner_enabled():
+            server = self.get_prefork_server()
+            try:
+                command = server.runner_command(script_path, code=code)
+            except RailsPreforkError as e:
+                self._logger.warning("Rails prefork server unavailable, using cold rails runner: %s", e)
+            else:
+                stdout, stderr, rc = docker.execute_command(command, timeout=timeout, env=env)
+                if rc != UNAVAILABLE_EXIT:
+                    return stdout, stderr, rc
+                self._logger.warning(
+                    "Rails prefork server went away (%s); retrying with cold rails runner",
+                    stderr[:200],
+                )
+                server.mark_unavailable()
+        target = shlex.quote(code) if code is not None else str(script_path)
+        return docker.execute_command(cold_runner_command(target), timeout=timeout, env=env)
+
+    def console_execute(
+        self,
+        command: str,
+        timeout: int | None = None,
+        *,
+        suppress_output: bool = False,
+    ) -> str:
+        """Run ``command`` on the RPC worker when enabled, else the tmux console.
+
+        Same contract as :py:meth:`RailsConsoleClient.execute`.
+        """
+        if self.rpc_worker_enabled():
+            try:
+                return self.get_rpc_worker().execute(command, timeout, suppress_output=suppress_output)
+            except RailsRpcError as e:
+                raise CommandExecutionError(str(e)) from e
+        return self._client.rails_client.execute(command, timeout=timeout, suppress_output=suppress_output)
+
+    def _output_channel(self) -> TmuxOutputChannel | None:
+        """Return the console's pipe-pane channel when enabled (else capture-pane polling)."""
+        getter = getattr(self._client.rails_client, "get_output_channel", None)
+        channel = getter() if callable(getter) else None
+        return channel if isinstance(channel, TmuxOutputChannel) else None
+
+    @staticmethod
+    def extract_marked_json(output: str, start_marker: str, end_marker: str) -> tuple[bool, Any]:
+        """Parse the JSON payload a script printed between its unique markers.
+
+        Only for clean (non-tmux) output such as RPC-captured stdout; the
+        last start marker wins so earlier diagnostic prints cannot confuse it.
+
+        Returns:
+            ``(found, parsed)`` — ``found`` is False when either marker is missing.
+
+        Raises:
+            QueryExecutionError: If the markers are present but the payload is not valid JSON.
+
+        """
+        start_idx = output.rfind(start_marker)
+        if start_idx == -1:
+            return False, None
+        end_idx = output.find(end_marker, start_idx + len(start_marker))
+        if end_idx == -1:
+            return False, None
+        payload = output[start_idx + len(start_marker) : end_idx].strip()
+        try:
+            return True, json.loads(payload)
+        except json.JSONDecodeError as e:
+            q_msg = f"Failed to parse JSON output: {e}"
+            raise QueryExecutionError(q_msg) from e
+
     # ── console-output validation ─────────────────────────────────────────
 
     def check_console_output_for_errors(self, output: str, context: str) -> None:
@@ -323,6 +554,12 @@ class OpenProjectRailsRunnerService:
         client = self._client
         client._last_query = query
         effective_timeout = timeout if timeout is not None else 30
+        if self.rpc_worker_enabled():
+            try:
+                response = self.get_rpc_worker().call(f"puts ({query})", timeout=effective_timeout)
+            except RailsRpcError as e:
+                raise CommandExecutionError(str(e)) from e
+            return str(response.get("stdout", "")).strip()
         return client.rails_client._send_command_to_tmux(
             f"puts ({query})",
             effective_timeout,
@@ -514,38 +751,54 @@ class OpenProjectRailsRunnerService:
         client = self._client
         client._validate_model_name(model)
 
+        if self.rpc_worker_enabled():
+            try:
+                response = self.get_rpc_worker().call(f"{model}.count", timeout=30, inspect=True)
+                return int(str(response.get("value", "")).strip())
+            except (RailsRpcError, RubyError, ValueError) as e:
+                msg = f"Unable to count {model} via RPC worker: {e}"
+                raise QueryExecutionError(msg) from e
+
         marker_id = secrets.token_hex(8)
         start_marker = f"J2O_COUNT_START_{marker_id}"
         end_marker = f"J2O_COUNT_END_{marker_id}"
 
         query = f'puts "{start_marker}"; puts {model}.count; puts "{end_marker}"'
 
-        target = client.rails_client._get_target()
-        tmux = shutil.which("tmux") or "tmux"
-
-        escaped_command = client.rails_client._escape_command(query)
-        subprocess.run(
-            [tmux, "send-keys", "-t", target, escaped_command, "Enter"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        max_wait = 30
-        start_time = time.time()
-        result = ""
+        # Hold the pane for the whole send/wait round trip.
+        with client.rails_client.command_lock:
+            target = client.rails_client._get_target()
+            tmux = shutil.which("tmux") or "tmux"
 
-        while time.time() - start_time < max_wait:
-            time.sleep(0.3)
-            cap = subprocess.run(
-                [tmux, "capture-pane", "-p", "-S", "-100", "-t", target],
+            escaped_command = client.rails_client._escape_command(query)
+            channel = self._output_channel()
+            mark = channel.mark() if channel is not None else 0
+            subprocess.run(
+                [tmux, "send-keys", "-t", target, escaped_command, "Enter"],
                 capture_output=True,
                 text=True,
                 check=True,
             )
-            result = cap.stdout
-            if end_marker in result:
-                break
+
+            max_wait = 30
+            start_time = time.time()
+            result = ""
+
+            if channel is not None:
+                # Wakes on the printed end marker instead of polling the pane.
+                _found, result = channel.wait_for(end_marker, mark, max_wait, at_line_start=True)
+
+            while channel is None and time.time() - start_time < max_wait:
+                time.sleep(0.3)
+                cap = subprocess.run(
+                    [tmux, "capture-pane", "-p", "-S", "-100", "-t", target],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                result = cap.stdout
+                if end_marker in result:
+                    break
 
         pattern = rf"^{re.escape(start_marker)}$\n(\d+)\n^{re.escape(end_marker)}$"
         match = re.search(pattern, result, re.MULTILINE)
@@ -582,27 +835,22 @@ class OpenProjectRailsRunnerService:
 
         The Ruby script should print a JSON payload between the markers
         ``JSON_OUTPUT_START_<exec_id>`` and ``JSON_OUTPUT_END_<exec_id>`` (the
-        exec_id is unique per call to distinguish from earlier-run output
-        still in the tmux buffer); the JSON is parsed and returned in the
-        ``data`` field.
+        exec_id is unique per call). The script's stdout is captured in the
+        container and that payload is written to a per-call result file, so
+        the pane only carries a completion marker and any other output (e.g.
+        error text); the file is read back — and removed together with the
+        input file — in one round trip, then parsed and returned in the
+        ``data`` field. Payloads are neither sanitised nor limited by the tmux
+        scrollback.
 
         Returns:
             Dict with keys: status ("success"|"error"), message, data (parsed JSON), output (raw snippet).
 
         """
-        # Lazy import: the ANSI/control-char regexes live on openproject_client
-        # module scope (used by execute_script_with_data here AND by
-        # execute_large_query_to_json_file which is still on the client),
-        # so importing them lazily here avoids the import cycle at module
-        # load time.
-        from src.infrastructure.openproject.openproject_client import (
-            _RE_ANSI_ESCAPE,
-            _RE_CTRL_CHARS,
-            _RE_OSC_ESCAPE,
-            _RE_OTHER_ESCAPE,
-        )
-
         client = self._client
+        if self.rpc_worker_enabled():
+            return self._execute_script_with_data_rpc(script_content, data, timeout)
+
         # Prepare local temp paths
         temp_dir = Path(client.file_manager.data_dir) / "temp_scripts"
         temp_dir.mkdir(parents=True, exist_ok=True)
@@ -615,21 +863,23 @@ class OpenProjectRailsRunnerService:
             err_msg = f"Failed to serialize input data: {e}"
             raise QueryExecutionError(err_msg) from e
 
-        # Compose Ruby script with a small header that loads JSON into `input_data`
+        # The script itself is content-addressed and uploaded once per run;
+        # per call only the JSON input moves and becomes ``input_data``.
         container_data_path = Path("/tmp") / local_data_path.name
-        header = f"require 'json'\ninput_data = JSON.parse(File.read('{container_data_path.as_posix()}'))\n"
-        full_script = header + script_content
+        input_expr = f"JSON.parse(File.read('{container_data_path.as_posix()}'))"
 
+        # The cached script is never cleaned up per call, so only the data
+        # files are tracked for cleanup (local_script_path stays None).
         local_script_path: Path | None = None
         container_script_path: Path | None = None
         operation_succeeded = False  # Track success for debug file preservation
+        data_files_removed = False  # The result fetch also removes the container input
         try:
-            # Create local script file and transfer both script and data
-            local_script_path = client._create_script_file(full_script)
-            container_script_path = client._transfer_rails_script(local_script_path)
-
-            # Transfer the input JSON to container
-            client.transfer_file_to_container(local_data_path, container_data_path)
+            script_id = self.script_cache.ensure(
+                script_content,
+                extra_uploads=[(local_data_path, container_data_path)],
+            )
+            container_script_path = cached_script_path(script_id)
 
             # Execute the script inside Rails console.
             # IMPORTANT: We use a unique execution ID to distinguish this run's output
@@ -638,72 +888,69 @@ class OpenProjectRailsRunnerService:
             unique_start_marker = f"JSON_OUTPUT_START_{exec_id}"
             unique_end_marker = f"JSON_OUTPUT_END_{exec_id}"
 
-            load_cmd = f'load "{container_script_path.as_posix()}"'
-            try:
-                target = client.rails_client._get_target()
-                tmux = shutil.which("tmux") or "tmux"
-
-                # Define the unique markers for this execution; the script
-                # uses these instead of hardcoded markers.
-                marker_setup = f"$j2o_start_marker = '{unique_start_marker}'; $j2o_end_marker = '{unique_end_marker}'"
-                subprocess.run(
-                    [tmux, "send-keys", "-t", target, marker_setup, "Enter"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                time.sleep(0.1)
-
-                escaped_cmd = client.rails_client._escape_command(load_cmd)
-                subprocess.run(
-                    [tmux, "send-keys", "-t", target, escaped_cmd, "Enter"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-
-                # Poll for our unique JSON_OUTPUT_END marker with timeout
-                effective_timeout = timeout or client.rails_client.command_timeout
-                start_time = time.time()
-                output = ""
-                found_markers = False
+            result_path = f"/tmp/j2o_result_{exec_id}.json"
+            done_marker = f"J2O_RESULT_DONE_{exec_id}"
+            done_re = re.compile(re.escape(done_marker) + r":([01])")
 
-                while time.time() - start_time < effective_timeout:
-                    cap = subprocess.run(
-                        [tmux, "capture-pane", "-p", "-S", "-2000", "-t", target],
+            load_cmd = result_call_expression(script_id, input_expr, result_path, done_marker)
+            try:
+                # Hold the pane for the whole send/wait round trip.
+                with client.rails_client.command_lock:
+                    target = client.rails_client._get_target()
+                    tmux = shutil.which("tmux") or "tmux"
+
+                    # Define the unique markers for this execution; the script
+                    # uses these instead of hardcoded markers.
+                    marker_setup = (
+                        f"$j2o_start_marker = '{unique_start_marker}'; $j2o_end_marker = '{unique_end_marker}'"
+                    )
+                    channel = self._output_channel()
+                    mark = channel.mark() if channel is not None else 0
+                    subprocess.run(
+                        [tmux, "send-keys", "-t", target, marker_setup, "Enter"],
                         capture_output=True,
                         text=True,
                         check=True,
                     )
-                    output = cap.stdout
-
-                    # Normalize output by removing newlines to handle markers
-                    # split by terminal width wrapping in tmux pane capture
-                    normalized = output.replace("\n", "").replace("\r", "")
-
-                    if unique_start_marker in normalized and unique_end_marker in normalized:
-                        # Use rfind for the LAST occurrence (actual JSON output,
-                        # not the command echo which contains markers in quotes).
-                        start_pos = normalized.rfind(unique_start_marker)
-                        if start_pos != -1:
-                            next_char_pos = start_pos + len(unique_start_marker)
-                            if next_char_pos < len(normalized):
-                                next_char = normalized[next_char_pos]
-                                if next_char in "[{":  # Actual JSON content
-                                    end_pos = normalized.find(unique_end_marker, next_char_pos)
-                                    if end_pos != -1 and end_pos > start_pos:
-                                        found_markers = True
-                                        output = normalized
-                                        break
-
-                    time.sleep(0.2)  # Poll every 200ms
-
-                if not found_markers:
-                    self._logger.warning(
-                        "JSON_OUTPUT_END_%s marker not found within %d seconds",
-                        exec_id,
-                        effective_timeout,
+                    time.sleep(0.1)
+
+                    escaped_cmd = client.rails_client._escape_command(load_cmd)
+                    subprocess.run(
+                        [tmux, "send-keys", "-t", target, escaped_cmd, "Enter"],
+                        capture_output=True,
+                        text=True,
+                        check=True,
                     )
+
+                    # The pane only signals completion (and carries error
+                    # text); the payload itself is in ``result_path``.
+                    effective_timeout = timeout or client.rails_client.command_timeout
+                    start_time = time.time()
+                    output = ""
+
+                    if channel is not None:
+                        # Event-driven: only output printed since ``mark`` is scanned.
+                        # The echoed command quotes the done marker; the real one
+                        # is followed by ``:<flag>``.
+                        _found, output = channel.wait_for(
+                            done_marker,
+                            mark,
+                            effective_timeout,
+                            accept=lambda text, idx: text.startswith(":", idx + len(done_marker)),
+                        )
+
+                    while channel is None and time.time() - start_time < effective_timeout:
+                        cap = subprocess.run(
+                            [tmux, "capture-pane", "-p", "-S", "-200", "-t", target],
+                            capture_output=True,
+                            text=True,
+                            check=True,
+                        )
+                        # Join lines so markers wrapped at the pane width still match.
+                        output = cap.stdout.replace("\n", "").replace("\r", "")
+                        if done_re.search(output):
+                            break
+                        time.sleep(0.2)  # Poll every 200ms
             except Exception as e:
                 # Fallback: if Rails console crashed or is unstable (e.g. Reline/IRB
                 # errors), execute via non-interactive runner to avoid TTY/Reline issues.
@@ -714,14 +961,11 @@ class OpenProjectRailsRunnerService:
                         "Rails console execution failed (%s). Falling back to rails runner.",
                         type(e).__name__,
                     )
-                    runner_cmd = (
-                        f"(cd /app || cd /opt/openproject) && "
-                        f"bundle exec rails runner {container_script_path.as_posix()}"
-                    )
-                    stdout, stderr, rc = client.docker_client.execute_command(
-                        runner_cmd,
-                        timeout=timeout or 120,
+                    runner_code = (
+                        f"$j2o_start_marker = '{unique_start_marker}'; "
+                        f"$j2o_end_marker = '{unique_end_marker}'; {load_cmd}"
                     )
+                    stdout, stderr, rc = self.execute_runner_script(code=runner_code, timeout=timeout or 120)
                     if rc != 0:
                         q_msg = f"rails runner failed (rc={rc}): {stderr[:500]}"
                         raise QueryExecutionError(q_msg) from e
@@ -729,115 +973,43 @@ class OpenProjectRailsRunnerService:
                 else:
                     raise
 
-            # Extract JSON payload between unique markers
-            normalized_output = output.replace("\n", "").replace("\r", "")
-            start_idx = normalized_output.rfind(unique_start_marker)
-            if start_idx != -1:
-                end_idx = normalized_output.find(unique_end_marker, start_idx + len(unique_start_marker))
-            else:
-                end_idx = -1
-
-            output = normalized_output
-
-            self._logger.debug(
-                "Marker extraction: start_idx=%s, end_idx=%s, marker=%s, output_len=%d",
-                start_idx,
-                end_idx,
-                exec_id,
-                len(output),
-            )
-            if start_idx != -1 and end_idx != -1:
-                json_preview = output[start_idx : end_idx + len(unique_end_marker)][:200]
-                self._logger.debug("JSON region preview: %r", json_preview)
-
-            if start_idx != -1 and end_idx != -1 and end_idx > start_idx:
-                json_str = output[start_idx + len(unique_start_marker) : end_idx].strip()
-
-                # Sanitisation guards against stray ANSI / control chars from
-                # IRB / tmux that would otherwise blow up json.loads.
-                def _try_parse(s: str) -> Any:
-                    return json.loads(s)
-
-                def _sanitize_control_chars(s: str) -> str:
-                    s = _RE_ANSI_ESCAPE.sub("", s)
-                    s = _RE_OSC_ESCAPE.sub("", s)
-                    s = _RE_OTHER_ESCAPE.sub("", s)
-                    return _RE_CTRL_CHARS.sub("", s)
-
-                def _extract_first_json_block(s: str) -> str | None:
-                    # Isolate the first balanced JSON object/array
-                    for i, ch in enumerate(s):
-                        if ch in "{[":
-                            opening = ch
-                            closing = "}" if ch == "{" else "]"
-                            depth = 0
-                            in_str = False
-                            esc = False
-                            for j in range(i, len(s)):
-                                c = s[j]
-                                if in_str:
-                                    if esc:
-                                        esc = False
-                                    elif c == "\\":
-                                        esc = True
-                                    elif c == '"':
-                                        in_str = False
-                                elif c == '"':
-                                    in_str = True
-                                elif c == opening:
-                                    depth += 1
-                                elif c == closing:
-                                    depth -= 1
-                                    if depth == 0:
-                                        return s[i : j + 1]
-                            break
-                    return None
-
-                json_str = _sanitize_control_chars(json_str)
+            done = done_re.search(output)
+            if done is None:
+                self._logger.warning(
+                    "%s marker not found within %d seconds",
+                    done_marker,
+                    timeout or client.rails_client.command_timeout,
+                )
+            elif done.group(1) == "1":
+                payload = self._fetch_result_file(result_path, container_data_path)
+                data_files_removed = True
                 try:
-                    parsed = _try_parse(json_str)
-                except Exception:
-                    try:
-                        parsed = _try_parse(json_str)  # Already sanitised
-                    except Exception:
-                        candidate = _extract_first_json_block(json_str)
-                        if candidate is None:
-                            candidate = _extract_first_json_block(_sanitize_control_chars(json_str)) or json_str
-                        try:
-                            parsed = _try_parse(candidate)
-                        except json.JSONDecodeError as e:
-                            pos = e.pos if hasattr(e, "pos") else 0
-                            start_ctx = max(0, pos - 20)
-                            end_ctx = min(len(candidate), pos + 20)
-                            ctx = candidate[start_ctx:end_ctx]
-                            char_at_pos = repr(candidate[pos : pos + 5]) if pos < len(candidate) else "EOF"
-                            self._logger.warning(
-                                "JSON parse error at pos %d: char=%s, context=%r",
-                                pos,
-                                char_at_pos,
-                                ctx,
-                            )
-                            q_msg = f"Failed to parse JSON output: {e}"
-                            raise QueryExecutionError(q_msg) from e
-                        except Exception as e:
-                            q_msg = f"Failed to parse JSON output: {e}"
-                            raise QueryExecutionError(q_msg) from e
+                    parsed = json.loads(payload)
+                except json.JSONDecodeError as e:
+                    self._logger.warning(
+                        "JSON parse error at pos %d in %s: context=%r",
+                        e.pos,
+                        result_path,
+                        payload[max(0, e.pos - 20) : e.pos + 20],
+                    )
+                    q_msg = f"Failed to parse JSON output: {e}"
+                    raise QueryExecutionError(q_msg) from e
 
                 operation_succeeded = True
                 return {
                     "status": "success",
                     "message": "Script executed successfully",
                     "data": parsed,
-                    "output": output[:2000],
+                    "output": output[-2000:],
                 }
 
-            # No JSON markers found — return an error envelope (still mark
-            # 'succeeded' since execution completed; just no JSON found).
+            # No payload — return an error envelope (still mark 'succeeded'
+            # since execution completed; the script just printed no JSON).
             operation_succeeded = True
             return {
                 "status": "error",
                 "message": "JSON markers not found in Rails output",
-                "output": output[:2000],
+                "output": output[-2000:],
             }
 
         finally:
@@ -869,7 +1041,10 @@ class OpenProjectRailsRunnerService:
                         cleanup_err,
                     )
                 try:
-                    client._cleanup_script_files(local_data_path, container_data_path)
+                    if data_files_removed:
+                        local_data_path.unlink(missing_ok=True)
+                    else:
+                        client._cleanup_script_files(local_data_path, container_data_path)
                 except Exception as cleanup_err:
                     self._logger.warning(
                         "Failed to cleanup data files (local=%s, container=%s): %s",
@@ -878,6 +1053,79 @@ class OpenProjectRailsRunnerService:
                         cleanup_err,
                     )
 
+    def _fetch_result_file(self, result_path: str, *cleanup: Path) -> str:
+        """Read a container result file and remove it (plus ``cleanup``) in one round trip.
+
+        Raises:
+            QueryExecutionError: If the file cannot be read.
+
+        """
+        client = self._client
+        compress = compression_enabled()
+        reader = "gzip -c --" if compress else "cat"
+        paths = " ".join(shlex.quote(p) for p in [result_path, *(c.as_posix() for c in cleanup)])
+        remote = f"{reader} {shlex.quote(result_path)} && rm -f {paths}"
+        # Root, like cleanup_script_files: uploaded inputs carry the host uid.
+        ssh_command = f"docker exec -u root {shlex.quote(client.container_name)} sh -c {shlex.quote(remote)}"
+        try:
+            if compress:
+                stdout, stderr, returncode = self._read_gzipped_command_output(ssh_command)
+            else:
+                stdout, stderr, returncode = client.ssh_client.execute_command(ssh_command, check=False)
+        except Exception as e:
+            raise QueryExecutionError(str(e)) from e
+        if returncode != 0:
+            msg = f"Failed to read result file {result_path} (rc={returncode}): {stderr[:500]}"
+            raise QueryExecutionError(msg)
+        return stdout
+
+    def _execute_script_with_data_rpc(
+        self,
+        script_content: str,
+        data: Any,
+        timeout: int | None,
+    ) -> dict[str, Any]:
+        """``execute_script_with_data`` over the persistent RPC worker.
+
+        ``data`` travels inside the request frame and is bound to
+        ``input_data`` directly; the script is sent through the container
+        script cache, so only the first call transfers it and the output
+        needs no pane sanitisation. Returns the same envelope
+        as the tmux path.
+        """
+        exec_id = os.urandom(8).hex()
+        start_marker = f"JSON_OUTPUT_START_{exec_id}"
+        end_marker = f"JSON_OUTPUT_END_{exec_id}"
+        try:
+            # The worker parses the script once; later calls only send its id.
+            script_id = self.script_cache.ensure(script_content)
+            response = self.get_rpc_worker().call(
+                call_expression(script_id, "input_data"),
+                data=data,
+                timeout=timeout,
+                start_marker=start_marker,
+                end_marker=end_marker,
+            )
+        except RubyError as e:
+            return {"status": "error", "message": str(e), "output": ""}
+        except RailsRpcError as e:
+            raise QueryExecutionError(str(e)) from e
+
+        output = str(response.get("stdout", ""))
+        found, parsed = self.extract_marked_json(output, start_marker, end_marker)
+        if not found:
+            return {
+                "status": "error",
+                "message": "JSON markers not found in Rails output",
+                "output": output[:2000],
+            }
+        return {
+            "status": "success",
+            "message": "Script executed successfully",
+            "data": parsed,
+            "output": output[:2000],
+        }
+
     # ── large-result-set queries via container file ──────────────────────
 
     def execute_large_query_to_json_file(
@@ -921,58 +1169,7 @@ class OpenProjectRailsRunnerService:
         # IMPORTANT: Do not shell-quote here; we need the actual path string in Ruby.
         ruby_path_literal = escape_ruby_single_quoted(str(container_file))
 
-        # Build provenance hint: where did this originate?
-        # Compose a concise hint like: "j2o: migration/work_packages func=_migrate_work_packages project=NRS ts=..."
-        _SKIP_CLIENT_FILES = (
-            "/src/infrastructure/openproject/openproject_client.py",
-            "/src/infrastructure/openproject/openproject_rails_runner_service.py",
-            "/src/infrastructure/openproject/rails_console_client.py",
-            "/src/infrastructure/openproject/docker_client.py",
-            "/src/infrastructure/openproject/ssh_client.py",
-        )
-
-        def _caller_hint(default_component: str) -> str:
-            try:
-                import sys
-
-                # Use sys._getframe instead of inspect.stack (O(1) per frame, no source loading)
-                path: str | None = None
-                func: str | None = None
-                frame = sys._getframe(1)
-                for _ in range(49):
-                    if frame is None:
-                        break
-                    filename = frame.f_code.co_filename
-                    if "/src/" in filename and not any(skip in filename for skip in _SKIP_CLIENT_FILES):
-                        path = filename.split("/src/")[-1]
-                        func = frame.f_code.co_name
-                        break
-                    frame = frame.f_back
-
-                # Derive a concise component label from path
-                component = default_component
-                if path:
-                    component = (
-                        path.replace("migrations/", "migration/")
-                        .replace("clients/", "client/")
-                        .replace("_migration.py", "")
-                        .replace(".py", "")
-                    )
-
-                parts: list[str] = ["j2o:", component]
-                if func:
-                    parts.append(f"func={func}")
-                ts = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
-                parts.append(f"ts={ts}")
-                # include project filter if configured
-                proj = (config.jira_config or {}).get("project_filter")
-                if proj:
-                    parts.append(f"project={proj}")
-                return " ".join(parts)
-            except Exception:
-                return f"j2o: {default_component}"
-
-        provenance = _caller_hint("query/json")
+        provenance = _query_caller_hint("query/json")
 
         ruby_script = (
             f"# {provenance}\n"
@@ -986,6 +1183,182 @@ class OpenProjectRailsRunnerService:
             f"begin; FileUtils.chmod(0644, '{ruby_path_literal}'); rescue; end\n"
         )
 
+        self._run_file_writing_script(ruby_script, timeout=timeout, context="execute_large_query_to_json_file")
+
+        # Read file back from container via SSH (avoids tmux buffer limits);
+        # gzipped in transit and inflated while streaming when compression is on.
+        compress = compression_enabled()
+        reader = "gzip -c --" if compress else "cat"
+        ssh_command = f"docker exec {shlex.quote(client.container_name)} {reader} {shlex.quote(container_file)}"
+
+        # Retry loop to handle race where file write completes slightly after command returns
+        wait_env = os.environ.get("J2O_QUERY_RESULT_WAIT_SECONDS")
+        try:
+            max_wait_seconds = int(wait_env) if wait_env else 600
+        except Exception:
+            # Invalid env value: fall back to the same 600s default as the
+            # no-env branch instead of an unrelated 60s short window. The
+            # original 60s here was a copy-paste from another caller and
+            # made invalid env values silently shrink the wait by 10×.
+            max_wait_seconds = 600
+        poll_interval = 0.5
+        attempts = max(1, int(max_wait_seconds / poll_interval))
+
+        stdout = ""
+        stderr = ""
+        returncode = 1
+        for attempt in range(attempts):
+            try:
+                if compress:
+                    stdout, stderr, returncode = self._read_gzipped_command_output(ssh_command)
+                else:
+                    stdout, stderr, returncode = client.ssh_client.execute_command(
+                        ssh_command,
+                        check=False,
+                    )
+            except Exception as e:
+                # Unexpected transport error; bubble it up immediately
+                raise QueryExecutionError(str(e)) from e
+
+            if returncode == 0 and stdout:
+                if attempt > 0:
+                    self._logger.debug(
+                        "Recovered after %d attempts reading container file %s",
+                        attempt + 1,
+                        container_file,
+                    )
+                break
+
+            # Non-zero return code with no stdout. Treat "file not yet present" as a retry case,
+            # otherwise escalate after the loop.
+            if "No such file or directory" in (stderr or ""):
+                # Emit a lightweight heartbeat every ~5 seconds so runs don't look hung
+                if attempt and (attempt % max(1, int(5 / poll_interval)) == 0):
+                    self._logger.info(
+                        "Waiting for query result file %s (waited %.1fs)",
+                        container_file,
+                        attempt * poll_interval,
+                    )
+                time.sleep(poll_interval)
+                continue
+
+            # Any other stderr/returncode is considered a hard failure
+            if returncode != 0:
+                break
+            time.sleep(poll_interval)
+
+        if returncode != 0:
+            msg = f"SSH command failed with code {returncode}: {stderr}"
+            raise QueryExecutionError(msg)
+
+        try:
+            return json.loads(stdout.strip())
+        except Exception as e:  # Normalize JSON parse errors
+            raise JsonParseError(str(e)) from e
+
+    def iter_query_ndjson(
+        self,
+        ruby_body: str,
+        *,
+        container_file: str | None = None,
+        timeout: int | None = None,
+    ) -> Iterator[Any]:
+        """Stream a large result set as NDJSON, yielding rows as they arrive.
+
+        ``ruby_body`` calls ``emit.call(row)`` once per row — typically inside
+        ``find_each``/``find_in_batches`` — and each row is written to the
+        container file as one JSON line. The file is then streamed back and
+        parsed line by line, so neither side holds the whole result set:
+        peak memory is bounded by one record (plus Ruby's batch).
+
+        The script only runs once iteration starts; the container file is
+        removed when the iterator finishes or is closed.
+
+        Args:
+            ruby_body: Ruby code emitting rows via ``emit.call(row)``
+            container_file: Container path for the NDJSON file (default: unique ``/tmp`` path)
+            timeout: Ruby execution timeout, as for :py:meth:`execute_large_query_to_json_file`;
+                also bounds the read-back stream (default 300s)
+
+        Raises:
+            QueryExecutionError: If the script or the read-back fails
+            JsonParseError: If a line is not valid JSON
+
+        """
+        from src.infrastructure.openproject.openproject_client import escape_ruby_single_quoted
+
+        client = self._client
+        path = container_file or f"/tmp/j2o_stream_{secrets.token_hex(6)}.ndjson"
+        path_literal = escape_ruby_single_quoted(path)
+        # Written under ``.part`` and renamed when complete, so the reader
+        # never sees a half-written file.
+        ruby_script = (
+            f"# {_query_caller_hint('query/ndjson')}\n"
+            "require 'json'\n"
+            "begin; require 'fileutils'; rescue; end\n"
+            f"File.open('{path_literal}.part', 'w') do |j2o_out|\n"
+            '  emit = lambda { |row| j2o_out.write(JSON.generate(row.as_json)); j2o_out.write("\\n") }\n'
+            f"{ruby_body.rstrip()}\n"
+            "end\n"
+            f"File.rename('{path_literal}.part', '{path_literal}')\n"
+            f"begin; FileUtils.chmod(0644, '{path_literal}'); rescue; end\n"
+        )
+        self._run_file_writing_script(ruby_script, timeout=timeout, context="iter_query_ndjson")
+
+        try:
+            self._wait_for_container_file(path)
+            compress = compression_enabled()
+            reader = "gzip -c --" if compress else "cat"
+            command = f"docker exec {shlex.quote(client.container_name)} {reader} {shlex.quote(path)}"
+            outcome: dict[str, Any] = {}
+            raw = client.ssh_client.iter_command_output(
+                command,
+                timeout if timeout is not None else 300,
+                outcome=outcome,
+            )
+            try:
+                chunks = iter_gunzip(raw) if compress else raw
+                try:
+                    yield from iter_ndjson(chunks)
+                except json.JSONDecodeError as e:
+                    raise JsonParseError(str(e)) from e
+                except (ValueError, subprocess.TimeoutExpired) as e:
+                    msg = f"Failed to stream query result {path}: {e}"
+                    raise QueryExecutionError(msg) from e
+            finally:
+                raw.close()
+            if outcome.get("returncode", 0) != 0:
+                msg = f"SSH command failed with code {outcome['returncode']}: {outcome.get('stderr', '')}"
+                raise QueryExecutionError(msg)
+        finally:
+            try:
+                client.docker_client.execute_command(f"rm -f {shlex.quote(path)}", user="root")
+            except Exception as cleanup_err:
+                self._logger.debug("Failed to remove %s: %s", path, cleanup_err)
+
+    def _wait_for_container_file(self, path: str) -> None:
+        """Poll until ``path`` exists in the container (``J2O_QUERY_RESULT_WAIT_SECONDS``, default 600)."""
+        wait_env = os.environ.get("J2O_QUERY_RESULT_WAIT_SECONDS")
+        try:
+            max_wait_seconds = int(wait_env) if wait_env else 600
+        except Exception:
+            max_wait_seconds = 600
+        poll_interval = 0.5
+        deadline = time.monotonic() + max_wait_seconds
+        while not self._client.docker_client.check_file_exists_in_container(path):
+            if time.monotonic() >= deadline:
+                msg = f"Query result file {path} not found after {max_wait_seconds}s"
+                raise QueryExecutionError(msg)
+            time.sleep(poll_interval)
+
+    def _run_file_writing_script(self, ruby_script: str, *, timeout: int | None, context: str) -> None:
+        """Run a script whose result goes to a container file (console ``load`` or rails runner).
+
+        Timeouts default to 90s for the console and 300s for rails runner,
+        see :py:meth:`execute_large_query_to_json_file`.
+        """
+        client = self._client
+
         # Choose execution mode: use rails runner for long scripts to avoid pasting into console
         # Use both max lines and char threshold (defaults: 10 lines OR 200 chars)
         max_lines_env = os.environ.get("J2O_SCRIPT_RUNNER_MAX_LINES")
@@ -1017,14 +1390,14 @@ class OpenProjectRailsRunnerService:
                 mode = "runner"
             if mode == "console":
                 try:
-                    _console_output = client.rails_client.execute(
+                    _console_output = self.console_execute(
                         f"load '{runner_script_path}'",
                         timeout=timeout or 90,
                         suppress_output=True,
                     )
                     self.check_console_output_for_errors(
                         _console_output or "",
-                        context="execute_large_query_to_json_file(load)",
+                        context=f"{context}(load)",
                     )
                 except Exception as e:
                     # Fallback to rails runner on console instability. Use the
@@ -1033,18 +1406,16 @@ class OpenProjectRailsRunnerService:
                     # (which would either time out short or hang long). Use
                     # ``is not None`` so a caller-supplied ``timeout=0`` is
                     # respected literally rather than treated as "default".
-                    runner_cmd = f"(cd /app || cd /opt/openproject) && bundle exec rails runner {runner_script_path}"
-                    stdout, stderr, rc = client.docker_client.execute_command(
-                        runner_cmd,
+                    _stdout, stderr, rc = self.execute_runner_script(
+                        runner_script_path,
                         timeout=timeout if timeout is not None else 300,
                     )
                     if rc != 0:
                         q_msg = f"rails runner failed (rc={rc}): {stderr[:500]}"
                         raise QueryExecutionError(q_msg) from e
             else:
-                runner_cmd = f"(cd /app || cd /opt/openproject) && bundle exec rails runner {runner_script_path}"
-                stdout, stderr, rc = client.docker_client.execute_command(
-                    runner_cmd,
+                _stdout, stderr, rc = self.execute_runner_script(
+                    runner_script_path,
                     timeout=timeout or 300,  # Increased from 120 for large projects
                 )
                 if rc != 0:
@@ -1053,14 +1424,14 @@ class OpenProjectRailsRunnerService:
         else:
             # Execute via persistent tmux Rails console (faster than rails runner)
             try:
-                _console_output = client.rails_client.execute(
+                _console_output = self.console_execute(
                     ruby_script,
                     timeout=timeout or 90,
                     suppress_output=True,
                 )
                 self.check_console_output_for_errors(
                     _console_output or "",
-                    context="execute_large_query_to_json_file",
+                    context=context,
                 )
             except Exception as e:
                 if isinstance(e, (ConsoleNotReadyError, CommandExecutionError, RubyError)):
@@ -1076,15 +1447,15 @@ class OpenProjectRailsRunnerService:
                     with local_tmp.open("w", encoding="utf-8") as f:
                         f.write(ruby_script)
                     client.docker_client.transfer_file_to_container(local_tmp, Path(runner_script_path))
-                    runner_cmd = f"(cd /app || cd /opt/openproject) && bundle exec rails runner {runner_script_path}"
                     # Same explicit timeout as the other runner paths. This
                     # fallback fires when the persistent tmux console crashed
                     # mid-query, so a fresh ``bundle exec rails runner`` boots
-                    # cold — 300s matches the explicit-runner branch. Use
-                    # ``is not None`` so a caller-supplied ``timeout=0`` is
-                    # respected literally rather than treated as "default".
-                    stdout, stderr, rc = client.docker_client.execute_command(
-                        runner_cmd,
+                    # cold (unless the prefork runner is warm) — 300s matches
+                    # the explicit-runner branch. Use ``is not None`` so a
+                    # caller-supplied ``timeout=0`` is respected literally
+                    # rather than treated as "default".
+                    _stdout, stderr, rc = self.execute_runner_script(
+                        runner_script_path,
                         timeout=timeout if timeout is not None else 300,
                     )
                     if rc != 0:
@@ -1093,67 +1464,12 @@ class OpenProjectRailsRunnerService:
                 else:
                     raise
 
-        # Read file back from container via SSH (avoids tmux buffer limits)
-        ssh_command = f"docker exec {shlex.quote(client.container_name)} cat {shlex.quote(container_file)}"
-
-        # Retry loop to handle race where file write completes slightly after command returns
-        wait_env = os.environ.get("J2O_QUERY_RESULT_WAIT_SECONDS")
-        try:
-            max_wait_seconds = int(wait_env) if wait_env else 600
-        except Exception:
-            # Invalid env value: fall back to the same 600s default as the
-            # no-env branch instead of an unrelated 60s short window. The
-            # original 60s here was a copy-paste from another caller and
-            # made invalid env values silently shrink the wait by 10×.
-            max_wait_seconds = 600
-        poll_interval = 0.5
-        attempts = max(1, int(max_wait_seconds / poll_interval))
-
-        stdout = ""
-        stderr = ""
-        returncode = 1
-        for attempt in range(attempts):
-            try:
-                stdout, stderr, returncode = client.ssh_client.execute_command(
-                    ssh_command,
-                    check=False,
-                )
-            except Exception as e:
-                # Unexpected transport error; bubble it up immediately
-                raise QueryExecutionError(str(e)) from e
-
-            if returncode == 0 and stdout:
-                if attempt > 0:
-                    self._logger.debug(
-                        "Recovered after %d attempts reading container file %s",
-                        attempt + 1,
-                        container_file,
-                    )
-                break
-
-            # Non-zero return code with no stdout. Treat "file not yet present" as a retry case,
-            # otherwise escalate after the loop.
-            if "No such file or directory" in (stderr or ""):
-                # Emit a lightweight heartbeat every ~5 seconds so runs don't look hung
-                if attempt and (attempt % max(1, int(5 / poll_interval)) == 0):
-                    self._logger.info(
-                        "Waiting for query result file %s (waited %.1fs)",
-                        container_file,
-                        attempt * poll_interval,
-                    )
-                time.sleep(poll_interval)
-                continue
-
-            # Any other stderr/returncode is considered a hard failure
-            if returncode != 0:
-                break
-            time.sleep(poll_interval)
-
+    def _read_gzipped_command_output(self, ssh_command: str) -> tuple[str, str, int]:
+        """Run ``ssh_command`` (which prints gzip) and return its inflated stdout."""
+        buffer = io.BytesIO()
+        sink = GunzipWriter(buffer)
+        stderr, returncode = self._client.ssh_client.stream_command_output(ssh_command, sink.write, check=False)
         if returncode != 0:
-            msg = f"SSH command failed with code {returncode}: {stderr}"
-            raise QueryExecutionError(msg)
-
-        try:
-            return json.loads(stdout.strip())
-        except Exception as e:  # Normalize JSON parse errors
-            raise JsonParseError(str(e)) from e
+            return "", stderr, returncode
+        sink.finish()
+        return buffer.getvalue().decode("utf-8"), stderr, returncode
@@ -7,6 +7,10 @@ onto a focused service. The service owns:
 * **Single-record reads** — ``find_record`` (id or conditions hash).
 * **Single-record writes** — ``create_record``, ``update_record``,
   ``delete_record``.
+* **Set reconciliation** — ``reconcile_records`` matches a component's
+  whole desired set (types, statuses, priorities, ...) against existing
+  rows and creates the missing ones in one Rails call (opt-in for the
+  metadata migrations via ``J2O_METADATA_RECONCILE=1``).
 * **Multi-record reads** — ``find_all_records`` (where + includes +
   limit) and ``batch_find_records`` (paged id lookup with the shared
   ``@batch_idempotent`` decorator and a keyword-only ``headers`` kwarg
@@ -33,8 +37,12 @@ work unchanged.
 
 from __future__ import annotations
 
+import json
+import re
+from collections.abc import Iterable
 from typing import Any
 
+from src import config
 from src.infrastructure.exceptions import (
     JsonParseError,
     QueryExecutionError,
@@ -50,6 +58,14 @@ from src.utils.idempotency_decorators import batch_idempotent
 # import surface if the constant is later relocated.
 BATCH_LABEL_SAMPLE = 3
 
+# Attribute names interpolated into the reconciliation script
+_RE_ATTRIBUTE_NAME = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+
+def metadata_reconcile_enabled() -> bool:
+    """Whether metadata migrations should go through ``reconcile_records``."""
+    return config.migration_flag("J2O_METADATA_RECONCILE", "metadata_reconcile")
+
 
 class OpenProjectRecordsService:
     """Generic ActiveRecord CRUD helpers for ``OpenProjectClient``."""
@@ -550,3 +566,115 @@ class OpenProjectRecordsService:
         except Exception as e:
             msg = f"Error deleting {model}."
             raise QueryExecutionError(msg) from e
+
+    # ── set reconciliation ──────────────────────────────────────────────
+
+    def reconcile_records(
+        self,
+        model: str,
+        records: list[dict[str, Any]],
+        *,
+        match_on: str = "name",
+        compare: Iterable[str] = (),
+        timeout: int | None = None,
+    ) -> dict[str, Any]:
+        """Reconcile a desired set of records against OpenProject in one Rails call.
+
+        Every record is matched case-insensitively on ``match_on`` against
+        the existing rows (one query for the whole set). Matched records
+        whose ``compare`` attributes agree are ``existing``; those that
+        differ are ``conflicts`` and are left untouched. Unmatched records
+        are created; a later record with the same key matches the one
+        created earlier in the call.
+
+        Args:
+            model: Model name (e.g., "Type", "Status")
+            records: Attribute dicts suitable for mass-assignment
+            match_on: Attribute identifying a record
+            compare: Attributes checked on matched records
+            timeout: Optional execution timeout
+
+        Returns:
+            ``{status, existing, created, conflicts, errors}``. Each entry
+            carries the record ``index``; existing/created/conflict entries
+            add ``id`` and the matched value, conflicts add ``fields`` (the
+            differing attributes with their current values), errors add
+            ``errors``
+
+        Raises:
+            QueryExecutionError: If execution fails or returns an unexpected shape
+
+        """
+        from src.infrastructure.openproject.openproject_client import _validate_model_name
+
+        _validate_model_name(model)
+        compare = list(compare)
+        for name in (match_on, *compare):
+            if not _RE_ATTRIBUTE_NAME.match(name):
+                msg = f"Invalid attribute name: {name!r}"
+                raise ValueError(msg)
+        if not records:
+            return {"status": "success", "existing": [], "created": [], "conflicts": [], "errors": []}
+
+        data_json = json.dumps(records, ensure_ascii=False)
+        script = f"""
+          require 'json'
+          model = {model}
+          match_on = '{match_on}'
+          compare = {json.dumps(compare)}
+          records = JSON.parse(<<-'J2O_DATA'
+{data_json}
+J2O_DATA
+)
+          norm = ->(value) {{ value.to_s.strip.downcase }}
+          wanted = records.map {{ |attrs| norm.call(attrs[match_on]) }}.reject(&:empty?).uniq
+          column = "#{{model.quoted_table_name}}.#{{model.connection.quote_column_name(match_on)}}"
+          found = {{}}
+          unless wanted.empty?
+            model.where("LOWER(TRIM(#{{column}})) IN (?)", wanted).order(:id).each do |rec|
+              found[norm.call(rec.public_send(match_on))] ||= rec
+            end
+          end
+
+          result = {{ 'status' => 'success', 'existing' => [], 'created' => [], 'conflicts' => [], 'errors' => [] }}
+          records.each_with_index do |attrs, idx|
+            key = norm.call(attrs[match_on])
+            if key.empty?
+              result['errors'] << {{ 'index' => idx, 'errors' => ["#{{match_on}} is blank"] }}
+              next
+            end
+            rec = found[key]
+            if rec
+              entry = {{ 'index' => idx, 'id' => rec.id, match_on => rec.public_send(match_on) }}
+              diffs = compare.select {{ |attr| attrs.key?(attr) && rec.public_send(attr) != attrs[attr] }}
+              if diffs.empty?
+                result['existing'] << entry
+              else
+                result['conflicts'] << entry.merge('fields' => diffs.to_h {{ |attr| [attr, rec.public_send(attr)] }})
+              end
+              next
+            end
+            begin
+              rec = model.new(attrs)
+              if rec.save
+                found[key] = rec
+                result['created'] << {{ 'index' => idx, 'id' => rec.id, match_on => rec.public_send(match_on) }}
+              else
+                result['errors'] << {{ 'index' => idx, 'errors' => rec.errors.full_messages }}
+              end
+            rescue => e
+              result['errors'] << {{ 'index' => idx, 'errors' => ["#{{e.class}}: #{{e.message}}"] }}
+            end
+          end
+          result
+        """
+
+        try:
+            result = self._client.execute_query_to_json_file(script, timeout=timeout)
+        except Exception as e:
+            msg = f"Failed to reconcile {model} records."
+            raise QueryExecutionError(msg) from e
+        if not isinstance(result, dict) or result.get("status") != "success":
+            msg = f"Unexpected {model} reconciliation response: {str(result)[:200]}"
+            raise QueryExecutionError(msg)
+        return result
@@ -112,8 +112,7 @@ class OpenProjectStatusTypeService:
                     with local_tmp.open("w", encoding="utf-8") as f:
                         f.write(ruby_runner)
                     client.docker_client.transfer_file_to_container(local_tmp, Path(runner_script_path))
-                    runner_cmd = f"(cd /app || cd /opt/openproject) && bundle exec rails runner {runner_script_path}"
-                    stdout, stderr, rc = client.docker_client.execute_command(runner_cmd)
+                    stdout, stderr, rc = client.rails_runner.execute_runner_script(runner_script_path)
                     if rc != 0:
                         msg = f"rails runner failed (rc={rc}): {stderr[:500]}"
                         raise QueryExecutionError(msg) from e
@@ -241,8 +240,7 @@ class OpenProjectStatusTypeService:
                     with local_tmp.open("w", encoding="utf-8") as f:
                         f.write(ruby_runner)
                     client.docker_client.transfer_file_to_container(local_tmp, Path(runner_script_path))
-                    runner_cmd = f"(cd /app || cd /opt/openproject) && bundle exec rails runner {runner_script_path}"
-                    stdout, stderr, rc = client.docker_client.execute_command(runner_cmd)
+                    stdout, stderr, rc = client.rails_runner.execute_runner_script(runner_script_path)
                     if rc != 0:
                         _emsg = f"rails runner failed (rc={rc}): {stderr[:500]}"
                         raise QueryExecutionError(_emsg) from e
@@ -302,17 +302,27 @@ class OpenProjectTimeEntryService:
     def batch_create_time_entries(
         self,
         time_entries: list[dict[str, Any]],
+        *,
+        timeout: int = 120,
     ) -> dict[str, Any]:
         """Create multiple time entries via file-based JSON in the container.
 
         This avoids console output parsing by writing input and results to files
         inside the container and reading results back via docker exec.
 
+        Work packages, users and activities are resolved in one query each
+        per call, and entries whose ``jira_worklog_key`` already carries a
+        time entry are answered with the existing id (``existing: true``)
+        instead of being created again, so chunks of thousands are safe
+        to resubmit.
+
         Args:
             time_entries: List of time entry data dictionaries
+            timeout: Rails execution timeout in seconds for the whole chunk
 
         Returns:
-            Dictionary with creation results and statistics. The Ruby
+            Dictionary with creation results and statistics (``created``,
+            ``existing``, ``failed`` and per-index ``results``). The Ruby
             runner catches per-entry exceptions and continues, so the
             returned dict can have ``failed > 0`` alongside ``created >
             0`` — partial success is the normal shape, not an error.
@@ -325,7 +335,7 @@ class OpenProjectTimeEntryService:
 
         """
         if not time_entries:
-            return {"created": 0, "failed": 0, "results": []}
+            return {"created": 0, "existing": 0, "failed": 0, "results": []}
 
         client = self._client
 
@@ -385,6 +395,7 @@ class OpenProjectTimeEntryService:
         if not entries_data:
             return {
                 "created": 0,
+                "existing": 0,
                 "failed": len(time_entries),
                 "results": skipped_results,
             }
@@ -416,73 +427,77 @@ class OpenProjectTimeEntryService:
             "entries = JSON.parse(File.read(data_path), symbolize_names: true)",
             "results = []",
             "created_count = 0",
+            "existing_count = 0",
             "failed_count = 0",
+            # Resolve every referenced work package (with its project),
+            # user and activity up front: a fixed handful of queries per
+            # chunk instead of two ``find_by`` calls per entry.
+            "wps = WorkPackage.where(id: entries.map { |e| e[:work_package_id] }.uniq).includes(:project).index_by(&:id)",
+            "users = User.where(id: entries.map { |e| e[:user_id] }.uniq).index_by(&:id)",
+            "activities = TimeEntryActivity.where(id: entries.map { |e| e[:activity_id] }.uniq).index_by(&:id)",
+            # Use the canonical 'J2O Origin Worklog Key' name so this
+            # batch path writes provenance to the SAME custom field as
+            # ``create_time_entry`` and ``ensure_origin_custom_fields`` —
+            # the previous 'Jira Worklog Key' would split provenance
+            # across two CFs and break idempotency lookups. The field is
+            # resolved once per chunk, and worklog keys that already
+            # carry a time entry are answered with that entry's id
+            # instead of creating a duplicate.
+            "keys = entries.map { |e| e[:jira_worklog_key].to_s }.reject(&:empty?).uniq",
+            "cf = nil",
+            "existing = {}",
+            "unless keys.empty?",
+            "  cf = CustomField.find_by(type: 'TimeEntryCustomField', name: 'J2O Origin Worklog Key')",
+            "  if !cf",
+            "    cf = CustomField.new(name: 'J2O Origin Worklog Key', field_format: 'string', is_required: false, is_for_all: true, type: 'TimeEntryCustomField')",
+            "    cf = nil unless cf.save",
+            "  end",
+            "  if cf",
+            "    existing = CustomValue.where(custom_field_id: cf.id, customized_type: 'TimeEntry', value: keys).pluck(:value, :customized_id).to_h",
+            "  end",
+            "end",
             "entries.each do |entry|",
             "  begin",
-            "    te = TimeEntry.new(",
-            "      activity_id: entry[:activity_id],",
-            "      hours: entry[:hours],",
-            "      spent_on: Date.parse(entry[:spent_on]),",
-            "      comments: entry[:comments],",
-            "      entity_id: entry[:work_package_id],",
-            "      entity_type: 'WorkPackage'",
-            "    )",
-            "    begin",
-            "      wp = WorkPackage.find_by(id: entry[:work_package_id])",
-            "      if wp.nil?",
-            "        failed_count += 1",
-            "        results << { index: entry[:index], success: false, error: 'WorkPackage not found: ' + entry[:work_package_id].to_s }",
-            "        next",
-            "      end",
-            "      te.entity = wp",
-            "      te.project = wp.project",
-            "    rescue => e",
+            # Empty strings are truthy in Ruby, so the key check has to
+            # be explicit rather than a bare ``if key``.
+            "    key = entry[:jira_worklog_key].to_s",
+            "    if !key.empty? && existing[key]",
+            "      existing_count += 1",
+            "      results << { index: entry[:index], success: true, id: existing[key], existing: true }",
+            "      next",
+            "    end",
+            "    wp = wps[entry[:work_package_id]]",
+            "    if wp.nil?",
             "      failed_count += 1",
-            "      results << { index: entry[:index], success: false, error: 'WorkPackage lookup failed: ' + e.message }",
+            "      results << { index: entry[:index], success: false, error: 'WorkPackage not found: ' + entry[:work_package_id].to_s }",
             "      next",
             "    end",
-            "    begin",
-            "      user = User.find_by(id: entry[:user_id])",
-            "      if user.nil?",
-            "        failed_count += 1",
-            "        results << { index: entry[:index], success: false, error: 'User not found: ' + entry[:user_id].to_s }",
-            "        next",
-            "      end",
-            "      te.user = user",
-            "      te.user_id = entry[:user_id]",
-            "      te.logged_by_id = entry[:user_id]",
-            "    rescue => e",
+            "    user = users[entry[:user_id]]",
+            "    if user.nil?",
             "      failed_count += 1",
-            "      results << { index: entry[:index], success: false, error: 'User lookup failed: ' + e.message }",
+            "      results << { index: entry[:index], success: false, error: 'User not found: ' + entry[:user_id].to_s }",
             "      next",
             "    end",
-            "    begin",
-            "      key = entry[:jira_worklog_key]",
-            # Use the canonical 'J2O Origin Worklog Key' name so this
-            # batch path writes provenance to the SAME custom field as
-            # ``create_time_entry`` and ``ensure_origin_custom_fields`` —
-            # the previous 'Jira Worklog Key' would split provenance
-            # across two CFs and break idempotency lookups.
-            #
-            # Empty strings are truthy in Ruby, so the existence check
-            # has to be explicit (``!key.nil? && !key.to_s.empty?``)
-            # instead of the bare ``if key`` that the pre-extraction
-            # client code used.
-            "      if !key.nil? && !key.to_s.empty?",
-            "        cf = CustomField.find_by(type: 'TimeEntryCustomField', name: 'J2O Origin Worklog Key')",
-            "        if !cf",
-            "          cf = CustomField.new(name: 'J2O Origin Worklog Key', field_format: 'string', is_required: false, is_for_all: true, type: 'TimeEntryCustomField')",
-            "          cf.save",
-            "        end",
-            "        begin",
-            "          te.custom_field_values = { cf.id => key }",
-            "        rescue => e",
-            "        end",
-            "      end",
-            "    rescue => e",
+            "    activity = activities[entry[:activity_id]]",
+            "    if activity.nil?",
+            "      failed_count += 1",
+            "      results << { index: entry[:index], success: false, error: 'TimeEntryActivity not found: ' + entry[:activity_id].to_s }",
+            "      next",
             "    end",
+            "    te = TimeEntry.new(",
+            "      activity: activity,",
+            "      hours: entry[:hours],",
+            "      spent_on: Date.parse(entry[:spent_on]),",
+            "      comments: entry[:comments],",
+            "      entity: wp,",
+            "      project: wp.project,",
+            "      user: user,",
+            "      logged_by_id: user.id",
+            "    )",
+            "    te.custom_values.build(custom_field: cf, value: key) if cf && !key.empty?",
             "    if te.save",
             "      created_count += 1",
+            "      existing[key] = te.id unless key.empty?",
             "      results << { index: entry[:index], success: true, id: te.id }",
             "    else",
             "      failed_count += 1",
@@ -493,7 +508,7 @@ class OpenProjectTimeEntryService:
             "    results << { index: entry[:index], success: false, error: e.message }",
             "  end",
             "end",
-            "File.write(result_path, JSON.generate({ created: created_count, failed: failed_count, results: results }))",
+            "File.write(result_path, JSON.generate({ created: created_count, existing: existing_count, failed: failed_count, results: results }))",
         ]
         # Wrap the body in an outer ``begin/rescue/ensure`` so any
         # top-level Ruby error (e.g. JSON parse failure on the input
@@ -533,7 +548,7 @@ class OpenProjectTimeEntryService:
 
         try:
             try:
-                _ = client.rails_client.execute(ruby, timeout=120, suppress_output=True)
+                _ = client.rails_client.execute(ruby, timeout=timeout, suppress_output=True)
             except Exception as e:
                 msg = f"Rails execution failed for batch_create_time_entries: {e}"
                 raise QueryExecutionError(msg) from e
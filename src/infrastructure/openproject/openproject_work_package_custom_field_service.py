@@ -7,6 +7,9 @@ that don't fit the generic ``OpenProjectCustomFieldService``
 
 * ``bulk_set_wp_custom_field_values`` — set CF values on many work
   packages in one Rails round-trip.
+* ``bulk_set_custom_values`` — set one CF on many work packages by
+  writing ``custom_values`` rows directly (``insert_all``/``upsert_all``,
+  thousands per Rails call) instead of a ``save!`` per work package.
 * ``set_wp_last_update_date_by_keys`` — back-fill the ``J2O Last
   Update Date`` CF on work packages identified by Jira issue key,
   used by the change-detection pipeline.
@@ -26,10 +29,14 @@ sites (migrations, tests) work unchanged.
 from __future__ import annotations
 
 import json
+from collections.abc import Mapping
 from typing import Any
 
 from src.infrastructure.openproject.openproject_client import OpenProjectClient
 
+# Work packages per Rails call in ``bulk_set_custom_values``.
+BULK_CUSTOM_VALUE_CHUNK = 2000
+
 
 class OpenProjectWorkPackageCustomFieldService:
     """Bulk CF writes + change-detection date back-fill on work packages."""
@@ -151,6 +158,145 @@ J2O_DATA
             self._logger.warning("Bulk set WP CF values failed: %s", e)
             return {"success": False, "updated": 0, "failed": len(cf_values), "error": str(e)}
 
+    def bulk_set_custom_values(
+        self,
+        cf_id: int,
+        values: Mapping[int, str],
+        *,
+        touch_journal: bool = False,
+        chunk_size: int = BULK_CUSTOM_VALUE_CHUNK,
+    ) -> dict[str, Any]:
+        """Set custom field ``cf_id`` on many work packages without per-WP saves.
+
+        Each chunk is one Rails call: existing ``custom_values`` rows whose
+        value differs are rewritten with ``upsert_all`` (keyed on the row
+        id — the table has no unique index on work package + field), missing
+        ones are added with ``insert_all`` and identical ones are left alone.
+        That bypasses ``WorkPackage#save!`` and its callbacks, so no journal
+        is written unless ``touch_journal`` is set, in which case every
+        changed work package gets exactly one journal entry (by the system
+        user) after its value is written.
+
+        Args:
+            cf_id: Work-package custom field id
+            values: Work-package id → value (stored as text, like the form would)
+            touch_journal: Write one journal per changed work package
+            chunk_size: Work packages per Rails call
+
+        Returns:
+            Dict with ``success`` (bool), ``updated`` (rows written),
+            ``created`` (of those, new rows), ``unchanged``, ``failed`` and
+            ``errors`` (list).
+
+        """
+        totals: dict[str, Any] = {"updated": 0, "created": 0, "unchanged": 0, "failed": 0, "errors": []}
+        try:
+            cf = int(cf_id)
+            rows = [[int(wp_id), str(value)] for wp_id, value in values.items()]
+        except (TypeError, ValueError) as e:
+            self._logger.warning("Malformed input to bulk_set_custom_values: %s", e)
+            return {**totals, "success": False, "failed": len(values), "error": str(e)}
+
+        for start in range(0, len(rows), max(1, chunk_size)):
+            chunk = rows[start : start + max(1, chunk_size)]
+            result = self._set_custom_values_chunk(cf, chunk, touch_journal=touch_journal)
+            for key in ("updated", "created", "unchanged", "failed"):
+                totals[key] += int(result.get(key, 0) or 0)
+            totals["errors"].extend(result.get("errors") or [])
+        totals["success"] = totals["failed"] == 0
+        return totals
+
+    def _set_custom_values_chunk(
+        self,
+        cf_id: int,
+        rows: list[list[Any]],
+        *,
+        touch_journal: bool,
+    ) -> dict[str, Any]:
+        """Write one chunk of ``[wp_id, value]`` rows for ``bulk_set_custom_values``."""
+        # Same heredoc-as-data pattern as ``bulk_set_wp_custom_field_values``.
+        data_json = json.dumps(rows, ensure_ascii=False)
+        script = f"""
+          require 'json'
+          rows = JSON.parse(<<-'J2O_DATA'
+{data_json}
+J2O_DATA
+)
+          cf_id = {cf_id}
+          touch_journal = {"true" if touch_journal else "false"}
+          results = {{ updated: 0, created: 0, unchanged: 0, failed: 0, errors: [] }}
+
+          if CustomField.where(id: cf_id, type: 'WorkPackageCustomField').exists?
+            wanted = rows.to_h
+            valid = WorkPackage.where(id: wanted.keys).pluck(:id).to_set
+            (wanted.keys - valid.to_a).each do |wp_id|
+              results[:failed] += 1
+              results[:errors] << {{ wp_id: wp_id, error: 'WorkPackage not found' }}
+            end
+
+            # First row per work package, like ``custom_value_for``.
+            existing = {{}}
+            CustomValue.where(customized_type: 'WorkPackage', custom_field_id: cf_id, customized_id: valid.to_a)
+                       .order(:id).pluck(:id, :customized_id, :value)
+                       .each {{ |id, wp_id, value| existing[wp_id] ||= [id, value] }}
+
+            updates = []
+            inserts = []
+            valid.each do |wp_id|
+              value = wanted[wp_id]
+              row = existing[wp_id]
+              attrs = {{ customized_type: 'WorkPackage', customized_id: wp_id, custom_field_id: cf_id, value: value }}
+              if row.nil?
+                inserts << attrs
+              elsif row[1].to_s == value
+                results[:unchanged] += 1
+              else
+                updates << {{ id: row[0], **attrs }}
+              end
+            end
+
+            begin
+              CustomValue.transaction do
+                CustomValue.upsert_all(updates, unique_by: :id) if updates.any?
+                CustomValue.insert_all(inserts) if inserts.any?
+              end
+              results[:created] = inserts.size
+              results[:updated] = updates.size + inserts.size
+            rescue => e
+              results[:failed] += updates.size + inserts.size
+              results[:errors] << {{ error: "#{{e.class}}: #{{e.message}}" }}
+              updates = []
+              inserts = []
+            end
+
+            changed = updates.map {{ |r| r[:customized_id] }} + inserts.map {{ |r| r[:customized_id] }}
+            if touch_journal && changed.any?
+              WorkPackage.where(id: changed).update_all(updated_at: Time.current)
+              system_user = User.system
+              WorkPackage.where(id: changed).find_each do |wp|
+                begin
+                  Journals::CreateService.new(wp, system_user).call
+                rescue => e
+                  results[:errors] << {{ wp_id: wp.id, error: "journal: #{{e.message}}" }}
+                end
+              end
+            end
+          else
+            results[:failed] = rows.size
+            results[:errors] << {{ cf_id: cf_id, error: 'CustomField not found' }}
+          end
+
+          results
+        """
+        try:
+            result = self._client.execute_query_to_json_file(script)
+            if isinstance(result, dict):
+                return result
+            return {"failed": len(rows), "errors": [{"error": str(result)}]}
+        except Exception as e:
+            self._logger.warning("Bulk set custom values for CF %s failed: %s", cf_id, e)
+            return {"failed": len(rows), "errors": [{"error": str(e)}]}
+
     # ── change-detection back-fill ────────────────────────────────────────
 
     def set_wp_last_update_date_by_keys(
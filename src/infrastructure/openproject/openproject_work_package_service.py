@@ -7,9 +7,14 @@ onto a focused service. The service owns:
 * **Single-record writes** — ``create_work_package`` (accepts both
   API-style ``_links`` payload and direct attribute payload),
   ``update_work_package``.
-* **Batch writes** — ``batch_update_work_packages`` (per-row
-  ``find / send / save!`` loop with structured success/failure
-  result).
+* **Batch writes** — ``batch_update_work_packages`` (prefetches the
+  batch's work packages, custom values and custom fields, then saves
+  only rows with dirty attributes or custom values; structured
+  success/unchanged/failure result). Runs inside ``J2O::BulkMode``
+  when bulk mode is on (see ``rails_bulk_mode``).
+* **Deferred rebuild** — ``rebuild_derived_work_package_data``
+  recomputes hierarchy rows, derived totals and parent dates once per
+  project after bulk-mode batches skipped the per-record callbacks.
 * **Reads** — ``stream_work_packages_for_project`` yields the first
   ``batch_size`` work packages of a project (the historical
   ``stream_*`` name doesn't paginate; behaviour preserved as-is —
@@ -49,10 +54,15 @@ from __future__ import annotations
 
 import json
 import re
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING, Any
 
 from src.infrastructure.exceptions import QueryExecutionError
+from src.infrastructure.openproject.rails_bulk_mode import (
+    REBUILD_DERIVED_SCRIPT,
+    bulk_mode_enabled,
+    wrap_bulk_mode,
+)
 
 if TYPE_CHECKING:
     from src.infrastructure.openproject.openproject_client import OpenProjectClient
@@ -124,50 +134,175 @@ class OpenProjectWorkPackageService:
         self,
         updates: list[dict[str, Any]],
     ) -> dict[str, Any]:
-        """Update multiple work packages in batches."""
+        """Update multiple work packages in one Rails call.
+
+        All target work packages (with their custom values) and the
+        referenced work-package custom fields are prefetched up front, so
+        the script issues a constant number of reads per batch instead of
+        a ``find`` plus lazy custom-value lookups per row. Work packages
+        whose attributes and custom values already match are left alone;
+        changed ones are saved with ``save!``, so custom values go through
+        the ``custom_field_values`` writer and its validations and the
+        change is journaled like any other edit.
+
+        Args:
+            updates: Dicts with the work package ``id`` plus attribute names
+                to assign (``subject``, ``version_id``, ...) and/or custom
+                field values keyed ``customFieldN`` or ``custom_field_N``.
+                Custom field values may be scalars, or lists of scalars for
+                multi-value fields; other shapes, lists for single-value
+                fields and fields not enabled for the work package are
+                reported as ``skipped`` on the row instead of being stored.
+                A value the field rejects fails the row.
+
+        Returns:
+            Dict with ``updated``, ``unchanged`` and ``failed`` counts and one
+            ``{id, status, error?, skipped?}`` result per update.
+
+        """
         if not updates:
-            return {"updated": 0, "failed": 0, "results": []}
+            return {"updated": 0, "unchanged": 0, "failed": 0, "results": []}
 
-        # Build batch update script
-        # Use ensure_ascii=False to output UTF-8 directly, avoiding \uXXXX escapes
-        # that Ruby misinterprets as invalid Unicode escape sequences
-        # NOTE: Ruby parses {"key": value} as symbol keys (:key), so we use :id etc.
+        # Use ensure_ascii=False to keep UTF-8 literal; the <<-'J2O_DATA'
+        # heredoc prevents Ruby interpolation and \u escape interpretation
+        # (and JSON ``null`` survives, unlike in a Ruby hash literal).
         updates_json = json.dumps(updates, ensure_ascii=False)
         script = f"""
-        updates = {updates_json}
-        updated_count = 0
-        failed_count = 0
-        results = []
-
-        updates.each do |update|
-          begin
-            wp = WorkPackage.find(update[:id])
-            update.each do |key, value|
-              next if key == :id
-              wp.send("#{{key}}=", value) if wp.respond_to?("#{{key}}=")
+          require 'json'
+          updates = JSON.parse(<<-'J2O_DATA'
+{updates_json}
+J2O_DATA
+)
+          cf_key = /\\Acustom_?field_?(\\d+)\\z/i
+          updated_count = 0
+          unchanged_count = 0
+          failed_count = 0
+          results = []
+
+          # Pre-fetch target WPs with their custom values and the referenced
+          # custom fields: three queries per batch instead of ~3 per row
+          wp_ids = updates.map {{ |u| u['id'].to_i }}.uniq
+          cf_ids = updates.flat_map {{ |u| u.keys.filter_map {{ |k| k[cf_key, 1]&.to_i }} }}.uniq
+          wps = WorkPackage.where(id: wp_ids).includes(:custom_values).index_by(&:id)
+          cfs = cf_ids.empty? ? {{}} : WorkPackageCustomField.where(id: cf_ids).index_by(&:id)
+
+          updates.each do |update|
+            begin
+              wp = wps[update['id'].to_i]
+              raise ActiveRecord::RecordNotFound, "Couldn't find WorkPackage with 'id'=#{{update['id']}}" unless wp
+
+              cf_values = {{}}
+              cf_keys = {{}}
+              skipped = []
+              update.each do |key, value|
+                next if key == 'id'
+                cf_id = key[cf_key, 1]&.to_i
+                if cf_id.nil?
+                  wp.public_send("#{{key}}=", value) if wp.respond_to?("#{{key}}=")
+                  next
+                end
+
+                cf = cfs[cf_id]
+                values = value.is_a?(Array) ? value : [value]
+                scalar = values.all? {{ |v| v.nil? || v.is_a?(String) || v.is_a?(Numeric) || v == true || v == false }}
+                unless cf && scalar && (values.size <= 1 || cf.multi_value?)
+                  skipped << key
+                  next
+                end
+
+                wanted = values.map {{ |v| v == true ? '1' : (v == false ? '0' : v&.to_s) }}
+                cf_values[cf_id] = cf.multi_value? ? wanted : wanted.first
+                cf_keys[cf_id] = key
+              end
+
+              # Assign through acts_as_customizable so the values are
+              # validated (list options, formats) on save!; fields not
+              # enabled for the WP's project/type are ignored by the writer.
+              unless cf_values.empty?
+                wp.custom_field_values = cf_values
+                available = wp.custom_field_values.map(&:custom_field_id)
+                skipped.concat(cf_keys.reject {{ |cf_id, _| available.include?(cf_id) }}.values)
+              end
+
+              if wp.changed? || wp.custom_values.any?(&:changed?)
+                # A custom-value-only change leaves the WP row clean; bump
+                # updated_at so save! writes it and the change is journaled.
+                wp.updated_at = Time.current unless wp.changed?
+                wp.save!
+                updated_count += 1
+                row = {{ id: wp.id, status: 'updated' }}
+              else
+                unchanged_count += 1
+                row = {{ id: wp.id, status: 'unchanged' }}
+              end
+              row[:skipped] = skipped if skipped.any?
+              results << row
+            rescue => e
+              failed_count += 1
+              results << {{ id: update['id'], status: 'failed', error: e.message }}
             end
-            wp.save!
-            updated_count += 1
-            results << {{ id: wp.id, status: 'updated' }}
-          rescue => e
-            failed_count += 1
-            results << {{ id: update[:id], status: 'failed', error: e.message }}
           end
-        end
 
-        {{
-          updated: updated_count,
-          failed: failed_count,
-          results: results
-        }}
+          {{
+            updated: updated_count,
+            unchanged: unchanged_count,
+            failed: failed_count,
+            results: results
+          }}
         """
+        if bulk_mode_enabled():
+            script = wrap_bulk_mode(script)
 
         try:
-            return self._client.execute_json_query(script)
+            result = self._client.execute_json_query(script)
         except Exception as e:
             msg = f"Failed to batch update work packages: {e}"
             raise QueryExecutionError(msg) from e
 
+        rows = result.get("results", []) if isinstance(result, dict) else []
+        skipped = {row.get("id"): row["skipped"] for row in rows if isinstance(row, dict) and row.get("skipped")}
+        if skipped:
+            self._logger.warning(
+                "Batch update skipped custom field values that are unknown, not enabled for the "
+                "work package or of an unsupported shape on %d work package(s): %s",
+                len(skipped),
+                skipped,
+            )
+        return result
+
+    def rebuild_derived_work_package_data(self, project_ids: Iterable[int]) -> list[dict[str, Any]]:
+        """Recompute what bulk mode's skipped callbacks maintain, once per project.
+
+        Rebuilds the projects' ``work_package_hierarchies`` rows, the derived
+        work/remaining work/% complete totals of parents and the dates of
+        automatically scheduled parents with a few set-based statements.
+
+        Returns:
+            One ``{project_id, success, hierarchy_rows, totals_updated,
+            dates_updated, error?}`` dict per project
+
+        """
+        ids = sorted({int(pid) for pid in project_ids})
+        if not ids:
+            return []
+
+        script = f"project_ids = {json.dumps(ids)}\n{REBUILD_DERIVED_SCRIPT}"
+        try:
+            results = self._client.execute_json_query(script, timeout=600)
+        except Exception as e:
+            self._logger.warning("Deferred rebuild failed for projects %s: %s", ids, e)
+            return [{"project_id": pid, "success": False, "error": str(e)} for pid in ids]
+        if not isinstance(results, list):
+            return [{"project_id": pid, "success": False, "error": "unexpected response"} for pid in ids]
+        for result in results:
+            if isinstance(result, dict) and not result.get("success"):
+                self._logger.warning(
+                    "Deferred rebuild failed for project %s: %s",
+                    result.get("project_id"),
+                    result.get("error"),
+                )
+        return results
+
     def create_work_package(self, payload: dict[str, Any]) -> dict[str, Any] | None:
         """Create a single work package.
 
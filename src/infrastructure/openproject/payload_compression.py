@@ -0,0 +1,106 @@
+"""Payload compression.
+
+gzip framing for the JSON payloads and result files moving between the
+migration host and the OpenProject container. Batches with descriptions or
+journal ``rails_ops`` compress roughly 8-10x, which matters when the SSH
+link to the OpenProject host is the bottleneck.
+
+* **Uploads** — the batched tar stream (``DockerClient.transfer_files_to_container``)
+  is gzipped when the batch is large enough and unpacked by ``tar -z`` inside
+  the container, so scripts keep reading plain files.
+* **Downloads** — result files are read through ``gzip -c`` inside the
+  container and gunzipped locally while they stream in (:py:class:`GunzipWriter`).
+
+Negotiated per call: uploads below ``min_compress_bytes()`` go uncompressed.
+Opt-in via ``J2O_PAYLOAD_COMPRESSION=1`` or ``migration.payload_compression:
+true``; the container only needs ``gzip``, which every Debian-based
+OpenProject image ships.
+"""
+
+from __future__ import annotations
+
+import os
+import zlib
+from collections.abc import Iterable, Iterator
+from typing import IO
+
+from src import config
+
+# Below this many bytes gzip's CPU cost outweighs the transfer saved.
+DEFAULT_MIN_COMPRESS_BYTES = 64 * 1024
+
+
+def compression_enabled() -> bool:
+    """Whether payloads/results should be gzipped in transit."""
+    return config.migration_flag("J2O_PAYLOAD_COMPRESSION", "payload_compression")
+
+
+def min_compress_bytes() -> int:
+    """Smallest upload that is worth compressing."""
+    raw = os.environ.get("J2O_PAYLOAD_COMPRESS_MIN_BYTES")
+    if raw is None:
+        raw = config.migration_config.get("payload_compress_min_bytes", DEFAULT_MIN_COMPRESS_BYTES)
+    try:
+        return max(0, int(raw))
+    except TypeError, ValueError:
+        return DEFAULT_MIN_COMPRESS_BYTES
+
+
+def should_compress(size: int) -> bool:
+    """Whether an upload of ``size`` bytes should travel gzipped."""
+    return compression_enabled() and size >= min_compress_bytes()
+
+
+class GunzipWriter:
+    """Write-only sink that gunzips a gzip stream into ``out`` as chunks arrive."""
+
+    def __init__(self, out: IO[bytes]) -> None:
+        """Initialize the sink writing decompressed bytes to ``out``."""
+        self._out = out
+        self._inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        self.compressed_bytes = 0
+        self.raw_bytes = 0
+
+    def write(self, chunk: bytes) -> int:
+        """Decompress ``chunk`` and forward the result."""
+        self.compressed_bytes += len(chunk)
+        data = self._inflater.decompress(chunk)
+        if data:
+            self.raw_bytes += len(data)
+            self._out.write(data)
+        return len(chunk)
+
+    def finish(self) -> None:
+        """Flush the tail of the stream.
+
+        Raises:
+            ValueError: If the gzip stream was truncated
+
+        """
+        data = self._inflater.flush()
+        if data:
+            self.raw_bytes += len(data)
+            self._out.write(data)
+        if not self._inflater.eof:
+            msg = "Truncated gzip stream"
+            raise ValueError(msg)
+
+
+def iter_gunzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Inflate a gzip stream chunk by chunk.
+
+    Raises:
+        ValueError: If the gzip stream was truncated
+
+    """
+    inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = inflater.decompress(chunk)
+        if data:
+            yield data
+    tail = inflater.flush()
+    if tail:
+        yield tail
+    if not inflater.eof:
+        msg = "Truncated gzip stream"
+        raise ValueError(msg)
@@ -0,0 +1,180 @@
+"""Rails bulk mode.
+
+Suppression window for OpenProject's per-record side effects while a bulk
+script creates or updates work packages.
+
+:py:func:`wrap_bulk_mode` wraps a Ruby script body in
+``J2O::BulkMode.run do ... end``. Inside the block:
+
+* journal notifications are off (``Journal::NotificationConfiguration``), so
+  no notification or mail jobs are enqueued for the batch,
+* ``ActionMailer`` deliveries are off,
+* ``WorkPackage`` save callbacks listed in ``SKIPPED_CALLBACKS`` are skipped.
+  Today that is the closure_tree hierarchy maintenance (``_ct_after_save``),
+  which otherwise takes an advisory lock and rewrites hierarchy rows on every
+  save.
+
+What the skipped callbacks would have kept up to date is recomputed once per
+project afterwards by :py:data:`REBUILD_DERIVED_SCRIPT` (see
+``OpenProjectWorkPackageService.rebuild_derived_work_package_data``):
+hierarchy rows, derived work/remaining work/% complete totals, and the dates
+of automatically scheduled parents. The block returns the value of the
+wrapped body, so scripts read through ``execute_json_query`` keep working.
+
+Opt-in via ``J2O_BULK_MODE=1`` or ``migration.bulk_mode: true``.
+"""
+
+from __future__ import annotations
+
+from src import config
+
+# Defined on first use in each Rails process; re-evaluating it is harmless.
+_BULK_MODE_PRELUDE = """module J2O
+  module BulkMode
+    # [callback kind, phase, name] skipped on WorkPackage inside run; only
+    # callbacks the running OpenProject actually defines are touched.
+    SKIPPED_CALLBACKS = [[:save, :after, :_ct_after_save]].freeze unless const_defined?(:SKIPPED_CALLBACKS, false)
+
+    def self.active?
+      Thread.current[:j2o_bulk_mode] == true
+    end
+
+    # Make the skipped callbacks conditional on bulk mode (once per process).
+    def self.install
+      return if @installed
+
+      SKIPPED_CALLBACKS.each do |kind, phase, name|
+        chain = WorkPackage.__callbacks[kind]
+        next unless chain && chain.any? { |cb| cb.kind == phase && cb.filter == name }
+
+        WorkPackage.skip_callback(kind, phase, name, if: -> { J2O::BulkMode.active? })
+      end
+      @installed = true
+    end
+
+    def self.run(&block)
+      return yield if active?
+
+      install
+      deliveries = ActionMailer::Base.perform_deliveries
+      begin
+        ActionMailer::Base.perform_deliveries = false
+        Thread.current[:j2o_bulk_mode] = true
+        if defined?(Journal::NotificationConfiguration)
+          Journal::NotificationConfiguration.with(false, &block)
+        else
+          yield
+        end
+      ensure
+        Thread.current[:j2o_bulk_mode] = nil
+        ActionMailer::Base.perform_deliveries = deliveries
+      end
+    end
+  end
+end
+"""
+
+# Set-based recomputation of what the skipped callbacks maintain, once per
+# project. Expects ``project_ids``; evaluates to one result hash per project.
+REBUILD_DERIVED_SCRIPT = r"""
+conn = ActiveRecord::Base.connection
+wp_columns = WorkPackage.column_names
+has_hierarchies = conn.table_exists?('work_package_hierarchies')
+has_non_working_days = conn.table_exists?('non_working_days')
+working_days = (Setting.working_days rescue [1, 2, 3, 4, 5]).map(&:to_i).select { |d| d.between?(1, 7) }
+working_days = [1, 2, 3, 4, 5] if working_days.empty?
+
+project_ids.map do |pid|
+  pid = pid.to_i
+  result = { 'project_id' => pid, 'hierarchy_rows' => 0, 'totals_updated' => 0, 'dates_updated' => 0 }
+  begin
+    WorkPackage.transaction do
+      in_project = "SELECT id FROM work_packages WHERE project_id = #{pid}"
+      if has_hierarchies
+        conn.execute("DELETE FROM work_package_hierarchies WHERE descendant_id IN (#{in_project})")
+        result['hierarchy_rows'] = conn.exec_update(<<~SQL)
+          WITH RECURSIVE chain(ancestor_id, descendant_id, generations) AS (
+            SELECT id, id, 0 FROM work_packages WHERE project_id = #{pid}
+            UNION ALL
+            SELECT wp.parent_id, chain.descendant_id, chain.generations + 1
+            FROM chain JOIN work_packages wp ON wp.id = chain.ancestor_id
+            WHERE wp.parent_id IS NOT NULL AND chain.generations < 100
+          )
+          INSERT INTO work_package_hierarchies (ancestor_id, descendant_id, generations)
+          SELECT ancestor_id, descendant_id, generations FROM chain
+        SQL
+
+        # Totals include the parent's own values, like OpenProject's Σ columns
+        if wp_columns.include?('derived_estimated_hours') && wp_columns.include?('derived_remaining_hours')
+          done_ratio_sql =
+            if wp_columns.include?('derived_done_ratio')
+              ", derived_done_ratio = CASE WHEN agg.work > 0 AND agg.remaining IS NOT NULL " \
+              "THEN ROUND((agg.work - agg.remaining) * 100.0 / agg.work) ELSE NULL END"
+            else
+              ''
+            end
+          result['totals_updated'] = conn.exec_update(<<~SQL)
+            UPDATE work_packages SET derived_estimated_hours = agg.work,
+              derived_remaining_hours = agg.remaining#{done_ratio_sql}
+            FROM (
+              SELECT h.ancestor_id, SUM(d.estimated_hours) AS work, SUM(d.remaining_hours) AS remaining
+              FROM work_package_hierarchies h
+              JOIN work_packages d ON d.id = h.descendant_id
+              WHERE h.ancestor_id IN (#{in_project})
+              GROUP BY h.ancestor_id
+              HAVING MAX(h.generations) > 0
+            ) agg
+            WHERE work_packages.id = agg.ancestor_id
+          SQL
+        end
+
+        # Automatically scheduled parents span their descendants
+        holidays_sql = has_non_working_days ? "AND d::date NOT IN (SELECT date FROM non_working_days)" : ''
+        duration_sql =
+          if wp_columns.include?('duration')
+            ", duration = CASE WHEN agg.start_date IS NULL OR agg.due_date IS NULL THEN NULL " \
+            "WHEN work_packages.ignore_non_working_days THEN agg.due_date - agg.start_date + 1 " \
+            "ELSE (SELECT COUNT(*) FROM generate_series(agg.start_date, agg.due_date, interval '1 day') d " \
+            "WHERE EXTRACT(ISODOW FROM d)::int IN (#{working_days.join(', ')}) #{holidays_sql}) END"
+          else
+            ''
+          end
+        result['dates_updated'] = conn.exec_update(<<~SQL)
+          UPDATE work_packages SET start_date = agg.start_date, due_date = agg.due_date#{duration_sql}
+          FROM (
+            SELECT h.ancestor_id, MIN(COALESCE(d.start_date, d.due_date)) AS start_date,
+              MAX(COALESCE(d.due_date, d.start_date)) AS due_date
+            FROM work_package_hierarchies h
+            JOIN work_packages d ON d.id = h.descendant_id
+            WHERE h.ancestor_id IN (#{in_project}) AND h.generations > 0
+            GROUP BY h.ancestor_id
+          ) agg
+          WHERE work_packages.id = agg.ancestor_id
+            AND work_packages.schedule_manually = false
+            AND (agg.start_date IS NOT NULL OR agg.due_date IS NOT NULL)
+            AND (work_packages.start_date IS DISTINCT FROM agg.start_date
+                 OR work_packages.due_date IS DISTINCT FROM agg.due_date)
+        SQL
+      end
+    end
+    result['success'] = true
+  rescue => e
+    result['success'] = false
+    result['error'] = "#{e.class}: #{e.message}"
+  end
+  result
+end
+"""
+
+
+def bulk_mode_enabled() -> bool:
+    """Whether bulk WP scripts should run inside ``J2O::BulkMode``."""
+    return config.migration_flag("J2O_BULK_MODE", "bulk_mode")
+
+
+def wrap_bulk_mode(script: str) -> str:
+    """Wrap ``script`` so it runs inside ``J2O::BulkMode.run``.
+
+    The wrapped script evaluates to the value of ``script``.
+    """
+    return f"{_BULK_MODE_PRELUDE}\nJ2O::BulkMode.run do\n{script.rstrip()}\nend\n"
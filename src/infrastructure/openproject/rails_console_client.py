@@ -7,6 +7,7 @@ Uses exception-based error handling for all operations.
 import os
 import shutil
 import subprocess
+import threading
 import time
 from datetime import UTC, datetime
 from typing import Any
@@ -17,6 +18,7 @@ try:
     from src import config  # type: ignore
 except Exception:
     config = None
+from src.infrastructure.openproject.tmux_output_channel import TmuxOutputChannel, pipe_pane_enabled
 from src.utils.file_manager import FileManager
 
 logger = configure_logging("INFO", None)
@@ -85,6 +87,7 @@ class RailsConsoleClient:
         pane: int = 0,
         command_timeout: int = 180,
         inactivity_timeout: int = 30,
+        marker_namespace: str = "",
     ) -> None:
         """Initialize the Rails console client.
 
@@ -94,6 +97,9 @@ class RailsConsoleClient:
             pane: tmux pane number (default: 0)
             command_timeout: Command timeout in seconds (default: 180)
             inactivity_timeout: Inactivity timeout in seconds (default: 30)
+            marker_namespace: Prefix for execution markers, so output of
+                concurrently used sessions (see ``RailsSessionPool``) is never
+                attributed to the wrong console (default: none)
 
         Raises:
             TmuxSessionError: If tmux session does not exist
@@ -104,9 +110,15 @@ class RailsConsoleClient:
         self.pane = pane
         self.command_timeout = command_timeout
         self.inactivity_timeout = inactivity_timeout
+        self.marker_namespace = marker_namespace
         self.file_manager = FileManager()
         self._rails_command = "bundle exec rails console"
         self._tmux_path = shutil.which("tmux") or "tmux"
+        # pipe-pane output channel (opt-in, attached on first command)
+        self._output_channel: TmuxOutputChannel | None = None
+        self._output_channel_failed = False
+        # Serializes pane round trips across threads (see ``command_lock``)
+        self._command_lock = threading.RLock()
 
         # Skip tmux session check if forced runner mode (tmux not needed)
         if os.environ.get("J2O_FORCE_RAILS_RUNNER"):
@@ -181,6 +193,15 @@ class RailsConsoleClient:
         else:
             return result.returncode == 0
 
+    @property
+    def command_lock(self) -> threading.RLock:
+        """Re-entrant lock held for each send/wait round trip on the pane.
+
+        Callers that drive the pane directly (``send-keys`` + marker waits)
+        must hold it so commands from different threads don't interleave.
+        """
+        return self._command_lock
+
     def _get_target(self) -> str:
         """Get the tmux target string for the session, window, and pane.
 
@@ -190,6 +211,31 @@ class RailsConsoleClient:
         """
         return f"{self.tmux_session_name}:{self.window}.{self.pane}"
 
+    def get_output_channel(self) -> TmuxOutputChannel | None:
+        """Return the pane's pipe-pane output channel, or None for capture-pane polling.
+
+        Enabled via ``J2O_TMUX_PIPE_PANE`` / ``migration.tmux_pipe_pane``; if
+        tmux refuses the pipe, polling is used for the rest of the run.
+        """
+        if self._output_channel_failed or not pipe_pane_enabled():
+            return None
+        if self._output_channel is not None and self._output_channel.is_running:
+            return self._output_channel
+        log_path = self.file_manager.temp_dir / "tmux" / f"{self.tmux_session_name}_{self.window}_{self.pane}.pane.log"
+        channel = TmuxOutputChannel(self._tmux_path, self._get_target(), log_path)
+        if not channel.start():
+            self._output_channel_failed = True
+            return None
+        self._output_channel = channel
+        return channel
+
+    @staticmethod
+    def _drop_prompt_lines(output: str) -> str:
+        """Drop IRB return (``=> ``) and prompt echo (``irb(main):``) lines."""
+        return "\n".join(
+            line.strip() for line in output.split("\n") if not line.strip().startswith(("=> ", "irb(main):"))
+        ).strip()
+
     def _configure_irb_settings(self) -> None:
         """Configure IRB settings for better output and interaction.
 
@@ -353,7 +399,7 @@ class RailsConsoleClient:
         if timeout is None:
             timeout = self.command_timeout
 
-        marker_id = self.file_manager.generate_unique_id()
+        marker_id = f"{self.marker_namespace}{self.file_manager.generate_unique_id()}"
         debug_session_dir = self.file_manager.create_debug_session(marker_id)
 
         self.file_manager.add_to_debug_log(
@@ -501,10 +547,11 @@ class RailsConsoleClient:
         # Execute in tmux
         if suppress_output:
             # For suppressed multi-line scripts, avoid marker waits entirely to reduce fragility/noise
+            # (wait_for_line is only honoured by the pipe-pane channel here)
             tmux_output = self._send_command_to_tmux(
                 wrapped_command,
                 timeout,
-                wait_for_line=None,
+                wait_for_line=end_marker_out,
                 script_end_marker=None,
             )
         else:
@@ -942,103 +989,139 @@ class RailsConsoleClient:
             CommandExecutionError: If command execution fails
 
         """
-        target = self._get_target()
+        # One command on the pane at a time: callers on other threads (e.g. the
+        # bulk-create pipeline) would otherwise interleave their keystrokes.
+        with self._command_lock:
+            target = self._get_target()
 
-        if not self._wait_for_console_ready(target, timeout=10, reset_on_stall=False):
-            logger.error("Console not ready, forcing full stabilization")
-            self._stabilize_console()
+            if not self._wait_for_console_ready(target, timeout=10, reset_on_stall=False):
+                logger.error("Console not ready, forcing full stabilization")
+                self._stabilize_console()
 
-            if not self._wait_for_console_ready(target, timeout=5, reset_on_stall=False):
-                msg = "Console could not be made ready"
-                raise ConsoleNotReadyError(msg)
+                if not self._wait_for_console_ready(target, timeout=5, reset_on_stall=False):
+                    msg = "Console could not be made ready"
+                    raise ConsoleNotReadyError(msg)
 
-        escaped_command = self._escape_command(command)
+            escaped_command = self._escape_command(command)
+            channel = self.get_output_channel() if wait_for_line else None
 
-        try:
-            # Removed TMUX_CMD_* markers; rely solely on EXEC_* markers from the script
+            try:
+                # Removed TMUX_CMD_* markers; rely solely on EXEC_* markers from the script
+                mark = channel.mark() if channel is not None else 0
 
-            logger.debug("Sending command (length: %s bytes)", len(escaped_command))
-            tmux = self._tmux_path
-            subprocess.run(
-                [tmux, "send-keys", "-t", target, escaped_command, "Enter"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+                logger.debug("Sending command (length: %s bytes)", len(escaped_command))
+                tmux = self._tmux_path
+                subprocess.run(
+                    [tmux, "send-keys", "-t", target, escaped_command, "Enter"],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
 
-            # Give the command a brief moment to start producing output
-            time.sleep(0.2)
+                if channel is not None and wait_for_line:
+                    return self._wait_on_channel(channel, mark, wait_for_line, script_end_marker, timeout)
 
-            # State-machine: first observe script-end echo, then require post-script output to contain EXEC_END
-            if script_end_marker:
-                found_script_end, pane_output = self._wait_for_console_output(
-                    target,
-                    script_end_marker,
-                    timeout,
-                )
-                if not found_script_end:
-                    if self._has_fatal_console_error(pane_output):
-                        snippet = self._extract_error_summary(pane_output)
-                        msg = f"Rails console crashed before script-end echo: {snippet}"
-                        raise ConsoleNotReadyError(msg)
-                    msg = "Script end echo not observed in console output"
-                    raise CommandExecutionError(msg)
-
-                # Wait for any new output beyond script-end echo
-                baseline = pane_output
-                start_wait = time.time()
-                while time.time() - start_wait < max(2, min(timeout, 10)):
-                    tmux = self._tmux_path
-                    cap = subprocess.run(
-                        [tmux, "capture-pane", "-p", "-S", "-200", "-t", target],
-                        capture_output=True,
-                        text=True,
-                        check=True,
+                # Give the command a brief moment to start producing output
+                time.sleep(0.2)
+
+                # State-machine: first observe script-end echo, then require post-script output to contain EXEC_END
+                if script_end_marker:
+                    found_script_end, pane_output = self._wait_for_console_output(
+                        target,
+                        script_end_marker,
+                        timeout,
                     )
-                    cur = cap.stdout
-                    if cur != baseline:
-                        break
-                    time.sleep(0.1)
+                    if not found_script_end:
+                        if self._has_fatal_console_error(pane_output):
+                            snippet = self._extract_error_summary(pane_output)
+                            msg = f"Rails console crashed before script-end echo: {snippet}"
+                            raise ConsoleNotReadyError(msg)
+                        msg = "Script end echo not observed in console output"
+                        raise CommandExecutionError(msg)
+
+                    # Wait for any new output beyond script-end echo
+                    baseline = pane_output
+                    start_wait = time.time()
+                    while time.time() - start_wait < max(2, min(timeout, 10)):
+                        tmux = self._tmux_path
+                        cap = subprocess.run(
+                            [tmux, "capture-pane", "-p", "-S", "-200", "-t", target],
+                            capture_output=True,
+                            text=True,
+                            check=True,
+                        )
+                        cur = cap.stdout
+                        if cur != baseline:
+                            break
+                        time.sleep(0.1)
 
-                # Inspect only the tail window for the end marker
-                tail_lines = cur.strip().split("\n")[-200:]
-                if wait_for_line and not any(wait_for_line in ln for ln in tail_lines):
-                    # No further output with EXEC_END → error (nothing should print after EXEC_END)
-                    msg = "End marker not found in tail after post-script output"
-                    raise CommandExecutionError(msg)
+                    # Inspect only the tail window for the end marker
+                    tail_lines = cur.strip().split("\n")[-200:]
+                    if wait_for_line and not any(wait_for_line in ln for ln in tail_lines):
+                        # No further output with EXEC_END → error (nothing should print after EXEC_END)
+                        msg = "End marker not found in tail after post-script output"
+                        raise CommandExecutionError(msg)
 
-            # Now ensure prompt is ready before final capture
-            self._wait_for_console_ready(target, timeout, reset_on_stall=False)
+                # Now ensure prompt is ready before final capture
+                self._wait_for_console_ready(target, timeout, reset_on_stall=False)
 
-            # After script completes, capture a compact tail; outer parser will locate markers
-            tmux = self._tmux_path
-            cap = subprocess.run(
-                [tmux, "capture-pane", "-p", "-S", "-1000", "-t", target],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            last_output = cap.stdout
+                # After script completes, capture a compact tail; outer parser will locate markers
+                tmux = self._tmux_path
+                cap = subprocess.run(
+                    [tmux, "capture-pane", "-p", "-S", "-1000", "-t", target],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                last_output = cap.stdout
 
-            # drop all return lines from last_output
-            last_output = "\n".join(
-                [line.strip() for line in last_output.split("\n") if not line.strip().startswith("=> ")],
-            )
-            # drop all lines irb(main):30486>
-            last_output = "\n".join(
-                [line.strip() for line in last_output.split("\n") if not line.strip().startswith("irb(main):")],
-            )
-            # Do not slice out EXEC markers here; higher-level parser relies on them
+                # drop all return lines and irb(main):30486> prompt lines.
+                # Do not slice out EXEC markers here; higher-level parser relies on them
+                return self._drop_prompt_lines(last_output)
 
-            return last_output.strip()
+            except subprocess.SubprocessError as e:
+                logger.exception("Tmux command failed")
+                self._stabilize_console()
+                msg = f"Tmux command failed: {e}"
+                raise TmuxSessionError(msg) from e
+            except Exception as e:
+                logger.exception("Error sending command to tmux")
+                self._stabilize_console()
+                msg = f"Error sending command to tmux: {e}"
+                raise CommandExecutionError(msg) from e
 
-        except subprocess.SubprocessError as e:
-            logger.exception("Tmux command failed")
-            self._stabilize_console()
-            msg = f"Tmux command failed: {e}"
-            raise TmuxSessionError(msg) from e
-        except Exception as e:
-            logger.exception("Error sending command to tmux")
-            self._stabilize_console()
-            msg = f"Error sending command to tmux: {e}"
-            raise CommandExecutionError(msg) from e
+    def _wait_on_channel(
+        self,
+        channel: TmuxOutputChannel,
+        mark: int,
+        wait_for_line: str,
+        script_end_marker: str | None,
+        timeout: int,
+    ) -> str:
+        """Wait for ``wait_for_line`` on the pipe-pane channel and return the output.
+
+        Only a printed marker counts (it must start a line; in the echoed
+        command it follows ``puts "``). The echoed script up to
+        ``script_end_marker`` is cut off so marker parsing sees program
+        output only.
+        """
+        found, output = channel.wait_for(
+            wait_for_line,
+            mark,
+            timeout,
+            at_line_start=True,
+            abort=self._has_fatal_console_error,
+        )
+        if not found:
+            if self._has_fatal_console_error(output):
+                snippet = self._extract_error_summary(output)
+                msg = f"Rails console crashed before end marker: {snippet}"
+                raise ConsoleNotReadyError(msg)
+            msg = f"End marker '{wait_for_line}' not observed within {timeout}s"
+            raise CommandExecutionError(msg)
+        if script_end_marker:
+            echo_end = output.rfind(script_end_marker, 0, output.rfind(wait_for_line))
+            if echo_end != -1:
+                line_end = output.find("\n", echo_end)
+                output = output[line_end + 1 :] if line_end != -1 else ""
+        return self._drop_prompt_lines(output)
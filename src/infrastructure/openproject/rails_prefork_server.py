@@ -0,0 +1,193 @@
+"""RailsPreforkServer.
+
+Warm replacement for ``bundle exec rails runner`` on the non-interactive path
+(``J2O_FORCE_RAILS_RUNNER``, ``J2O_SCRIPT_LOAD_MODE=runner`` and the
+``enable_runner_fallback`` fallbacks).
+
+``src/ruby/j2o_prefork_server.rb`` boots Rails once inside the container,
+eager-loads the app and listens on a Unix socket. A runner call then executes
+the plain-Ruby client ``src/ruby/j2o_prefork_client.rb``; the server forks a
+child that runs the script on its own database connection, and the client
+prints the child's stdout/stderr and exits with its status. Callers keep the
+``(stdout, stderr, rc)`` contract of ``rails runner`` from
+``DockerClient.execute_command`` — without paying the 10-40s Rails boot per
+call. Up to ``max_children`` scripts run concurrently.
+
+Opt-in via ``J2O_RAILS_PREFORK=1`` or ``migration.rails_prefork_runner: true``.
+The server is started detached and outlives the run, so the next run reuses
+it; it keeps the code loaded at boot, so :py:meth:`RailsPreforkServer.stop`
+it after upgrading OpenProject.
+"""
+
+from __future__ import annotations
+
+import shlex
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from src import config
+from src.display import configure_logging
+from src.infrastructure.openproject.rails_console_client import RailsConsoleError
+
+logger = configure_logging("INFO", None)
+
+_RUBY_DIR = Path(__file__).resolve().parents[2] / "ruby"
+SERVER_SCRIPT_LOCAL = _RUBY_DIR / "j2o_prefork_server.rb"
+SERVER_SCRIPT_CONTAINER = Path("/tmp/j2o_prefork_server.rb")
+CLIENT_SCRIPT_LOCAL = _RUBY_DIR / "j2o_prefork_client.rb"
+CLIENT_SCRIPT_CONTAINER = Path("/tmp/j2o_prefork_client.rb")
+SOCKET_PATH = "/tmp/j2o_prefork.sock"
+READY_PATH = f"{SOCKET_PATH}.ready"
+LOG_PATH = "/tmp/j2o_prefork.log"
+
+# Rails boot inside the OpenProject container routinely takes 10-40s.
+DEFAULT_BOOT_TIMEOUT = 240
+DEFAULT_MAX_CHILDREN = 4
+
+# Exit status of the client when the server is unreachable (EX_TEMPFAIL).
+UNAVAILABLE_EXIT = 75
+
+
+class RailsPreforkError(RailsConsoleError):
+    """The prefork server could not be started or reached."""
+
+
+def prefork_runner_enabled() -> bool:
+    """Whether runner calls should go through the preforked server."""
+    return config.migration_flag("J2O_RAILS_PREFORK", "rails_prefork_runner")
+
+
+def cold_runner_command(target: str) -> str:
+    """Classic ``bundle exec rails runner`` command for ``target`` (path or quoted code)."""
+    return f"(cd /app || cd /opt/openproject) && bundle exec rails runner {target}"
+
+
+class RailsPreforkServer:
+    """Starts, probes and addresses the preforked Rails server in one container."""
+
+    def __init__(
+        self,
+        docker_client: Any,
+        *,
+        boot_timeout: int = DEFAULT_BOOT_TIMEOUT,
+        max_children: int = DEFAULT_MAX_CHILDREN,
+    ) -> None:
+        """Initialize the handle (nothing is started until :py:meth:`start`).
+
+        Args:
+            docker_client: ``DockerClient`` of the OpenProject container
+            boot_timeout: Maximum time to wait for the server's ready file
+            max_children: Scripts the server runs concurrently
+
+        """
+        self._docker = docker_client
+        self.boot_timeout = boot_timeout
+        self.max_children = max_children
+        self._ready = False
+        # A server that failed to boot isn't retried for the rest of the run.
+        self._boot_failed = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the server answered a ping since it was (re)started."""
+        return self._ready
+
+    def ping(self) -> bool:
+        """Ask the server for a liveness answer."""
+        try:
+            _stdout, _stderr, rc = self._docker.execute_command(
+                f"ruby {CLIENT_SCRIPT_CONTAINER.as_posix()} --ping",
+                timeout=15,
+            )
+        except Exception as e:
+            logger.debug("Prefork server ping failed: %s", e)
+            return False
+        return rc == 0
+
+    def start(self) -> None:
+        """Make sure a server is running, booting one if needed.
+
+        Raises:
+            RailsPreforkError: If the server does not become ready in time
+
+        """
+        with self._lock:
+            if self._ready:
+                return
+            if self._boot_failed:
+                msg = "Rails prefork server failed to boot earlier in this run"
+                raise RailsPreforkError(msg)
+            self._docker.transfer_files_to_container(
+                [
+                    (SERVER_SCRIPT_LOCAL, SERVER_SCRIPT_CONTAINER),
+                    (CLIENT_SCRIPT_LOCAL, CLIENT_SCRIPT_CONTAINER),
+                ],
+            )
+            if self.ping():
+                logger.info("Reusing running Rails prefork server (%s)", SOCKET_PATH)
+                self._ready = True
+                return
+
+            logger.info("Booting Rails prefork server in the container")
+            started = time.monotonic()
+            boot = shlex.quote(cold_runner_command(SERVER_SCRIPT_CONTAINER.as_posix()))
+            self._docker.execute_command(
+                f"rm -f {READY_PATH}; nohup bash -c {boot} > {LOG_PATH} 2>&1 < /dev/null &",
+                timeout=30,
+                env={"J2O_PREFORK_MAX_CHILDREN": str(self.max_children)},
+            )
+            deadline = started + self.boot_timeout
+            while time.monotonic() < deadline:
+                if self._docker.check_file_exists_in_container(READY_PATH) and self.ping():
+                    self._ready = True
+                    logger.success(
+                        "Rails prefork server ready after %.1fs (max_children=%d)",
+                        time.monotonic() - started,
+                        self.max_children,
+                    )
+                    return
+                time.sleep(1.0)
+
+            tail = ""
+            try:
+                tail, _stderr, _rc = self._docker.execute_command(f"tail -n 20 {LOG_PATH}", timeout=10)
+            except Exception:
+                pass
+            self._boot_failed = True
+            msg = f"Rails prefork server not ready after {self.boot_timeout}s: {tail.strip()[-500:]}"
+            raise RailsPreforkError(msg)
+
+    def runner_command(self, script_path: str | None = None, *, code: str | None = None) -> str:
+        """Command that runs ``script_path`` (or inline ``code``) in a forked child.
+
+        Raises:
+            RailsPreforkError: If the server cannot be started
+            ValueError: If neither or both of ``script_path`` and ``code`` are given
+
+        """
+        if (script_path is None) == (code is None):
+            msg = "Pass exactly one of script_path or code"
+            raise ValueError(msg)
+        self.start()
+        target = f"-e {shlex.quote(code)}" if code is not None else shlex.quote(str(script_path))
+        return f"ruby {CLIENT_SCRIPT_CONTAINER.as_posix()} {target}"
+
+    def mark_unavailable(self) -> None:
+        """Forget readiness (e.g. after a call exited with :py:data:`UNAVAILABLE_EXIT`)."""
+        with self._lock:
+            self._ready = False
+
+    def stop(self) -> None:
+        """Shut the server down."""
+        with self._lock:
+            try:
+                self._docker.execute_command(
+                    f"ruby {CLIENT_SCRIPT_CONTAINER.as_posix()} --shutdown",
+                    timeout=15,
+                )
+            except Exception as e:
+                logger.debug("Prefork server shutdown failed: %s", e)
+            self._ready = False
@@ -0,0 +1,340 @@
+r"""RailsRpcWorker.
+
+Persistent in-container Ruby worker for executing Rails scripts without the
+tmux ``send-keys`` / ``capture-pane`` round trips.
+
+The worker (``src/ruby/j2o_rpc_worker.rb``) is started once per run through a
+single ``ssh <host> docker exec -i <container> bundle exec rails runner``
+process and then kept alive. Each call is one framed request/response pair on
+that process' stdin/stdout::
+
+    J2O-RPC <payload byte length>\n<JSON payload>
+
+so completion is signalled by the response frame itself — no polling, no
+marker scraping, no ANSI cleanup. Script output (everything the Ruby code
+``puts``) is captured per call inside the worker and returned in the
+response's ``stdout`` field.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import shlex
+import subprocess
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import IO, Any
+
+from src.display import configure_logging
+from src.infrastructure.openproject.rails_console_client import RailsConsoleError, RubyError
+
+logger = configure_logging("INFO", None)
+
+FRAME_PREFIX = b"J2O-RPC "
+
+# Location of the worker script locally and inside the container.
+WORKER_SCRIPT_LOCAL = Path(__file__).resolve().parents[2] / "ruby" / "j2o_rpc_worker.rb"
+WORKER_SCRIPT_CONTAINER = Path("/tmp/j2o_rpc_worker.rb")
+
+# Rails boot inside the OpenProject container routinely takes 10-40s.
+DEFAULT_BOOT_TIMEOUT = 240
+
+
+class RailsRpcError(RailsConsoleError):
+    """Error in the RPC worker transport (process died, frame corrupt, timeout)."""
+
+
+def encode_frame(payload: dict[str, Any]) -> bytes:
+    """Encode a request/response dict as one length-prefixed frame."""
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    return FRAME_PREFIX + str(len(body)).encode("ascii") + b"\n" + body
+
+
+def read_frame(stream: IO[bytes]) -> dict[str, Any] | None:
+    """Read one frame from ``stream``; returns ``None`` on EOF.
+
+    Non-frame lines (Rails boot warnings that slipped onto stdout before the
+    worker took over the descriptor) are skipped.
+
+    Raises:
+        RailsRpcError: If a frame header is malformed or the payload is truncated.
+
+    """
+    while True:
+        header = stream.readline()
+        if not header:
+            return None
+        if not header.startswith(FRAME_PREFIX):
+            logger.debug("Skipping non-frame worker output: %r", header[:200])
+            continue
+        try:
+            length = int(header[len(FRAME_PREFIX) :].strip())
+        except ValueError as e:
+            msg = f"Malformed RPC frame header: {header[:80]!r}"
+            raise RailsRpcError(msg) from e
+        body = stream.read(length)
+        if body is None or len(body) < length:
+            msg = f"Truncated RPC frame: expected {length} bytes, got {len(body or b'')}"
+            raise RailsRpcError(msg)
+        try:
+            return json.loads(body.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            msg = f"Invalid RPC frame payload: {e}"
+            raise RailsRpcError(msg) from e
+
+
+class RailsRpcWorker:
+    """Client side of the persistent Rails RPC worker.
+
+    Thread-safe: calls are serialised on an internal lock, matching the single
+    Rails process on the other end.
+    """
+
+    def __init__(
+        self,
+        command: list[str],
+        *,
+        call_timeout: int = 180,
+        boot_timeout: int = DEFAULT_BOOT_TIMEOUT,
+        name: str = "rpc-0",
+    ) -> None:
+        """Initialize the worker client (the process is started lazily).
+
+        Args:
+            command: Full local argv that starts the worker (ssh + docker exec -i + rails runner)
+            call_timeout: Default per-call timeout in seconds
+            boot_timeout: Maximum time to wait for the worker's ready frame
+            name: Label used in logs and utilisation stats
+
+        """
+        self.command = command
+        self.call_timeout = call_timeout
+        self.boot_timeout = boot_timeout
+        self.name = name
+        self._process: subprocess.Popen[bytes] | None = None
+        self._responses: queue.Queue[dict[str, Any] | BaseException | None] = queue.Queue()
+        self._stderr_tail: deque[str] = deque(maxlen=200)
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self.calls = 0
+        self.busy_seconds = 0.0
+
+    @classmethod
+    def for_container(
+        cls,
+        ssh_base_command: list[str],
+        container_name: str,
+        **kwargs: Any,
+    ) -> RailsRpcWorker:
+        """Build a worker that runs inside ``container_name`` via SSH + ``docker exec -i``."""
+        remote = f"docker exec -i {shlex.quote(container_name)} bash -c " + shlex.quote(
+            f"(cd /app || cd /opt/openproject) && exec bundle exec rails runner {WORKER_SCRIPT_CONTAINER.as_posix()}",
+        )
+        return cls([*ssh_base_command, remote], **kwargs)
+
+    # ── lifecycle ─────────────────────────────────────────────────────────
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the worker process is alive."""
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> None:
+        """Start the worker process and wait for its ready frame.
+
+        Raises:
+            RailsRpcError: If the worker exits or does not become ready in time.
+
+        """
+        if self.is_running:
+            return
+        self._responses = queue.Queue()
+        logger.info("Starting Rails RPC worker %s", self.name)
+        started = time.monotonic()
+        self._process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        # Pumps get the process and queue explicitly so a pump outliving a
+        # restarted worker can never feed the new worker's queue.
+        threading.Thread(
+            target=self._pump_stdout,
+            args=(self._process, self._responses),
+            name=f"{self.name}-stdout",
+            daemon=True,
+        ).start()
+        threading.Thread(
+            target=self._pump_stderr,
+            args=(self._process,),
+            name=f"{self.name}-stderr",
+            daemon=True,
+        ).start()
+
+        try:
+            ready = self._next_response(self.boot_timeout)
+        except RailsRpcError:
+            self.close()
+            raise
+        if ready.get("status") != "ready":
+            self.close()
+            msg = f"Rails RPC worker {self.name} sent unexpected first frame: {ready!r}"
+            raise RailsRpcError(msg)
+        logger.success(
+            "Rails RPC worker %s ready after %.1fs (pid=%s)",
+            self.name,
+            time.monotonic() - started,
+            ready.get("pid"),
+        )
+
+    def close(self) -> None:
+        """Ask the worker to exit, then make sure the local process is gone."""
+        process = self._process
+        if process is None:
+            return
+        try:
+            if process.poll() is None and process.stdin is not None:
+                process.stdin.write(encode_frame({"id": -1, "op": "shutdown"}))
+                process.stdin.flush()
+                process.stdin.close()
+            process.wait(timeout=5)
+        except Exception:
+            process.kill()
+        finally:
+            self._process = None
+
+    # ── calls ─────────────────────────────────────────────────────────────
+
+    def call(
+        self,
+        script: str,
+        *,
+        data: Any = None,
+        timeout: int | None = None,
+        start_marker: str | None = None,
+        end_marker: str | None = None,
+        inspect: bool = False,
+    ) -> dict[str, Any]:
+        """Evaluate ``script`` in the worker with ``input_data`` bound to ``data``.
+
+        Args:
+            script: Ruby source to evaluate
+            data: JSON-serialisable value exposed to the script as ``input_data``
+            timeout: Per-call timeout in seconds (default: ``call_timeout``)
+            start_marker: Value for ``$j2o_start_marker`` during the call
+            end_marker: Value for ``$j2o_end_marker`` during the call
+            inspect: Include ``value.inspect`` of the script's result
+
+        Returns:
+            Response dict with ``stdout`` and, if requested, ``value``
+
+        Raises:
+            RubyError: If the script raised inside Rails
+            RailsRpcError: On transport failure or timeout
+
+        """
+        effective_timeout = timeout if timeout is not None else self.call_timeout
+        with self._lock:
+            self.start()
+            request_id = self._next_id
+            self._next_id += 1
+            request = {
+                "id": request_id,
+                "op": "eval",
+                "script": script,
+                "data": data,
+                "start_marker": start_marker,
+                "end_marker": end_marker,
+                "inspect": inspect,
+            }
+            began = time.monotonic()
+            try:
+                stdin = self._process.stdin if self._process is not None else None
+                if stdin is None:
+                    msg = f"Rails RPC worker {self.name} has no stdin"
+                    raise BrokenPipeError(msg)
+                stdin.write(encode_frame(request))
+                stdin.flush()
+            except (BrokenPipeError, OSError) as e:
+                self.close()
+                msg = f"Rails RPC worker {self.name} is not accepting requests: {e}"
+                raise RailsRpcError(msg) from e
+
+            try:
+                response = self._next_response(effective_timeout)
+            except RailsRpcError:
+                # A hung or dead worker can't be resynchronised; restart on next call.
+                self.close()
+                raise
+            finally:
+                self.calls += 1
+                self.busy_seconds += time.monotonic() - began
+
+        if response.get("id") != request_id:
+            self.close()
+            msg = f"Rails RPC worker {self.name} answered request {response.get('id')} instead of {request_id}"
+            raise RailsRpcError(msg)
+        if response.get("status") == "error":
+            msg = f"Ruby error: {response.get('error_class')}: {response.get('message')}"
+            raise RubyError(msg)
+        return response
+
+    def execute(self, command: str, timeout: int | None = None, *, suppress_output: bool = False) -> str:
+        """Console-compatible execute: captured output plus ``result.inspect``.
+
+        Mirrors :py:meth:`RailsConsoleClient.execute` so callers can switch
+        between the tmux console and the worker without changing parsing.
+        """
+        response = self.call(command, timeout=timeout, inspect=not suppress_output)
+        if suppress_output:
+            return ""
+        parts = [response.get("stdout", "").strip()]
+        if response.get("value") is not None:
+            parts.append(str(response["value"]))
+        return "\n".join(p for p in parts if p).strip()
+
+    def stderr_tail(self, lines: int = 20) -> str:
+        """Return the last ``lines`` lines the worker wrote to stderr."""
+        return "\n".join(list(self._stderr_tail)[-lines:])
+
+    # ── internals ─────────────────────────────────────────────────────────
+
+    def _next_response(self, timeout: float) -> dict[str, Any]:
+        try:
+            item = self._responses.get(timeout=timeout)
+        except queue.Empty:
+            msg = f"Rails RPC worker {self.name} did not respond within {timeout}s"
+            raise RailsRpcError(msg) from None
+        if item is None:
+            msg = f"Rails RPC worker {self.name} exited: {self.stderr_tail(5)}"
+            raise RailsRpcError(msg)
+        if isinstance(item, BaseException):
+            msg = f"Rails RPC worker {self.name} sent a corrupt frame: {item}"
+            raise RailsRpcError(msg) from item
+        return item
+
+    @staticmethod
+    def _pump_stdout(
+        process: subprocess.Popen[bytes],
+        responses: queue.Queue[dict[str, Any] | BaseException | None],
+    ) -> None:
+        if process.stdout is None:
+            return
+        try:
+            while True:
+                frame = read_frame(process.stdout)
+                responses.put(frame)
+                if frame is None:
+                    return
+        except Exception as e:
+            responses.put(e)
+
+    def _pump_stderr(self, process: subprocess.Popen[bytes]) -> None:
+        if process.stderr is None:
+            return
+        for raw in iter(process.stderr.readline, b""):
+            self._stderr_tail.append(raw.decode("utf-8", errors="replace").rstrip())
@@ -0,0 +1,191 @@
+"""RailsScriptCache.
+
+Content-addressed cache of Ruby scripts inside the OpenProject container.
+
+A script is identified by the SHA-256 of its source. The first use uploads
+``/tmp/j2o_scripts/<sha>.rb``, a wrapper that registers the script body as a
+lambda in the ``J2O::Scripts`` module::
+
+    J2O::Scripts.register('<sha>', lambda do |input_data|
+      <script body>
+    end)
+
+Later calls only reference the script by id (``J2O::Scripts.call``), so the
+per-call transfer shrinks to the JSON input and a Rails process that already
+loaded the script skips re-reading and re-parsing it. A process that has not
+seen the script yet (fresh console, runner, RPC worker) ``load``s the cached
+file once on demand.
+
+The upload registry lives in this process: it assumes the container's
+``/tmp`` survives for the run; call :py:meth:`RailsScriptCache.invalidate`
+after a container restart.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any
+
+from src.display import configure_logging
+
+logger = configure_logging("INFO", None)
+
+CONTAINER_SCRIPT_DIR = Path("/tmp/j2o_scripts")
+
+# Shared by every cached script; re-evaluating it is harmless.
+_REGISTRY_PRELUDE = """require 'stringio'
+
+module J2O
+  module Scripts
+    REGISTRY = {} unless const_defined?(:REGISTRY, false)
+
+    def self.register(sha, callable)
+      REGISTRY[sha] = callable
+    end
+
+    def self.loaded?(sha)
+      REGISTRY.key?(sha)
+    end
+
+    def self.call(sha, input_data = nil)
+      REGISTRY.fetch(sha).call(input_data)
+    end
+
+    # Run a script with $stdout captured. The JSON it prints between
+    # $j2o_start_marker and $j2o_end_marker goes to +path+ (tmp + rename);
+    # the rest is echoed back, followed by "<done_marker>:1" (or ":0" when
+    # no payload was written).
+    def self.call_to_file(sha, input_data, path, done_marker)
+      console = $stdout
+      buffer = StringIO.new
+      written = false
+      $stdout = buffer
+      begin
+        call(sha, input_data)
+      ensure
+        $stdout = console
+        text = buffer.string
+        start_marker = $j2o_start_marker.to_s
+        end_marker = $j2o_end_marker.to_s
+        from = start_marker.empty? ? nil : text.rindex(start_marker)
+        to = from && text.index(end_marker, from + start_marker.length)
+        if to
+          begin
+            File.write("#{path}.tmp", text[(from + start_marker.length)...to].strip)
+            File.rename("#{path}.tmp", path)
+            written = true
+            text = text[0...from] + text[(to + end_marker.length)..]
+          rescue StandardError => e
+            console.puts("j2o: result file #{path} not written: #{e.class}: #{e.message}")
+          end
+        end
+        console.print(text.length > 2000 ? text[-2000..] : text)
+        console.puts("#{done_marker}:#{written ? 1 : 0}")
+      end
+      nil
+    end
+  end
+end
+"""
+
+
+def script_digest(source: str) -> str:
+    """Return the cache id of ``source`` (first 24 hex chars of its SHA-256)."""
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()[:24]
+
+
+def cached_script_path(sha: str) -> Path:
+    """Return the container path of the cached script ``sha``."""
+    return CONTAINER_SCRIPT_DIR / f"{sha}.rb"
+
+
+def render_cached_script(sha: str, source: str) -> str:
+    """Wrap ``source`` so that loading it registers the script under ``sha``."""
+    return (
+        f"# j2o cached script {sha}\n"
+        f"{_REGISTRY_PRELUDE}\n"
+        f"J2O::Scripts.register('{sha}', lambda do |input_data|\n"
+        f"{source.rstrip()}\n"
+        "end)\n"
+    )
+
+
+def call_expression(sha: str, input_expr: str = "nil") -> str:
+    """Ruby expression running cached script ``sha`` with ``input_expr`` as ``input_data``.
+
+    Loads the cached file first when the current Rails process has not
+    registered the script yet. Evaluates to ``nil`` so consoles don't echo
+    the script's return value.
+    """
+    path = cached_script_path(sha).as_posix()
+    return (
+        f"load('{path}') unless defined?(J2O::Scripts) && J2O::Scripts.loaded?('{sha}'); "
+        f"J2O::Scripts.call('{sha}', {input_expr}); nil"
+    )
+
+
+def result_call_expression(sha: str, input_expr: str, result_path: str, done_marker: str) -> str:
+    """Like :py:func:`call_expression`, but the script's marked JSON goes to ``result_path``.
+
+    The console then only shows the script's other output and a
+    ``<done_marker>:1`` line (``:0`` when the script printed no payload);
+    see ``J2O::Scripts.call_to_file``.
+    """
+    path = cached_script_path(sha).as_posix()
+    return (
+        f"load('{path}') unless defined?(J2O::Scripts) && J2O::Scripts.loaded?('{sha}') "
+        "&& J2O::Scripts.respond_to?(:call_to_file); "
+        f"J2O::Scripts.call_to_file('{sha}', {input_expr}, '{result_path}', '{done_marker}'); nil"
+    )
+
+
+class RailsScriptCache:
+    """Tracks which scripts are already present in the container and uploads the rest."""
+
+    def __init__(self, client: Any) -> None:
+        """Initialize the cache for ``client``'s container."""
+        self._client = client
+        self._uploaded: set[str] = set()
+        self._lock = threading.Lock()
+
+    def ensure(self, source: str, *, extra_uploads: list[tuple[Path, Path]] | None = None) -> str:
+        """Make ``source`` available in the container and return its id.
+
+        ``extra_uploads`` (e.g. the call's JSON input) travel in the same
+        batched transfer, so a cache miss costs no extra round trip and a hit
+        moves only the extra files.
+
+        Raises:
+            FileTransferError: If the upload fails.
+
+        """
+        sha = script_digest(source)
+        uploads = list(extra_uploads or [])
+        with self._lock:
+            cached = sha in self._uploaded
+        if not cached:
+            local_dir = Path(self._client.file_manager.data_dir) / "script_cache"
+            local_dir.mkdir(parents=True, exist_ok=True)
+            local_path = local_dir / f"{sha}.rb"
+            if not local_path.exists():
+                local_path.write_text(render_cached_script(sha, source), encoding="utf-8")
+            uploads.insert(0, (local_path, cached_script_path(sha)))
+            logger.debug("Uploading cached Rails script %s (%d bytes)", sha, len(source))
+        if uploads:
+            self._client.transfer_files_to_container(uploads)
+        if not cached:
+            with self._lock:
+                self._uploaded.add(sha)
+        return sha
+
+    def is_uploaded(self, source: str) -> bool:
+        """Whether ``source`` is already cached in the container."""
+        with self._lock:
+            return script_digest(source) in self._uploaded
+
+    def invalidate(self) -> None:
+        """Forget all uploads (e.g. after the container was recreated)."""
+        with self._lock:
+            self._uploaded.clear()
@@ -0,0 +1,268 @@
+"""RailsSessionPool.
+
+A pool of N independent Rails execution sessions so that the thread pools in
+the migration (time-entry creation, existing-WP batch updates, ...) are no
+longer serialised on the single tmux console that ``OpenProjectClient`` used
+to be bound to.
+
+A session is either
+
+* a tmux Rails console (``RailsConsoleClient``) — session 1 is the client's
+  own console, sessions 2..N are ``<tmux_session_name>_2`` ..
+  ``<tmux_session_name>_N`` (start them with
+  ``scripts/start_rails_tmux.py --sessions N``), each with its own marker
+  namespace; or
+* a persistent RPC worker (``RailsRpcWorker``) when the RPC worker is
+  enabled — extra workers are plain processes, so nothing has to be
+  pre-started.
+
+Work is routed through a thread-local binding: inside ``pool.session()`` (or
+a batch run by ``pool.dispatch``) ``client.rails_client`` and
+``client.rpc_worker`` resolve to the session held by the current thread, so
+every existing service method runs on that session unchanged.
+
+Size comes from ``J2O_RAILS_SESSIONS`` or ``migration.rails_sessions``
+(default 1, i.e. the previous single-console behaviour).
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+from src import config
+from src.display import configure_logging
+from src.infrastructure.openproject.rails_console_client import RailsConsoleClient, TmuxSessionError
+from src.infrastructure.openproject.rails_rpc_worker import RailsRpcWorker
+
+logger = configure_logging("INFO", None)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Hard cap: each session is a full Rails process holding DB connections.
+MAX_RAILS_SESSIONS = 16
+
+
+def configured_session_count() -> int:
+    """Return the requested pool size (``J2O_RAILS_SESSIONS`` / ``migration.rails_sessions``)."""
+    raw = os.environ.get("J2O_RAILS_SESSIONS")
+    if raw is None:
+        raw = config.migration_config.get("rails_sessions", 1)
+    try:
+        return max(1, min(MAX_RAILS_SESSIONS, int(raw)))
+    except TypeError, ValueError:
+        logger.warning("Ignoring invalid Rails session count %r; using 1", raw)
+        return 1
+
+
+class RailsSession:
+    """One Rails executor plus its utilisation counters."""
+
+    def __init__(
+        self,
+        name: str,
+        rails_client: RailsConsoleClient | None = None,
+        rpc_worker: RailsRpcWorker | None = None,
+    ) -> None:
+        """Initialize a session.
+
+        Args:
+            name: Label used in logs and utilisation stats
+            rails_client: Console bound while the session is held (``None``: keep the client's own)
+            rpc_worker: RPC worker bound while the session is held (``None``: keep the client's own)
+
+        """
+        self.name = name
+        self.rails_client = rails_client
+        self.rpc_worker = rpc_worker
+        self.calls = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+
+    def close(self) -> None:
+        """Stop the session's own RPC worker, if any."""
+        if self.rpc_worker is not None:
+            self.rpc_worker.close()
+
+
+class RailsSessionPool:
+    """Fixed set of Rails sessions handed out to worker threads."""
+
+    def __init__(self, sessions: list[RailsSession]) -> None:
+        """Initialize the pool.
+
+        Args:
+            sessions: Sessions to pool; an empty list gives an inline pool that
+                runs everything on the caller's thread and default session
+
+        """
+        self.sessions = sessions
+        self._free: queue.Queue[RailsSession] = queue.Queue()
+        for session in sessions:
+            self._free.put(session)
+        self._local = threading.local()
+        self._created = time.monotonic()
+
+    @classmethod
+    def from_client(cls, client: Any, size: int | None = None) -> RailsSessionPool:
+        """Build a pool around ``client``'s primary console/worker.
+
+        Extra console sessions that do not exist are skipped with a warning,
+        so a misconfigured size degrades to fewer sessions instead of failing.
+        """
+        size = configured_session_count() if size is None else max(1, size)
+        sessions = [RailsSession("rails-1")]
+        if size == 1:
+            return cls(sessions)
+
+        use_rpc = client.rails_runner.rpc_worker_enabled()
+        if use_rpc:
+            # Uploads the worker script once; extra workers start lazily on first call.
+            client.rails_runner.get_rpc_worker()
+        for index in range(2, size + 1):
+            name = f"rails-{index}"
+            if use_rpc:
+                worker = RailsRpcWorker.for_container(
+                    client.ssh_client.get_ssh_base_command(),
+                    str(client.container_name),
+                    call_timeout=client.command_timeout,
+                    name=f"rpc-{index}",
+                )
+                sessions.append(RailsSession(name, rpc_worker=worker))
+                continue
+            tmux_name = f"{client.tmux_session_name}_{index}"
+            try:
+                console = RailsConsoleClient(
+                    tmux_session_name=tmux_name,
+                    command_timeout=client.command_timeout,
+                    marker_namespace=f"S{index}_",
+                )
+            except TmuxSessionError as e:
+                logger.warning(
+                    "Rails session pool: %s unavailable (%s); continuing with %d session(s)",
+                    tmux_name,
+                    e,
+                    len(sessions),
+                )
+                break
+            sessions.append(RailsSession(name, rails_client=console))
+
+        logger.info("Rails session pool ready with %d session(s)", len(sessions))
+        return cls(sessions)
+
+    @property
+    def size(self) -> int:
+        """Number of sessions that can run concurrently."""
+        return max(1, len(self.sessions))
+
+    def current(self) -> RailsSession | None:
+        """Return the session held by the calling thread, if any."""
+        return getattr(self._local, "session", None)
+
+    @contextmanager
+    def session(self) -> Iterator[RailsSession | None]:
+        """Hold a free session for the duration of the block.
+
+        Re-entrant: a thread that already holds a session keeps using it.
+        """
+        held = self.current()
+        if held is not None or not self.sessions:
+            yield held
+            return
+        session = self._free.get()
+        self._local.session = session
+        began = time.monotonic()
+        failed = False
+        try:
+            yield session
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            session.calls += 1
+            session.errors += int(failed)
+            session.busy_seconds += time.monotonic() - began
+            self._local.session = None
+            self._free.put(session)
+
+    def dispatch(
+        self,
+        items: Iterable[T],
+        fn: Callable[[T], R],
+    ) -> Iterator[tuple[int, R | None, Exception | None]]:
+        """Run ``fn`` over independent ``items``, one free session per item.
+
+        Items must not depend on each other (e.g. different projects or
+        disjoint work package ranges). With a single session everything runs
+        inline on the calling thread.
+
+        Yields:
+            ``(index, result, error)`` in completion order; exactly one of
+            ``result``/``error`` is meaningful per item
+
+        """
+        work = list(items)
+
+        def _run(item: T) -> R:
+            with self.session():
+                return fn(item)
+
+        if self.size == 1 or len(work) <= 1:
+            for index, item in enumerate(work):
+                try:
+                    yield index, _run(item), None
+                except Exception as e:
+                    yield index, None, e
+            return
+
+        with ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="rails-session") as executor:
+            futures = {executor.submit(_run, item): index for index, item in enumerate(work)}
+            for future in as_completed(futures):
+                try:
+                    yield futures[future], future.result(), None
+                except Exception as e:
+                    yield futures[future], None, e
+
+    def utilisation(self) -> list[dict[str, Any]]:
+        """Per-session call counts and share of pool lifetime spent busy."""
+        elapsed = max(time.monotonic() - self._created, 1e-9)
+        return [
+            {
+                "name": s.name,
+                "calls": s.calls,
+                "errors": s.errors,
+                "busy_seconds": round(s.busy_seconds, 3),
+                "utilisation": round(min(1.0, s.busy_seconds / elapsed), 3),
+            }
+            for s in self.sessions
+        ]
+
+    def log_utilisation(self) -> None:
+        """Log one line per session with its utilisation."""
+        for row in self.utilisation():
+            logger.info(
+                "Rails session %s: %d call(s), %d error(s), busy %.1fs (%.0f%%)",
+                row["name"],
+                row["calls"],
+                row["errors"],
+                row["busy_seconds"],
+                row["utilisation"] * 100,
+            )
+
+    def close(self) -> None:
+        """Stop the sessions' own RPC workers (the primary session is left alone)."""
+        for session in self.sessions:
+            session.close()
+
+
+def session_pool_for(client: Any) -> RailsSessionPool:
+    """Return ``client``'s session pool, or an inline pool for clients without one."""
+    pool = getattr(client, "rails_sessions", None)
+    return pool if isinstance(pool, RailsSessionPool) else RailsSessionPool([])
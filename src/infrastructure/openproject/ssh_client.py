@@ -9,11 +9,12 @@ This is the foundation of the layered client architecture:
 """
 
 import subprocess
+import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from shlex import quote
-from typing import Any
+from typing import IO, Any
 
 from src.display import configure_logging
 from src.utils.file_manager import FileManager
@@ -359,6 +360,176 @@ class SSHClient:
         msg = "Command failed after all retry attempts"
         raise RuntimeError(msg)  # Fallback in case of logic error
 
+    def execute_command_with_input(
+        self,
+        command: str,
+        write_input: Callable[[IO[bytes]], None],
+        timeout: int | None = None,
+        *,
+        check: bool = True,
+    ) -> tuple[str, str, int]:
+        """Execute a command on the remote host, streaming data to its stdin.
+
+        ``write_input`` is called with the process' stdin and may write any
+        amount of data (e.g. a tar stream); stdin is closed afterwards. Not
+        retried, since the input stream cannot be replayed.
+
+        Args:
+            command: Command to execute
+            write_input: Callback writing the command's input
+            timeout: Timeout in seconds for the command to finish after input is written
+            check: Whether to check the return code
+
+        Returns:
+            Tuple of (stdout, stderr, returncode)
+
+        Raises:
+            SSHCommandError: If check=True and the command fails
+            subprocess.TimeoutExpired: If the command times out
+
+        """
+        if timeout is None:
+            timeout = self.operation_timeout
+
+        cmd = self.get_ssh_base_command()
+        cmd.append(command)
+        logger.debug("Executing SSH command with streamed input: %s", " ".join(cmd))
+
+        process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        captured: dict[str, bytes] = {}
+
+        def _drain(name: str, stream: IO[bytes]) -> None:
+            captured[name] = stream.read()
+
+        drains = [
+            threading.Thread(target=_drain, args=("stdout", process.stdout), daemon=True),
+            threading.Thread(target=_drain, args=("stderr", process.stderr), daemon=True),
+        ]
+        for drain in drains:
+            drain.start()
+
+        try:
+            write_input(process.stdin)  # type: ignore[arg-type]
+        except BrokenPipeError:
+            # Remote side exited early; its return code and stderr tell why.
+            logger.debug("Remote command closed stdin early: %s", command)
+        finally:
+            try:
+                process.stdin.close()  # type: ignore[union-attr]
+            except BrokenPipeError:
+                pass
+
+        try:
+            returncode = process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            logger.exception("SSH command timed out after %d seconds", timeout)
+            raise
+        for drain in drains:
+            drain.join(timeout=5)
+
+        stdout = captured.get("stdout", b"").decode("utf-8", errors="replace")
+        stderr = captured.get("stderr", b"").decode("utf-8", errors="replace")
+        if check and returncode != 0:
+            raise SSHCommandError(command=command, returncode=returncode, stdout=stdout, stderr=stderr)
+        return stdout, stderr, returncode
+
+    def stream_command_output(
+        self,
+        command: str,
+        write_output: Callable[[bytes], object],
+        timeout: int | None = None,
+        *,
+        check: bool = True,
+    ) -> tuple[str, int]:
+        """Execute a command on the remote host, streaming its stdout to ``write_output``.
+
+        stdout is handed over in chunks as it arrives (e.g. into a
+        decompressor), so large outputs are never held in memory. Not
+        retried, since a partially consumed stream cannot be replayed.
+
+        Args:
+            command: Command to execute
+            write_output: Callback receiving each stdout chunk
+            timeout: Timeout in seconds for the whole command
+            check: Whether to check the return code
+
+        Returns:
+            Tuple of (stderr, returncode)
+
+        Raises:
+            SSHCommandError: If check=True and the command fails
+            subprocess.TimeoutExpired: If the command times out
+
+        """
+        outcome: dict[str, Any] = {}
+        for chunk in self.iter_command_output(command, timeout, outcome=outcome):
+            write_output(chunk)
+        stderr, returncode = outcome["stderr"], outcome["returncode"]
+        if check and returncode != 0:
+            raise SSHCommandError(command=command, returncode=returncode, stdout="", stderr=stderr)
+        return stderr, returncode
+
+    def iter_command_output(
+        self,
+        command: str,
+        timeout: int | None = None,
+        *,
+        outcome: dict[str, Any] | None = None,
+    ) -> Iterator[bytes]:
+        """Execute a command on the remote host and yield its stdout in chunks.
+
+        The consumer pulls output as it arrives; closing the generator early
+        kills the remote command. Once stdout is exhausted, ``outcome``
+        (when given) receives ``stderr`` and ``returncode``; a non-zero
+        return code is *not* raised, so callers decide how to treat it.
+
+        Raises:
+            subprocess.TimeoutExpired: If the command times out
+
+        """
+        if timeout is None:
+            timeout = self.operation_timeout
+
+        cmd = self.get_ssh_base_command()
+        cmd.append(command)
+        logger.debug("Executing SSH command with streamed output: %s", " ".join(cmd))
+
+        process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        captured: dict[str, bytes] = {}
+        timed_out = threading.Event()
+
+        def _drain_stderr() -> None:
+            captured["stderr"] = process.stderr.read()  # type: ignore[union-attr]
+
+        def _kill() -> None:
+            timed_out.set()
+            process.kill()
+
+        drain = threading.Thread(target=_drain_stderr, daemon=True)
+        drain.start()
+        timer = threading.Timer(timeout, _kill)
+        timer.start()
+        finished = False
+        try:
+            while chunk := process.stdout.read(65536):  # type: ignore[union-attr]
+                yield chunk
+            returncode = process.wait()
+            finished = True
+        finally:
+            timer.cancel()
+            if not finished:
+                process.kill()
+                process.wait()
+        drain.join(timeout=5)
+
+        if timed_out.is_set():
+            logger.error("SSH command timed out after %d seconds", timeout)
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        if outcome is not None:
+            outcome["stderr"] = captured.get("stderr", b"").decode("utf-8", errors="replace")
+            outcome["returncode"] = returncode
+
     def copy_file_to_remote(
         self,
         local_path: Path | str,
@@ -0,0 +1,216 @@
+"""TmuxOutputChannel.
+
+Event-driven view of a tmux pane's output, replacing ``capture-pane`` polling
+for marker detection.
+
+``tmux pipe-pane`` appends everything the pane prints to a local file; a
+reader thread tails that file, strips terminal escapes incrementally and
+wakes waiters (``threading.Condition``) as soon as new text arrives. A
+waiter only scans the text appended since its own mark, so detecting an end
+marker costs O(new output) instead of re-capturing and rescanning up to 2000
+scrollback lines every 200 ms — and there is no line wrapping to undo.
+
+Opt-in via ``J2O_TMUX_PIPE_PANE=1`` or ``migration.tmux_pipe_pane: true``.
+Note that ``pipe-pane`` replaces any pipe already attached to the pane (e.g.
+the log opened by ``scripts/start_rails_tmux.py``); the channel's own file
+then serves as the pane log.
+"""
+
+from __future__ import annotations
+
+import codecs
+import re
+import subprocess
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from src import config
+from src.display import configure_logging
+
+logger = configure_logging("INFO", None)
+
+# CSI, OSC and two-byte escapes emitted by IRB/Reline, plus stray control chars.
+_RE_ESCAPES = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)|\x1b[@-Z\\-_]")
+_RE_CONTROL = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]")
+
+# Bounded buffer: once exceeded, the oldest half is dropped.
+MAX_BUFFER_CHARS = 8 * 1024 * 1024
+
+# Reader back-off when the pipe file has no new bytes.
+_IDLE_SLEEP = 0.01
+
+
+def pipe_pane_enabled() -> bool:
+    """Whether console calls should use the pipe-pane channel."""
+    return config.migration_flag("J2O_TMUX_PIPE_PANE", "tmux_pipe_pane")
+
+
+def clean_terminal_text(text: str) -> tuple[str, str]:
+    """Strip terminal escapes/control chars from ``text``.
+
+    Returns:
+        ``(clean, pending)`` where ``pending`` is a trailing, possibly
+        incomplete escape sequence to prepend to the next chunk.
+
+    """
+    pending = ""
+    esc = text.rfind("\x1b")
+    if esc != -1 and len(text) - esc < 256 and not _RE_ESCAPES.match(text, esc):
+        text, pending = text[:esc], text[esc:]
+    clean = _RE_ESCAPES.sub("", text).replace("\r", "")
+    return _RE_CONTROL.sub("", clean), pending
+
+
+class TmuxOutputChannel:
+    """Tail of one tmux pane's output with marker waits."""
+
+    def __init__(self, tmux_path: str, target: str, log_path: Path) -> None:
+        """Initialize the channel (nothing is attached until :py:meth:`start`).
+
+        Args:
+            tmux_path: tmux executable
+            target: tmux target (session:window.pane)
+            log_path: Local append-only file the pane is piped into
+
+        """
+        self.tmux_path = tmux_path
+        self.target = target
+        self.log_path = log_path
+        self._text = ""
+        self._base = 0  # absolute offset of self._text[0]
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the reader thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> bool:
+        """Attach ``pipe-pane`` and start the reader; returns False if tmux refused."""
+        if self.is_running:
+            return True
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self.log_path.touch()
+        start_offset = self.log_path.stat().st_size
+        try:
+            subprocess.run(
+                [self.tmux_path, "pipe-pane", "-t", self.target, f"cat >> '{self.log_path.as_posix()}'"],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except (subprocess.SubprocessError, OSError) as e:
+            logger.warning("tmux pipe-pane failed for %s, using capture-pane polling: %s", self.target, e)
+            return False
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._tail,
+            args=(start_offset,),
+            name=f"tmux-pipe-{self.target}",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.debug("Piping tmux pane %s to %s", self.target, self.log_path)
+        return True
+
+    def stop(self) -> None:
+        """Detach ``pipe-pane`` and stop the reader."""
+        self._stop.set()
+        try:
+            subprocess.run([self.tmux_path, "pipe-pane", "-t", self.target], capture_output=True, check=False)
+        except subprocess.SubprocessError, OSError:
+            pass
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def mark(self) -> int:
+        """Return the current end-of-output offset (take it *before* sending a command)."""
+        with self._cond:
+            return self._base + len(self._text)
+
+    def text_since(self, mark: int) -> str:
+        """Return the cleaned output appended after ``mark``."""
+        with self._cond:
+            return self._text[max(0, mark - self._base) :]
+
+    def wait_for(
+        self,
+        marker: str,
+        since: int,
+        timeout: float,
+        *,
+        at_line_start: bool = False,
+        accept: Callable[[str, int], bool] | None = None,
+        abort: Callable[[str], bool] | None = None,
+    ) -> tuple[bool, str]:
+        """Block until ``marker`` is printed after ``since``.
+
+        Args:
+            marker: Text to wait for
+            since: Offset from :py:meth:`mark`
+            timeout: Maximum time to wait in seconds
+            at_line_start: Only accept occurrences starting a line (skips the
+                command echo, where the marker is preceded by ``puts "``)
+            accept: Extra check ``accept(text, index)`` on each occurrence
+            abort: Called with each new chunk; True stops waiting (e.g. fatal console error)
+
+        Returns:
+            ``(found, text)`` with all output since ``since``
+
+        """
+        deadline = time.monotonic() + timeout
+        scan_from = since
+        with self._cond:
+            while True:
+                text = self._text[max(0, since - self._base) :]
+                offset = max(0, since - self._base) + self._base  # absolute offset of text[0]
+                start = max(0, scan_from - offset - len(marker))
+                if abort is not None and abort(text[max(0, scan_from - offset) :]):
+                    return False, text
+                idx = text.find(marker, start)
+                while idx != -1:
+                    line_ok = not at_line_start or idx == 0 or text[idx - 1] == "\n"
+                    if line_ok and (accept is None or accept(text, idx)):
+                        return True, text
+                    idx = text.find(marker, idx + 1)
+                scan_from = offset + len(text)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.is_running:
+                    return False, text
+                self._cond.wait(remaining)
+
+    # ── reader ────────────────────────────────────────────────────────────
+
+    def _append(self, chunk: str) -> None:
+        with self._cond:
+            self._text += chunk
+            if len(self._text) > MAX_BUFFER_CHARS:
+                drop = len(self._text) // 2
+                self._text = self._text[drop:]
+                self._base += drop
+            self._cond.notify_all()
+
+    def _tail(self, offset: int) -> None:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        pending = ""
+        try:
+            with self.log_path.open("rb") as f:
+                f.seek(offset)
+                while not self._stop.is_set():
+                    raw = f.read(65536)
+                    if not raw:
+                        self._stop.wait(_IDLE_SLEEP)
+                        continue
+                    clean, pending = clean_terminal_text(pending + decoder.decode(raw))
+                    if clean:
+                        self._append(clean)
+        except OSError as e:
+            logger.warning("tmux pipe reader for %s stopped: %s", self.target, e)
+        finally:
+            with self._cond:
+                self._cond.notify_all()
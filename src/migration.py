@@ -478,6 +478,51 @@ class Migration:
         )
 
 
+COMPONENT_CLASSES: dict[str, type[BaseMigration]] = {
+    "users": UserMigration,
+    "user_mapping_backfill": UserMappingBackfillMigration,
+    "groups": GroupMigration,
+    "custom_fields": CustomFieldMigration,
+    "companies": CompanyMigration,
+    "projects": ProjectMigration,
+    "link_types": LinkTypeMigration,
+    "issue_types": IssueTypeMigration,
+    "status_types": StatusMigration,
+    "work_packages": WorkPackageMigration,
+    "work_packages_skeleton": WorkPackageSkeletonMigration,
+    "work_packages_content": WorkPackageContentMigration,
+    "time_entries": TimeEntryMigration,
+    "watchers": WatcherMigration,
+    "relations": RelationMigration,
+    "priorities": PriorityMigration,
+    "simpletasks": SimpleTasksMigration,
+    "resolutions": ResolutionMigration,
+    "labels": LabelsMigration,
+    "versions": VersionsMigration,
+    "components": ComponentsMigration,
+    "attachments": AttachmentsMigration,
+    "estimates": EstimatesMigration,
+    "affects_versions": AffectsVersionsMigration,
+    "security_levels": SecurityLevelsMigration,
+    "votes_reactions": VotesMigration,
+    "customfields_generic": CustomFieldsGenericMigration,
+    "story_points": StoryPointsMigration,
+    "sprint_epic": SprintEpicMigration,
+    "remote_links": RemoteLinksMigration,
+    "category_defaults": CategoryDefaultsMigration,
+    "attachment_provenance": AttachmentProvenanceMigration,
+    "attachment_recovery": AttachmentRecoveryMigration,
+    "wp_metadata_backfill": WpMetadataBackfillMigration,
+    "inline_refs": InlineRefsMigration,
+    "native_tags": NativeTagsMigration,
+    "accounts": AccountMigration,
+    "workflows": WorkflowMigration,
+    "agile_boards": AgileBoardMigration,
+    "admin_schemes": AdminSchemeMigration,
+    "reporting": ReportingMigration,
+}
+
+
 def _build_component_factories(
     jira_client: JiraClient,
     op_client: OpenProjectClient,
@@ -488,50 +533,28 @@ def _build_component_factories(
     when only a subset was requested.
     """
     return {
-        "users": lambda: UserMigration(jira_client=jira_client, op_client=op_client),
-        "user_mapping_backfill": lambda: UserMappingBackfillMigration(jira_client=jira_client, op_client=op_client),
-        "groups": lambda: GroupMigration(jira_client=jira_client, op_client=op_client),
-        "custom_fields": lambda: CustomFieldMigration(jira_client=jira_client, op_client=op_client),
-        "companies": lambda: CompanyMigration(jira_client=jira_client, op_client=op_client),
-        "projects": lambda: ProjectMigration(jira_client=jira_client, op_client=op_client),
-        "link_types": lambda: LinkTypeMigration(jira_client=jira_client, op_client=op_client),
-        "issue_types": lambda: IssueTypeMigration(jira_client=jira_client, op_client=op_client),
-        "status_types": lambda: StatusMigration(jira_client=jira_client, op_client=op_client),
-        "work_packages": lambda: WorkPackageMigration(jira_client=jira_client, op_client=op_client),
-        "work_packages_skeleton": lambda: WorkPackageSkeletonMigration(jira_client=jira_client, op_client=op_client),
-        "work_packages_content": lambda: WorkPackageContentMigration(jira_client=jira_client, op_client=op_client),
-        "time_entries": lambda: TimeEntryMigration(jira_client=jira_client, op_client=op_client),
-        "watchers": lambda: WatcherMigration(jira_client=jira_client, op_client=op_client),
-        "relations": lambda: RelationMigration(jira_client=jira_client, op_client=op_client),
-        "priorities": lambda: PriorityMigration(jira_client=jira_client, op_client=op_client),
-        "simpletasks": lambda: SimpleTasksMigration(jira_client=jira_client, op_client=op_client),
-        "resolutions": lambda: ResolutionMigration(jira_client=jira_client, op_client=op_client),
-        "labels": lambda: LabelsMigration(jira_client=jira_client, op_client=op_client),
-        "versions": lambda: VersionsMigration(jira_client=jira_client, op_client=op_client),
-        "components": lambda: ComponentsMigration(jira_client=jira_client, op_client=op_client),
-        "attachments": lambda: AttachmentsMigration(jira_client=jira_client, op_client=op_client),
-        "estimates": lambda: EstimatesMigration(jira_client=jira_client, op_client=op_client),
-        "affects_versions": lambda: AffectsVersionsMigration(jira_client=jira_client, op_client=op_client),
-        "security_levels": lambda: SecurityLevelsMigration(jira_client=jira_client, op_client=op_client),
-        "votes_reactions": lambda: VotesMigration(jira_client=jira_client, op_client=op_client),
-        "customfields_generic": lambda: CustomFieldsGenericMigration(jira_client=jira_client, op_client=op_client),
-        "story_points": lambda: StoryPointsMigration(jira_client=jira_client, op_client=op_client),
-        "sprint_epic": lambda: SprintEpicMigration(jira_client=jira_client, op_client=op_client),
-        "remote_links": lambda: RemoteLinksMigration(jira_client=jira_client, op_client=op_client),
-        "category_defaults": lambda: CategoryDefaultsMigration(jira_client=jira_client, op_client=op_client),
-        "attachment_provenance": lambda: AttachmentProvenanceMigration(jira_client=jira_client, op_client=op_client),
-        "attachment_recovery": lambda: AttachmentRecoveryMigration(jira_client=jira_client, op_client=op_client),
-        "wp_metadata_backfill": lambda: WpMetadataBackfillMigration(jira_client=jira_client, op_client=op_client),
-        "inline_refs": lambda: InlineRefsMigration(jira_client=jira_client, op_client=op_client),
-        "native_tags": lambda: NativeTagsMigration(jira_client=jira_client, op_client=op_client),
-        "accounts": lambda: AccountMigration(jira_client=jira_client, op_client=op_client),
-        "workflows": lambda: WorkflowMigration(jira_client=jira_client, op_client=op_client),
-        "agile_boards": lambda: AgileBoardMigration(jira_client=jira_client, op_client=op_client),
-        "admin_schemes": lambda: AdminSchemeMigration(jira_client=jira_client, op_client=op_client),
-        "reporting": lambda: ReportingMigration(jira_client=jira_client, op_client=op_client),
+        name: (lambda cls=cls: cls(jira_client=jira_client, op_client=op_client))
+        for name, cls in COMPONENT_CLASSES.items()
     }
 
 
+# Components that create or rewrite the work package mapping; field-derived
+# components can only share an extraction pass once all of them have run.
+_WP_MAPPING_COMPONENTS = ("work_packages", "work_packages_skeleton", "work_packages_content")
+
+
+def _fused_extraction_components(components: list[str]) -> list[str]:
+    """Return the components of ``components`` that share one fused extraction pass.
+
+    Only components declaring ``FUSED_EXTRACTION`` that run after the last
+    work-package-mapping component qualify; fusing fewer than two is
+    pointless, so an empty list is returned then.
+    """
+    last_wp = max((i for i, c in enumerate(components) if c in _WP_MAPPING_COMPONENTS), default=-1)
+    fused = [c for c in components[last_wp + 1 :] if c in COMPONENT_CLASSES and COMPONENT_CLASSES[c].FUSED_EXTRACTION]
+    return fused if len(fused) > 1 else []
+
+
 def print_component_header(component_name: str) -> None:
     """Print a formatted header for a migration component.
 
@@ -658,6 +681,7 @@ async def run_migration(
         Dictionary with migration results
 
     """
+    op_client: OpenProjectClient | None = None
     try:
         # Resolve the effective component list NOW so the dry-run gate
         # sees the same set the orchestrator will execute. Without this,
@@ -892,6 +916,15 @@ async def run_migration(
             components,
         )
 
+        # Components that declare the Jira fields they read share one
+        # projected fetch shape for the run instead of full payloads.
+        BaseMigration.set_run_jira_projection(COMPONENT_CLASSES[c] for c in components if c in COMPONENT_CLASSES)
+
+        # Field-derived components share one extraction pass over the issues;
+        # they are constructed together when the first of them comes up.
+        fused_components = _fused_extraction_components(components)
+        prebuilt_components: dict[str, BaseMigration] = {}
+
         # WorkPackageMigration is already constructed in available_components above
         # Avoid re-instantiation here to prevent duplicate initializer side-effects
 
@@ -905,11 +938,23 @@ async def run_migration(
                 if factory is None:
                     config.logger.warning("Unknown component '%s' - skipping", component_name)
                     continue
-                component = factory()
+                component = prebuilt_components.pop(component_name, None) or factory()
 
                 # Header for this component in logs
                 print_component_header(component_name)
 
+                if component_name in fused_components:
+                    prebuilt_components = {
+                        name: available_component_factories[name]()
+                        for name in fused_components
+                        if name != component_name
+                    }
+                    fused_components = []
+                    try:
+                        BaseMigration.run_fused_extraction([component, *prebuilt_components.values()])
+                    except Exception as e:
+                        config.logger.warning("Fused extraction failed; components will extract individually: %s", e)
+
                 # Track timing
                 component_start_time = time.time()
 
@@ -957,10 +1002,6 @@ async def run_migration(
                 # Run the component (diagnose if base run is invoked)
                 try:
                     try:
-                        from src.application.components.base_migration import (
-                            BaseMigration,  # local import to avoid cycles
-                        )
-
                         if component.__class__.run is BaseMigration.run:
                             src_file = inspect.getsourcefile(component.__class__) or "<unknown>"
                             config.logger.warning(
@@ -1311,6 +1352,10 @@ async def run_migration(
                 "timestamp": datetime.now(tz=UTC).isoformat(),
             },
         )
+    finally:
+        # Extra Rails sessions and RPC workers must not outlive the run.
+        if op_client is not None:
+            op_client.close()
 
 
 def parse_args() -> argparse.Namespace:
@@ -5,6 +5,11 @@
 # Python pre-computes: version, validity_period_start/end, field_changes mapping
 # Ruby only: reads WP initial state, applies field_changes, bulk INSERT
 #
+# Journals of ALL WPs in the batch are built in memory first and then written
+# with a few multi-row INSERT ... RETURNING statements (work_package_journals,
+# journals, customizable_journals), in one transaction. If that fails the
+# batch is retried WP by WP so errors stay per WP.
+#
 # Expected variables:
 # - input_data: Array of {wp_id:, jira_key:, rails_ops:} hashes
 # - rails_ops contain: version, validity_period_start, validity_period_end, field_changes, user_id, notes
@@ -85,46 +90,72 @@ if input_data && input_data.respond_to?(:each)
     cache[value.to_s.downcase] || fallback
   end
 
-  input_data.each_with_index do |wp_data, batch_idx|
-    wp_id = wp_data['wp_id'] || wp_data[:wp_id]
-    jira_key = wp_data['jira_key'] || wp_data[:jira_key]
-    rails_ops = wp_data['rails_ops'] || wp_data[:rails_ops]
+  # Rows per multi-row INSERT statement; bounds statement size on
+  # history-heavy batches.
+  insert_slice = 1000
+
+  sql_time = lambda { |t| t.strftime('%Y-%m-%d %H:%M:%S.%6N%:z') }
+
+  range_sql = lambda do |start_time, period_end|
+    start_str = sql_time.call(start_time)
+    if period_end
+      period_end = Time.parse(period_end.to_s) unless period_end.is_a?(Time)
+      "tstzrange('#{start_str}', '#{sql_time.call(period_end)}', '[)')"
+    else
+      "tstzrange('#{start_str}', NULL, '[)')"
+    end
+  end
+
+  wp_journal_tuple = lambda do |s, rec|
+    due_date_sql = s[:due_date] ? "'#{s[:due_date]}'" : "NULL"
+    start_date_sql = s[:start_date] ? "'#{s[:start_date]}'" : "NULL"
 
-    result = { 'wp_id' => wp_id, 'jira_key' => jira_key, 'created' => 0, 'error' => nil }
+    "(#{s[:type_id] || 'NULL'}, #{s[:project_id] || 'NULL'}, #{conn.quote(s[:subject].to_s)}, " +
+    "#{conn.quote(s[:description].to_s)}, " +
+    "#{due_date_sql}, #{s[:category_id] || 'NULL'}, #{s[:status_id] || 'NULL'}, #{s[:assigned_to_id] || 'NULL'}, " +
+    "#{sanitize_id_field.call(s[:priority_id], priority_cache, rec.priority_id) || 'NULL'}, #{s[:version_id] || 'NULL'}, #{s[:author_id] || 'NULL'}, " +
+    "#{s[:done_ratio] || 0}, #{s[:estimated_hours] || 'NULL'}, #{start_date_sql}, #{s[:parent_id] || 'NULL'}, " +
+    "#{s[:schedule_manually] || false}, #{s[:ignore_non_working_days] || false})"
+  end
+
+  entries = input_data.map do |wp_data|
+    {
+      wp_id: wp_data['wp_id'] || wp_data[:wp_id],
+      jira_key: wp_data['jira_key'] || wp_data[:jira_key],
+      rails_ops: wp_data['rails_ops'] || wp_data[:rails_ops]
+    }
+  end
+
+  # One query each for the batch's work packages and their v1 journals
+  wp_ids = entries.map { |e| e[:wp_id] }.compact.map(&:to_i)
+  records = WorkPackage.where(id: wp_ids).index_by(&:id)
+  v1_journals = Journal.where(journable_id: records.keys, journable_type: 'WorkPackage', version: 1)
+                       .index_by(&:journable_id)
+
+  # Phase 1: build every WP's journal rows in memory (no writes)
+  plans = []
+  entries.each do |entry|
+    wp_id = entry[:wp_id]
+    rails_ops = entry[:rails_ops]
+    result = { 'wp_id' => wp_id, 'jira_key' => entry[:jira_key], 'created' => 0, 'error' => nil }
+    results << result
 
     begin
-      rec = WorkPackage.find_by(id: wp_id)
+      rec = records[wp_id.to_i]
       unless rec
         result['error'] = "WP not found"
-        results << result
         next
       end
 
       # Skip if no operations
-      unless rails_ops && rails_ops.respond_to?(:each) && rails_ops.any?
-        results << result
-        next
-      end
-
-      # Delete v2+ journals for idempotent re-migration
-      v2_plus_journals = Journal.where(journable_id: rec.id, journable_type: 'WorkPackage').where('version > 1')
-      v2_plus_count = v2_plus_journals.count
-
-      if v2_plus_count > 0
-        v2_plus_ids = v2_plus_journals.pluck(:id)
-        if v2_plus_ids.any?
-          Journal::CustomizableJournal.where(journal_id: v2_plus_ids).delete_all
-          data_ids = v2_plus_journals.pluck(:data_id).compact
-          v2_plus_journals.delete_all
-          Journal::WorkPackageJournal.where(id: data_ids).delete_all if data_ids.any?
-        end
-      end
+      next unless rails_ops && rails_ops.respond_to?(:each) && rails_ops.any?
 
       # Operations are already sorted by Python, use as-is
       ops = rails_ops
 
-      # Get base version for this WP
-      base_version = Journal.where(journable_id: rec.id, journable_type: 'WorkPackage').maximum(:version) || 0
+      # v2+ journals are replaced below, so numbering continues after v1
+      v1_journal = v1_journals[rec.id]
+      base_version = v1_journal ? 1 : 0
 
       # Initialize state from WP record (Ruby has DB access)
       current_state = {
@@ -138,7 +169,7 @@ if input_data && input_data.respond_to?(:each)
 
       # Collect journal data using pre-computed values from Python
       bulk_journals = []
-      v1_journal = nil
+      v1_entry = nil
       v1_cf_snapshot = nil
 
       ops.each_with_index do |op, op_idx|
@@ -201,23 +232,11 @@ if input_data && input_data.respond_to?(:each)
         if op_idx == 0
           # First operation updates v1 journal
           v1_cf_snapshot = resolved_cf_snapshot
-          v1_journal = Journal.where(journable_id: rec.id, journable_type: 'WorkPackage', version: 1).first
           if v1_journal
-            v1_journal.user_id = user_id
-            v1_journal.notes = notes
-            v1_journal.data = Journal::WorkPackageJournal.new(sanitized_state)
-            v1_journal.save(validate: false)
-
-            # Update timestamps via raw SQL
-            target_time_str = target_time.strftime('%Y-%m-%d %H:%M:%S.%6N%:z')
-            if validity_period.end
-              period_end_time = validity_period.end.is_a?(Time) ? validity_period.end : Time.parse(validity_period.end.to_s)
-              period_end_str = period_end_time.strftime('%Y-%m-%d %H:%M:%S.%6N%:z')
-              range_sql = "tstzrange('#{target_time_str}', '#{period_end_str}', '[)')"
-            else
-              range_sql = "tstzrange('#{target_time_str}', NULL, '[)')"
-            end
-            conn.execute("UPDATE journals SET created_at = '#{target_time_str}', updated_at = '#{target_time_str}', validity_period = #{range_sql} WHERE id = #{v1_journal.id}")
+            v1_entry = {
+              user_id: user_id, notes: notes, created_at: target_time,
+              validity_period: validity_period, state: sanitized_state
+            }
           end
         else
           # v2+ journals: use pre-computed version or increment
@@ -251,121 +270,143 @@ if input_data && input_data.respond_to?(:each)
         bulk_journals = deduped
       end
 
-      # Bulk INSERT work_package_journals first (to get data_id)
-      if bulk_journals.any?
-        wp_journal_values = bulk_journals.map do |j|
-          s = j[:state]
-          subject_escaped = conn.quote(s[:subject].to_s)
-          desc_escaped = conn.quote(s[:description].to_s)
-          due_date_sql = s[:due_date] ? "'#{s[:due_date]}'" : "NULL"
-          start_date_sql = s[:start_date] ? "'#{s[:start_date]}'" : "NULL"
-
-          "(#{s[:type_id] || 'NULL'}, #{s[:project_id] || 'NULL'}, #{subject_escaped}, #{desc_escaped}, " +
-          "#{due_date_sql}, #{s[:category_id] || 'NULL'}, #{s[:status_id] || 'NULL'}, #{s[:assigned_to_id] || 'NULL'}, " +
-          "#{sanitize_id_field.call(s[:priority_id], priority_cache, rec.priority_id) || 'NULL'}, #{s[:version_id] || 'NULL'}, #{s[:author_id] || 'NULL'}, " +
-          "#{s[:done_ratio] || 0}, #{s[:estimated_hours] || 'NULL'}, #{start_date_sql}, #{s[:parent_id] || 'NULL'}, " +
-          "#{s[:schedule_manually] || false}, #{s[:ignore_non_working_days] || false})"
-        end
+      plans << {
+        result: result, rec: rec, v1_journal: v1_journal, v1_entry: v1_entry,
+        v1_cf_snapshot: v1_cf_snapshot, journals: bulk_journals
+      }
+    rescue => e
+      result['error'] = "#{e.class}: #{e.message}"
+    end
+  end
 
-        wp_insert_sql = <<~SQL
-          INSERT INTO work_package_journals (type_id, project_id, subject, description,
-            due_date, category_id, status_id, assigned_to_id, priority_id, version_id, author_id,
-            done_ratio, estimated_hours, start_date, parent_id, schedule_manually, ignore_non_working_days)
-          VALUES #{wp_journal_values.join(",\n       ")}
-          RETURNING id
-        SQL
-
-        wp_result = conn.execute(wp_insert_sql)
-        wp_journal_ids = []
-        wp_result.each { |row| wp_journal_ids << row['id'] }
-
-        # Bulk INSERT journals with data_type and data_id
-        journal_values = bulk_journals.each_with_index.map do |j, idx|
-          wp_journal_id = wp_journal_ids[idx]
-          next nil unless wp_journal_id
-
-          ts_str = j[:created_at].strftime('%Y-%m-%d %H:%M:%S.%6N%:z')
-          notes_escaped = conn.quote(j[:notes].to_s)
-
-          if j[:validity_period].end
-            period_end = j[:validity_period].end.is_a?(Time) ? j[:validity_period].end : Time.parse(j[:validity_period].end.to_s)
-            period_end_str = period_end.strftime('%Y-%m-%d %H:%M:%S.%6N%:z')
-            range_sql = "tstzrange('#{ts_str}', '#{period_end_str}', '[)')"
-          else
-            range_sql = "tstzrange('#{ts_str}', NULL, '[)')"
+  # Phase 2: write the given plans with a handful of multi-row statements
+  # shared by all their WPs instead of a round of INSERTs per WP.
+  write_plans = lambda do |batch|
+    batch_wp_ids = batch.map { |plan| plan[:rec].id }
+
+    # Delete v2+ journals for idempotent re-migration
+    stale = Journal.where(journable_id: batch_wp_ids, journable_type: 'WorkPackage').where('version > 1')
+    stale_rows = stale.pluck(:id, :data_id)
+    if stale_rows.any?
+      stale_ids = stale_rows.map(&:first)
+      data_ids = stale_rows.map(&:last).compact
+      Journal::CustomizableJournal.where(journal_id: stale_ids).delete_all
+      Journal.where(id: stale_ids).delete_all
+      Journal::WorkPackageJournal.where(id: data_ids).delete_all if data_ids.any?
+    end
+
+    # work_package_journals rows for every v1 update and v2+ journal (to get data_id)
+    data_targets = []
+    batch.each do |plan|
+      data_targets << [plan[:v1_entry], plan[:rec]] if plan[:v1_entry]
+      plan[:journals].each { |j| data_targets << [j, plan[:rec]] }
+    end
+    data_targets.each_slice(insert_slice) do |slice|
+      values = slice.map { |j, rec| wp_journal_tuple.call(j[:state], rec) }
+      wp_result = conn.execute(<<~SQL)
+        INSERT INTO work_package_journals (type_id, project_id, subject, description,
+          due_date, category_id, status_id, assigned_to_id, priority_id, version_id, author_id,
+          done_ratio, estimated_hours, start_date, parent_id, schedule_manually, ignore_non_working_days)
+        VALUES #{values.join(",\n       ")}
+        RETURNING id
+      SQL
+      wp_result.each_with_index { |row, idx| slice[idx][0][:data_id] = row['id'].to_i }
+    end
+
+    # Point the v1 journals at their new data rows and timestamps
+    v1_values = batch.filter_map do |plan|
+      j = plan[:v1_entry]
+      next nil unless j && j[:data_id]
+
+      ts_str = sql_time.call(j[:created_at])
+      "(#{plan[:v1_journal].id}, #{j[:user_id]}, #{conn.quote(j[:notes].to_s)}, #{j[:data_id]}, " +
+      "'#{ts_str}'::timestamptz, #{range_sql.call(j[:created_at], j[:validity_period].end)})"
+    end
+    v1_values.each_slice(insert_slice) do |slice|
+      conn.execute(<<~SQL)
+        UPDATE journals SET user_id = v.user_id, notes = v.notes,
+          data_type = 'Journal::WorkPackageJournal', data_id = v.data_id,
+          created_at = v.ts, updated_at = v.ts, validity_period = v.vp
+        FROM (VALUES #{slice.join(",\n       ")}) AS v(id, user_id, notes, data_id, ts, vp)
+        WHERE journals.id = v.id
+      SQL
+    end
+
+    # journals rows with data_type and data_id
+    journal_targets = batch.flat_map { |plan| plan[:journals].select { |j| j[:data_id] }.map { |j| [j, plan[:rec]] } }
+    journal_ids = {}
+    journal_targets.each_slice(insert_slice) do |slice|
+      values = slice.map do |j, rec|
+        ts_str = sql_time.call(j[:created_at])
+        "(#{rec.id}, 'WorkPackage', #{j[:user_id]}, #{conn.quote(j[:notes].to_s)}, #{j[:version]}, " +
+        "'#{ts_str}', '#{ts_str}', 'Journal::WorkPackageJournal', #{j[:data_id]}, " +
+        "#{range_sql.call(j[:created_at], j[:validity_period].end)})"
+      end
+      journal_result = conn.execute(<<~SQL)
+        INSERT INTO journals (journable_id, journable_type, user_id, notes, version, created_at, updated_at,
+          data_type, data_id, validity_period)
+        VALUES #{values.join(",\n       ")}
+        RETURNING id, journable_id, version
+      SQL
+      journal_result.each { |row| journal_ids[[row['journable_id'].to_i, row['version'].to_i]] = row['id'].to_i }
+    end
+
+    # customizable_journals for the J2O custom fields
+    if j2o_cf_ids.any?
+      cf_journal_values = []
+      v1_ids = batch.filter_map { |plan| plan[:v1_journal]&.id }
+      Journal::CustomizableJournal.where(journal_id: v1_ids, custom_field_id: j2o_cf_ids).delete_all if v1_ids.any?
+
+      batch.each do |plan|
+        v1_cf_snapshot = plan[:v1_cf_snapshot]
+        if plan[:v1_journal] && v1_cf_snapshot.is_a?(Hash)
+          v1_cf_snapshot.each do |cf_id, cf_value|
+            next if cf_id.nil? || cf_value.nil?
+            cf_journal_values << "(#{plan[:v1_journal].id}, #{cf_id.to_i}, #{conn.quote(cf_value.to_s)})"
           end
+        end
 
-          "(#{rec.id}, 'WorkPackage', #{j[:user_id]}, #{notes_escaped}, #{j[:version]}, '#{ts_str}', '#{ts_str}', " +
-          "'Journal::WorkPackageJournal', #{wp_journal_id}, #{range_sql})"
-        end.compact
-
-        if journal_values.any?
-          insert_sql = <<~SQL
-            INSERT INTO journals (journable_id, journable_type, user_id, notes, version, created_at, updated_at,
-              data_type, data_id, validity_period)
-            VALUES #{journal_values.join(",\n       ")}
-            RETURNING id, version
-          SQL
-
-          journal_result = conn.execute(insert_sql)
-          version_to_id = {}
-          journal_result.each { |row| version_to_id[row['version']] = row['id'] }
-
-          # Bulk INSERT customizable_journals for v2+ (J2O custom fields)
-          # NOOP FIX: Only insert entries when CF value actually CHANGED
-          if j2o_cf_ids.any?
-            cf_journal_values = []
-            # Start with v1's CF state as the baseline for comparison
-            prev_cf_snapshot = v1_cf_snapshot.is_a?(Hash) ? v1_cf_snapshot.dup : {}
-
-            bulk_journals.each do |j|
-              journal_id = version_to_id[j[:version]]
-              next unless journal_id
-
-              curr_cf_snapshot = j[:cf_snapshot].is_a?(Hash) ? j[:cf_snapshot] : {}
-
-              # Only insert entries for CF values that actually CHANGED from previous version
-              curr_cf_snapshot.each do |cf_id, cf_value|
-                next if cf_id.nil? || cf_value.nil?
-                prev_value = prev_cf_snapshot[cf_id]
-
-                # Check if value actually changed (handle nil vs empty string)
-                value_changed = prev_value.to_s != cf_value.to_s
-
-                if value_changed
-                  cf_journal_values << "(#{journal_id}, #{cf_id.to_i}, #{conn.quote(cf_value.to_s)})"
-                end
-              end
-
-              # Update prev_cf_snapshot for next iteration
-              prev_cf_snapshot = curr_cf_snapshot.dup
-            end
-            if cf_journal_values.any?
-              conn.execute("INSERT INTO customizable_journals (journal_id, custom_field_id, value) VALUES #{cf_journal_values.join(', ')}")
-            end
+        # NOOP FIX: v2+ only get entries when a CF value actually CHANGED,
+        # starting from v1's CF state as the baseline for comparison
+        prev_cf_snapshot = v1_cf_snapshot.is_a?(Hash) ? v1_cf_snapshot.dup : {}
+        plan[:journals].each do |j|
+          journal_id = journal_ids[[plan[:rec].id, j[:version].to_i]]
+          next unless journal_id
+
+          curr_cf_snapshot = j[:cf_snapshot].is_a?(Hash) ? j[:cf_snapshot] : {}
+          curr_cf_snapshot.each do |cf_id, cf_value|
+            next if cf_id.nil? || cf_value.nil?
+            # Check if value actually changed (handle nil vs empty string)
+            next if prev_cf_snapshot[cf_id].to_s == cf_value.to_s
+
+            cf_journal_values << "(#{journal_id}, #{cf_id.to_i}, #{conn.quote(cf_value.to_s)})"
           end
+          prev_cf_snapshot = curr_cf_snapshot.dup
         end
       end
 
-      # Insert customizable_journals for v1
-      if v1_journal && j2o_cf_ids.any?
-        Journal::CustomizableJournal.where(journal_id: v1_journal.id, custom_field_id: j2o_cf_ids).delete_all
-        if v1_cf_snapshot.is_a?(Hash) && v1_cf_snapshot.any?
-          cf_values = v1_cf_snapshot.map do |cf_id, cf_value|
-            next nil if cf_id.nil? || cf_value.nil?
-            "(#{v1_journal.id}, #{cf_id.to_i}, #{conn.quote(cf_value.to_s)})"
-          end.compact
-          conn.execute("INSERT INTO customizable_journals (journal_id, custom_field_id, value) VALUES #{cf_values.join(', ')}") if cf_values.any?
-        end
+      cf_journal_values.each_slice(insert_slice) do |slice|
+        conn.execute("INSERT INTO customizable_journals (journal_id, custom_field_id, value) VALUES #{slice.join(', ')}")
       end
+    end
 
-      result['created'] = bulk_journals.length
+    batch.each { |plan| plan[:result]['created'] = plan[:journals].length }
+  end
 
+  if plans.any?
+    begin
+      ActiveRecord::Base.transaction { write_plans.call(plans) }
     rescue => e
-      result['error'] = "#{e.class}: #{e.message}"
+      # Something in the shared statements failed: retry WP by WP so one bad
+      # row only fails its own WP
+      plans.each do |plan|
+        begin
+          ActiveRecord::Base.transaction { write_plans.call([plan]) }
+        rescue => wp_error
+          plan[:result]['error'] = "#{wp_error.class}: #{wp_error.message}"
+        end
+      end
     end
-
-    results << result
   end
 end
 
@@ -0,0 +1,49 @@
+# J2O preforking Rails runner — client
+#
+# Plain Ruby (no Bundler, no Rails), so starting it is cheap:
+#
+#   ruby /tmp/j2o_prefork_client.rb /tmp/script.rb
+#   ruby /tmp/j2o_prefork_client.rb -e 'puts User.count'
+#   ruby /tmp/j2o_prefork_client.rb --ping | --shutdown
+#
+# Hands the script to j2o_prefork_server.rb, prints the child's stdout and
+# stderr and exits with its status — the same contract as `rails runner`.
+# J2O_* environment variables are forwarded to the child. Exits 75
+# (EX_TEMPFAIL) when the server is unreachable or failed to answer.
+
+require 'json'
+require 'socket'
+
+socket_path = ENV.fetch('J2O_PREFORK_SOCKET', '/tmp/j2o_prefork.sock')
+request =
+  case ARGV[0]
+  when '--ping' then { 'op' => 'ping' }
+  when '--shutdown' then { 'op' => 'shutdown' }
+  when '-e' then { 'op' => 'run', 'code' => ARGV[1].to_s }
+  else { 'op' => 'run', 'script' => File.expand_path(ARGV[0].to_s) }
+  end
+request['env'] = ENV.select { |key, _| key.start_with?('J2O_') }
+
+begin
+  sock = UNIXSocket.new(socket_path)
+rescue SystemCallError => e
+  warn "j2o prefork server unavailable at #{socket_path}: #{e.message}"
+  exit 75
+end
+
+sock.puts(JSON.generate(request))
+line = sock.gets
+sock.close
+if line.nil?
+  warn 'j2o prefork server closed the connection without a response'
+  exit 75
+end
+
+response = JSON.parse(line)
+$stdout.write(response['stdout'].to_s)
+$stderr.write(response['stderr'].to_s)
+if response['status'] != 'ok'
+  warn "j2o prefork server error: #{response['message']}"
+  exit 75
+end
+exit(Integer(response.fetch('exit', 0)))
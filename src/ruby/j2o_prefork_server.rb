@@ -0,0 +1,158 @@
+# J2O preforking Rails runner — server
+#
+# Boots Rails ONCE inside the OpenProject container (started detached via
+#
+#   bundle exec rails runner /tmp/j2o_prefork_server.rb
+#
+# ) and serves `rails runner`-style script runs from forked children. Each
+# call goes through the plain-Ruby client (/tmp/j2o_prefork_client.rb), so a
+# call costs a fork instead of a 10-40s Rails boot.
+#
+# Protocol on the Unix socket, one JSON line each way:
+#
+#   request:  {"op": "run"|"ping"|"shutdown", "script": "/tmp/x.rb",
+#              "code": "...", "env": {"J2O_...": "..."}}
+#   response: {"status": "ok"|"error", "exit": N, "stdout": "...",
+#              "stderr": "...", "message": "..."}
+#
+# A child exits 0 on success and 1 when the script raised, like
+# `rails runner`. A client that disconnects before its child finished (e.g.
+# killed on a Python-side timeout) takes the child down with it.
+
+require 'json'
+require 'socket'
+require 'securerandom'
+require 'tmpdir'
+
+module J2OPreforkServer
+  SOCKET_PATH = ENV.fetch('J2O_PREFORK_SOCKET', '/tmp/j2o_prefork.sock')
+  READY_PATH = "#{SOCKET_PATH}.ready".freeze
+  MAX_CHILDREN = [Integer(ENV.fetch('J2O_PREFORK_MAX_CHILDREN', '4')), 1].max
+
+  module_function
+
+  def boot
+    begin
+      Rails.application.eager_load!
+    rescue StandardError => e
+      warn "j2o prefork: eager_load failed: #{e.class}: #{e.message}"
+    end
+    begin; Rails.logger.level = Logger::WARN; rescue StandardError; end
+    # Children open their own connections; the parent must not hold one
+    # that forked children would share.
+    ActiveRecord::Base.connection_pool.disconnect! if defined?(ActiveRecord::Base)
+  end
+
+  def fork_child(request, out_path, err_path)
+    fork do
+      $stdout.reopen(out_path, 'w')
+      $stderr.reopen(err_path, 'w')
+      $stdout.sync = true
+      $stderr.sync = true
+      (request['env'] || {}).each { |key, value| ENV[key.to_s] = value.to_s }
+      ActiveRecord::Base.establish_connection if defined?(ActiveRecord::Base)
+      status = 0
+      begin
+        if request['code']
+          TOPLEVEL_BINDING.eval(request['code'].to_s, 'j2o_prefork_code.rb', 1) # rubocop:disable Security/Eval
+        else
+          load request['script'].to_s
+        end
+      rescue SystemExit => e
+        status = e.status
+      rescue Exception => e # rubocop:disable Lint/RescueException
+        warn "#{e.class}: #{e.message}"
+        warn (e.backtrace || []).first(20).join("\n")
+        status = 1
+      end
+      $stdout.flush
+      $stderr.flush
+      # Skip at_exit hooks inherited from the server.
+      exit!(status)
+    end
+  end
+
+  # Wait for `pid`; kill it if the client hangs up first.
+  def wait_child(pid, conn)
+    loop do
+      done, status = Process.wait2(pid, Process::WNOHANG)
+      return status.exitstatus || 1 if done
+
+      next unless IO.select([conn], nil, nil, 0.1)
+      next unless conn.read_nonblock(1, exception: false).nil?
+
+      begin; Process.kill('KILL', pid); rescue StandardError; end
+      begin; Process.wait(pid); rescue StandardError; end
+      raise IOError, 'client disconnected'
+    end
+  end
+
+  def run_script(request, slots)
+    slots.pop
+    token = SecureRandom.hex(6)
+    out_path = File.join(Dir.tmpdir, "j2o_prefork_#{token}.out")
+    err_path = File.join(Dir.tmpdir, "j2o_prefork_#{token}.err")
+    begin
+      pid = fork_child(request, out_path, err_path)
+      status = yield(pid)
+      {
+        'status' => 'ok',
+        'exit' => status,
+        'stdout' => File.exist?(out_path) ? File.read(out_path) : '',
+        'stderr' => File.exist?(err_path) ? File.read(err_path) : '',
+      }
+    ensure
+      slots.push(true)
+      [out_path, err_path].each { |path| File.delete(path) if File.exist?(path) }
+    end
+  end
+
+  def serve(conn, slots, server)
+    request = JSON.parse(conn.gets.to_s)
+    response =
+      case request['op']
+      when 'ping'
+        { 'status' => 'ok', 'pid' => Process.pid, 'max_children' => MAX_CHILDREN }
+      when 'shutdown'
+        # Answer before closing: the main thread exits once accept fails.
+        conn.puts(JSON.generate({ 'status' => 'ok' }))
+        server.close
+        return
+      else
+        run_script(request, slots) { |pid| wait_child(pid, conn) }
+      end
+    conn.puts(JSON.generate(response))
+  rescue IOError, SystemCallError
+    nil
+  rescue StandardError => e
+    begin
+      conn.puts(JSON.generate({ 'status' => 'error', 'message' => "#{e.class}: #{e.message}" }))
+    rescue StandardError
+      nil
+    end
+  ensure
+    conn.close unless conn.closed?
+  end
+
+  def run
+    boot
+    File.delete(SOCKET_PATH) if File.exist?(SOCKET_PATH)
+    server = UNIXServer.new(SOCKET_PATH)
+    slots = Queue.new
+    MAX_CHILDREN.times { slots << true }
+    File.write(READY_PATH, Process.pid.to_s)
+    at_exit { [SOCKET_PATH, READY_PATH].each { |path| File.delete(path) if File.exist?(path) } }
+    warn "j2o prefork server #{Process.pid} ready on #{SOCKET_PATH} (max_children=#{MAX_CHILDREN})"
+
+    loop do
+      conn = begin
+        server.accept
+      rescue IOError, Errno::EBADF
+        break
+      end
+      Thread.new(conn) { |c| serve(c, slots, server) }
+    end
+  end
+end
+
+J2OPreforkServer.run
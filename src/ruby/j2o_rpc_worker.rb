@@ -0,0 +1,118 @@
+# J2O persistent Rails RPC worker
+#
+# Started ONCE per migration run inside the OpenProject container via
+#
+#   docker exec -i <container> bundle exec rails runner /tmp/j2o_rpc_worker.rb
+#
+# and kept alive for the whole run. Python talks to it over the process'
+# stdin/stdout using a length-prefixed JSON protocol:
+#
+#   J2O-RPC <payload byte length>\n<JSON payload>
+#
+# Request payload:  {"id": N, "op": "eval"|"ping"|"shutdown", "script": "...",
+#                    "data": <any JSON>, "start_marker": "...", "end_marker": "...",
+#                    "inspect": true|false}
+# Response payload: {"id": N, "status": "ok"|"error"|"ready", "stdout": "...",
+#                    "value": "<inspect>", "error_class": "...", "message": "...",
+#                    "backtrace": [...], "elapsed": seconds}
+#
+# Everything an evaluated script prints is captured per call and returned in
+# "stdout", so the real stdout carries nothing but frames. Anything written
+# straight to STDOUT (the constant) is redirected to stderr, which Python
+# drains for liveness/error text only.
+
+require 'json'
+require 'stringio'
+
+module J2ORpcWorker
+  FRAME_PREFIX = 'J2O-RPC '.freeze
+
+  module_function
+
+  # Read one frame; skips stray non-frame lines (e.g. boot-time warnings).
+  def read_frame(io)
+    loop do
+      header = io.gets
+      return nil if header.nil?
+
+      header = header.chomp
+      next unless header.start_with?(FRAME_PREFIX)
+
+      length = Integer(header[FRAME_PREFIX.length..])
+      payload = io.read(length)
+      return nil if payload.nil? || payload.bytesize < length
+
+      return JSON.parse(payload.force_encoding(Encoding::UTF_8))
+    end
+  end
+
+  def write_frame(io, obj)
+    payload = JSON.generate(obj)
+    io.write("#{FRAME_PREFIX}#{payload.bytesize}\n")
+    io.write(payload)
+    io.flush
+  end
+
+  # Evaluate a script with `input_data` bound, mirroring `load` semantics
+  # (top-level self, methods defined on Object) without leaking locals
+  # between calls.
+  def evaluate(request)
+    captured = StringIO.new
+    previous_stdout = $stdout
+    started = Process.clock_gettime(Process::CLOCK_MONOTONIC)
+    $j2o_start_marker = request['start_marker']
+    $j2o_end_marker = request['end_marker']
+    response = { 'id' => request['id'] }
+    begin
+      $stdout = captured
+      script_binding = TOPLEVEL_BINDING.dup
+      script_binding.local_variable_set(:input_data, request['data'])
+      value = eval(request['script'].to_s, script_binding, "j2o_rpc_#{request['id']}.rb", 1) # rubocop:disable Security/Eval
+      response['status'] = 'ok'
+      response['value'] = value.inspect if request['inspect']
+    rescue StandardError, ScriptError, SystemStackError => e
+      response['status'] = 'error'
+      response['error_class'] = e.class.name
+      response['message'] = e.message.to_s[0, 2000]
+      response['backtrace'] = (e.backtrace || []).first(20)
+    ensure
+      $stdout = previous_stdout
+      $j2o_start_marker = nil
+      $j2o_end_marker = nil
+    end
+    response['stdout'] = captured.string
+    response['elapsed'] = (Process.clock_gettime(Process::CLOCK_MONOTONIC) - started).round(4)
+    response
+  end
+
+  def run
+    rpc_in = STDIN
+    rpc_in.binmode
+    rpc_out = STDOUT.dup
+    rpc_out.binmode
+    rpc_out.sync = true
+    # From here on, STDOUT/$stdout belong to scripts and end up on stderr.
+    STDOUT.reopen(STDERR)
+    $stdout = STDOUT
+    begin; Rails.logger.level = Logger::WARN; rescue StandardError; end
+
+    write_frame(rpc_out, { 'id' => 0, 'status' => 'ready', 'pid' => Process.pid, 'ruby' => RUBY_VERSION })
+
+    loop do
+      request = read_frame(rpc_in)
+      break if request.nil?
+
+      case request['op']
+      when 'ping'
+        write_frame(rpc_out, { 'id' => request['id'], 'status' => 'ok', 'stdout' => '' })
+      when 'shutdown'
+        write_frame(rpc_out, { 'id' => request['id'], 'status' => 'ok', 'stdout' => '' })
+        break
+      else
+        write_frame(rpc_out, evaluate(request))
+      end
+    end
+  end
+end
+
+J2ORpcWorker.run
@@ -0,0 +1,300 @@
+"""Persistent on-disk store of fetched Jira issues shared by all components.
+
+The primary issue fetch (work package content/migration) writes every page
+it receives into a SQLite database under the data directory. Post-WP
+components then read the issues they need from the store — lazily per key
+or per project — instead of re-fetching them from Jira through
+``_merge_batch_issues`` or ``json.load``-ing the monolithic
+``jira_issues_cache.json``.
+
+Layout: ``jira_issue_store_issues`` holds one row per issue key with its
+project, Jira ``updated`` timestamp and the expands it was fetched with;
+``jira_issue_store_fields`` holds one JSON blob per issue and field (plus
+the ``@changelog`` / ``@renderedFields`` expands), so a reader that only
+needs ``labels`` never deserializes the rest of the payload. Only
+full-field fetches are stored; a projected fetch would leave holes that a
+later reader could not tell apart from empty fields.
+
+Rows are upserted whenever an issue is fetched again, so a fast-forward
+run refreshes exactly the issues Jira reported as updated. Reads are not
+checked against Jira, so a post-WP component run on its own sees the
+issues as of the last work package fetch.
+
+Disabled by default; enable via ``J2O_JIRA_ISSUE_STORE=1`` or
+``migration.jira_issue_store: true``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import sqlite3
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from src import config
+
+STORE_FILENAME = "jira_issue_store.sqlite"
+
+# Top-level issue keys stored next to the per-field blobs, keyed by the
+# ``expand`` option that produces them.
+_EXPAND_BLOBS = {"changelog": "@changelog", "renderedFields": "@renderedFields"}
+
+# SQLite's default limit on host parameters per statement is 999 on older
+# builds; stay well below it for ``IN (...)`` lookups.
+_LOOKUP_CHUNK = 500
+
+
+def issue_store_enabled() -> bool:
+    """Whether fetched Jira issues should be written to and read from the store."""
+    return config.migration_flag("J2O_JIRA_ISSUE_STORE", "jira_issue_store")
+
+
+def _raw_issue(issue: Any) -> dict[str, Any] | None:
+    """Return the REST payload of an SDK issue or cache dict, if it has one."""
+    raw = issue if isinstance(issue, dict) else getattr(issue, "raw", None)
+    if isinstance(raw, dict) and isinstance(raw.get("key"), str) and isinstance(raw.get("fields"), dict):
+        return raw
+    return None
+
+
+def _attrs(value: Any) -> Any:
+    if isinstance(value, dict):
+        return SimpleNamespace(**{str(k): _attrs(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return [_attrs(v) for v in value]
+    return value
+
+
+def issue_from_raw(raw: dict[str, Any]) -> SimpleNamespace:
+    """Return an attribute view of a stored issue shaped like a ``jira.Issue``.
+
+    Nested dicts become attribute objects the same way python-jira's
+    ``dict2resource`` builds them, so consumers written against SDK issues
+    (``issue.fields.watches.watchers``, ``dir(issue.fields)``) work
+    unchanged. The payload itself stays available as ``.raw``.
+    """
+    issue = SimpleNamespace(
+        key=raw.get("key"),
+        id=raw.get("id"),
+        raw=raw,
+        fields=_attrs(raw.get("fields") or {}),
+    )
+    for expand in _EXPAND_BLOBS:
+        if expand in raw:
+            setattr(issue, expand, _attrs(raw[expand]))
+    return issue
+
+
+class JiraIssueStore:
+    """SQLite-backed store of raw Jira issue payloads keyed by issue key."""
+
+    def __init__(self, db_path: Path | str) -> None:
+        self.db_path = Path(db_path)
+
+    @classmethod
+    def for_data_dir(cls, data_dir: Path | str) -> JiraIssueStore:
+        """Return the store that lives in ``data_dir``."""
+        return cls(Path(data_dir) / STORE_FILENAME)
+
+    @staticmethod
+    def _ensure_tables(conn: sqlite3.Connection) -> None:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jira_issue_store_issues (
+                issue_key TEXT PRIMARY KEY,
+                project_key TEXT NOT NULL,
+                issue_id TEXT,
+                updated TEXT,
+                expand TEXT NOT NULL DEFAULT '',
+                stored_at TEXT
+            )
+            """,
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS jira_issue_store_project ON jira_issue_store_issues (project_key)",
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jira_issue_store_fields (
+                issue_key TEXT NOT NULL,
+                field TEXT NOT NULL,
+                value TEXT,
+                PRIMARY KEY (issue_key, field)
+            )
+            """,
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        self._ensure_tables(conn)
+        return conn
+
+    # ── writes ───────────────────────────────────────────────────────────
+
+    def upsert(self, issues: Iterable[Any], *, expand: str | None = None) -> int:
+        """Store full-field issue payloads, replacing any earlier version.
+
+        Args:
+            issues: SDK ``Issue`` objects or ``{"key", "fields", ...}`` dicts;
+                items without a raw payload are skipped
+            expand: The expand options the issues were fetched with
+
+        Returns:
+            Number of issues written
+
+        """
+        fetched_expand = {e.strip() for e in (expand or "").split(",") if e.strip()}
+        issue_rows: list[tuple[Any, ...]] = []
+        field_rows: list[tuple[str, str, str]] = []
+        now = datetime.now(tz=UTC).isoformat()
+        for issue in issues:
+            raw = _raw_issue(issue)
+            if raw is None:
+                continue
+            key = raw["key"]
+            fields: dict[str, Any] = raw["fields"]
+            stored_expand = sorted(e for e in fetched_expand if e in _EXPAND_BLOBS and raw.get(e) is not None)
+            issue_rows.append(
+                (
+                    key,
+                    key.rsplit("-", 1)[0],
+                    str(raw.get("id")) if raw.get("id") is not None else None,
+                    fields.get("updated"),
+                    ",".join(stored_expand),
+                    now,
+                ),
+            )
+            field_rows.extend((key, name, json.dumps(value)) for name, value in fields.items())
+            field_rows.extend((key, _EXPAND_BLOBS[e], json.dumps(raw[e])) for e in stored_expand)
+        if not issue_rows:
+            return 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "DELETE FROM jira_issue_store_fields WHERE issue_key = ?",
+                [(row[0],) for row in issue_rows],
+            )
+            conn.executemany("INSERT OR REPLACE INTO jira_issue_store_issues VALUES (?, ?, ?, ?, ?, ?)", issue_rows)
+            conn.executemany("INSERT INTO jira_issue_store_fields VALUES (?, ?, ?)", field_rows)
+        return len(issue_rows)
+
+    # ── reads ────────────────────────────────────────────────────────────
+
+    def get_many(
+        self,
+        keys: Iterable[str],
+        *,
+        fields: Iterable[str] | None = None,
+        expand: Iterable[str] = (),
+    ) -> dict[str, dict[str, Any]]:
+        """Return stored issues for ``keys`` as ``{"key", "id", "fields", ...}`` dicts.
+
+        Keys that are not stored, or were stored without one of the
+        requested ``expand`` options, are omitted so callers can fetch
+        them from Jira.
+
+        Args:
+            keys: Jira issue keys
+            fields: Field ids to load; ``None`` loads every stored field
+            expand: Expand options (``changelog``, ``renderedFields``) the
+                caller needs
+
+        """
+        unique = list(dict.fromkeys(k for k in keys if k))
+        if not unique or not self.db_path.exists():
+            return {}
+        issues: dict[str, dict[str, Any]] = {}
+        with contextlib.closing(self._connect()) as conn:
+            for i in range(0, len(unique), _LOOKUP_CHUNK):
+                chunk = unique[i : i + _LOOKUP_CHUNK]
+                marks = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT issue_key, issue_id, expand FROM jira_issue_store_issues WHERE issue_key IN ({marks})",
+                    chunk,
+                ).fetchall()
+                issues.update(self._load_issues(conn, rows, fields, expand))
+        return issues
+
+    def get(self, key: str, *, fields: Iterable[str] | None = None) -> dict[str, Any] | None:
+        """Return the stored issue ``key``, or ``None`` if it is not stored."""
+        return self.get_many([key], fields=fields).get(key)
+
+    def iter_project(
+        self,
+        project_key: str | None = None,
+        *,
+        fields: Iterable[str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield stored issues of ``project_key`` (or of every project) one page at a time.
+
+        Only one page of issues is held in memory at once, so iterating a
+        large store stays flat in memory.
+        """
+        if not self.db_path.exists():
+            return
+        with contextlib.closing(self._connect()) as conn:
+            query = "SELECT issue_key, issue_id, expand FROM jira_issue_store_issues"
+            params: tuple[Any, ...] = ()
+            if project_key is not None:
+                query += " WHERE project_key = ?"
+                params = (project_key,)
+            cursor = conn.execute(query + " ORDER BY issue_key", params)
+            while rows := cursor.fetchmany(_LOOKUP_CHUNK):
+                yield from self._load_issues(conn, rows, fields, ()).values()
+
+    def latest_updated(self, project_key: str) -> str | None:
+        """Return the newest Jira ``updated`` timestamp stored for ``project_key``."""
+        if not self.db_path.exists():
+            return None
+        with contextlib.closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT MAX(updated) FROM jira_issue_store_issues WHERE project_key = ?",
+                (project_key,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def count(self) -> int:
+        """Return the number of stored issues."""
+        if not self.db_path.exists():
+            return 0
+        with contextlib.closing(self._connect()) as conn:
+            return int(conn.execute("SELECT COUNT(*) FROM jira_issue_store_issues").fetchone()[0])
+
+    @staticmethod
+    def _load_issues(
+        conn: sqlite3.Connection,
+        rows: list[tuple[Any, ...]],
+        fields: Iterable[str] | None,
+        expand: Iterable[str],
+    ) -> dict[str, dict[str, Any]]:
+        wanted_expand = [e for e in expand if e in _EXPAND_BLOBS]
+        issues: dict[str, dict[str, Any]] = {}
+        for key, issue_id, stored_expand in rows:
+            if any(e not in (stored_expand or "").split(",") for e in wanted_expand):
+                continue
+            issues[key] = {"key": key, "id": issue_id, "fields": {}}
+        if not issues:
+            return issues
+
+        names: list[str] | None = None
+        if fields is not None:
+            names = [*fields, *(_EXPAND_BLOBS[e] for e in wanted_expand)]
+        keys = list(issues)
+        marks = ",".join("?" * len(keys))
+        query = f"SELECT issue_key, field, value FROM jira_issue_store_fields WHERE issue_key IN ({marks})"
+        params: list[str] = list(keys)
+        if names is not None:
+            query += f" AND field IN ({','.join('?' * len(names))})"
+            params.extend(names)
+        for key, name, value in conn.execute(query, params):
+            decoded = json.loads(value) if value is not None else None
+            if name.startswith("@"):
+                issues[key][name[1:]] = decoded
+            else:
+                issues[key]["fields"][name] = decoded
+        return issues
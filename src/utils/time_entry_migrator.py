@@ -326,10 +326,14 @@ class TimeEntryMigrator:
 
         extracted_logs = {}
         total_logs = 0
+        bulk_logs = self._fetch_work_logs_bulk(issue_keys) if self._worklog_bulk_enabled() else None
 
         for issue_key in issue_keys:
             try:
-                work_logs = self.jira_client.get_work_logs_for_issue(issue_key)
+                if bulk_logs is not None:
+                    work_logs = bulk_logs.get(issue_key, [])
+                else:
+                    work_logs = self.jira_client.get_work_logs_for_issue(issue_key)
 
                 if work_logs:
                     # Add issue_key to each work log for later processing
@@ -378,6 +382,27 @@ class TimeEntryMigrator:
 
         return extracted_logs
 
+    @staticmethod
+    def _worklog_bulk_enabled() -> bool:
+        """Whether work logs come from Jira's bulk worklog endpoints instead of per issue."""
+        return config.migration_flag("J2O_JIRA_WORKLOG_BULK", "jira_worklog_bulk")
+
+    def _fetch_work_logs_bulk(self, issue_keys: list[str]) -> dict[str, list[dict[str, Any]]] | None:
+        """Fetch the work logs of ``issue_keys``' projects in bulk, or ``None`` to fall back per issue.
+
+        With fast-forward on, only work logs updated since the cutoff are
+        requested; a ``created`` cutoff is a subset of that, and
+        ``_ff_accept`` still filters locally.
+        """
+        project_keys = sorted({key.rsplit("-", 1)[0] for key in issue_keys if "-" in key})
+        since = self._ff_cutoff if self._ff_enabled else None
+        try:
+            work_logs_by_issue, _until = self.jira_client.get_work_logs_for_projects(project_keys, since=since)
+        except Exception as e:
+            self.logger.warning("Bulk work log extraction failed, fetching per issue: %s", e)
+            return None
+        return work_logs_by_issue
+
     def extract_tempo_time_entries(
         self,
         project_keys: list[str] | None = None,
@@ -545,15 +570,19 @@ class TimeEntryMigrator:
     def migrate_time_entries_to_openproject(
         self,
         time_entries: list[dict[str, Any]] | None = None,
-        batch_size: int = 200,
+        batch_size: int = 2000,
         *,
         dry_run: bool = False,
     ) -> dict[str, Any]:
         """Migrate time entries to OpenProject.
 
+        Entries are submitted in chunks to ``batch_create_time_entries``,
+        one Rails execution per chunk; the per-entry path is only used
+        when batch mode is disabled or a chunk fails outright.
+
         Args:
             time_entries: Time entries to migrate (uses transformed_time_entries if None)
-            batch_size: Number of entries to process in each batch
+            batch_size: Initial number of entries per Rails execution
             dry_run: If True, don't actually create entries in OpenProject
 
         Returns:
@@ -664,9 +693,10 @@ class TimeEntryMigrator:
         except Exception:
             heartbeat_sec = 30
 
-        # Prefer batch file-based creation for stability and speed (disabled in unit-test mode)
+        # Batch file-based creation is the default path; ``unit_test_mode``
+        # must be set explicitly to force the per-entry path.
         use_batch = bool(config.migration_config.get("enable_time_entry_batch", True))
-        if config.migration_config.get("unit_test_mode", True):
+        if config.migration_config.get("unit_test_mode", False):
             use_batch = False
         if use_batch:
             # Process in chunks to avoid timeout (batch_size entries per Rails execution)
@@ -677,13 +707,16 @@ class TimeEntryMigrator:
             processed_count = 0
             chunk_num = 0
 
-            # Adaptive sizing configuration (timeout is 120s in batch_create_time_entries)
-            batch_timeout = 120.0
-            min_chunk_size = 100
-            max_chunk_size = 800  # Capped at 800 - larger sizes risk timeout
+            # Adaptive sizing configuration. The bulk creator resolves
+            # work packages, users and activities once per chunk, so its
+            # cost is dominated by the inserts and chunks of thousands
+            # fit comfortably inside the per-chunk timeout.
+            batch_timeout = 600.0
+            min_chunk_size = 500
+            max_chunk_size = 10000
             # Thresholds for adaptive sizing (fraction of timeout)
-            fast_threshold = 0.25  # < 30s: increase chunk size by 1.5x
-            slow_threshold = 0.50  # > 60s: decrease chunk size by 0.75x
+            fast_threshold = 0.25  # < 150s: increase chunk size by 1.5x
+            slow_threshold = 0.50  # > 300s: decrease chunk size by 0.75x
 
             self.logger.info(
                 "Using adaptive batch mode: initial chunk_size=%d, range=[%d-%d], entries=%d",
@@ -710,14 +743,25 @@ class TimeEntryMigrator:
                         est_chunks_left,
                     )
                     chunk_start_time = time.time()
-                    batch_result = self.op_client.batch_create_time_entries(chunk)
+                    batch_result = self.op_client.batch_create_time_entries(
+                        chunk,
+                        timeout=int(batch_timeout),
+                    )
                     chunk_elapsed = time.time() - chunk_start_time
 
                     created = int(batch_result.get("created", 0))
                     failed = int(batch_result.get("failed", 0))
+                    # Entries whose worklog key already had a time entry
+                    # (server-side provenance dedup) count as skipped.
+                    existing = int(batch_result.get("existing", 0))
                     migration_summary["successful_migrations"] += created
                     migration_summary["failed_migrations"] += failed
-                    ids = [r.get("id") for r in batch_result.get("results", []) if r.get("success") and r.get("id")]
+                    migration_summary["skipped_entries"] += existing
+                    ids = [
+                        r.get("id")
+                        for r in batch_result.get("results", [])
+                        if r.get("success") and r.get("id") and not r.get("existing")
+                    ]
                     migration_summary["created_time_entry_ids"].extend(ids)
                     processed_count += len(chunk)
 
@@ -783,6 +827,12 @@ class TimeEntryMigrator:
 
         from concurrent.futures import ThreadPoolExecutor, as_completed
 
+        from src.infrastructure.openproject.rails_session_pool import session_pool_for
+
+        # Each worker thread holds its own Rails session, so concurrency is
+        # bounded by the pool instead of being serialised on one console.
+        session_pool = session_pool_for(self.op_client)
+
         total_to_process = len(entries_to_migrate)
         processed_total = 0
         last_hb = time.time()
@@ -808,7 +858,8 @@ class TimeEntryMigrator:
                     if not is_valid:
                         return False, None, reason
                     try:
-                        res = self.op_client.create_time_entry(entry)
+                        with session_pool.session():
+                            res = self.op_client.create_time_entry(entry)
                         if isinstance(res, dict) and res.get("id"):
                             return True, int(res["id"]), None
                         return False, None, None
@@ -958,7 +1009,7 @@ class TimeEntryMigrator:
                 pass
 
             # Run complete migration process
-            batch_env = int(os.environ.get("J2O_TIME_ENTRY_BATCH_SIZE", "200"))
+            batch_env = int(os.environ.get("J2O_TIME_ENTRY_BATCH_SIZE", "2000"))
             _ = self.run_complete_migration(
                 issue_keys=issue_keys,
                 include_tempo=True,
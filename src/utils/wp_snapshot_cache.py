@@ -0,0 +1,129 @@
+"""Local cache of per-project work package snapshots for delta runs.
+
+The fast-forward path of the work package migration needs, per project,
+the Jira keys of all migrated work packages and their newest migration
+timestamp. Instead of downloading the whole project snapshot on every run,
+:py:class:`WorkPackageSnapshotCache` keeps the rows from the previous run
+together with the project's high-water marks (newest ``updated_at`` and
+highest WP id) in the migration checkpoint database. A run then only asks
+OpenProject for work packages created or updated since then
+(``get_project_wp_cf_delta``) and merges them in.
+
+Deletions do not show up in a delta; when the merged rows' count or id
+sum differs from the project's the caller refreshes the full snapshot.
+
+Opt-in via ``J2O_WP_SNAPSHOT_DELTA=1`` or ``migration.wp_snapshot_delta: true``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import sqlite3
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from src import config
+
+_ROW_COLUMNS = ("id", "updated_at", "jira_issue_key", "jira_migration_date")
+
+
+def snapshot_delta_enabled() -> bool:
+    """Whether fast-forward runs should use the cached delta snapshot."""
+    return config.migration_flag("J2O_WP_SNAPSHOT_DELTA", "wp_snapshot_delta")
+
+
+@dataclass
+class ProjectSnapshot:
+    """Cached snapshot rows of one project plus its high-water marks."""
+
+    high_water: str | None = None
+    max_id: int = 0
+    rows: dict[int, dict[str, Any]] = field(default_factory=dict)
+
+
+class WorkPackageSnapshotCache:
+    """SQLite-backed store of :py:class:`ProjectSnapshot` per project key."""
+
+    def __init__(self, db_path: Path | str) -> None:
+        self.db_path = Path(db_path)
+
+    @staticmethod
+    def _ensure_tables(conn: sqlite3.Connection) -> None:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS wp_snapshot_state (
+                project_key TEXT PRIMARY KEY,
+                high_water TEXT,
+                max_id INTEGER NOT NULL DEFAULT 0,
+                synced_at TEXT
+            )
+            """,
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS wp_snapshot_rows (
+                project_key TEXT NOT NULL,
+                wp_id INTEGER NOT NULL,
+                updated_at TEXT,
+                jira_issue_key TEXT,
+                jira_migration_date TEXT,
+                PRIMARY KEY (project_key, wp_id)
+            )
+            """,
+        )
+
+    def load(self, project_key: str) -> ProjectSnapshot | None:
+        """Return the cached snapshot of ``project_key``, or ``None`` if there is none."""
+        if not self.db_path.exists():
+            return None
+        with contextlib.closing(sqlite3.connect(str(self.db_path))) as conn:
+            self._ensure_tables(conn)
+            state = conn.execute(
+                "SELECT high_water, max_id FROM wp_snapshot_state WHERE project_key = ?",
+                (project_key,),
+            ).fetchone()
+            if state is None:
+                return None
+            rows = conn.execute(
+                "SELECT wp_id, updated_at, jira_issue_key, jira_migration_date "
+                "FROM wp_snapshot_rows WHERE project_key = ?",
+                (project_key,),
+            ).fetchall()
+        return ProjectSnapshot(
+            high_water=state[0],
+            max_id=int(state[1] or 0),
+            rows={int(r[0]): dict(zip(_ROW_COLUMNS, r, strict=True)) for r in rows},
+        )
+
+    def save(
+        self,
+        project_key: str,
+        rows: Iterable[dict[str, Any]],
+        *,
+        high_water: str | None,
+        max_id: int,
+        replace: bool,
+    ) -> None:
+        """Store ``rows`` for ``project_key`` and move its high-water marks.
+
+        With ``replace`` the cached rows are dropped first (full snapshot);
+        otherwise ``rows`` are upserted into them (delta).
+        """
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        values = [
+            (project_key, int(r["id"]), r.get("updated_at"), r.get("jira_issue_key"), r.get("jira_migration_date"))
+            for r in rows
+            if r.get("id") is not None
+        ]
+        with contextlib.closing(sqlite3.connect(str(self.db_path))) as conn, conn:
+            self._ensure_tables(conn)
+            if replace:
+                conn.execute("DELETE FROM wp_snapshot_rows WHERE project_key = ?", (project_key,))
+            conn.executemany("INSERT OR REPLACE INTO wp_snapshot_rows VALUES (?, ?, ?, ?, ?)", values)
+            conn.execute(
+                "INSERT OR REPLACE INTO wp_snapshot_state VALUES (?, ?, ?, ?)",
+                (project_key, high_water, int(max_id or 0), datetime.now(tz=UTC).isoformat()),
+            )
@@ -9,9 +9,11 @@ from src.infrastructure.openproject.openproject_client import OpenProjectClient
 class FakeRailsConsoleClient:
     def __init__(self) -> None:
         self.last_script: str | None = None
+        self.last_timeout: int | None = None
 
     def execute(self, script: str, timeout: int = 30, suppress_output: bool = False) -> str:
         self.last_script = script
+        self.last_timeout = timeout
         # Extract data_path and result_path assigned in Ruby header
         m_data = re.search(r"data_path\s*=\s*'([^']+)'", script)
         m_result = re.search(r"result_path\s*=\s*'([^']+)'", script)
@@ -100,3 +102,33 @@ def test_batch_create_time_entries_file_based(tmp_path: Path) -> None:
     # Verify our runner script included logged_by assignment
     rails = client.rails_client  # type: ignore[attr-defined]
     assert hasattr(rails, "last_script") and "logged_by_id" in rails.last_script
+
+
+def test_batch_create_time_entries_prefetches_and_dedups(tmp_path: Path) -> None:
+    client = make_client(tmp_path)
+
+    entries = [
+        {
+            "_embedded": {
+                "workPackage": {"href": f"/api/v3/work_packages/{100 + i}"},
+                "user": {"href": "/api/v3/users/456"},
+                "activity": {"href": "/api/v3/time_entries/activities/789"},
+            },
+            "hours": 1,
+            "spentOn": "2024-01-02",
+            "comment": "",
+            "_meta": {"jira_worklog_key": f"JWL-{i}"},
+        }
+        for i in range(3)
+    ]
+
+    result = client.batch_create_time_entries(entries, timeout=600)
+    assert result.get("created") == 3
+
+    rails = client.rails_client  # type: ignore[attr-defined]
+    assert rails.last_timeout == 600
+    # Lookups are resolved once per chunk, not per entry
+    assert "WorkPackage.where(id:" in rails.last_script
+    assert "WorkPackage.find_by" not in rails.last_script
+    # Existing worklog keys are answered with the existing id
+    assert "existing: true" in rails.last_script
@@ -305,7 +305,7 @@ def test_attachment_provenance_pipeline(monkeypatch: pytest.MonkeyPatch, patched
     assert attachments_result.success is True
     assert provenance_result.success is True
 
-    op_client.transfer_file_to_container.assert_called_once()
+    op_client.transfer_files_to_container.assert_called_once()
     # Pull the provenance _load call by inspecting payload shape — the
     # call list also contains setting reads/writes and the attachments
     # _load, so positional indexing is brittle.
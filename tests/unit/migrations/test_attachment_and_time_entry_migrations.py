@@ -90,7 +90,7 @@ def test_attachments_migration_transfers_files(tmp_path, monkeypatch, dummy_mapp
     result = migration.run()
 
     assert result.success
-    op_client.transfer_file_to_container.assert_called_once()
+    op_client.transfer_files_to_container.assert_called_once()
     execute_args = op_client.execute_script_with_data.call_args[0]
     payload = execute_args[1]
     assert len(payload) == 1
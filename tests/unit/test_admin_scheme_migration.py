@@ -59,6 +59,9 @@ class DummyOp:
             return {"success": False, "error": "boom"}
         return {"success": True}
 
+    def bulk_assign_user_roles(self, assignments):
+        return [self.assign_user_roles(**assignment) for assignment in assignments]
+
     def assign_group_roles(self, assignments):
         self.group_calls.append(assignments)
         return {"updated": len(assignments), "errors": 0}
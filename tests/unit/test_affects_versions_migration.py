@@ -30,12 +30,13 @@ class DummyJira:
             "PRJ-3": DummyIssue("PRJ-3", []),
         }
 
-    def batch_get_issues(self, keys):
+    def batch_get_issues(self, keys, **kwargs):
         return {k: self.issues[k] for k in keys if k in self.issues}
 
 
 class DummyOp:
     def __init__(self) -> None:
+        self.cf_writes: list[tuple] = []
         self.scripts: list[str] = []
 
     def get_custom_field_by_name(self, name: str):
@@ -49,6 +50,10 @@ class DummyOp:
             return 555
         return True
 
+    def bulk_set_custom_values(self, cf_id: int, values, *, touch_journal: bool = False):
+        self.cf_writes.append((cf_id, dict(values), touch_journal))
+        return {"updated": len(values), "unchanged": 0, "failed": 0}
+
     def ensure_wp_custom_field_id(self, name: str, field_format: str = "text") -> int:
         return 555
 
@@ -90,3 +95,6 @@ def test_affects_versions_migration_end_to_end():
     assert ld.success is True
     # Two issues have versions; third empty
     assert ld.updated == 2
+    # One bulk write for both work packages instead of a script per issue
+    assert len(mig.op_client.cf_writes) == 1
+    assert mig.op_client.scripts == []
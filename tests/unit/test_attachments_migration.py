@@ -53,6 +53,9 @@ class DummyOp:
     def transfer_file_to_container(self, local_path: Path, container_path: str):
         self.transfers.append((local_path, container_path))
 
+    def transfer_files_to_container(self, files: list[tuple[Path, Path]]):
+        self.transfers.extend((local_path, container_path.as_posix()) for local_path, container_path in files)
+
     def execute_script_with_data(self, script_content: str, data: object):
         # Marker-fenced ``Setting.attachment_max_size`` script — extract the
         # write target (if any) so the dummy mirrors a real Rails read/write
@@ -0,0 +1,109 @@
+"""Set-based prefetch in ``batch_update_work_packages``."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.exceptions import QueryExecutionError
+from src.infrastructure.openproject.openproject_work_package_service import (
+    OpenProjectWorkPackageService,
+)
+from tests.unit.test_work_package_content_comment_idempotency import _build_mig
+
+
+def _service() -> tuple[OpenProjectWorkPackageService, MagicMock]:
+    client = MagicMock()
+    client.logger = MagicMock()
+    return OpenProjectWorkPackageService(client), client
+
+
+def _payload(script: str) -> list[dict[str, object]]:
+    """Decode the updates embedded in the script's ``J2O_DATA`` heredoc."""
+    body = script.split("<<-'J2O_DATA'\n", 1)[1].split("\nJ2O_DATA\n", 1)[0]
+    return json.loads(body)
+
+
+def test_custom_field_keys_and_nulls_reach_rails_unchanged(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("J2O_BULK_MODE", "0")
+    service, client = _service()
+    client.execute_json_query.return_value = {"updated": 2, "unchanged": 0, "failed": 0, "results": []}
+    updates = [{"id": 1, "description": "Ünïcode", "customField7": "x"}, {"id": 2, "custom_field_8": None}]
+
+    service.batch_update_work_packages(updates)
+
+    client.execute_json_query.assert_called_once()
+    assert _payload(client.execute_json_query.call_args.args[0]) == updates
+
+
+def test_unchanged_and_skipped_rows_are_returned_and_skips_logged(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("J2O_BULK_MODE", "0")
+    service, client = _service()
+    response = {
+        "updated": 1,
+        "unchanged": 1,
+        "failed": 0,
+        "results": [
+            {"id": 1, "status": "updated", "skipped": ["customField9"]},
+            {"id": 2, "status": "unchanged"},
+        ],
+    }
+    client.execute_json_query.return_value = response
+
+    result = service.batch_update_work_packages([{"id": 1, "customField9": {"a": 1}}, {"id": 2, "subject": "x"}])
+
+    assert result == response
+    client.logger.warning.assert_called_once()
+    assert client.logger.warning.call_args.args[-1] == {1: ["customField9"]}
+
+
+def test_no_warning_without_skipped_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("J2O_BULK_MODE", "0")
+    service, client = _service()
+    client.execute_json_query.return_value = {
+        "updated": 0,
+        "unchanged": 1,
+        "failed": 0,
+        "results": [{"id": 1, "status": "unchanged"}],
+    }
+
+    assert service.batch_update_work_packages([{"id": 1, "subject": "x"}])["unchanged"] == 1
+    client.logger.warning.assert_not_called()
+
+
+def test_content_migration_writes_custom_fields_through_batch_update(tmp_path: Path) -> None:
+    mig = _build_mig(tmp_path)
+    mig.op_client.batch_update_work_packages.return_value = {"updated": 1, "unchanged": 0, "failed": 0, "results": []}
+    item = {
+        "wp_id": 5040,
+        "jira_key": "PROJ-1",
+        "description_update": None,
+        "custom_field_updates": {"customField7": "x", "customField8": ["a", "b"]},
+        "comments": [],
+        "watchers": [],
+    }
+
+    results = mig._bulk_process_collected_content([item])
+
+    mig.op_client.batch_update_work_packages.assert_called_once_with(
+        [{"id": 5040, "customField7": "x", "customField8": ["a", "b"]}],
+    )
+    assert results["custom_fields_updated"] == 1
+
+
+def test_empty_batch_skips_rails() -> None:
+    service, client = _service()
+
+    assert service.batch_update_work_packages([]) == {"updated": 0, "unchanged": 0, "failed": 0, "results": []}
+    client.execute_json_query.assert_not_called()
+
+
+def test_rails_failure_raises() -> None:
+    service, client = _service()
+    client.execute_json_query.side_effect = RuntimeError("console gone")
+
+    with pytest.raises(QueryExecutionError, match="Failed to batch update work packages"):
+        service.batch_update_work_packages([{"id": 1, "subject": "x"}])
@@ -0,0 +1,156 @@
+"""Double-buffered bulk-create pipeline.
+
+``BulkCreatePipeline`` runs the stage (serialize + upload), execute (Rails)
+and collect (download + cleanup) legs of consecutive ``bulk_create_records``
+batches on separate workers: batch N+1 uploads while batch N executes.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.exceptions import QueryExecutionError
+from src.infrastructure.openproject.openproject_bulk_create_service import (
+    BulkCreatePipeline,
+    OpenProjectBulkCreateService,
+)
+
+
+def _service() -> OpenProjectBulkCreateService:
+    client = MagicMock()
+    client.logger = MagicMock()
+    service = OpenProjectBulkCreateService(client)
+    service._stage_bulk_batch = MagicMock(side_effect=lambda model, records, **kw: {"n": records[0]})
+    service._execute_bulk_batch = MagicMock(side_effect=lambda staged: f"out{staged['n']}")
+    service._collect_bulk_batch = MagicMock(
+        side_effect=lambda staged, output: {"status": "success", "n": staged["n"], "output": output},
+    )
+    return service
+
+
+def test_results_resolve_in_submission_order() -> None:
+    service = _service()
+
+    with service.pipeline() as pipeline:
+        futures = [pipeline.submit("WorkPackage", [i], result_basename=f"b{i}") for i in range(5)]
+
+    assert [f.result()["n"] for f in futures] == [0, 1, 2, 3, 4]
+    assert [f.result()["output"] for f in futures] == [f"out{i}" for i in range(5)]
+    executed = [c.args[0]["n"] for c in service._execute_bulk_batch.call_args_list]
+    assert executed == [0, 1, 2, 3, 4]
+    assert service._stage_bulk_batch.call_args_list[2].kwargs == {"timeout": None, "result_basename": "b2"}
+
+
+def test_next_batch_stages_while_previous_executes() -> None:
+    service = _service()
+    executing = threading.Event()
+    staged_second = threading.Event()
+    release = threading.Event()
+
+    def _stage(model, records, **kw):
+        if records[0] == 1:
+            staged_second.set()
+        return {"n": records[0]}
+
+    def _execute(staged):
+        if staged["n"] == 0:
+            executing.set()
+            release.wait(5)
+
+    service._stage_bulk_batch.side_effect = _stage
+    service._execute_bulk_batch.side_effect = _execute
+
+    with service.pipeline(depth=2) as pipeline:
+        first = pipeline.submit("WorkPackage", [0])
+        assert executing.wait(5)
+        second = pipeline.submit("WorkPackage", [1])
+        # Batch 1 is uploaded while batch 0 still holds Rails.
+        assert staged_second.wait(5)
+        assert not first.done()
+        release.set()
+
+    assert first.result()["n"] == 0
+    assert second.result()["n"] == 1
+
+
+def test_failure_surfaces_on_its_future_only() -> None:
+    service = _service()
+
+    def _execute(staged):
+        if staged["n"] == 1:
+            msg = "boom"
+            raise QueryExecutionError(msg)
+
+    service._execute_bulk_batch.side_effect = _execute
+
+    with service.pipeline() as pipeline:
+        futures = [pipeline.submit("WorkPackage", [i]) for i in range(3)]
+
+    assert futures[0].result()["n"] == 0
+    with pytest.raises(QueryExecutionError, match="boom"):
+        futures[1].result()
+    assert futures[2].result()["n"] == 2
+    assert service._collect_bulk_batch.call_count == 2
+
+
+def test_submit_after_close_and_invalid_depth() -> None:
+    service = _service()
+    pipeline = service.pipeline()
+    pipeline.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        pipeline.submit("WorkPackage", [0])
+    with pytest.raises(ValueError, match="depth"):
+        BulkCreatePipeline(service, depth=0)
+
+
+def test_early_termination_while_flushing_the_tail_still_drains(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    from src.application.components.work_package_migration import WorkPackageMigration
+
+    monkeypatch.setenv("J2O_BULK_PIPELINE", "1")
+    monkeypatch.setenv("J2O_BULK_MODE", "0")
+    monkeypatch.setattr("src.config.jira_config", {"projects": ["PROJ"]})
+    monkeypatch.setattr("src.config.migration_config", {"batch_size": 100})
+
+    # Nothing is created, and the three full batches only finish once the
+    # tail is submitted, so the tail flush is what settles them.
+    futures: list[Future[dict[str, Any]]] = []
+
+    def submit(_model: str, _records: list[dict[str, Any]], **_kw: Any) -> Future[dict[str, Any]]:
+        futures.append(Future())
+        if len(futures) == 4:
+            for future in futures:
+                future.set_result({"created": [], "created_count": 0})
+        return futures[-1]
+
+    op_client = MagicMock()
+    op_client.bulk_create_pipeline.return_value = SimpleNamespace(submit=submit, close=lambda: None)
+    migration = WorkPackageMigration.__new__(WorkPackageMigration)
+    migration.logger = MagicMock()
+    migration.data_dir = tmp_path
+    migration.project_mapping = {"PROJ": {"jira_key": "PROJ", "openproject_id": 42}}
+    migration.op_client = op_client
+    migration._get_existing_work_packages = lambda *_a: {}
+    migration._iter_all_project_issues = lambda _key: iter(
+        SimpleNamespace(key=f"PROJ-{i}", id=str(i)) for i in range(1, 302)
+    )
+    migration.prepare_work_package = lambda issue, _pid: {"subject": issue.key, "project_id": 42}
+    migration._extract_issue_meta = lambda _issue: {}
+    migration._record_created_work_packages = MagicMock()
+    migration._assign_memberships_for_mentioned_users = lambda _pid: {}
+
+    migration._migrate_work_packages()
+
+    migration.logger.exception.assert_not_called()
+    warnings = [call.args[0] for call in migration.logger.warning.call_args_list]
+    assert "Migration stopped early for %s after %d failed attempts" in warnings
+    assert len(futures) == 4
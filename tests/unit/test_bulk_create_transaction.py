@@ -0,0 +1,94 @@
+"""Batch-transaction mode (one commit per batch, a savepoint per record) of the bulk-create scripts."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.exceptions import QueryExecutionError
+from src.infrastructure.openproject.openproject_bulk_create_service import (
+    OpenProjectBulkCreateService,
+)
+
+
+def _service(tmp_path: Path) -> tuple[OpenProjectBulkCreateService, MagicMock]:
+    client = MagicMock()
+    client.logger = MagicMock()
+    client.file_manager.data_dir = str(tmp_path)
+    return OpenProjectBulkCreateService(client), client
+
+
+def test_bulk_create_records_mode_travels_with_the_call_input(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    service, client = _service(tmp_path)
+    staged = {}
+    for enabled in ("1", "0"):
+        monkeypatch.setenv("J2O_BULK_TRANSACTION", enabled)
+        staged[enabled] = service._stage_bulk_batch("Status", [{"name": "Open"}], timeout=None, result_basename=None)
+
+    bodies = {call.args[0] for call in client.rails_runner.script_cache.ensure.call_args_list}
+    # Both modes share one cached body; only the per-call input differs.
+    assert len(bodies) == 1
+    assert "'batch_transaction' => '1'" in staged["1"].full_script
+    assert "'batch_transaction' => '0'" in staged["0"].full_script
+
+
+def _uploaded_payload(client: MagicMock) -> list[dict[str, object]]:
+    uploads: list[list[dict[str, object]]] = []
+
+    def _transfer(pairs: list[tuple[Path, Path]]) -> None:
+        uploads.extend(json.loads(local.read_text()) for local, _remote in pairs)
+
+    client.transfer_files_to_container.side_effect = _transfer
+    return uploads
+
+
+@pytest.mark.parametrize("enabled", ["1", "0"])
+def test_work_package_batch_uploads_payload_and_returns_rails_result(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    enabled: str,
+) -> None:
+    monkeypatch.setenv("J2O_BULK_TRANSACTION", enabled)
+    service, client = _service(tmp_path)
+    uploads = _uploaded_payload(client)
+    rails_result = {
+        "created": 1,
+        "failed": 1,
+        "results": [
+            {"id": 10, "status": "created", "subject": "A"},
+            {"subject": "B", "status": "failed", "error": "rolled back"},
+        ],
+    }
+    client.execute_json_query.return_value = rails_result
+    work_packages = [{"subject": "A", "project_id": 1}, {"subject": "B", "project_id": 1}]
+
+    assert service._create_work_packages_batch(work_packages) == rails_result
+    assert uploads == [work_packages]
+
+
+def test_work_package_batch_counts_unexpected_result_as_failed(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setenv("J2O_BULK_TRANSACTION", "1")
+    service, client = _service(tmp_path)
+    client.execute_json_query.return_value = None
+
+    result = service._create_work_packages_batch([{"subject": "A"}, {"subject": "B"}])
+
+    assert result == {"created": 0, "failed": 2, "results": []}
+
+
+def test_work_package_batch_raises_when_rails_fails(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("J2O_BULK_TRANSACTION", "1")
+    service, client = _service(tmp_path)
+    client.execute_json_query.side_effect = RuntimeError("console gone")
+
+    with pytest.raises(QueryExecutionError, match="Failed to batch create work packages"):
+        service._create_work_packages_batch([{"subject": "A"}])
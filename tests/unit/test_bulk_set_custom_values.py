@@ -0,0 +1,65 @@
+"""Tests for the chunked work-package custom-value writer."""
+
+from __future__ import annotations
+
+import json
+import re
+from unittest.mock import MagicMock
+
+from src.infrastructure.openproject.openproject_work_package_custom_field_service import (
+    OpenProjectWorkPackageCustomFieldService,
+)
+
+
+def _service() -> tuple[OpenProjectWorkPackageCustomFieldService, MagicMock]:
+    client = MagicMock()
+    client.logger = MagicMock()
+    return OpenProjectWorkPackageCustomFieldService(client), client
+
+
+def _rows(script: str) -> list[list]:
+    return json.loads(re.search(r"<<-'J2O_DATA'\n(.*?)\nJ2O_DATA", script, re.DOTALL).group(1))
+
+
+def test_values_are_written_in_chunks_and_totals_aggregated() -> None:
+    svc, client = _service()
+    client.execute_query_to_json_file.side_effect = [
+        {"updated": 2, "created": 1, "unchanged": 0, "failed": 0, "errors": []},
+        {"updated": 0, "created": 0, "unchanged": 0, "failed": 1, "errors": [{"wp_id": 3, "error": "x"}]},
+    ]
+
+    result = svc.bulk_set_custom_values(7, {1: "a", 2: "b", 3: "c'd"}, chunk_size=2)
+
+    scripts = [c.args[0] for c in client.execute_query_to_json_file.call_args_list]
+    assert [_rows(s) for s in scripts] == [[[1, "a"], [2, "b"]], [[3, "c'd"]]]
+    assert all("cf_id = 7" in s and "touch_journal = false" in s for s in scripts)
+    assert result == {
+        "updated": 2,
+        "created": 1,
+        "unchanged": 0,
+        "failed": 1,
+        "errors": [{"wp_id": 3, "error": "x"}],
+        "success": False,
+    }
+
+
+def test_touch_journal_and_rails_failure() -> None:
+    svc, client = _service()
+    client.execute_query_to_json_file.side_effect = RuntimeError("console gone")
+
+    result = svc.bulk_set_custom_values(7, {1: "a", 2: "b"}, touch_journal=True)
+
+    assert "touch_journal = true" in client.execute_query_to_json_file.call_args.args[0]
+    assert result["success"] is False
+    assert result["failed"] == 2
+    assert result["errors"] == [{"error": "console gone"}]
+
+
+def test_empty_and_malformed_input() -> None:
+    svc, client = _service()
+
+    assert svc.bulk_set_custom_values(7, {})["success"] is True
+    bad = svc.bulk_set_custom_values(7, {"x": "a"})  # type: ignore[dict-item]
+    assert bad["success"] is False
+    assert bad["failed"] == 1
+    client.execute_query_to_json_file.assert_not_called()
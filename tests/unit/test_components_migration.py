@@ -27,7 +27,7 @@ class DummyJira:
             "ABC-3": DummyIssue("ABC-3", ["Core"]),
         }
 
-    def batch_get_issues(self, keys):
+    def batch_get_issues(self, keys, **kwargs):
         return {k: self.issues[k] for k in keys if k in self.issues}
 
 
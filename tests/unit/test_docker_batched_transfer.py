@@ -0,0 +1,84 @@
+"""Batched tar-stream transfer into the container.
+
+``DockerClient.transfer_files_to_container`` streams many files through one
+``ssh ... docker exec -i -u root <ctr> sh -c 'tar -x ... && stat ...'`` call
+instead of scp + ``docker cp`` + chmod + checks per file.
+"""
+
+from __future__ import annotations
+
+import io
+import tarfile
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.openproject.docker_client import DockerClient
+
+
+def _docker_with_fake_ssh(stat_output: str | None = None, rc: int = 0) -> tuple[DockerClient, MagicMock, io.BytesIO]:
+    sent = io.BytesIO()
+    ssh = MagicMock()
+
+    def _run(command, write_input, timeout=None, *, check=True):
+        write_input(sent)
+        return stat_output if stat_output is not None else _stat_from(sent), "", rc
+
+    ssh.execute_command_with_input.side_effect = _run
+    docker = DockerClient.__new__(DockerClient)
+    docker.container_name = "openproject-web"
+    docker.command_timeout = 60
+    docker.ssh_client = ssh
+    return docker, ssh, sent
+
+
+def _stat_from(sent: io.BytesIO) -> str:
+    with tarfile.open(fileobj=io.BytesIO(sent.getvalue()), mode="r|") as tar:
+        return "".join(f"{m.size} /{m.name}\n" for m in tar)
+
+
+def test_streams_all_files_in_one_ssh_call(tmp_path: Path) -> None:
+    a = tmp_path / "a.json"
+    a.write_text("[1, 2, 3]")
+    b = tmp_path / "b.rb"
+    b.write_text("puts 1\n")
+    docker, ssh, sent = _docker_with_fake_ssh()
+
+    docker.transfer_files_to_container([(a, "/tmp/a.json"), (b, Path("/tmp/b.rb"))])
+
+    assert ssh.execute_command_with_input.call_count == 1
+    command = ssh.execute_command_with_input.call_args[0][0]
+    assert command.startswith("docker exec -i -u root openproject-web sh -c")
+    assert "tar -x" in command
+    with tarfile.open(fileobj=io.BytesIO(sent.getvalue()), mode="r|") as tar:
+        members = {m.name: (m.mode, m.uid) for m in tar}
+    assert members == {"tmp/a.json": (0o644, 0), "tmp/b.rb": (0o644, 0)}
+
+
+def test_size_mismatch_raises(tmp_path: Path) -> None:
+    a = tmp_path / "a.json"
+    a.write_text("[1, 2, 3]")
+    docker, _ssh, _sent = _docker_with_fake_ssh(stat_output="3 /tmp/a.json\n")
+
+    with pytest.raises(ValueError, match="Size mismatch"):
+        docker.transfer_files_to_container([(a, "/tmp/a.json")])
+
+
+def test_remote_failure_raises(tmp_path: Path) -> None:
+    a = tmp_path / "a.json"
+    a.write_text("{}")
+    docker, _ssh, _sent = _docker_with_fake_ssh(stat_output="", rc=2)
+
+    with pytest.raises(ValueError, match="rc=2"):
+        docker.transfer_files_to_container([(a, "/tmp/a.json")])
+
+
+def test_rejects_missing_local_and_relative_container_paths(tmp_path: Path) -> None:
+    docker, ssh, _sent = _docker_with_fake_ssh()
+    with pytest.raises(ValueError, match="Local file not found"):
+        docker.transfer_files_to_container([(tmp_path / "missing", "/tmp/x")])
+    (tmp_path / "x").write_text("x")
+    with pytest.raises(ValueError, match="absolute"):
+        docker.transfer_files_to_container([(tmp_path / "x", "tmp/x")])
+    ssh.execute_command_with_input.assert_not_called()
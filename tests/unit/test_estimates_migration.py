@@ -30,7 +30,7 @@ class DummyJira:
             "PRJ-3": DummyIssue("PRJ-3", DummyFields(timeoriginalestimate=None, timeestimate=None)),
         }
 
-    def batch_get_issues(self, keys):
+    def batch_get_issues(self, keys, **kwargs):
         return {k: self.issues[k] for k in keys if k in self.issues}
 
 
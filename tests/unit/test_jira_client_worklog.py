@@ -127,6 +127,45 @@ class TestJiraClientWorkLog:
         ):
             mock_jira_client.get_work_logs_for_issue("TEST-123")
 
+    def test_get_work_logs_for_projects_bulk(self, mock_jira_client) -> None:
+        """Bulk worklog endpoints are paged and filtered to the target projects."""
+        mock_jira_client.jira.search_issues.return_value = {
+            "total": 1,
+            "issues": [{"id": "501", "key": "TEST-1"}],
+        }
+        updated_pages = [
+            {"values": [{"worklogId": 1}, {"worklogId": 2}], "until": 100, "lastPage": False, "nextPage": "/page2"},
+            {"values": [{"worklogId": 3}], "until": 200, "lastPage": True},
+        ]
+        worklogs = [
+            {"id": 1, "issueId": 501, "timeSpentSeconds": 3600, "author": {"name": "jdoe"}, "updated": "u1"},
+            {"id": 2, "issueId": 999, "timeSpentSeconds": 60},
+            {"id": 3, "issueId": 501, "timeSpentSeconds": 1800, "updateAuthor": {"accountId": "a-1"}},
+        ]
+
+        with (
+            patch.object(
+                mock_jira_client.jira._session,
+                "get",
+                side_effect=[Mock(status_code=200, json=Mock(return_value=page)) for page in updated_pages],
+            ) as get,
+            patch.object(
+                mock_jira_client.jira._session,
+                "post",
+                return_value=Mock(status_code=200, json=Mock(return_value=worklogs)),
+            ) as post,
+        ):
+            result, until = mock_jira_client.get_work_logs_for_projects(["TEST"], since=50)
+
+        assert until == 200
+        assert get.call_args_list[0].args[0] == "https://test.atlassian.net/rest/api/2/worklog/updated?since=50"
+        assert get.call_args_list[1].args[0] == "https://test.atlassian.net/page2"
+        assert post.call_args.kwargs["data"] == '{"ids": [1, 2, 3]}'
+        assert [log["id"] for log in result["TEST-1"]] == ["1", "3"]
+        assert result["TEST-1"][0]["author"]["name"] == "jdoe"
+        assert result["TEST-1"][1]["update_author"]["account_id"] == "a-1"
+        assert list(result) == ["TEST-1"]
+
     def test_get_tempo_work_logs_success(self, mock_jira_client) -> None:
         """Test successful Tempo work logs retrieval."""
         # Mock the session response
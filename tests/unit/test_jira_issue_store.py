@@ -0,0 +1,78 @@
+"""Shared on-disk Jira issue store read by the post-WP components."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.application.components.base_migration import BaseMigration
+from src.utils.jira_issue_store import JiraIssueStore, issue_from_raw
+
+
+def _issue(key: str, updated: str = "2026-01-01T00:00:00.000+0000", **fields: object) -> SimpleNamespace:
+    raw = {
+        "key": key,
+        "id": key.rsplit("-", 1)[1],
+        "fields": {"updated": updated, "labels": [], **fields},
+        "changelog": {"histories": []},
+    }
+    return SimpleNamespace(key=key, raw=raw)
+
+
+def test_upsert_and_lazy_reads(tmp_path: Path) -> None:
+    store = JiraIssueStore.for_data_dir(tmp_path)
+    written = store.upsert(
+        [_issue("P-1", labels=["a"]), _issue("P-2"), _issue("Q-1"), SimpleNamespace(raw=None), {"fields": {}}],
+        expand="changelog,renderedFields",
+    )
+    assert written == 3
+    assert store.count() == 3
+
+    hits = store.get_many(["P-1", "P-9"], fields=["labels"])
+    assert hits == {"P-1": {"key": "P-1", "id": "1", "fields": {"labels": ["a"]}}}
+    # renderedFields was requested but not in the payload, so it is not claimed as stored.
+    assert store.get_many(["P-1"], expand=["renderedFields"]) == {}
+    assert store.get_many(["P-1"], fields=["labels"], expand=["changelog"])["P-1"]["changelog"] == {"histories": []}
+
+    assert [i["key"] for i in store.iter_project("P", fields=["labels"])] == ["P-1", "P-2"]
+
+    store.upsert([_issue("P-2", updated="2026-02-01T00:00:00.000+0000", labels=["b"])], expand="changelog")
+    assert store.get("P-2", fields=["labels"])["fields"] == {"labels": ["b"]}
+    assert store.latest_updated("P") == "2026-02-01T00:00:00.000+0000"
+    assert store.count() == 3
+
+
+def test_issue_from_raw_is_sdk_shaped() -> None:
+    issue = issue_from_raw(
+        {"key": "P-1", "id": "1", "fields": {"watches": {"watchers": [{"name": "bob"}]}, "customfield_1": 3}},
+    )
+    assert issue.fields.watches.watchers[0].name == "bob"
+    assert "customfield_1" in dir(issue.fields)
+    assert issue.raw["key"] == "P-1"
+
+
+def test_merge_batch_issues_reads_store_and_fetches_misses(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("J2O_JIRA_ISSUE_STORE", "1")
+    JiraIssueStore.for_data_dir(tmp_path).upsert([_issue("P-1", labels=["a"])], expand="changelog")
+
+    requested: list[list[str]] = []
+
+    class DummyJira:
+        def batch_get_issues(self, keys: list[str], **kwargs: object) -> dict[str, object]:
+            requested.append(list(keys))
+            return {k: _issue(k, labels=["fresh"]) for k in keys}
+
+    migration = BaseMigration.__new__(BaseMigration)
+    migration.data_dir = tmp_path
+    migration.jira_client = DummyJira()
+
+    issues = migration._merge_batch_issues(["P-1", "P-2"])
+
+    assert requested == [["P-2"]]
+    assert issues["P-1"].fields.labels == ["a"]
+    assert issues["P-2"].raw["fields"]["labels"] == ["fresh"]
+    # The full-field miss was written back, so the next read needs no fetch.
+    migration._merge_batch_issues(["P-1", "P-2"])
+    assert requested == [["P-2"]]
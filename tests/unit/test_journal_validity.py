@@ -460,6 +460,20 @@ class TestRubyScriptIntegrity:
         assert "CLEANUP" in ruby_content, "Cleanup actions should be logged"
         assert "puts" in ruby_content, "Should have logging statements"
 
+    def test_batch_script_inserts_across_work_packages(self) -> None:
+        """Verify the batch script writes all WPs' journals with shared multi-row statements."""
+        with open("src/ruby/create_work_package_journals_batch.rb", encoding="utf-8") as f:
+            ruby_content = f.read()
+
+        # Rows are inserted per slice of the whole batch, not per WP
+        assert ruby_content.count("each_slice(insert_slice)") >= 4
+        assert "RETURNING id, journable_id, version" in ruby_content, (
+            "Journal ids must be mapped back by (work package, version)"
+        )
+        assert "FROM (VALUES" in ruby_content, "v1 journals should be updated in one statement"
+        # A failing shared statement is retried WP by WP
+        assert "write_plans.call([plan])" in ruby_content
+
 
 # ============================================================================
 # Regression Tests
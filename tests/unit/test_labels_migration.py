@@ -1,6 +1,8 @@
 import pytest
 
+from src.application.components.base_migration import BaseMigration
 from src.application.components.labels_migration import LABELS_CF_NAME, LabelsMigration
+from src.application.components.native_tags_migration import NativeTagsMigration
 
 
 class DummyIssue:
@@ -13,8 +15,8 @@ class DummyIssue:
 
 
 class DummyJira:
-    def batch_get_issues(self, keys):
-        return {"J1": DummyIssue(["x", "y", "x"]), "J2": DummyIssue([])}
+    def batch_get_issues(self, keys, **kwargs):
+        return {"PROJ-1": DummyIssue(["x", "y", "x"]), "PROJ-2": DummyIssue([])}
 
 
 class DummyOp:
@@ -56,8 +58,8 @@ def _mock_mappings(monkeypatch: pytest.MonkeyPatch):
         def __init__(self) -> None:
             self._m = {
                 "work_package": {
-                    "J1": {"openproject_id": 2001},
-                    "J2": {"openproject_id": 2002},
+                    "PROJ-1": {"openproject_id": 2001},
+                    "PROJ-2": {"openproject_id": 2002},
                 },
             }
 
@@ -74,3 +76,26 @@ def test_labels_migration_sets_cf_text():
     ld = mig._load(mp)
     assert ld.success is True
     assert ld.updated >= 1
+
+
+def test_fused_extraction_fetches_issues_once(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(BaseMigration, "_run_jira_projection", None)
+    monkeypatch.setattr(BaseMigration, "_fused_issue_values", {})
+    calls: list[list[str]] = []
+
+    class CountingJira(DummyJira):
+        def batch_get_issues(self, keys, **kwargs):
+            calls.append(list(keys))
+            return super().batch_get_issues(keys, **kwargs)
+
+    jira = CountingJira()
+
+    labels = LabelsMigration(jira_client=jira, op_client=DummyOp())  # type: ignore[arg-type]
+    tags = NativeTagsMigration(jira_client=jira, op_client=DummyOp())  # type: ignore[arg-type]
+    BaseMigration.run_fused_extraction([labels, tags])
+
+    assert calls == [["PROJ-1", "PROJ-2"]]
+    assert labels._extract().data == {"labels": {"PROJ-1": ["x", "y", "x"]}}
+    assert tags._extract().data == {"by_key": {"PROJ-1": ["x", "y"]}}
+    # Both components were served from the fused pass, not a fetch of their own.
+    assert len(calls) == 1
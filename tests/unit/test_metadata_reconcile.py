@@ -0,0 +1,175 @@
+"""One-call reconciliation of metadata sets (types, statuses, priorities)."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.exceptions import QueryExecutionError
+from src.infrastructure.openproject.openproject_records_service import (
+    OpenProjectRecordsService,
+)
+
+
+def _service() -> tuple[OpenProjectRecordsService, MagicMock]:
+    client = MagicMock()
+    client.logger = MagicMock()
+    return OpenProjectRecordsService(client), client
+
+
+def _envelope(**buckets: list[dict]) -> dict:
+    return {"status": "success", "existing": [], "created": [], "conflicts": [], "errors": [], **buckets}
+
+
+def _sent_records(script: str) -> list[dict[str, object]]:
+    """Decode the records embedded in the script's ``J2O_DATA`` heredoc."""
+    body = script.split("<<-'J2O_DATA'\n", 1)[1].split("\nJ2O_DATA\n", 1)[0]
+    return json.loads(body)
+
+
+def test_reconcile_sends_whole_set_in_one_call() -> None:
+    service, client = _service()
+    response = _envelope(created=[{"index": 0, "id": 9, "name": "Bug"}])
+    client.execute_query_to_json_file.return_value = response
+    records = [{"name": "Bug"}, {"name": "Tâche 'quoted'", "is_milestone": None}]
+
+    result = service.reconcile_records("Type", records, compare=["is_milestone"])
+
+    assert result == response
+    client.execute_query_to_json_file.assert_called_once()
+    assert _sent_records(client.execute_query_to_json_file.call_args.args[0]) == records
+
+
+def test_reconcile_wraps_rails_failure() -> None:
+    service, client = _service()
+    client.execute_query_to_json_file.side_effect = RuntimeError("console gone")
+
+    with pytest.raises(QueryExecutionError, match="Failed to reconcile Type records"):
+        service.reconcile_records("Type", [{"name": "Bug"}])
+
+
+def test_reconcile_validates_names() -> None:
+    service, client = _service()
+
+    with pytest.raises(ValueError, match="not in the allowed models"):
+        service.reconcile_records("Kernel", [{"name": "x"}])
+    with pytest.raises(ValueError, match="Invalid attribute name"):
+        service.reconcile_records("Type", [{"name": "x"}], compare=["name'); system('id"])
+    client.execute_query_to_json_file.assert_not_called()
+
+
+def test_reconcile_empty_set_skips_rails() -> None:
+    service, client = _service()
+
+    assert service.reconcile_records("Status", [])["created"] == []
+    client.execute_query_to_json_file.assert_not_called()
+
+
+def test_reconcile_rejects_unexpected_response() -> None:
+    service, client = _service()
+    client.execute_query_to_json_file.return_value = {"status": "error"}
+
+    with pytest.raises(QueryExecutionError, match="Unexpected Status reconciliation response"):
+        service.reconcile_records("Status", [{"name": "Open"}])
+
+
+def test_issue_types_reconciled_in_one_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    from src.application.components.issue_type_migration import IssueTypeMigration
+
+    monkeypatch.setenv("J2O_METADATA_RECONCILE", "1")
+    persisted: dict[str, dict] = {}
+    monkeypatch.setattr(
+        "src.config.mappings",
+        MagicMock(set_mapping=persisted.__setitem__),
+        raising=False,
+    )
+    mig = IssueTypeMigration.__new__(IssueTypeMigration)
+    mig.logger = MagicMock()
+    mig.op_client = MagicMock()
+    mig.issue_type_mapping = {
+        "Bug": {"jira_id": 1, "jira_name": "Bug", "openproject_name": "Bug", "openproject_id": None},
+        "Sub: Bug": {"jira_id": 2, "jira_name": "Sub: Bug", "openproject_name": "bug", "openproject_id": None},
+        "Epic": {"jira_id": 3, "jira_name": "Epic", "openproject_name": "Epic", "openproject_id": None},
+    }
+    mig.op_client.reconcile_records.return_value = _envelope(
+        existing=[{"index": 0, "id": 7, "name": "Bug"}],
+        created=[{"index": 1, "id": 8, "name": "Epic"}],
+    )
+
+    mig.migrate_issue_types_via_rails()
+
+    records = mig.op_client.reconcile_records.call_args.args[1]
+    assert [r["name"] for r in records] == ["Bug", "Epic"]
+    mig.op_client.get_work_package_types.assert_not_called()
+    mig.op_client.bulk_create_records.assert_not_called()
+    assert persisted["issue_type_id"] == {1: 7, 2: 7, 3: 8}
+    assert mig.issue_type_mapping["Epic"]["matched_by"] == "created"
+
+
+def test_single_type_create_is_one_call() -> None:
+    from src.application.components.issue_type_migration import IssueTypeMigration
+
+    mig = IssueTypeMigration.__new__(IssueTypeMigration)
+    mig.logger = MagicMock()
+    mig.op_client = MagicMock()
+    mig.op_client.reconcile_records.return_value = _envelope(existing=[{"index": 0, "id": 5, "name": "Bug"}])
+
+    result = mig.create_work_package_type_via_rails({"openproject_name": "Bug"})
+
+    assert result["id"] == 5
+    mig.op_client.reconcile_records.assert_called_once()
+    mig.op_client.execute_query.assert_not_called()
+
+
+def test_statuses_reconciled(monkeypatch: pytest.MonkeyPatch) -> None:
+    from src.application.components.status_migration import StatusMigration
+
+    monkeypatch.setenv("J2O_METADATA_RECONCILE", "1")
+    mig = StatusMigration.__new__(StatusMigration)
+    mig.op_client = MagicMock()
+    mig.op_client.reconcile_records.return_value = _envelope(
+        conflicts=[{"index": 0, "id": 3, "name": "Done", "fields": {"is_closed": False}}],
+        created=[{"index": 1, "id": 4, "name": "Review"}],
+        errors=[{"index": 2, "errors": ["Name is too long"]}],
+    )
+
+    result = mig.create_statuses_bulk_via_rails(
+        [
+            {"jira_id": "10", "name": "Done", "is_closed": True},
+            {"jira_id": "11", "name": "Review"},
+            {"jira_id": "12", "name": "x" * 300},
+        ],
+    )
+
+    assert result == {
+        "10": {"id": 3, "name": "Done", "already_existed": True},
+        "11": {"id": 4, "name": "Review", "already_existed": False},
+        "12": {"error": "Name is too long", "already_existed": False},
+    }
+    assert mig.op_client.reconcile_records.call_args.kwargs["compare"] == ("is_closed",)
+    mig.op_client.bulk_create_records.assert_not_called()
+
+
+def test_priorities_reconciled(monkeypatch: pytest.MonkeyPatch) -> None:
+    from src.application.components.priority_migration import PriorityMigration
+    from src.models import JiraPriority
+
+    monkeypatch.setenv("J2O_METADATA_RECONCILE", "1")
+    mig = PriorityMigration.__new__(PriorityMigration)
+    mig.op_client = MagicMock()
+    mig.mappings = MagicMock()
+    mig.op_client.reconcile_records.return_value = _envelope(
+        existing=[{"index": 0, "id": 1, "name": "normal"}],
+        created=[{"index": 1, "id": 2, "name": "High"}],
+    )
+    priorities = [JiraPriority.from_dict({"name": n}) for n in ("Normal", "High", "Normal")]
+
+    mapped = mig._map(MagicMock(data={"priorities": priorities}))
+
+    assert mapped.data == {"mapping": {"Normal": 1, "High": 2}}
+    assert mapped.created_types == 1
+    records = mig.op_client.reconcile_records.call_args.args[1]
+    assert records == [{"name": "Normal", "active": True}, {"name": "High", "active": True}]
+    mig.op_client.create_issue_priority.assert_not_called()
@@ -0,0 +1,80 @@
+"""``config.migration_flag`` and the opt-in switches built on it."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import pytest
+
+from src import config
+from src.infrastructure.openproject.openproject_associations_service import raw_bulk_associations_enabled
+from src.infrastructure.openproject.openproject_bulk_create_service import (
+    bulk_pipeline_enabled,
+    bulk_transaction_enabled,
+    skeleton_fast_path_enabled,
+)
+from src.infrastructure.openproject.openproject_rails_runner_service import OpenProjectRailsRunnerService
+from src.infrastructure.openproject.openproject_records_service import metadata_reconcile_enabled
+from src.infrastructure.openproject.payload_compression import compression_enabled
+from src.infrastructure.openproject.rails_bulk_mode import bulk_mode_enabled
+from src.infrastructure.openproject.rails_prefork_server import prefork_runner_enabled
+from src.infrastructure.openproject.tmux_output_channel import pipe_pane_enabled
+from src.utils.jira_issue_store import issue_store_enabled
+from src.utils.time_entry_migrator import TimeEntryMigrator
+from src.utils.wp_snapshot_cache import snapshot_delta_enabled
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("1", True), ("TRUE", True), (" yes ", True), ("on", True), ("0", False), ("no", False), ("", False)],
+)
+def test_env_overrides_config(monkeypatch: pytest.MonkeyPatch, raw: str, expected: bool) -> None:
+    monkeypatch.setattr("src.config.migration_config", {"some_switch": not expected})
+    monkeypatch.setenv("J2O_SOME_SWITCH", raw)
+
+    assert config.migration_flag("J2O_SOME_SWITCH", "some_switch") is expected
+
+
+def test_config_then_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("J2O_SOME_SWITCH", raising=False)
+    monkeypatch.setattr("src.config.migration_config", {})
+    assert config.migration_flag("J2O_SOME_SWITCH", "some_switch") is False
+    assert config.migration_flag("J2O_SOME_SWITCH", "some_switch", default=True) is True
+
+    monkeypatch.setattr("src.config.migration_config", {"some_switch": True})
+    assert config.migration_flag("J2O_SOME_SWITCH", "some_switch") is True
+
+
+@pytest.mark.parametrize(
+    ("enabled", "env", "key"),
+    [
+        (lambda: OpenProjectRailsRunnerService.rpc_worker_enabled(None), "J2O_RAILS_RPC_WORKER", "rails_rpc_worker"),
+        (pipe_pane_enabled, "J2O_TMUX_PIPE_PANE", "tmux_pipe_pane"),
+        (compression_enabled, "J2O_PAYLOAD_COMPRESSION", "payload_compression"),
+        (bulk_pipeline_enabled, "J2O_BULK_PIPELINE", "bulk_pipeline"),
+        (prefork_runner_enabled, "J2O_RAILS_PREFORK", "rails_prefork_runner"),
+        (raw_bulk_associations_enabled, "J2O_RAW_BULK_ASSOCIATIONS", "raw_bulk_associations"),
+        (bulk_mode_enabled, "J2O_BULK_MODE", "bulk_mode"),
+        (bulk_transaction_enabled, "J2O_BULK_TRANSACTION", "bulk_transaction"),
+        (skeleton_fast_path_enabled, "J2O_SKELETON_FAST_PATH", "skeleton_fast_path"),
+        (metadata_reconcile_enabled, "J2O_METADATA_RECONCILE", "metadata_reconcile"),
+        (snapshot_delta_enabled, "J2O_WP_SNAPSHOT_DELTA", "wp_snapshot_delta"),
+        (issue_store_enabled, "J2O_JIRA_ISSUE_STORE", "jira_issue_store"),
+        (TimeEntryMigrator._worklog_bulk_enabled, "J2O_JIRA_WORKLOG_BULK", "jira_worklog_bulk"),
+    ],
+)
+def test_switches_are_opt_in(
+    monkeypatch: pytest.MonkeyPatch,
+    enabled: Callable[[], bool],
+    env: str,
+    key: str,
+) -> None:
+    monkeypatch.delenv(env, raising=False)
+    monkeypatch.setattr("src.config.migration_config", {})
+    assert enabled() is False
+
+    monkeypatch.setattr("src.config.migration_config", {key: True})
+    assert enabled() is True
+
+    monkeypatch.setenv(env, "0")
+    assert enabled() is False
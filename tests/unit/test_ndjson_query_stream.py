@@ -0,0 +1,103 @@
+"""Tests for NDJSON streaming of large Rails query results."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.exceptions import QueryExecutionError
+from src.infrastructure.openproject.openproject_project_attribute_service import (
+    OpenProjectProjectAttributeService,
+)
+from src.infrastructure.openproject.openproject_rails_runner_service import (
+    OpenProjectRailsRunnerService,
+    iter_ndjson,
+)
+
+ROWS = [{"id": i, "jira_issue_key": f"NRS-{i}"} for i in range(1, 6)]
+
+
+def _ndjson(rows: list[dict]) -> bytes:
+    return b"".join(json.dumps(row).encode() + b"\n" for row in rows)
+
+
+def test_iter_ndjson_handles_lines_split_across_chunks() -> None:
+    blob = _ndjson(ROWS)
+    chunks = [blob[i : i + 7] for i in range(0, len(blob), 7)]
+    assert list(iter_ndjson(chunks)) == ROWS
+    assert list(iter_ndjson([b'{"a": 1}\n\n{"a": 2}'])) == [{"a": 1}, {"a": 2}]
+
+
+@pytest.fixture
+def streaming_service(monkeypatch: pytest.MonkeyPatch, tmp_path) -> tuple[OpenProjectRailsRunnerService, MagicMock]:
+    monkeypatch.setenv("J2O_RAILS_RPC_WORKER", "0")
+    client = MagicMock()
+    client.logger = MagicMock()
+    client.container_name = "openproject-web"
+    client.file_manager.data_dir = tmp_path
+    client.docker_client.check_file_exists_in_container.return_value = True
+    svc = OpenProjectRailsRunnerService(client)
+    monkeypatch.setattr(svc, "_run_file_writing_script", MagicMock())
+    return svc, client
+
+
+def _stream(blob: bytes, returncode: int = 0):
+    def _iter(command, timeout=None, *, outcome=None) -> Iterator[bytes]:
+        for i in range(0, len(blob), 5):
+            yield blob[i : i + 5]
+        if outcome is not None:
+            outcome.update(stderr="", returncode=returncode)
+
+    return _iter
+
+
+def test_iter_query_ndjson_yields_rows_and_cleans_up(streaming_service, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("J2O_PAYLOAD_COMPRESSION", "0")
+    svc, client = streaming_service
+    client.ssh_client.iter_command_output.side_effect = _stream(_ndjson(ROWS))
+
+    rows = svc.iter_query_ndjson("Project.find_each { |p| emit.call(p) }")
+    svc._run_file_writing_script.assert_not_called()  # lazy until iterated
+    assert list(rows) == ROWS
+
+    svc._run_file_writing_script.assert_called_once()
+    assert " cat /tmp/j2o_stream_" in client.ssh_client.iter_command_output.call_args[0][0]
+    assert client.docker_client.execute_command.call_args[0][0].startswith("rm -f /tmp/j2o_stream_")
+
+
+def test_iter_query_ndjson_inflates_gzip(streaming_service, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("J2O_PAYLOAD_COMPRESSION", "1")
+    svc, client = streaming_service
+    client.ssh_client.iter_command_output.side_effect = _stream(gzip.compress(_ndjson(ROWS)))
+
+    assert list(svc.iter_query_ndjson("emit.call(1)", container_file="/tmp/x.ndjson")) == ROWS
+    assert "gzip -c -- /tmp/x.ndjson" in client.ssh_client.iter_command_output.call_args[0][0]
+
+
+def test_iter_query_ndjson_raises_on_read_failure(streaming_service, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("J2O_PAYLOAD_COMPRESSION", "0")
+    svc, client = streaming_service
+    client.ssh_client.iter_command_output.side_effect = _stream(b"", returncode=1)
+
+    with pytest.raises(QueryExecutionError):
+        list(svc.iter_query_ndjson("emit.call(1)"))
+
+
+def test_snapshot_streams_rows_from_ndjson_query() -> None:
+    client = MagicMock()
+    client.logger = MagicMock()
+    client.iter_query_ndjson.return_value = iter(ROWS)
+    service = OpenProjectProjectAttributeService(client)
+
+    assert service.get_project_wp_cf_snapshot(7) == ROWS
+    client.iter_query_ndjson.assert_called_once()
+
+    client.iter_query_ndjson.return_value = iter([ROWS[0], "not-a-row"])
+    with pytest.raises(QueryExecutionError, match="Invalid snapshot"):
+        service.get_project_wp_cf_snapshot(7)
+    with pytest.raises(QueryExecutionError):
+        service.get_project_wp_cf_snapshot("not-an-id")
@@ -214,3 +214,45 @@ class TestPaginationImplementation:
 
                 assert count == 150
                 assert mock_fetch.call_count == 4  # 3 data batches + 1 empty batch to end
+
+    def test_iter_all_project_issues_fetches_id_windows_in_order(self) -> None:
+        """Test that concurrent id windows are yielded in listing order."""
+
+        def create_mock_issue(issue_id):
+            mock_issue = Mock(spec=Issue)
+            mock_issue.id = str(issue_id)
+            mock_issue.key = f"TEST-{issue_id}"
+            return mock_issue
+
+        listing = {"issues": [{"id": str(i)} for i in range(1, 6)], "total": 5}
+        self.migration.jira_client.jira.search_issues.return_value = listing
+
+        def fetch(jql, start_at, max_results, fields, expand, project_key):
+            ids = jql[len("id in (") : -1].split(",")
+            # Jira returns ``id in (...)`` results in its own order
+            return [create_mock_issue(i) for i in reversed(ids)]
+
+        with patch("src.application.components.work_package_migration.config") as mock_config:
+            mock_config.migration_config = {"batch_size": 2, "jira_page_concurrency": 3}
+
+            with patch.object(self.migration, "_fetch_issues_with_retry", side_effect=fetch) as mock_fetch:
+                issues = list(self.migration._iter_all_project_issues("TEST"))
+
+        assert [issue.key for issue in issues] == [f"TEST-{i}" for i in range(1, 6)]
+        # One call per window of batch_size ids: (1,2), (3,4), (5)
+        assert mock_fetch.call_count == 3
+        # The id listing goes through the Jira rate limiter too
+        limiter = self.mock_jira_client.rate_limiter
+        limiter.wait_if_needed.assert_any_call("search_issues_TEST")
+        assert limiter.record_response.called
+
+    def test_iter_all_project_issues_pages_sequentially_by_default(self) -> None:
+        """Test that id-window paging stays off unless jira_page_concurrency is raised."""
+        with patch("src.application.components.work_package_migration.config") as mock_config:
+            mock_config.migration_config = {"batch_size": 2}
+
+            with patch.object(self.migration, "_fetch_issues_with_retry", return_value=[]) as mock_fetch:
+                assert list(self.migration._iter_all_project_issues("TEST")) == []
+
+        self.mock_jira_client.jira.search_issues.assert_not_called()
+        assert mock_fetch.call_count == 1
@@ -0,0 +1,106 @@
+"""Tests for gzip framing of container payloads and results."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import tarfile
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.openproject.docker_client import DockerClient
+from src.infrastructure.openproject.payload_compression import GunzipWriter, should_compress
+from src.infrastructure.openproject.ssh_client import SSHClient
+
+
+def _docker(ssh: MagicMock) -> DockerClient:
+    docker = DockerClient.__new__(DockerClient)
+    docker.container_name = "openproject-web"
+    docker.command_timeout = 60
+    docker.ssh_client = ssh
+    return docker
+
+
+def test_gunzip_writer_inflates_chunked_stream() -> None:
+    payload = b'{"description": "' + b"x" * 100_000 + b'"}'
+    compressed = gzip.compress(payload)
+    out = io.BytesIO()
+    sink = GunzipWriter(out)
+    for i in range(0, len(compressed), 1000):
+        sink.write(compressed[i : i + 1000])
+    sink.finish()
+    assert out.getvalue() == payload
+    assert sink.compressed_bytes == len(compressed)
+
+
+def test_gunzip_writer_rejects_truncated_stream() -> None:
+    sink = GunzipWriter(io.BytesIO())
+    sink.write(gzip.compress(b"x" * 10_000)[:20])
+    with pytest.raises(ValueError, match="Truncated"):
+        sink.finish()
+
+
+def test_should_compress_respects_flag_and_threshold(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("J2O_PAYLOAD_COMPRESSION", "0")
+    assert not should_compress(10**9)
+    monkeypatch.setenv("J2O_PAYLOAD_COMPRESSION", "on")
+    monkeypatch.setenv("J2O_PAYLOAD_COMPRESS_MIN_BYTES", "1000")
+    assert should_compress(1000)
+    assert not should_compress(999)
+
+
+def test_large_upload_batch_is_gzipped(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("J2O_PAYLOAD_COMPRESSION", "1")
+    monkeypatch.setenv("J2O_PAYLOAD_COMPRESS_MIN_BYTES", "10")
+    local = tmp_path / "batch.json"
+    local.write_text("[" + ",".join(['{"a": 1}'] * 500) + "]")
+    sent = io.BytesIO()
+    ssh = MagicMock()
+
+    def _run(command, write_input, timeout=None, *, check=True):
+        write_input(sent)
+        return f"{local.stat().st_size} /tmp/batch.json\n", "", 0
+
+    ssh.execute_command_with_input.side_effect = _run
+    _docker(ssh).transfer_files_to_container([(local, "/tmp/batch.json")])
+
+    assert "tar -x -z" in ssh.execute_command_with_input.call_args[0][0]
+    assert len(sent.getvalue()) < local.stat().st_size
+    with tarfile.open(fileobj=io.BytesIO(sent.getvalue()), mode="r|gz") as tar:
+        assert [m.name for m in tar] == ["tmp/batch.json"]
+
+
+def test_gzipped_download_streams_into_local_file(tmp_path: Path) -> None:
+    payload = b'{"created": [' + b"1," * 5000 + b"1]}"
+    ssh = MagicMock()
+
+    def _stream(command, write_output, timeout=None, *, check=True):
+        blob = gzip.compress(payload)
+        write_output(blob[:100])
+        write_output(blob[100:])
+        return "", 0
+
+    ssh.stream_command_output.side_effect = _stream
+    docker = _docker(ssh)
+    docker.check_file_exists_in_container = MagicMock(return_value=True)
+
+    local = tmp_path / "out" / "result.json"
+    assert docker.copy_file_from_container("/tmp/result.json", local, compress=True) == local
+
+    assert local.read_bytes() == payload
+    assert "gzip -c -- /tmp/result.json" in ssh.stream_command_output.call_args[0][0]
+    assert not (tmp_path / "out" / "result.json.part").exists()
+
+
+def test_stream_command_output_hands_over_chunks() -> None:
+    ssh = SSHClient.__new__(SSHClient)
+    ssh.operation_timeout = 10
+    ssh.get_ssh_base_command = lambda: ["sh", "-c"]
+    chunks: list[bytes] = []
+
+    stderr, rc = ssh.stream_command_output("printf abc; echo warn >&2; exit 3", chunks.append, check=False)
+
+    assert b"".join(chunks) == b"abc"
+    assert (stderr.strip(), rc) == ("warn", 3)
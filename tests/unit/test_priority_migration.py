@@ -10,7 +10,7 @@ class DummyJira:
             {"name": "Normal"},
         ]
 
-    def batch_get_issues(self, keys):
+    def batch_get_issues(self, keys, **kwargs):
         class F:
             def __init__(self, name: str) -> None:
                 class FF:
@@ -111,7 +111,7 @@ def test_priority_migration_load_with_numeric_outer_keys(monkeypatch: pytest.Mon
         def get_priorities(self):
             return [{"name": "High"}, {"name": "Normal"}]
 
-        def batch_get_issues(self, keys):
+        def batch_get_issues(self, keys, **kwargs):
             # Jira returns issues keyed by human-readable key
             issues = {
                 "TEST-1": _make_priority_issue("TEST-1", "High"),
@@ -0,0 +1,125 @@
+"""Tests for the Rails bulk-mode wrapper and the deferred per-project rebuild."""
+
+from __future__ import annotations
+
+from concurrent.futures import Future
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.openproject.openproject_work_package_service import (
+    OpenProjectWorkPackageService,
+)
+from src.infrastructure.openproject.rails_bulk_mode import REBUILD_DERIVED_SCRIPT, wrap_bulk_mode
+
+
+def _service() -> tuple[OpenProjectWorkPackageService, MagicMock]:
+    client = MagicMock()
+    client.logger = MagicMock()
+    return OpenProjectWorkPackageService(client), client
+
+
+def test_wrap_bulk_mode_runs_script_in_block() -> None:
+    wrapped = wrap_bulk_mode("results = []\nresults\n")
+
+    assert wrapped.endswith("J2O::BulkMode.run do\nresults = []\nresults\nend\n")
+
+
+def test_batch_update_wraps_script_in_bulk_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    service, client = _service()
+    client.execute_json_query.return_value = {"updated": 1, "failed": 0, "results": []}
+    scripts = {}
+    for enabled in ("0", "1"):
+        monkeypatch.setenv("J2O_BULK_MODE", enabled)
+        assert service.batch_update_work_packages([{"id": 1, "subject": "x"}])["updated"] == 1
+        scripts[enabled] = client.execute_json_query.call_args.args[0]
+
+    assert scripts["1"] == wrap_bulk_mode(scripts["0"])
+
+
+def test_rebuild_runs_one_script_for_all_projects() -> None:
+    service, client = _service()
+    client.execute_json_query.return_value = [
+        {"project_id": 3, "success": True, "hierarchy_rows": 10, "totals_updated": 1, "dates_updated": 0},
+        {"project_id": 7, "success": False, "error": "PG::Error"},
+    ]
+
+    results = service.rebuild_derived_work_package_data([7, 3, 7])
+
+    client.execute_json_query.assert_called_once()
+    assert client.execute_json_query.call_args.args[0] == f"project_ids = [3, 7]\n{REBUILD_DERIVED_SCRIPT}"
+    assert results[1]["error"] == "PG::Error"
+    client.logger.warning.assert_called_once()
+
+
+def test_rebuild_reports_every_project_on_failure() -> None:
+    service, client = _service()
+    client.execute_json_query.side_effect = RuntimeError("console gone")
+
+    assert service.rebuild_derived_work_package_data([5]) == [
+        {"project_id": 5, "success": False, "error": "console gone"},
+    ]
+    assert service.rebuild_derived_work_package_data([]) == []
+    client.execute_json_query.assert_called_once()
+
+
+class _PipelineClient(MagicMock):
+    """OpenProject client double whose bulk pipeline resolves batches immediately."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.rebuilds: list[list[int]] = []
+        self.submitted: list[int] = []
+
+    def bulk_create_pipeline(self) -> SimpleNamespace:
+        def submit(_model: str, records: list[dict[str, Any]], **_kw: Any) -> Future[dict[str, Any]]:
+            self.submitted.append(len(records))
+            future: Future[dict[str, Any]] = Future()
+            future.set_result({"created": [{"id": 1}] * len(records), "created_count": len(records)})
+            return future
+
+        return SimpleNamespace(submit=submit, close=lambda: None)
+
+    def rebuild_derived_work_package_data(self, project_ids: list[int]) -> list[dict[str, Any]]:
+        assert self.submitted, "rebuild ran before any batch was created"
+        self.rebuilds.append(list(project_ids))
+        return []
+
+
+@pytest.mark.parametrize(("enabled", "rebuilds"), [("1", [[42]]), ("0", [])])
+def test_work_package_migration_rebuilds_after_bulk_create(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    enabled: str,
+    rebuilds: list[list[int]],
+) -> None:
+    from src.application.components.work_package_migration import WorkPackageMigration
+
+    monkeypatch.setenv("J2O_BULK_MODE", enabled)
+    monkeypatch.setenv("J2O_BULK_PIPELINE", "1")
+    monkeypatch.setattr("src.config.jira_config", {"projects": ["PROJ"]})
+    monkeypatch.setattr("src.config.migration_config", {"batch_size": 2})
+
+    migration = WorkPackageMigration.__new__(WorkPackageMigration)
+    migration.logger = MagicMock()
+    migration.data_dir = tmp_path
+    migration.project_mapping = {"PROJ": {"jira_key": "PROJ", "openproject_id": 42}}
+    migration.op_client = _PipelineClient()
+    migration._get_existing_work_packages = lambda *_a: {}
+    migration._iter_all_project_issues = lambda _key: iter(
+        SimpleNamespace(key=f"PROJ-{i}", id=str(i)) for i in range(1, 4)
+    )
+    migration.prepare_work_package = lambda issue, _pid: {"subject": issue.key, "project_id": 42}
+    migration._extract_issue_meta = lambda _issue: {}
+    migration._record_created_work_packages = MagicMock()
+    migration._assign_memberships_for_mentioned_users = lambda _pid: {}
+
+    results = migration._migrate_work_packages()
+
+    assert results["total_created"] == 3
+    # Both batches settled before the one per-project rebuild.
+    assert migration.op_client.rebuilds == rebuilds
+    assert migration.op_client.submitted == [2, 1]
@@ -0,0 +1,145 @@
+"""Tests for the preforked Rails runner server and its runner-service wiring."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.openproject.openproject_rails_runner_service import (
+    OpenProjectRailsRunnerService,
+)
+from src.infrastructure.openproject.rails_prefork_server import (
+    READY_PATH,
+    UNAVAILABLE_EXIT,
+    RailsPreforkError,
+    RailsPreforkServer,
+)
+
+
+def _docker(*ping_results: int) -> MagicMock:
+    """Docker client whose ``--ping`` calls return the given exit codes in order."""
+    docker = MagicMock()
+    pings = iter(ping_results)
+
+    def _execute(command, **kwargs):
+        if command.endswith("--ping"):
+            return "", "", next(pings)
+        return "", "", 0
+
+    docker.execute_command.side_effect = _execute
+    return docker
+
+
+def _commands(docker: MagicMock) -> list[str]:
+    return [c.args[0] for c in docker.execute_command.call_args_list]
+
+
+def test_start_reuses_running_server() -> None:
+    docker = _docker(0)
+    server = RailsPreforkServer(docker)
+
+    server.start()
+    server.start()
+
+    assert server.is_ready
+    docker.transfer_files_to_container.assert_called_once()
+    assert not any("nohup" in c for c in _commands(docker))
+
+
+def test_start_boots_server_when_ping_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("src.infrastructure.openproject.rails_prefork_server.time.sleep", lambda _s: None)
+    docker = _docker(1, 0)
+    docker.check_file_exists_in_container.side_effect = [False, True]
+    server = RailsPreforkServer(docker, max_children=2)
+
+    server.start()
+
+    assert server.is_ready
+    boot = next(c for c in docker.execute_command.call_args_list if "nohup" in c.args[0])
+    assert "rails runner /tmp/j2o_prefork_server.rb" in boot.args[0]
+    assert boot.kwargs["env"] == {"J2O_PREFORK_MAX_CHILDREN": "2"}
+    docker.check_file_exists_in_container.assert_called_with(READY_PATH)
+
+
+def test_failed_boot_is_not_retried() -> None:
+    docker = _docker(1)
+    docker.check_file_exists_in_container.return_value = False
+    server = RailsPreforkServer(docker, boot_timeout=0)
+
+    with pytest.raises(RailsPreforkError, match="not ready"):
+        server.start()
+    with pytest.raises(RailsPreforkError, match="earlier"):
+        server.start()
+    docker.transfer_files_to_container.assert_called_once()
+
+
+def test_runner_command() -> None:
+    server = RailsPreforkServer(_docker(0))
+
+    assert server.runner_command("/tmp/x.rb") == "ruby /tmp/j2o_prefork_client.rb /tmp/x.rb"
+    assert server.runner_command(code="puts 1") == "ruby /tmp/j2o_prefork_client.rb -e 'puts 1'"
+    with pytest.raises(ValueError, match="exactly one"):
+        server.runner_command()
+    with pytest.raises(ValueError, match="exactly one"):
+        server.runner_command("/tmp/x.rb", code="puts 1")
+
+
+def _service() -> tuple[OpenProjectRailsRunnerService, MagicMock]:
+    client = MagicMock()
+    client.logger = MagicMock()
+    return OpenProjectRailsRunnerService(client), client.docker_client
+
+
+def test_execute_runner_script_cold_when_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("J2O_RAILS_PREFORK", "0")
+    svc, docker = _service()
+    docker.execute_command.return_value = ("out", "", 0)
+
+    assert svc.execute_runner_script("/tmp/x.rb", timeout=60) == ("out", "", 0)
+    command = docker.execute_command.call_args.args[0]
+    assert command.endswith("bundle exec rails runner /tmp/x.rb")
+    assert docker.execute_command.call_args.kwargs == {"timeout": 60, "env": None}
+
+
+def test_execute_runner_script_uses_prefork_server(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("J2O_RAILS_PREFORK", "1")
+    svc, docker = _service()
+    server = MagicMock(spec=RailsPreforkServer)
+    server.runner_command.return_value = "ruby /tmp/j2o_prefork_client.rb /tmp/x.rb"
+    svc._prefork_server = server
+    docker.execute_command.return_value = ("out", "", 0)
+
+    assert svc.execute_runner_script("/tmp/x.rb", env={"J2O_A": "1"}) == ("out", "", 0)
+    docker.execute_command.assert_called_once_with(
+        "ruby /tmp/j2o_prefork_client.rb /tmp/x.rb",
+        timeout=None,
+        env={"J2O_A": "1"},
+    )
+
+
+def test_execute_runner_script_falls_back_when_server_gone(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("J2O_RAILS_PREFORK", "1")
+    svc, docker = _service()
+    server = MagicMock(spec=RailsPreforkServer)
+    server.runner_command.return_value = "ruby /tmp/j2o_prefork_client.rb -e 'puts 1'"
+    svc._prefork_server = server
+    docker.execute_command.side_effect = [("", "unavailable", UNAVAILABLE_EXIT), ("1\n", "", 0)]
+
+    assert svc.execute_runner_script(code="puts 1") == ("1\n", "", 0)
+    server.mark_unavailable.assert_called_once()
+    assert docker.execute_command.call_args.args[0].endswith("bundle exec rails runner 'puts 1'")
+
+
+def test_execute_runner_script_falls_back_when_boot_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("J2O_RAILS_PREFORK", "1")
+    svc, docker = _service()
+    server = MagicMock(spec=RailsPreforkServer)
+    server.runner_command.side_effect = RailsPreforkError("boot failed")
+    svc._prefork_server = server
+    docker.execute_command.return_value = ("", "", 0)
+
+    svc.execute_runner_script("/tmp/x.rb")
+
+    docker.execute_command.assert_called_once()
+    assert "rails runner /tmp/x.rb" in docker.execute_command.call_args.args[0]
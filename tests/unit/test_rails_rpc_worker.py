@@ -0,0 +1,106 @@
+"""Tests for the persistent Rails RPC worker transport and its runner-service wiring."""
+
+from __future__ import annotations
+
+import io
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.openproject.openproject_rails_runner_service import (
+    OpenProjectRailsRunnerService,
+)
+from src.infrastructure.openproject.rails_console_client import RubyError
+from src.infrastructure.openproject.rails_rpc_worker import (
+    RailsRpcError,
+    RailsRpcWorker,
+    encode_frame,
+    read_frame,
+)
+
+
+class TestFraming:
+    def test_round_trip(self) -> None:
+        payload = {"id": 7, "status": "ok", "stdout": "héllo\nwörld"}
+        assert read_frame(io.BytesIO(encode_frame(payload))) == payload
+
+    def test_skips_non_frame_lines(self) -> None:
+        stream = io.BytesIO(b"warning: boot noise\n" + encode_frame({"id": 1}))
+        assert read_frame(stream) == {"id": 1}
+
+    def test_eof_returns_none(self) -> None:
+        assert read_frame(io.BytesIO(b"")) is None
+
+    def test_truncated_frame_raises(self) -> None:
+        with pytest.raises(RailsRpcError):
+            read_frame(io.BytesIO(b"J2O-RPC 50\n{}"))
+
+    def test_malformed_header_raises(self) -> None:
+        with pytest.raises(RailsRpcError):
+            read_frame(io.BytesIO(b"J2O-RPC abc\n{}"))
+
+
+def test_for_container_builds_docker_exec_command() -> None:
+    worker = RailsRpcWorker.for_container(["ssh", "host"], "openproject-web")
+    assert worker.command[:2] == ["ssh", "host"]
+    assert "docker exec -i openproject-web" in worker.command[2]
+    assert "rails runner /tmp/j2o_rpc_worker.rb" in worker.command[2]
+
+
+@pytest.fixture
+def rpc_service(monkeypatch: pytest.MonkeyPatch, tmp_path) -> tuple[OpenProjectRailsRunnerService, MagicMock]:
+    monkeypatch.setenv("J2O_RAILS_RPC_WORKER", "1")
+    client = MagicMock()
+    client.logger = MagicMock()
+    client.file_manager.data_dir = tmp_path
+    worker = MagicMock(spec=RailsRpcWorker)
+    client.rpc_worker = worker
+    return OpenProjectRailsRunnerService(client), worker
+
+
+def test_execute_script_with_data_uses_worker_frame(rpc_service) -> None:
+    svc, worker = rpc_service
+
+    def _call(script, *, data, timeout, start_marker, end_marker):
+        return {"id": 1, "status": "ok", "stdout": f'noise\n{start_marker}\n{{"n": {len(data)}}}\n{end_marker}\n'}
+
+    worker.call.side_effect = _call
+    result = svc.execute_script_with_data("puts 1", [1, 2, 3], timeout=10)
+
+    assert result["status"] == "success"
+    assert result["data"] == {"n": 3}
+    # The payload rides in the frame; only the cached script is uploaded, once.
+    assert worker.call.call_args.kwargs["data"] == [1, 2, 3]
+    svc.execute_script_with_data("puts 1", [4], timeout=10)
+    svc._client.transfer_files_to_container.assert_called_once()
+    svc._client.transfer_file_to_container.assert_not_called()
+    svc._client.rails_client._send_command_to_tmux.assert_not_called()
+
+
+def test_execute_script_with_data_reports_ruby_error(rpc_service) -> None:
+    svc, worker = rpc_service
+    worker.call.side_effect = RubyError("Ruby error: NameError: boom")
+
+    result = svc.execute_script_with_data("boom", {}, timeout=10)
+
+    assert result["status"] == "error"
+    assert "NameError" in result["message"]
+
+
+def test_count_records_uses_inspect_value(rpc_service) -> None:
+    svc, worker = rpc_service
+    worker.call.return_value = {"id": 1, "status": "ok", "stdout": "", "value": "42"}
+
+    assert svc.count_records("Project") == 42
+    worker.call.assert_called_once_with("Project.count", timeout=30, inspect=True)
+
+
+def test_console_used_when_worker_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("J2O_RAILS_RPC_WORKER", "0")
+    client = MagicMock()
+    client.logger = MagicMock()
+    client.rails_client.execute.return_value = "ok"
+    svc = OpenProjectRailsRunnerService(client)
+
+    assert svc.console_execute("1 + 1", timeout=5) == "ok"
+    client.rails_client.execute.assert_called_once_with("1 + 1", timeout=5, suppress_output=False)
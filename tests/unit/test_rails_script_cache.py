@@ -0,0 +1,71 @@
+"""Tests for the content-addressed Rails script cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from src.infrastructure.openproject.rails_script_cache import (
+    RailsScriptCache,
+    cached_script_path,
+    call_expression,
+    render_cached_script,
+    result_call_expression,
+    script_digest,
+)
+
+
+def _cache(tmp_path: Path) -> tuple[RailsScriptCache, MagicMock]:
+    client = MagicMock()
+    client.file_manager.data_dir = tmp_path
+    return RailsScriptCache(client), client
+
+
+def test_digest_is_stable_and_content_addressed() -> None:
+    assert script_digest("puts 1") == script_digest("puts 1")
+    assert script_digest("puts 1") != script_digest("puts 2")
+    assert len(script_digest("puts 1")) == 24
+
+
+def test_rendered_script_registers_body_as_lambda() -> None:
+    sha = script_digest("puts input_data.size")
+    rendered = render_cached_script(sha, "puts input_data.size\n")
+    assert "module J2O" in rendered
+    assert f"J2O::Scripts.register('{sha}', lambda do |input_data|\nputs input_data.size\nend)" in rendered
+
+
+def test_call_expression_loads_only_when_not_registered() -> None:
+    expr = call_expression("abc", "{'n' => 1}")
+    assert expr.startswith(f"load('{cached_script_path('abc').as_posix()}') unless defined?(J2O::Scripts)")
+    assert "J2O::Scripts.call('abc', {'n' => 1}); nil" in expr
+
+
+def test_result_call_expression_routes_payload_to_file() -> None:
+    expr = result_call_expression("abc", "nil", "/tmp/j2o_result_1.json", "J2O_RESULT_DONE_1")
+    # Consoles that registered the script under an older prelude reload it.
+    assert "J2O::Scripts.respond_to?(:call_to_file)" in expr
+    assert "J2O::Scripts.call_to_file('abc', nil, '/tmp/j2o_result_1.json', 'J2O_RESULT_DONE_1'); nil" in expr
+    assert "def self.call_to_file(sha, input_data, path, done_marker)" in render_cached_script("abc", "nil")
+
+
+def test_ensure_uploads_script_once_then_only_extras(tmp_path: Path) -> None:
+    cache, client = _cache(tmp_path)
+    data = tmp_path / "in.json"
+    data.write_text("[]")
+    extra = [(data, Path("/tmp/in.json"))]
+
+    sha = cache.ensure("puts 1", extra_uploads=extra)
+    first = client.transfer_files_to_container.call_args[0][0]
+    assert first[0] == (tmp_path / "script_cache" / f"{sha}.rb", cached_script_path(sha))
+    assert first[1:] == extra
+    assert cache.is_uploaded("puts 1")
+
+    assert cache.ensure("puts 1", extra_uploads=extra) == sha
+    assert client.transfer_files_to_container.call_args[0][0] == extra
+
+    cache.ensure("puts 1")
+    assert client.transfer_files_to_container.call_count == 2
+
+    cache.invalidate()
+    cache.ensure("puts 1")
+    assert client.transfer_files_to_container.call_count == 3
@@ -0,0 +1,102 @@
+"""Tests for the Rails session pool and its thread-local client binding."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.openproject.openproject_client import OpenProjectClient
+from src.infrastructure.openproject.rails_session_pool import (
+    RailsSession,
+    RailsSessionPool,
+    configured_session_count,
+    session_pool_for,
+)
+
+
+def _pool(n: int) -> RailsSessionPool:
+    return RailsSessionPool([RailsSession(f"rails-{i}", rails_client=MagicMock(name=f"c{i}")) for i in range(1, n + 1)])
+
+
+def test_dispatch_runs_batches_concurrently_on_distinct_sessions() -> None:
+    pool = _pool(3)
+    seen: dict[int, str] = {}
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work(item: int) -> int:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        seen[item] = pool.current().name
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return item * 2
+
+    results = {idx: res for idx, res, err in pool.dispatch(range(6), work) if err is None}
+
+    assert results == {i: i * 2 for i in range(6)}
+    assert peak > 1
+    assert set(seen.values()) <= {"rails-1", "rails-2", "rails-3"}
+    assert sum(row["calls"] for row in pool.utilisation()) == 6
+
+
+def test_dispatch_reports_errors_per_item() -> None:
+    pool = _pool(2)
+
+    def work(item: int) -> int:
+        if item == 1:
+            raise ValueError("bad batch")
+        return item
+
+    outcomes = {idx: (res, err) for idx, res, err in pool.dispatch([0, 1, 2], work)}
+
+    assert isinstance(outcomes[1][1], ValueError)
+    assert outcomes[0] == (0, None)
+    assert sum(row["errors"] for row in pool.utilisation()) == 1
+
+
+def test_session_is_reentrant_and_released() -> None:
+    pool = _pool(1)
+    with pool.session() as outer:
+        with pool.session() as inner:
+            assert inner is outer
+    assert pool.current() is None
+    assert pool.utilisation()[0]["calls"] == 1
+
+
+def test_inline_pool_for_clients_without_sessions() -> None:
+    pool = session_pool_for(object())
+    assert pool.size == 1
+    with pool.session() as session:
+        assert session is None
+    assert [(i, r) for i, r, _ in pool.dispatch([1, 2], lambda x: x + 1)] == [(0, 2), (1, 3)]
+
+
+def test_configured_session_count_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("J2O_RAILS_SESSIONS", "4")
+    assert configured_session_count() == 4
+    monkeypatch.setenv("J2O_RAILS_SESSIONS", "nope")
+    assert configured_session_count() == 1
+
+
+def test_client_close_stops_pool_and_own_rpc_workers() -> None:
+    client = OpenProjectClient.__new__(OpenProjectClient)
+    own_worker = MagicMock()
+    pool_worker = MagicMock()
+    client._rpc_worker = own_worker
+    client._rails_session_pool = RailsSessionPool(
+        [RailsSession("rails-1"), RailsSession("rpc-2", rpc_worker=pool_worker)]
+    )
+
+    client.close()
+    client.close()
+
+    own_worker.close.assert_called_once_with()
+    pool_worker.close.assert_called_once_with()
@@ -0,0 +1,107 @@
+"""Raw bulk mode for watchers, relations and memberships (``J2O_RAW_BULK_ASSOCIATIONS``)."""
+
+from __future__ import annotations
+
+import json
+import re
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.openproject.openproject_associations_service import (
+    OpenProjectAssociationsService,
+)
+from src.infrastructure.openproject.openproject_membership_service import (
+    OpenProjectMembershipService,
+)
+
+
+def _client() -> MagicMock:
+    client = MagicMock()
+    client.logger = MagicMock()
+    return client
+
+
+def _payload(script: str) -> list:
+    return json.loads(re.search(r"<<-'J2O_DATA'\n(.*?)\nJ2O_DATA", script, re.DOTALL).group(1))
+
+
+def test_watchers_use_insert_all_returning_in_raw_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("J2O_RAW_BULK_ASSOCIATIONS", "1")
+    client = _client()
+    outcome = {"success": True, "created": 1, "skipped": 0, "failed": 0, "outcomes": [{"status": "created"}]}
+    client.execute_query_to_json_file.return_value = outcome
+
+    service = OpenProjectAssociationsService(client)
+    result = service.bulk_add_watchers([{"work_package_id": 4, "user_id": 9}])
+
+    script = client.execute_query_to_json_file.call_args.args[0]
+    assert result == outcome
+    assert _payload(script) == [{"wp_id": 4, "user_id": 9}]
+    assert script == service._raw_watchers_script(json.dumps(_payload(script)))
+
+
+def test_relations_raw_mode_flips_reverse_types(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("J2O_RAW_BULK_ASSOCIATIONS", "1")
+    client = _client()
+    client.execute_query_to_json_file.side_effect = RuntimeError("console gone")
+
+    service = OpenProjectAssociationsService(client)
+    result = service.bulk_create_relations([{"from_id": 1, "to_id": 2, "relation_type": "follows"}])
+
+    script = client.execute_query_to_json_file.call_args.args[0]
+    assert _payload(script) == [{"from_id": 1, "to_id": 2, "type": "follows"}]
+    assert script == service._raw_relations_script(json.dumps(_payload(script)))
+    assert result == {"success": False, "created": 0, "skipped": 0, "failed": 1, "error": "console gone"}
+
+
+def test_relations_default_mode_saves_per_row(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("J2O_RAW_BULK_ASSOCIATIONS", "0")
+    client = _client()
+    outcome = {"success": True, "created": 1, "skipped": 0, "failed": 0}
+    client.execute_query_to_json_file.return_value = outcome
+    service = OpenProjectAssociationsService(client)
+
+    assert service.bulk_create_relations([{"from_id": 1, "to_id": 2, "relation_type": "blocks"}]) == outcome
+
+    script = client.execute_query_to_json_file.call_args.args[0]
+    assert _payload(script) == [{"from_id": 1, "to_id": 2, "type": "blocks"}]
+    assert script != service._raw_relations_script(json.dumps(_payload(script)))
+
+
+def test_bulk_assign_user_roles_loops_without_raw_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("J2O_RAW_BULK_ASSOCIATIONS", "0")
+    service = OpenProjectMembershipService(_client())
+    service.assign_user_roles = MagicMock(side_effect=[{"success": True, "changed": True}, RuntimeError("boom")])
+
+    results = service.bulk_assign_user_roles(
+        [{"project_id": 1, "user_id": 2, "role_ids": [3]}, {"project_id": 1, "user_id": 4, "role_ids": [3]}],
+    )
+
+    assert results == [{"success": True, "changed": True}, {"success": False, "error": "boom"}]
+    service.assign_user_roles.assert_any_call(project_id=1, user_id=2, role_ids=[3])
+
+
+def test_bulk_assign_user_roles_is_one_call_in_raw_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("J2O_RAW_BULK_ASSOCIATIONS", "1")
+    client = _client()
+    client.execute_query_to_json_file.return_value = [
+        {"success": True, "changed": False, "role_ids": [3]},
+        {"success": False, "error": "project or user not found"},
+    ]
+    service = OpenProjectMembershipService(client)
+
+    results = service.bulk_assign_user_roles(
+        [{"project_id": 1, "user_id": 2, "role_ids": [3, "3"]}, {"project_id": 1, "user_id": 99, "role_ids": [3]}],
+    )
+
+    client.execute_query_to_json_file.assert_called_once()
+    script = client.execute_query_to_json_file.call_args.args[0]
+    assert _payload(script) == [[1, 2, [3]], [1, 99, [3]]]
+    assert results[0]["success"] is True
+    assert results[1]["error"] == "project or user not found"
+
+    client.execute_query_to_json_file.return_value = {"unexpected": True}
+    assert service.bulk_assign_user_roles([{"project_id": 1, "user_id": 2, "role_ids": [3]}]) == [
+        {"success": False, "error": "unexpected response"},
+    ]
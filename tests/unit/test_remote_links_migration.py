@@ -22,7 +22,7 @@ class DummyJira:
             "PRJ-3": DummyIssue("PRJ-3", []),
         }
 
-    def batch_get_issues(self, keys):
+    def batch_get_issues(self, keys, **kwargs):
         return {k: self.issues.get(k) for k in keys}
 
 
@@ -13,7 +13,7 @@ class DummyIssue:
 
 
 class DummyJira:
-    def batch_get_issues(self, keys):
+    def batch_get_issues(self, keys, **kwargs):
         return {"J1": DummyIssue("Fixed"), "J2": DummyIssue(None)}
 
 
@@ -0,0 +1,110 @@
+"""``run_migration`` drives the requested components end to end.
+
+Clients, health checks and result persistence are replaced with mocks so
+the orchestrator loop itself — run projection, component construction and
+result collection — executes against stand-in components.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, ClassVar
+from unittest.mock import MagicMock
+
+import pytest
+
+import src.migration as migration_module
+from src.application.components.base_migration import BaseMigration
+from src.migration import run_migration
+from src.models.component_results import ComponentResult
+
+
+class _RecordingComponent(BaseMigration):
+    JIRA_FIELDS: ClassVar[tuple[str, ...] | None] = ("labels",)
+    runs: ClassVar[list[str]] = []
+
+    def __init__(self, jira_client: Any = None, op_client: Any = None) -> None:
+        self.jira_client = jira_client
+        self.op_client = op_client
+
+    def run_with_change_detection(self, entity_type: str | None = None) -> ComponentResult:
+        type(self).runs.append(type(self).__name__)
+        return ComponentResult(success=True, details={"total_count": 1, "success_count": 1})
+
+
+@pytest.fixture
+def orchestrator(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        "src.migration.config.migration_config",
+        {"dry_run": False, "no_backup": True},
+    )
+    monkeypatch.setattr("src.migration.config.mappings", MagicMock())
+    for name in ("SSHClient", "DockerClient", "RailsConsoleClient", "JiraClient", "OpenProjectClient"):
+        monkeypatch.setattr(migration_module, name, MagicMock())
+    health = MagicMock()
+    health.return_value.run_pre_migration_checks.return_value = (True, [])
+    monkeypatch.setattr(migration_module, "HealthCheckClient", health)
+    monkeypatch.setattr(migration_module, "_ensure_provenance_bootstrap", lambda *_a: None)
+    monkeypatch.setattr(migration_module, "_backfill_user_mapping_at_startup", lambda *_a: None)
+    monkeypatch.setattr(migration_module.data_handler, "save_results", lambda *_a, **_k: None)
+    # run_migration sets the run projection on the shared base class.
+    monkeypatch.setattr(BaseMigration, "_run_jira_projection", None)
+    _RecordingComponent.runs = []
+
+
+@pytest.mark.usefixtures("orchestrator")
+def test_run_migration_runs_component_with_run_projection(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(migration_module.COMPONENT_CLASSES, "recording", _RecordingComponent)
+
+    result = asyncio.run(run_migration(components=["recording"], no_confirm=True))
+
+    assert result.overall["status"] == "success", result.overall
+    assert _RecordingComponent.runs == ["_RecordingComponent"]
+    assert result.components["recording"].success is True
+    assert BaseMigration._run_jira_projection is not None
+    assert BaseMigration._run_jira_projection[0] == frozenset({"labels"})
+
+
+class _FusedA(_RecordingComponent):
+    FUSED_EXTRACTION: ClassVar[bool] = True
+
+
+class _FusedB(_RecordingComponent):
+    FUSED_EXTRACTION: ClassVar[bool] = True
+
+
+@pytest.mark.usefixtures("orchestrator")
+def test_run_migration_runs_fused_extraction_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(migration_module.COMPONENT_CLASSES, "fused_a", _FusedA)
+    monkeypatch.setitem(migration_module.COMPONENT_CLASSES, "fused_b", _FusedB)
+    fused_calls: list[list[BaseMigration]] = []
+    monkeypatch.setattr(
+        BaseMigration,
+        "run_fused_extraction",
+        classmethod(lambda _cls, components: fused_calls.append(list(components))),
+    )
+
+    result = asyncio.run(run_migration(components=["fused_a", "fused_b"], no_confirm=True))
+
+    assert result.overall["status"] == "success", result.overall
+    assert [[type(c) for c in call] for call in fused_calls] == [[_FusedA, _FusedB]]
+    assert _RecordingComponent.runs == ["_FusedA", "_FusedB"]
+
+
+class _FailingComponent(_RecordingComponent):
+    def run_with_change_detection(self, entity_type: str | None = None) -> ComponentResult:
+        msg = "boom"
+        raise RuntimeError(msg)
+
+
+@pytest.mark.usefixtures("orchestrator")
+@pytest.mark.parametrize("component", [_RecordingComponent, _FailingComponent])
+def test_run_migration_closes_openproject_client(
+    monkeypatch: pytest.MonkeyPatch,
+    component: type[_RecordingComponent],
+) -> None:
+    monkeypatch.setitem(migration_module.COMPONENT_CLASSES, "recording", component)
+
+    asyncio.run(run_migration(components=["recording"], stop_on_error=True, no_confirm=True))
+
+    migration_module.OpenProjectClient.return_value.close.assert_called_once_with()
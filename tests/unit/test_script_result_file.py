@@ -0,0 +1,88 @@
+"""execute_script_with_data reads its payload from a per-call result file.
+
+The console only signals completion (``J2O_RESULT_DONE_<id>:1|0``); the JSON
+comes back through one ``docker exec`` that also removes the call's files.
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.exceptions import QueryExecutionError
+from src.infrastructure.openproject.openproject_rails_runner_service import (
+    OpenProjectRailsRunnerService,
+)
+
+
+@pytest.fixture
+def console(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("J2O_RAILS_RPC_WORKER", "0")
+    monkeypatch.setenv("J2O_PAYLOAD_COMPRESSION", "0")
+    client = MagicMock()
+    client.logger = MagicMock()
+    client.container_name = "openproject-web"
+    client.file_manager.data_dir = tmp_path
+    client.rails_client._get_target.return_value = "rails:0.0"
+    client.rails_client._escape_command.side_effect = lambda cmd: cmd
+    client.rails_client.get_output_channel.return_value = None
+    state = {"flag": "1", "done": None}
+
+    def _run(argv, **kwargs):
+        if argv[1] == "send-keys":
+            match = re.search(r"'(J2O_RESULT_DONE_\w+)'", argv[4])
+            if match:
+                state["done"] = match.group(1)
+            return subprocess.CompletedProcess(argv, 0, "", "")
+        # capture-pane: the echoed command, then the script's output
+        pane = f"irb> ...'{state['done']}'); nil\nprogress\n{state['done']}:{state['flag']}\n=> nil\n"
+        return subprocess.CompletedProcess(argv, 0, pane, "")
+
+    monkeypatch.setattr(
+        "src.infrastructure.openproject.openproject_rails_runner_service.subprocess.run",
+        _run,
+    )
+    return OpenProjectRailsRunnerService(client), client, state
+
+
+def test_payload_is_read_from_result_file(console) -> None:
+    svc, client, _state = console
+    client.ssh_client.execute_command.return_value = ('{"created": [1, 2]}', "", 0)
+
+    result = svc.execute_script_with_data("puts 1", [1, 2], timeout=5)
+
+    assert result["status"] == "success"
+    assert result["data"] == {"created": [1, 2]}
+    assert "progress" in result["output"]
+    command = client.ssh_client.execute_command.call_args.args[0]
+    assert command.startswith("docker exec -u root openproject-web sh -c ")
+    # The fetch also removes the result and the input file: no extra cleanup round trip.
+    assert re.search(
+        r"cat /tmp/j2o_result_\w+\.json && rm -f /tmp/j2o_result_\w+\.json /tmp/openproject_input_",
+        command,
+    )
+    client._cleanup_script_files.assert_not_called()
+    assert not list((Path(client.file_manager.data_dir) / "temp_scripts").iterdir())
+
+
+def test_no_payload_returns_error_envelope_without_fetch(console) -> None:
+    svc, client, state = console
+    state["flag"] = "0"
+
+    result = svc.execute_script_with_data("puts 1", [], timeout=5)
+
+    assert result["status"] == "error"
+    client.ssh_client.execute_command.assert_not_called()
+    client._cleanup_script_files.assert_called_once()
+
+
+def test_unreadable_result_file_raises(console) -> None:
+    svc, client, _state = console
+    client.ssh_client.execute_command.return_value = ("", "cat: No such file or directory", 1)
+
+    with pytest.raises(QueryExecutionError, match="result file"):
+        svc.execute_script_with_data("puts 1", [], timeout=5)
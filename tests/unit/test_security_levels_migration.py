@@ -29,12 +29,13 @@ class DummyJira:
             "PRJ-2": DummyIssue("PRJ-2", None),
         }
 
-    def batch_get_issues(self, keys):
+    def batch_get_issues(self, keys, **kwargs):
         return {k: self.issues.get(k) for k in keys}
 
 
 class DummyOp:
     def __init__(self) -> None:
+        self.cf_writes: list[tuple] = []
         self.queries: list[str] = []
 
     def get_custom_field_by_name(self, name: str):
@@ -47,6 +48,10 @@ class DummyOp:
             return 501
         return True
 
+    def bulk_set_custom_values(self, cf_id: int, values, *, touch_journal: bool = False):
+        self.cf_writes.append((cf_id, dict(values), touch_journal))
+        return {"updated": len(values), "unchanged": 0, "failed": 0}
+
     def ensure_wp_custom_field_id(self, name: str, field_format: str = "text") -> int:
         return 501
 
@@ -85,3 +90,5 @@ def test_security_levels_migration_sets_cf():
     ld = mig._load(mp)
     assert ld.success is True
     assert ld.updated == 1
+    assert [(cf, list(values)) for cf, values, _touch in mig.op_client.cf_writes] == [(501, [9001])]
+    assert mig.op_client.queries == []
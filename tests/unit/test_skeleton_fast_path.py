@@ -0,0 +1,136 @@
+"""Set-based skeleton creation keyed by the J2O Origin Key."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.exceptions import QueryExecutionError
+from src.infrastructure.openproject.openproject_bulk_create_service import (
+    OpenProjectBulkCreateService,
+)
+
+
+def _service() -> tuple[OpenProjectBulkCreateService, MagicMock]:
+    client = MagicMock()
+    client.logger = MagicMock()
+    return OpenProjectBulkCreateService(client), client
+
+
+def _sent_skeletons(script: str) -> list[dict[str, object]]:
+    """Decode the skeletons embedded in the script's ``J2O_DATA`` heredoc."""
+    body = script.split("<<-'J2O_DATA'\n", 1)[1].split("\nJ2O_DATA\n", 1)[0]
+    return json.loads(body)
+
+
+def test_insert_sends_skeletons_unchanged_and_returns_rails_result() -> None:
+    service, client = _service()
+    response = {
+        "success": True,
+        "created": 1,
+        "existing": 0,
+        "failed": 0,
+        "ids_by_key": {"P-1": 5},
+        "results": [{"key": "P-1", "status": "created", "id": 5}],
+    }
+    client.execute_query_to_json_file.return_value = response
+    skeletons = [{"key": "P-1", "subject": "Ünïcode 'quoted'", "project_id": 1, "description": None}]
+
+    assert service.insert_work_package_skeletons(skeletons, 42) == response
+    client.execute_query_to_json_file.assert_called_once()
+    assert _sent_skeletons(client.execute_query_to_json_file.call_args.args[0]) == skeletons
+
+
+def test_insert_skips_empty_batch() -> None:
+    service, client = _service()
+
+    assert service.insert_work_package_skeletons([], 42)["created"] == 0
+    client.execute_query_to_json_file.assert_not_called()
+
+
+def test_insert_failure_marks_every_row_failed() -> None:
+    service, client = _service()
+    client.execute_query_to_json_file.side_effect = RuntimeError("console gone")
+
+    result = service.insert_work_package_skeletons([{"key": "P-1"}, {"key": "P-2"}], 42)
+
+    assert result["success"] is False
+    assert result["failed"] == 2
+    assert [r["key"] for r in result["results"]] == ["P-1", "P-2"]
+
+
+def test_insert_rejects_unexpected_response() -> None:
+    service, client = _service()
+    client.execute_query_to_json_file.return_value = "oops"
+
+    with pytest.raises(QueryExecutionError, match="Unexpected skeleton insert response"):
+        service.insert_work_package_skeletons([{"key": "P-1"}], 42)
+
+
+def _migration(tmp_path: Path) -> tuple[object, MagicMock]:
+    from src.application.components.work_package_skeleton_migration import (
+        WorkPackageSkeletonMigration,
+    )
+
+    op = MagicMock()
+    mig = WorkPackageSkeletonMigration(jira_client=MagicMock(), op_client=op)
+    mig.data_dir = tmp_path
+    mig._j2o_origin_key_cf_id = 42
+    return mig, op
+
+
+def _payload(jira_id: str, key: str) -> dict[str, object]:
+    return {"subject": key, "project_id": 1, "_jira_id": jira_id, "_jira_key": key}
+
+
+def test_skeleton_batch_uses_fast_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("J2O_SKELETON_FAST_PATH", "1")
+    mig, op = _migration(tmp_path)
+    op.insert_work_package_skeletons.return_value = {
+        "created": 1,
+        "existing": 1,
+        "failed": 1,
+        "ids_by_key": {"P-1": 7, "P-2": 3},
+        "results": [
+            {"key": "P-1", "status": "created", "id": 7},
+            {"key": "P-2", "status": "existing", "id": 3},
+            {"key": "P-3", "status": "failed", "error": "invalid type_id"},
+        ],
+    }
+
+    created, failed, mappings = mig._create_skeletons_batch(
+        [_payload("10", "P-1"), _payload("11", "P-2"), _payload("12", "P-3")],
+        "P",
+    )
+
+    assert (created, failed) == (1, 1)
+    assert sorted(mappings) == [("10", "P-1", 7), ("11", "P-2", 3)]
+    skeletons, key_cf_id = op.insert_work_package_skeletons.call_args.args
+    assert key_cf_id == 42
+    assert skeletons[0] == {"subject": "P-1", "project_id": 1, "key": "P-1"}
+    op._create_work_packages_batch.assert_not_called()
+
+
+def test_skeleton_batch_default_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("J2O_SKELETON_FAST_PATH", "0")
+    mig, op = _migration(tmp_path)
+    op._create_work_packages_batch.return_value = {
+        "created": 1,
+        "failed": 0,
+        "results": [{"status": "created", "id": 7}],
+    }
+
+    assert mig._create_skeletons_batch([_payload("10", "P-1")], "P") == (1, 0, [("10", "P-1", 7)])
+    op.insert_work_package_skeletons.assert_not_called()
+
+
+def test_skeleton_batch_fast_path_failure_fails_the_batch(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("J2O_SKELETON_FAST_PATH", "1")
+    mig, op = _migration(tmp_path)
+    op.insert_work_package_skeletons.side_effect = QueryExecutionError("Unexpected skeleton insert response: oops")
+
+    assert mig._create_skeletons_batch([_payload("10", "P-1"), _payload("11", "P-2")], "P") == (0, 2, [])
+    op._create_work_packages_batch.assert_not_called()
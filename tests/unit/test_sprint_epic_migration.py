@@ -29,6 +29,7 @@ class DummyJira:
 
 class DummyOp:
     def __init__(self) -> None:
+        self.cf_writes: list[tuple] = []
         self.updates: list[dict] = []
         self.queries: list[str] = []
 
@@ -50,6 +51,10 @@ class DummyOp:
         """Same behavior as execute_query but returns the result directly."""
         return self.execute_query(script)
 
+    def bulk_set_custom_values(self, cf_id: int, values, *, touch_journal: bool = False):
+        self.cf_writes.append((cf_id, dict(values), touch_journal))
+        return {"updated": len(values), "unchanged": 0, "failed": 0}
+
     def ensure_wp_custom_field_id(self, name: str, field_format: str = "text") -> int:
         return 901
 
@@ -91,3 +96,4 @@ def test_sprint_epic_migration_sets_parent_and_sprint_cf():
     # Expect: 1 parent link (PRJ-1 -> EPIC-1) + 2 sprint CF updates (EPIC-1, PRJ-1)
     # batch_update_work_packages updated=1, CF updates add 2 more -> updated==3
     assert ld.updated == 3
+    assert [(cf, sorted(values)) for cf, values, _touch in mig.op_client.cf_writes] == [(901, [12000, 12001])]
@@ -1,5 +1,6 @@
 import pytest
 
+from src.application.components.base_migration import BaseMigration
 from src.application.components.story_points_migration import STORY_POINTS_CF_NAME, StoryPointsMigration
 
 
@@ -23,12 +24,13 @@ class DummyJira:
             "PRJ-3": DummyIssue("PRJ-3", sp=None, cf=None),
         }
 
-    def batch_get_issues(self, keys):
+    def batch_get_issues(self, keys, **kwargs):
         return {k: self.issues.get(k) for k in keys}
 
 
 class DummyOp:
     def __init__(self) -> None:
+        self.cf_writes: list[tuple] = []
         self.queries: list[str] = []
 
     def get_custom_field_by_name(self, name: str):
@@ -41,6 +43,10 @@ class DummyOp:
             return 801
         return True
 
+    def bulk_set_custom_values(self, cf_id: int, values, *, touch_journal: bool = False):
+        self.cf_writes.append((cf_id, dict(values), touch_journal))
+        return {"updated": len(values), "unchanged": 0, "failed": 0}
+
     def ensure_wp_custom_field_id(self, name: str, field_format: str = "text") -> int:
         return 801
 
@@ -81,3 +87,62 @@ def test_story_points_migration_sets_cf():
     # PRJ-1, PRJ-2 have values -> 2 updates
     assert ld.success is True
     assert ld.updated == 2
+    assert mig.op_client.cf_writes == [(801, {11001: "3", 11002: "5.5"}, True)]
+    assert mig.op_client.queries == []
+
+
+def test_story_points_fetch_projects_resolved_field(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(BaseMigration, "_run_jira_projection", None)
+
+    class SpFields:
+        def __init__(self, value) -> None:
+            self.customfield_12345 = value
+
+    class SpIssue:
+        def __init__(self, value) -> None:
+            self.fields = SpFields(value)
+
+    class ProjectingJira:
+        def __init__(self) -> None:
+            self.calls: list[dict] = []
+
+        def resolve_field_ids(self, names):
+            return {STORY_POINTS_CF_NAME: "customfield_12345"} if STORY_POINTS_CF_NAME in names else {}
+
+        def batch_get_issues(self, keys, **kwargs):
+            self.calls.append(kwargs)
+            return {"PRJ-1": SpIssue(8)}
+
+    jira = ProjectingJira()
+    mig = StoryPointsMigration(jira_client=jira, op_client=DummyOp())  # type: ignore[arg-type]
+    ex = mig._extract()
+
+    assert jira.calls == [{"fields": "customfield_10016,customfield_12345", "expand": None}]
+    assert ex.data == {"sp": {"PRJ-1": 8.0}}
+
+
+def test_story_points_fetches_all_fields_when_name_unresolved(monkeypatch: pytest.MonkeyPatch):
+    from src.application.components.labels_migration import LabelsMigration
+
+    # The run union carries the labels projection too; an unresolved
+    # display name still falls back to the full payload.
+    monkeypatch.setattr(BaseMigration, "_run_jira_projection", None)
+    BaseMigration.set_run_jira_projection([LabelsMigration, StoryPointsMigration])
+
+    class UnresolvedJira(DummyJira):
+        def __init__(self) -> None:
+            super().__init__()
+            self.calls: list[dict] = []
+
+        def resolve_field_ids(self, names):
+            return {}
+
+        def batch_get_issues(self, keys, **kwargs):
+            self.calls.append(kwargs)
+            return super().batch_get_issues(keys)
+
+    jira = UnresolvedJira()
+    mig = StoryPointsMigration(jira_client=jira, op_client=DummyOp())  # type: ignore[arg-type]
+    mig._extract()
+
+    assert jira.calls == [{"fields": None, "expand": None}]
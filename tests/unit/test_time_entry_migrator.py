@@ -674,6 +674,39 @@ class TestTimeEntryMigratorMigration:
         # Should process in batches: 2, 2, 1
         assert mock_op_client.create_time_entry.call_count == 5
 
+    def test_migrate_time_entries_batch_mode_counts_existing_as_skipped(
+        self,
+        migrator,
+        mock_op_client,
+        sample_openproject_time_entry,
+        monkeypatch,
+    ) -> None:
+        """Verify batch mode uses one bulk call and skips server-side duplicates."""
+        # Arrange
+        monkeypatch.setitem(_test_migration_config, "unit_test_mode", False)
+        monkeypatch.setitem(_test_migration_config, "enable_time_entry_batch", True)
+        migrator.transformed_time_entries = [sample_openproject_time_entry] * 3
+        mock_op_client.batch_create_time_entries.return_value = {
+            "created": 2,
+            "existing": 1,
+            "failed": 0,
+            "results": [
+                {"index": 0, "success": True, "id": 10},
+                {"index": 1, "success": True, "id": 7, "existing": True},
+                {"index": 2, "success": True, "id": 11},
+            ],
+        }
+
+        # Act
+        result = migrator.migrate_time_entries_to_openproject()
+
+        # Assert
+        assert mock_op_client.batch_create_time_entries.call_count == 1
+        mock_op_client.create_time_entry.assert_not_called()
+        assert result["successful_migrations"] == 2
+        assert result["skipped_entries"] == 1
+        assert result["created_time_entry_ids"] == [10, 11]
+
 
 class TestTimeEntryMigratorOrchestration:
     """Tests for main migration orchestration methods."""
@@ -0,0 +1,67 @@
+"""Tests for the pipe-pane based tmux output channel."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.openproject import tmux_output_channel
+from src.infrastructure.openproject.tmux_output_channel import TmuxOutputChannel, clean_terminal_text
+
+
+@pytest.fixture
+def channel(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TmuxOutputChannel:
+    monkeypatch.setattr(tmux_output_channel.subprocess, "run", MagicMock())
+    ch = TmuxOutputChannel("tmux", "rails_console:0.0", tmp_path / "pane.log")
+    assert ch.start()
+    yield ch
+    ch.stop()
+
+
+def _emit(path: Path, data: bytes, delay: float = 0.0) -> None:
+    def _write() -> None:
+        time.sleep(delay)
+        with path.open("ab") as f:
+            f.write(data)
+
+    threading.Thread(target=_write, daemon=True).start()
+
+
+def test_clean_terminal_text_holds_back_partial_escape() -> None:
+    clean, pending = clean_terminal_text("ok\x1b[32mgreen\x1b[0m\r\nnext\x1b[")
+    assert clean == "okgreen\nnext"
+    assert pending == "\x1b["
+
+
+def test_wait_for_ignores_echoed_marker(channel: TmuxOutputChannel) -> None:
+    mark = channel.mark()
+    _emit(channel.log_path, b'irb(main):001> puts "--EXEC_END--abc"\r\n', 0.02)
+    _emit(channel.log_path, b"result\r\n\x1b[1m--EXEC_END--abc\x1b[0m\r\n", 0.1)
+
+    found, text = channel.wait_for("--EXEC_END--abc", mark, timeout=5, at_line_start=True)
+
+    assert found
+    assert "result\n--EXEC_END--abc" in text
+
+
+def test_wait_for_times_out_and_aborts(channel: TmuxOutputChannel) -> None:
+    mark = channel.mark()
+    assert channel.wait_for("--never--", mark, timeout=0.1) == (False, "")
+
+    _emit(channel.log_path, b"SystemStackError: stack level too deep\n")
+    found, text = channel.wait_for("--never--", mark, timeout=5, abort=lambda chunk: "SystemStackError" in chunk)
+    assert not found
+    assert "SystemStackError" in text
+
+
+def test_only_output_after_mark_is_scanned(channel: TmuxOutputChannel) -> None:
+    _emit(channel.log_path, b"--DONE--\n")
+    assert channel.wait_for("--DONE--", channel.mark(), timeout=5)[0]
+
+    mark = channel.mark()
+    found, _ = channel.wait_for("--DONE--", mark, timeout=0.1)
+    assert not found
@@ -26,7 +26,7 @@ class DummyJira:
             "PRJ-2": DummyIssue("PRJ-2", None),
         }
 
-    def batch_get_issues(self, keys):
+    def batch_get_issues(self, keys, **kwargs):
         return {k: self.issues.get(k) for k in keys}
 
 
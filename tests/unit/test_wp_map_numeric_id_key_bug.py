@@ -87,7 +87,7 @@ class _DummyJira:
             "TEST-3": _make_issue("TEST-3"),
         }
 
-    def batch_get_issues(self, keys: list[str]) -> dict:
+    def batch_get_issues(self, keys: list[str], **kwargs: object) -> dict:
         result = {}
         for k in keys:
             issue = self._issues.get(k)
@@ -157,7 +157,7 @@ def test_votes_migration_extract_uses_jira_keys(monkeypatch: pytest.MonkeyPatch)
     captured_keys: list[list[str]] = []
 
     class CapturingJira(_DummyJira):
-        def batch_get_issues(self, keys):
+        def batch_get_issues(self, keys, **kwargs):
             captured_keys.append(list(keys))
             for k in keys:
                 assert not k.isdigit(), (
@@ -196,7 +196,7 @@ def test_resolution_migration_extract_uses_jira_keys(monkeypatch: pytest.MonkeyP
     captured_keys: list[list[str]] = []
 
     class CapturingJira(_DummyJira):
-        def batch_get_issues(self, keys):
+        def batch_get_issues(self, keys, **kwargs):
             captured_keys.append(list(keys))
             for k in keys:
                 assert not k.isdigit(), f"Numeric Jira ID {k!r} passed to batch_get_issues"
@@ -229,7 +229,7 @@ def test_labels_migration_extract_uses_jira_keys(monkeypatch: pytest.MonkeyPatch
     captured_keys: list[list[str]] = []
 
     class CapturingJira(_DummyJira):
-        def batch_get_issues(self, keys):
+        def batch_get_issues(self, keys, **kwargs):
             captured_keys.append(list(keys))
             for k in keys:
                 assert not k.isdigit(), f"Numeric Jira ID {k!r} passed to batch_get_issues"
@@ -261,7 +261,7 @@ def test_native_tags_migration_extract_uses_jira_keys(monkeypatch: pytest.Monkey
     captured_keys: list[list[str]] = []
 
     class CapturingJira(_DummyJira):
-        def batch_get_issues(self, keys):
+        def batch_get_issues(self, keys, **kwargs):
             captured_keys.append(list(keys))
             for k in keys:
                 assert not k.isdigit(), f"Numeric Jira ID {k!r} passed to batch_get_issues"
@@ -293,7 +293,7 @@ def test_security_levels_migration_extract_uses_jira_keys(monkeypatch: pytest.Mo
     captured_keys: list[list[str]] = []
 
     class CapturingJira(_DummyJira):
-        def batch_get_issues(self, keys):
+        def batch_get_issues(self, keys, **kwargs):
             captured_keys.append(list(keys))
             for k in keys:
                 assert not k.isdigit(), f"Numeric Jira ID {k!r} passed to batch_get_issues"
@@ -0,0 +1,142 @@
+"""Delta snapshots of migrated work packages backed by a local key cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.components.work_package_migration import WorkPackageMigration
+from src.infrastructure.exceptions import QueryExecutionError
+from src.infrastructure.openproject.openproject_project_attribute_service import (
+    OpenProjectProjectAttributeService,
+)
+from src.utils.wp_snapshot_cache import WorkPackageSnapshotCache
+
+
+def _row(wp_id: int, key: str, updated_at: str = "2026-01-01T00:00:00Z") -> dict:
+    return {"id": wp_id, "updated_at": updated_at, "jira_issue_key": key, "jira_migration_date": None}
+
+
+def test_cache_replace_and_merge(tmp_path: Path) -> None:
+    cache = WorkPackageSnapshotCache(tmp_path / "checkpoints.db")
+    assert cache.load("P") is None
+
+    cache.save("P", [_row(1, "P-1"), _row(2, "P-2")], high_water="2026-01-01T00:00:00Z", max_id=2, replace=True)
+    cache.save("P", [_row(2, "P-2b"), _row(3, "P-3")], high_water="2026-01-02T00:00:00Z", max_id=3, replace=False)
+
+    snapshot = cache.load("P")
+    assert snapshot is not None
+    assert (snapshot.high_water, snapshot.max_id) == ("2026-01-02T00:00:00Z", 3)
+    assert {i: r["jira_issue_key"] for i, r in snapshot.rows.items()} == {1: "P-1", 2: "P-2b", 3: "P-3"}
+
+    cache.save("P", [_row(5, "P-5")], high_water=None, max_id=5, replace=True)
+    assert list(cache.load("P").rows) == [5]
+    assert cache.load("OTHER") is None
+
+
+def test_delta_query() -> None:
+    client = MagicMock()
+    client.logger = MagicMock()
+    client.execute_query_to_json_file.return_value = {"rows": [_row(3, "P-3")], "count": 3, "max_id": 3}
+    service = OpenProjectProjectAttributeService(client)
+
+    result = service.get_project_wp_cf_delta(7, since="2026-01-02T03:04:05Z", after_id=2)
+
+    assert result["count"] == 3
+    script = client.execute_query_to_json_file.call_args.args[0]
+    assert "WorkPackage.where(project_id: 7)" in script
+    assert (
+        "'work_packages.id > ? OR work_packages.updated_at >= ?', 2, Time.iso8601('2026-01-02T03:04:05.000000Z')"
+        in script
+    )
+    with pytest.raises(QueryExecutionError, match="Invalid snapshot delta arguments"):
+        service.get_project_wp_cf_delta(7, since="yesterday", after_id=2)
+
+
+def _migration(tmp_path: Path) -> WorkPackageMigration:
+    mig = WorkPackageMigration.__new__(WorkPackageMigration)
+    mig.logger = MagicMock()
+    mig.op_client = MagicMock()
+    mig._checkpoint_db_path = tmp_path / "checkpoints.db"
+    mig._snapshot_cache = WorkPackageSnapshotCache(mig._checkpoint_db_path)
+    return mig
+
+
+def _keys(rows) -> set[str]:
+    return {r["jira_issue_key"] for r in rows}
+
+
+def test_snapshot_uses_delta_after_first_run(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("J2O_WP_SNAPSHOT_DELTA", "1")
+    mig = _migration(tmp_path)
+    mig.op_client.iter_project_wp_cf_snapshot.return_value = iter(
+        [_row(1, "P-1", "2026-01-01T00:00:00Z"), _row(2, "P-2", "2026-01-03T00:00:00Z")],
+    )
+
+    assert _keys(mig._project_wp_snapshot("P", 7)) == {"P-1", "P-2"}
+    mig.op_client.get_project_wp_cf_delta.assert_not_called()
+
+    mig.op_client.iter_project_wp_cf_snapshot.reset_mock()
+    mig.op_client.get_project_wp_cf_delta.return_value = {
+        "rows": [_row(3, "P-3", "2025-12-01T00:00:00Z")],
+        "count": 3,
+        "id_sum": 6,
+        "max_id": 3,
+        "high_water": "2026-01-03T00:00:00.000000Z",
+    }
+
+    assert _keys(mig._project_wp_snapshot("P", 7)) == {"P-1", "P-2", "P-3"}
+    mig.op_client.iter_project_wp_cf_snapshot.assert_not_called()
+    mig.op_client.get_project_wp_cf_delta.assert_called_once_with(7, since="2026-01-03T00:00:00Z", after_id=2)
+    assert mig._snapshot_cache.load("P").max_id == 3
+
+
+def test_snapshot_refreshes_after_deletions(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("J2O_WP_SNAPSHOT_DELTA", "1")
+    mig = _migration(tmp_path)
+    mig._snapshot_cache.save(
+        "P", [_row(1, "P-1"), _row(2, "P-2")], high_water="2026-01-01T00:00:00Z", max_id=2, replace=True
+    )
+    mig.op_client.get_project_wp_cf_delta.return_value = {
+        "rows": [],
+        "count": 1,
+        "id_sum": 2,
+        "max_id": 2,
+        "high_water": None,
+    }
+    mig.op_client.iter_project_wp_cf_snapshot.return_value = iter([_row(2, "P-2")])
+
+    assert _keys(mig._project_wp_snapshot("P", 7)) == {"P-2"}
+    assert list(mig._snapshot_cache.load("P").rows) == [2]
+
+
+def test_snapshot_refreshes_when_count_matches_but_ids_differ(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    # WP 1 was deleted and WP 3 moved in without a newer updated_at, so the
+    # delta is empty and the project still has two work packages.
+    monkeypatch.setenv("J2O_WP_SNAPSHOT_DELTA", "1")
+    mig = _migration(tmp_path)
+    mig._snapshot_cache.save(
+        "P", [_row(1, "P-1"), _row(5, "P-5")], high_water="2026-01-01T00:00:00Z", max_id=5, replace=True
+    )
+    mig.op_client.get_project_wp_cf_delta.return_value = {
+        "rows": [],
+        "count": 2,
+        "id_sum": 8,
+        "max_id": 5,
+        "high_water": "2026-01-01T00:00:00.000000Z",
+    }
+    mig.op_client.iter_project_wp_cf_snapshot.return_value = iter([_row(3, "Q-3"), _row(5, "P-5")])
+
+    assert _keys(mig._project_wp_snapshot("P", 7)) == {"Q-3", "P-5"}
+    assert sorted(mig._snapshot_cache.load("P").rows) == [3, 5]
+
+
+def test_snapshot_streams_when_disabled(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("J2O_WP_SNAPSHOT_DELTA", "0")
+    mig = _migration(tmp_path)
+    mig.op_client.iter_project_wp_cf_snapshot.return_value = iter([_row(1, "P-1")])
+
+    assert _keys(mig._project_wp_snapshot("P", 7)) == {"P-1"}
+    assert not mig._checkpoint_db_path.exists()